@@ -4,23 +4,100 @@ FastAPI service wrapper for Phase-1 physics.
 
 This is optional for the Streamlit UI (which imports src directly),
 but it is included to support future web UIs and job execution.
+
+Batch work runs on a shared spawn-context process pool (``SHAMS_API_WORKERS``,
+default: CPU count) so the event loop stays free. A pool broken by a dead worker
+is replaced on the next submission; items lost with it come back as ``ok=False``:
+
+- ``POST /point/evaluate_batch``: N specs -> N results in request order
+- ``POST /point/evaluate_stream``: NDJSON, one line per result as it completes
+- ``POST /jobs`` + ``GET /jobs/{job_id}`` (+ ``/results``): submit and poll long scans;
+  finished jobs are forgotten after ``SHAMS_API_JOB_TTL_S`` (default 3600 s) and
+  at most ``SHAMS_API_MAX_JOBS`` (default 256) finished jobs are kept
 """
 from __future__ import annotations
 
-import os, sys
+import asyncio, functools, json, multiprocessing, os, sys, threading, time, uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from typing import Any, Dict, Optional, List
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ROOT = os.path.abspath(os.path.dirname(__file__))
 SRC = os.path.join(ROOT, "src")
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
+from utils.bytecode_cache import configure_bytecode_policy
+
+configure_bytecode_policy()  # before the physics imports; workers inherit the policy
+
 from phase1_core import PointInputs, hot_ion_point
 
-app = FastAPI(title="Phase-1 Clean Point Design API", version="0.1.0")
+# -----------------------------
+# Worker pool (lazy, shared by batch / stream / jobs)
+# -----------------------------
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _api_workers() -> int:
+    try:
+        n = int(os.environ.get("SHAMS_API_WORKERS", "") or 0)
+    except ValueError:
+        n = 0
+    return max(1, n or (os.cpu_count() or 1))
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=_api_workers(), mp_context=multiprocessing.get_context("spawn"))
+        return _POOL
+
+
+def _replace_broken_pool(broken: ProcessPoolExecutor) -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is broken:
+            _POOL = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _shutdown_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = None
+
+
+def _evaluate_spec(index: int, spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Pool task: evaluate one spec; errors are reported per item, never raised."""
+    try:
+        out = hot_ion_point(PointInputs.from_dict(spec))
+        return {"index": index, "ok": True, "outputs": out, "error": ""}
+    except Exception as e:
+        return _error_item(index, e)
+
+
+def _error_item(index: int, e: BaseException) -> Dict[str, Any]:
+    return {"index": index, "ok": False, "outputs": {}, "error": f"{type(e).__name__}: {e}"}
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    yield
+    _shutdown_pool()
+
+
+app = FastAPI(title="Phase-1 Clean Point Design API", version="0.1.0", lifespan=_lifespan)
 
 class PointSpec(BaseModel):
     # Mirror PointInputs fields. Keep it permissive: extra knobs are allowed.
@@ -57,6 +134,170 @@ class PointResponse(BaseModel):
 
 @app.post("/point/evaluate", response_model=PointResponse)
 def point_evaluate(spec: PointSpec):
-    inp = PointInputs(**spec.model_dump())
+    inp = PointInputs.from_dict(spec.model_dump())
     out = hot_ion_point(inp)
     return {"outputs": out}
+
+class BatchRequest(BaseModel):
+    specs: List[PointSpec] = Field(default_factory=list)
+
+class BatchItem(BaseModel):
+    index: int
+    ok: bool
+    outputs: Dict[str, Any]
+    error: str = ""
+
+class BatchResponse(BaseModel):
+    results: List[BatchItem]
+
+def _submit(specs: List[PointSpec]) -> List[Future]:
+    pool = _get_pool()
+    try:
+        return [pool.submit(_evaluate_spec, i, s.model_dump()) for i, s in enumerate(specs)]
+    except BrokenProcessPool:
+        # A worker died since the last batch; anything queued on this pool is lost.
+        _replace_broken_pool(pool)
+        pool = _get_pool()
+        return [pool.submit(_evaluate_spec, i, s.model_dump()) for i, s in enumerate(specs)]
+
+async def _item(index: int, fut: "asyncio.Future[Dict[str, Any]]") -> Dict[str, Any]:
+    """Await one pool result; a lost task (e.g. its worker died) becomes an error item."""
+    try:
+        return await fut
+    except Exception as e:
+        return _error_item(index, e)
+
+@app.post("/point/evaluate_batch", response_model=BatchResponse)
+async def point_evaluate_batch(req: BatchRequest):
+    futs = [asyncio.wrap_future(f) for f in _submit(req.specs)]
+    return {"results": list(await asyncio.gather(*(_item(i, f) for i, f in enumerate(futs))))}
+
+@app.post("/point/evaluate_stream")
+async def point_evaluate_stream(req: BatchRequest):
+    """NDJSON stream of BatchItem lines in completion order (use ``index`` to reorder)."""
+    futs = [asyncio.wrap_future(f) for f in _submit(req.specs)]
+
+    async def _lines():
+        try:
+            for nxt in asyncio.as_completed([_item(i, f) for i, f in enumerate(futs)]):
+                yield json.dumps(await nxt) + "\n"
+        finally:
+            for f in futs:
+                f.cancel()
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+# -----------------------------
+# Jobs (submit + poll); in-memory, per server process
+# -----------------------------
+
+_JOBS: Dict[str, Dict[str, Any]] = {}
+_JOBS_LOCK = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def _evict_jobs(now: float) -> None:
+    """Forget finished jobs past the TTL, then the oldest finished beyond the cap (lock held).
+
+    Running jobs are never evicted; their results are still arriving.
+    """
+    ttl_s = _env_float("SHAMS_API_JOB_TTL_S", 3600.0)
+    max_jobs = max(0, int(_env_float("SHAMS_API_MAX_JOBS", 256)))
+    finished = sorted(
+        (job["finished_at"], job_id) for job_id, job in _JOBS.items() if job["finished_at"] is not None
+    )
+    n_drop = max(0, len(finished) - max_jobs)
+    for i, (finished_at, job_id) in enumerate(finished):
+        if i < n_drop or now - finished_at > ttl_s:
+            del _JOBS[job_id]
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: str  # running | done | cancelled
+    n_total: int
+    n_done: int
+    n_failed: int
+
+def _job_status(job_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    n_done = len(job["results"])
+    status = job["status"] if job["status"] == "cancelled" else ("done" if n_done >= job["n_total"] else "running")
+    return {
+        "job_id": job_id,
+        "status": status,
+        "n_total": job["n_total"],
+        "n_done": n_done,
+        "n_failed": sum(1 for r in job["results"].values() if not r["ok"]),
+    }
+
+def _get_job(job_id: str) -> Dict[str, Any]:
+    job = _JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"unknown job {job_id!r}")
+    return job
+
+@app.post("/jobs", response_model=JobStatus)
+def job_submit(req: BatchRequest):
+    job_id = uuid.uuid4().hex
+    now = time.monotonic()
+    job: Dict[str, Any] = {
+        "status": "running",
+        "n_total": len(req.specs),
+        "results": {},
+        "futures": [],
+        "finished_at": now if not req.specs else None,
+    }
+
+    def _done(index: int, f: Future) -> None:
+        if f.cancelled():
+            return
+        try:
+            r = f.result()
+        except Exception as e:  # lost with a dead worker; still counts towards completion
+            r = _error_item(index, e)
+        with _JOBS_LOCK:
+            job["results"][r["index"]] = r
+            if len(job["results"]) >= job["n_total"]:
+                job["finished_at"] = time.monotonic()
+
+    with _JOBS_LOCK:
+        _evict_jobs(now)
+        _JOBS[job_id] = job
+    job["futures"] = _submit(req.specs)
+    for i, f in enumerate(job["futures"]):
+        f.add_done_callback(functools.partial(_done, i))
+    with _JOBS_LOCK:
+        return _job_status(job_id, job)
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+def job_status(job_id: str):
+    with _JOBS_LOCK:
+        return _job_status(job_id, _get_job(job_id))
+
+@app.get("/jobs/{job_id}/results", response_model=BatchResponse)
+def job_results(job_id: str, offset: int = 0):
+    """Finished results so far, in spec order; ``offset`` skips the first indices."""
+    with _JOBS_LOCK:
+        res = _get_job(job_id)["results"]
+        return {"results": [res[i] for i in sorted(res) if i >= offset]}
+
+@app.delete("/jobs/{job_id}", response_model=JobStatus)
+def job_cancel(job_id: str):
+    """Forget the job; a running job has its pending work cancelled first.
+
+    A job that already finished reports ``done`` (finished results are in the status).
+    """
+    with _JOBS_LOCK:
+        job = _JOBS.pop(job_id, None)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"unknown job {job_id!r}")
+        if job["finished_at"] is None:
+            for f in job["futures"]:
+                f.cancel()
+            job["status"] = "cancelled"
+        return _job_status(job_id, job)
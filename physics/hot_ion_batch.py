@@ -0,0 +1,2 @@
+# Proxy module: physics.hot_ion_batch -> src.physics.hot_ion_batch
+from src.physics.hot_ion_batch import *  # noqa
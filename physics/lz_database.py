@@ -0,0 +1,2 @@
+# Proxy module: physics.lz_database -> src.physics.lz_database
+from src.physics.lz_database import *  # noqa
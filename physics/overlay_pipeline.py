@@ -0,0 +1,2 @@
+# Proxy module: physics.overlay_pipeline -> src.physics.overlay_pipeline
+from src.physics.overlay_pipeline import *  # noqa
@@ -0,0 +1,2 @@
+# Proxy module: physics.point_cache -> src.physics.point_cache
+from src.physics.point_cache import *  # noqa
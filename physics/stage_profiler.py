@@ -0,0 +1,2 @@
+# Proxy module: physics.stage_profiler -> src.physics.stage_profiler
+from src.physics.stage_profiler import *  # noqa
@@ -5,6 +5,11 @@ We use it to enforce the permanent repository hygiene rule:
 
   - Do not write bytecode caches (__pycache__ / *.pyc)
 
+Opt-in: ``SHAMS_BYTECODE_CACHE=1`` (or a directory) keeps bytecode out of the
+tree but caches it under a user cache directory via ``sys.pycache_prefix``,
+so CLIs and spawned pool workers skip recompiling ``src/``
+(see ``src/utils/bytecode_cache.py``).
+
 This is UI/CLI safe and does not affect physics truth. It only avoids creating
 unwanted files in the working tree.
 
@@ -17,3 +22,10 @@ import sys
 
 
 sys.dont_write_bytecode = True
+
+try:
+    from src.utils.bytecode_cache import configure_bytecode_policy
+except Exception:
+    pass
+else:
+    configure_bytecode_policy()
@@ -16,13 +16,15 @@ the SHAMS robustness authority path.
 
 import math
 import random
-from dataclasses import asdict, replace
+from dataclasses import asdict
 from typing import Any, Dict, List, Tuple, Callable, Optional
 
 try:
     from ..models.inputs import PointInputs  # type: ignore
+    from ..schema.fingerprint import replace_inputs  # type: ignore
 except Exception:
     from models.inputs import PointInputs  # type: ignore
+    from schema.fingerprint import replace_inputs  # type: ignore
 from constraints.system import build_constraints_from_outputs
 
 try:
@@ -85,7 +87,7 @@ def monte_carlo_feasibility(
     ok_count = 0
 
     for _ in range(max(1, int(n))):
-        inp = replace(
+        inp = replace_inputs(
             base,
             confinement_mult=_rand_lognormal(max(getattr(base, "confinement_mult", 1.0), 1e-6), sigma_confinement),
             lambda_q_mult=_rand_lognormal(max(getattr(base, "lambda_q_mult", 1.0), 1e-6), sigma_lambda_q),
@@ -179,8 +181,8 @@ def deterministic_sensitivity_pack(
         h = max(step_rel * s, 1e-12)
 
         try:
-            plus = replace(base, **{var: x0 + h})
-            minus = replace(base, **{var: x0 - h})
+            plus = replace_inputs(base, **{var: x0 + h})
+            minus = replace_inputs(base, **{var: x0 - h})
         except Exception as e:
             log.append({"var": var, "status": "SKIP", "reason": f"replace_failed: {e}"})
             continue
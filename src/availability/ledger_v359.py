@@ -17,6 +17,11 @@ import math
 import hashlib
 from pathlib import Path
 
+try:
+    from ..contracts.registry import load_cached  # type: ignore
+except Exception:
+    from contracts.registry import load_cached  # type: ignore
+
 
 @dataclass(frozen=True)
 class AvailabilityReplacementV359:
@@ -35,6 +40,10 @@ def _finite(x: float) -> bool:
     return (x == x) and math.isfinite(x)
 
 
+def _sha256_file(p: Path) -> str:
+    return hashlib.sha256(p.read_bytes()).hexdigest()
+
+
 def compute_availability_replacement_v359(out: Dict[str, Any], inp: Any) -> AvailabilityReplacementV359:
     # Load contract fingerprint (in-repo)
     contract_sha = ""
@@ -42,7 +51,7 @@ def compute_availability_replacement_v359(out: Dict[str, Any], inp: Any) -> Avai
         here = Path(__file__).resolve()
         contract_path = here.parents[2] / "contracts" / "availability_replacement_v359_contract.json"
         if contract_path.exists():
-            contract_sha = hashlib.sha256(contract_path.read_bytes()).hexdigest()
+            contract_sha = load_cached(contract_path, _sha256_file)
     except Exception:
         contract_sha = ""
 
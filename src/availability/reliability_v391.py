@@ -20,6 +20,11 @@ from typing import Any, Dict, List, Tuple
 import hashlib
 import math
 
+try:
+    from ..contracts.registry import load_cached  # type: ignore
+except Exception:
+    from contracts.registry import load_cached  # type: ignore
+
 
 def _finite(x: float) -> bool:
     return (x == x) and math.isfinite(x)
@@ -34,12 +39,16 @@ def _contract_sha256() -> str:
         here = Path(__file__).resolve()
         p = here.parents[2] / "contracts" / "availability_reliability_v391_contract.json"
         if p.exists():
-            return hashlib.sha256(p.read_bytes()).hexdigest()
+            return load_cached(p, _sha256_file)
     except Exception:
         pass
     return ""
 
 
+def _sha256_file(p: Path) -> str:
+    return hashlib.sha256(p.read_bytes()).hexdigest()
+
+
 @dataclass(frozen=True)
 class AvailabilityReliabilityEntryV391:
     subsystem: str
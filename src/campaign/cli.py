@@ -6,6 +6,7 @@ Usage
 -----
 python -m src.campaign.cli export --campaign campaigns/my_campaign.json --out out.zip
 python -m src.campaign.cli eval --campaign campaigns/my_campaign.json --in candidates.csv --out results.jsonl
+python -m src.campaign.cli eval ... --checkpoint results.ckpt.jsonl   (rerun resumes)
 
 This CLI is intentionally minimal and deterministic.
 
@@ -33,7 +34,8 @@ def _cmd_export(args: argparse.Namespace) -> int:
 def _cmd_eval(args: argparse.Namespace) -> int:
     spec = load_campaign_spec(Path(args.campaign))
     rows = read_candidates_csv(Path(args.input))
-    results = evaluate_campaign_candidates(spec, rows)
+    ckpt = Path(args.checkpoint) if args.checkpoint else None
+    results, _summary = evaluate_campaign_candidates(spec, rows, checkpoint_path=ckpt, resume=not args.fresh)
     write_results_jsonl(results, Path(args.out))
     print(str(Path(args.out)))
     return 0
@@ -52,6 +54,8 @@ def main(argv: list[str] | None = None) -> int:
     pv.add_argument("--campaign", required=True, help="Path to campaign JSON")
     pv.add_argument("--in", dest="input", required=True, help="Input candidates CSV")
     pv.add_argument("--out", required=True, help="Output results JSONL")
+    pv.add_argument("--checkpoint", default=None, help="Checkpoint JSONL; a rerun skips completed candidates")
+    pv.add_argument("--fresh", action="store_true", help="Discard an existing checkpoint instead of resuming")
     pv.set_defaults(func=_cmd_eval)
 
     ns = p.parse_args(argv)
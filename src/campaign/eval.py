@@ -10,7 +10,7 @@ This module is suitable for both headless CLI execution and UI invocation.
 © 2026 Afshin Arjhangmehr
 """
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 import json
@@ -21,12 +21,14 @@ try:
     from ..constraints.system import build_constraints_from_outputs  # type: ignore
     from ..shams_io.run_artifact import build_run_artifact  # type: ignore
     from ..analysis.profile_contracts_v362 import evaluate_profile_contracts_v362  # type: ignore
+    from ..shams_io.checkpoint import CaseCheckpoint, case_fingerprint  # type: ignore
 except Exception:
     from models.inputs import PointInputs  # type: ignore
     from evaluator.core import Evaluator  # type: ignore
     from constraints.system import build_constraints_from_outputs  # type: ignore
     from shams_io.run_artifact import build_run_artifact  # type: ignore
     from analysis.profile_contracts_v362 import evaluate_profile_contracts_v362  # type: ignore
+    from shams_io.checkpoint import CaseCheckpoint, case_fingerprint  # type: ignore
 
 from .spec import CampaignSpec
 
@@ -72,28 +74,150 @@ class CampaignEvalRow:
     artifact: Optional[Dict[str, Any]]
 
 
+def _failed_artifact(merged: Dict[str, Any], error: str, code: str, *, first_failure: bool = False) -> Dict[str, Any]:
+    art: Dict[str, Any] = {
+        "schema_version": "shams_run_artifact.v1",
+        "kind": "shams_run_artifact",
+        "inputs": merged,
+        "outputs": {},
+        "constraints": [],
+        "kpis": {"feasible_hard": False, "min_hard_margin": float("nan")},
+        "error": error,
+    }
+    if first_failure:
+        art["first_failure"] = code
+    art["no_solution_atlas"] = {
+        "schema": "no_solution_atlas.v1",
+        "verdict": "INFEASIBLE",
+        "dominant_constraint": code,
+        "dominant_mechanism": "GENERAL",
+        "mechanism_map": {"GENERAL": [code]},
+        "hard_failures": [],
+        "n_hard_failures": 0,
+        "parity_aligned": True,
+    }
+    return art
+
+
+def _evaluate_candidate(
+    spec: CampaignSpec, cid: str, merged: Dict[str, Any], inc_full: bool, ev: Any
+) -> Tuple[CampaignEvalRow, bool]:
+    """One candidate -> (row, evaluated ok); ``ok=False`` rows are re-run on resume."""
+    try:
+        pi = PointInputs(**merged)
+    except (TypeError, ValueError) as ex:
+        art = _annotate_summary_fields(
+            _failed_artifact(merged, f"SCHEMA_INVALID: {ex}", "SCHEMA_INVALID", first_failure=True), intent=spec.intent
+        )
+        row = CampaignEvalRow(
+            cid=cid,
+            inputs=merged,
+            feasible_hard=False,
+            verdict="FAIL",
+            dominant_mechanism="SCHEMA_INVALID",
+            worst_hard_margin=None,
+            artifact=art if inc_full else None,
+        )
+        return row, False
+
+    evr = ev.evaluate(pi)
+    if not getattr(evr, "ok", True):
+        art = _failed_artifact(merged, getattr(evr, "message", "evaluate failed"), "EVAL_ERROR")
+    else:
+        out = getattr(evr, "out", None)
+        if not isinstance(out, dict):
+            out = getattr(evr, "outputs", {}) or {}
+        cons = build_constraints_from_outputs(out, design_intent=spec.intent)
+        art = build_run_artifact(inputs=merged, outputs=out, constraints=cons)
+
+    art = _annotate_summary_fields(art, intent=spec.intent)
+
+    # Profile contracts overlay (v362) — reuse injected evaluator when provided
+    try:
+        pc = spec.profile_contracts
+        pc_rep = evaluate_profile_contracts_v362(
+            pi,
+            preset=str(pc.preset),
+            tier=str(pc.tier),
+            evaluator=ev,
+        )
+        art["profile_contracts_v362"] = pc_rep.to_dict() if hasattr(pc_rep, "to_dict") else dict(pc_rep)  # type: ignore
+    except Exception as ex:
+        art["profile_contracts_v362"] = {
+            "schema_version": "profile_contracts_v362_error.v1",
+            "error": str(ex),
+        }
+
+    kpis = art.get("kpis", {}) if isinstance(art.get("kpis"), dict) else {}
+    worst = art.get("worst_hard_margin", None)
+    try:
+        worst_f = float(worst) if worst is not None else None
+    except Exception:
+        worst_f = None
+    row = CampaignEvalRow(
+        cid=cid,
+        inputs=merged,
+        feasible_hard=bool(kpis.get("feasible_hard", False)),
+        verdict=str(art.get("verdict", "FAIL")),
+        dominant_mechanism=str(art.get("dominant_mechanism", "")) or "(none)",
+        worst_hard_margin=worst_f,
+        artifact=art if inc_full else None,
+    )
+    return row, bool(getattr(evr, "ok", True))
+
+
+# Per-worker Evaluators for pooled campaigns (live in the worker process).
+_WORKER_EVALUATORS: Dict[str, Any] = {}
+
+
+def _candidate_task(spec: CampaignSpec, cid: str, merged: Dict[str, Any], inc_full: bool) -> Tuple[CampaignEvalRow, bool]:
+    """Worker-pool task: ``_evaluate_candidate`` with this worker's Evaluator."""
+    label = str(spec.evaluator_label)
+    ev = _WORKER_EVALUATORS.get(label)
+    if ev is None:
+        ev = _WORKER_EVALUATORS[label] = Evaluator(label=label, cache_enabled=False)
+    return _evaluate_candidate(spec, cid, merged, inc_full, ev)
+
+
 def evaluate_campaign_candidates(
     spec: CampaignSpec,
     candidates: List[Dict[str, Any]],
     *,
     include_full_artifact: Optional[bool] = None,
     evaluator: Any = None,
+    checkpoint_path: Optional[Path] = None,
+    resume: bool = True,
+    pool: Any = None,
 ) -> Tuple[List[CampaignEvalRow], Dict[str, Any]]:
     """Evaluate campaign candidates.
 
     NiceGUI should pass ``evaluator=ui_evaluator(origin=...)`` so batch eval
     routes through the UI choke point. When omitted, constructs a bare Evaluator.
+
+    With ``checkpoint_path`` every finished candidate is appended to a JSONL
+    checkpoint keyed by a fingerprint of (spec, candidate, artifact mode). A
+    rerun with ``resume=True`` replays completed candidates and re-evaluates
+    only missing ones and those that failed (schema/evaluation errors); the
+    rows and summary are the same as for an uninterrupted run.
+
+    ``pool`` (a :class:`evaluator.worker_pool.WarmWorkerPool`) evaluates the
+    candidates in its warm workers, each with its own Evaluator for
+    ``spec.evaluator_label`` (``evaluator`` is then not used). Rows keep the
+    candidate order; a candidate whose worker crashed or timed out becomes an
+    ``EVAL_ERROR`` row that is re-run on resume.
     """
     inc_full = bool(spec.include_full_artifact if include_full_artifact is None else include_full_artifact)
 
     if evaluator is not None:
         ev = evaluator
     else:
-        ev = Evaluator(label=str(spec.evaluator_label), cache_enabled=False)
+        ev = Evaluator(label=str(spec.evaluator_label), cache_enabled=False) if pool is None else None
 
     rows: List[CampaignEvalRow] = []
     mech_hist: Dict[str, int] = {}
+    ckpt = CaseCheckpoint(checkpoint_path, resume=resume) if checkpoint_path is not None else None
 
+    plan: List[Tuple[str, Dict[str, Any], str, Any]] = []
     for cand in candidates:
         cid = str(cand.get("cid", "")) or ""
         merged = dict(spec.fixed_inputs)
@@ -102,112 +226,48 @@ def evaluate_campaign_candidates(
                 continue
             merged[k] = v
 
-        try:
-            pi = PointInputs(**merged)
-        except (TypeError, ValueError) as ex:
-            art = {
-                "schema_version": "shams_run_artifact.v1",
-                "kind": "shams_run_artifact",
-                "inputs": merged,
-                "outputs": {},
-                "constraints": [],
-                "kpis": {"feasible_hard": False, "min_hard_margin": float("nan")},
-                "error": f"SCHEMA_INVALID: {ex}",
-                "first_failure": "SCHEMA_INVALID",
-                "no_solution_atlas": {
-                    "schema": "no_solution_atlas.v1",
-                    "verdict": "INFEASIBLE",
-                    "dominant_constraint": "SCHEMA_INVALID",
-                    "dominant_mechanism": "GENERAL",
-                    "mechanism_map": {"GENERAL": ["SCHEMA_INVALID"]},
-                    "hard_failures": [],
-                    "n_hard_failures": 0,
-                    "parity_aligned": True,
-                },
-            }
-            art = _annotate_summary_fields(art, intent=spec.intent)
-            rows.append(
-                CampaignEvalRow(
+        fp = ""
+        done = None
+        if ckpt is not None:
+            fp = case_fingerprint({"spec": spec, "candidate": cand, "include_full_artifact": inc_full})
+            done = ckpt.get(fp)
+        if done is None and pool is not None:
+            done = pool.submit(_candidate_task, spec, cid, merged, inc_full)
+        plan.append((cid, merged, fp, done))
+
+    for cid, merged, fp, done in plan:
+        if isinstance(done, dict):
+            ckpt.mark_reused()  # type: ignore[union-attr]
+            row = CampaignEvalRow(**done)
+            rows.append(row)
+            mech_hist[row.dominant_mechanism] = int(mech_hist.get(row.dominant_mechanism, 0)) + 1
+            continue
+        if done is None:
+            row, ok = _evaluate_candidate(spec, cid, merged, inc_full, ev)
+        else:
+            try:
+                row, ok = done.result()
+            except pool.LOST_TASK_ERRORS as ex:  # worker crashed / timed out
+                art = _annotate_summary_fields(
+                    _failed_artifact(merged, f"{type(ex).__name__}: {ex}", "EVAL_ERROR"), intent=spec.intent
+                )
+                row = CampaignEvalRow(
                     cid=cid,
                     inputs=merged,
                     feasible_hard=False,
                     verdict="FAIL",
-                    dominant_mechanism="SCHEMA_INVALID",
+                    dominant_mechanism=str(art.get("dominant_mechanism", "")) or "(none)",
                     worst_hard_margin=None,
                     artifact=art if inc_full else None,
                 )
-            )
-            mech_hist["SCHEMA_INVALID"] = int(mech_hist.get("SCHEMA_INVALID", 0)) + 1
-            continue
+                ok = False
+        rows.append(row)
+        mech_hist[row.dominant_mechanism] = int(mech_hist.get(row.dominant_mechanism, 0)) + 1
+        if ckpt is not None:
+            ckpt.record(fp, asdict(row), status="ok" if ok else "failed")
 
-        evr = ev.evaluate(pi)
-        if not getattr(evr, "ok", True):
-            art: Dict[str, Any] = {
-                "schema_version": "shams_run_artifact.v1",
-                "kind": "shams_run_artifact",
-                "inputs": merged,
-                "outputs": {},
-                "constraints": [],
-                "kpis": {"feasible_hard": False, "min_hard_margin": float("nan")},
-                "error": getattr(evr, "message", "evaluate failed"),
-                "no_solution_atlas": {
-                    "schema": "no_solution_atlas.v1",
-                    "verdict": "INFEASIBLE",
-                    "dominant_constraint": "EVAL_ERROR",
-                    "dominant_mechanism": "GENERAL",
-                    "mechanism_map": {"GENERAL": ["EVAL_ERROR"]},
-                    "hard_failures": [],
-                    "n_hard_failures": 0,
-                    "parity_aligned": True,
-                },
-            }
-        else:
-            out = getattr(evr, "out", None)
-            if not isinstance(out, dict):
-                out = getattr(evr, "outputs", {}) or {}
-            cons = build_constraints_from_outputs(out, design_intent=spec.intent)
-            art = build_run_artifact(inputs=merged, outputs=out, constraints=cons)
-
-        art = _annotate_summary_fields(art, intent=spec.intent)
-
-        # Profile contracts overlay (v362) — reuse injected evaluator when provided
-        try:
-            pc = spec.profile_contracts
-            pc_rep = evaluate_profile_contracts_v362(
-                pi,
-                preset=str(pc.preset),
-                tier=str(pc.tier),
-                evaluator=ev,
-            )
-            art["profile_contracts_v362"] = pc_rep.to_dict() if hasattr(pc_rep, "to_dict") else dict(pc_rep)  # type: ignore
-        except Exception as ex:
-            art["profile_contracts_v362"] = {
-                "schema_version": "profile_contracts_v362_error.v1",
-                "error": str(ex),
-            }
-
-        kpis = art.get("kpis", {}) if isinstance(art.get("kpis"), dict) else {}
-        feas = bool(kpis.get("feasible_hard", False))
-        verdict = str(art.get("verdict", "FAIL"))
-        mech = str(art.get("dominant_mechanism", "")) or "(none)"
-        mech_hist[mech] = int(mech_hist.get(mech, 0)) + 1
-        worst = art.get("worst_hard_margin", None)
-        try:
-            worst_f = float(worst) if worst is not None else None
-        except Exception:
-            worst_f = None
-
-        rows.append(
-            CampaignEvalRow(
-                cid=cid,
-                inputs=merged,
-                feasible_hard=feas,
-                verdict=verdict,
-                dominant_mechanism=mech,
-                worst_hard_margin=worst_f,
-                artifact=art if inc_full else None,
-            )
-        )
+    if ckpt is not None:
+        ckpt.close()
 
     summary = {
         "schema": "shams_campaign_summary.v1",
@@ -22,6 +22,7 @@ from .authority_registry import (
     load_authority_specs,
     registry_spec_names,
 )
+from .plan import ConstraintBatch, ConstraintPlan, evaluate_constraint_batch, get_constraint_plan
 from .registry_codegen import generate_registry_module, verify_codegen_sync
 
 # Backward-compatible alias for schema ledger type.
@@ -43,6 +44,10 @@ __all__ = [
     "load_authority_specs",
     "evaluate_registry_governance",
     "evaluate_registry_ledger",
+    "ConstraintPlan",
+    "ConstraintBatch",
+    "get_constraint_plan",
+    "evaluate_constraint_batch",
     "generate_registry_module",
     "verify_codegen_sync",
     "ledger_from_governance",
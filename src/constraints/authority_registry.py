@@ -4,7 +4,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 try:
     from schema.constraints import Constraint as LedgerConstraint  # type: ignore
@@ -40,8 +40,23 @@ def _registry_path() -> Path:
     return Path(__file__).resolve().parent / "data" / "authority_caps.json"
 
 
-def load_authority_specs() -> List[AuthorityCapSpec]:
-    """Load specs from codegen module (PROPOSAL-026) with JSON fallback."""
+# Parsed once per process; the registry is static for the lifetime of a run.
+_SPECS_CACHE: Optional[Tuple[AuthorityCapSpec, ...]] = None
+
+
+def load_authority_specs(*, refresh: bool = False) -> List[AuthorityCapSpec]:
+    """Load specs from codegen module (PROPOSAL-026) with JSON fallback.
+
+    Parsed once per process (``refresh=True`` re-reads); callers get a fresh
+    list of the shared frozen specs.
+    """
+    global _SPECS_CACHE
+    if _SPECS_CACHE is None or refresh:
+        _SPECS_CACHE = tuple(_parse_authority_specs())
+    return list(_SPECS_CACHE)
+
+
+def _parse_authority_specs() -> List[AuthorityCapSpec]:
     try:
         from .data.authority_specs_codegen import REGISTRY_SPECS  # type: ignore
 
@@ -91,9 +106,12 @@ def _resolve_limit(out: Dict[str, Any], spec: AuthorityCapSpec) -> float:
     return _safe(out, spec.limit_lo_key or "")
 
 
-def evaluate_registry_governance(out: Dict[str, Any]) -> List[GovernanceConstraint]:
+def evaluate_registry_governance(
+    out: Dict[str, Any],
+    specs: Optional[Sequence[AuthorityCapSpec]] = None,
+) -> List[GovernanceConstraint]:
     items: List[GovernanceConstraint] = []
-    for spec in load_authority_specs():
+    for spec in (load_authority_specs() if specs is None else specs):
         if not _enabled(out, spec):
             continue
         val = _resolve_value(out, spec)
@@ -119,9 +137,12 @@ def evaluate_registry_governance(out: Dict[str, Any]) -> List[GovernanceConstrai
     return items
 
 
-def evaluate_registry_ledger(out: Dict[str, Any]) -> List[LedgerConstraint]:
+def evaluate_registry_ledger(
+    out: Dict[str, Any],
+    specs: Optional[Sequence[AuthorityCapSpec]] = None,
+) -> List[LedgerConstraint]:
     items: List[LedgerConstraint] = []
-    for spec in load_authority_specs():
+    for spec in (load_authority_specs() if specs is None else specs):
         if not _enabled(out, spec):
             continue
         val = _resolve_value(out, spec)
@@ -0,0 +1,324 @@
+"""Compiled constraint plan for batch feasibility evaluation.
+
+``build_all_constraints`` walks the authority registry and the legacy
+procedural pipelines once per point and returns Python object lists. Scans,
+UQ and NSGA-II mostly need a feasibility mask, the dominant failing
+constraint and per-constraint margins for N points, so this module compiles
+the registry specs once (key lookups, sense codes, fraction terms) and
+evaluates them as NumPy column operations over the whole batch.
+
+The legacy governance pipeline (``evaluate_constraints``) is procedural,
+key-presence driven code; it still runs per row, and its results are
+scattered into the same column arrays. Merge order, name de-duplication and
+the hard/soft rule are exactly those of ``build_all_constraints``, so
+``ConstraintBatch.feasible`` / ``dominant`` agree with
+``ConstraintBundle.governance_feasible`` / ``dominant_failing_constraint``,
+and ``ConstraintBatch.bundle(i)`` rebuilds the per-point bundle on request.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .authority_registry import AuthorityCapSpec, load_authority_specs
+from .constraints import constraint_is_hard, evaluate_constraints
+from .unified import ConstraintBundle, _norm_name, build_all_constraints
+
+_TOL = 1e-12
+
+Rows = Sequence[Mapping[str, Any]]
+Columns = Mapping[str, Any]
+
+
+def _float_column(columns: Columns, key: str, n: int) -> np.ndarray:
+    """Column ``key`` as float64 (missing / non-numeric entries -> NaN)."""
+    if not key or key not in columns:
+        return np.full(n, np.nan, dtype=float)
+    col = columns[key]
+    try:
+        arr = np.asarray(col, dtype=float)
+    except (TypeError, ValueError):
+        arr = np.full(n, np.nan, dtype=float)
+        for i, v in enumerate(col):
+            try:
+                arr[i] = float(v)
+            except (TypeError, ValueError):
+                pass
+    if arr.ndim == 0:
+        arr = np.full(n, float(arr), dtype=float)
+    return arr
+
+
+def _rows_to_columns(rows: Rows, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+    n = len(rows)
+    cols: Dict[str, np.ndarray] = {}
+    for k in keys:
+        arr = np.full(n, np.nan, dtype=float)
+        for i, r in enumerate(rows):
+            v = r.get(k)
+            if v is None:
+                continue
+            try:
+                arr[i] = float(v)
+            except (TypeError, ValueError):
+                pass
+        cols[k] = arr
+    return cols
+
+
+def _columns_to_rows(columns: Columns, n: int) -> List[Dict[str, Any]]:
+    keys = [k for k in columns if not str(k).startswith("_")]
+    rows: List[Dict[str, Any]] = [{} for _ in range(n)]
+    for k in keys:
+        col = columns[k]
+        vals = col.tolist() if isinstance(col, np.ndarray) else list(col)
+        for i in range(n):
+            rows[i][k] = vals[i]
+    return rows
+
+
+def _as_float(v: Any) -> float:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _margin(value: np.ndarray, limit: np.ndarray, le: np.ndarray) -> np.ndarray:
+    """``GovernanceConstraint.margin`` over arrays (NaN where ``limit == 0``)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m = np.where(le, (limit - value) / limit, (value - limit) / limit)
+    return np.where(limit == 0, np.nan, m)
+
+
+@dataclass(frozen=True)
+class ConstraintBatch:
+    """Columnar governance constraint results for N points.
+
+    Columns are the registry specs (in registry order) followed by legacy
+    governance constraints in first-seen order; a legacy name repeated within
+    one point gets a ``#k`` suffix. ``evaluated[i, j]`` is False where the
+    constraint does not apply to point ``i`` (then ``value`` / ``limit`` /
+    ``margin`` are NaN and ``passed`` is False).
+    """
+
+    names: Tuple[str, ...]
+    senses: Tuple[str, ...]
+    value: np.ndarray
+    limit: np.ndarray
+    margin: np.ndarray
+    passed: np.ndarray
+    evaluated: np.ndarray
+    hard: np.ndarray
+    feasible: np.ndarray
+    dominant_index: np.ndarray
+    n_registry: int
+    _rows: Optional[Rows] = field(default=None, repr=False)
+    _evaluate_kwargs: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return int(self.feasible.shape[0])
+
+    @property
+    def dominant(self) -> Tuple[Optional[str], ...]:
+        """First failing hard constraint per point (None when feasible)."""
+        return tuple(self.names[j] if j >= 0 else None for j in self.dominant_index.tolist())
+
+    def column(self, name: str) -> int:
+        return self.names.index(name)
+
+    def bundle(self, i: int, *, design_intent: Optional[str] = None) -> ConstraintBundle:
+        """Full per-point ``ConstraintBundle`` (governance + ledger + parity) for row ``i``."""
+        if self._rows is None:
+            raise ValueError("bundle() needs the full outputs; evaluate with keep_rows=True")
+        return build_all_constraints(dict(self._rows[i]), design_intent=design_intent, **self._evaluate_kwargs)
+
+
+class ConstraintPlan:
+    """Registry authority caps compiled to key/sense arrays for batch evaluation."""
+
+    def __init__(self, specs: Optional[Sequence[AuthorityCapSpec]] = None) -> None:
+        self.specs: Tuple[AuthorityCapSpec, ...] = tuple(load_authority_specs() if specs is None else specs)
+        self.names: Tuple[str, ...] = tuple(s.name for s in self.specs)
+        self.senses: Tuple[str, ...] = tuple(s.sense for s in self.specs)
+        self.norm_names: Tuple[str, ...] = tuple(_norm_name(n) for n in self.names)
+        self._le = np.array([s == "<=" for s in self.senses], dtype=bool)
+        keys: List[str] = []
+        for s in self.specs:
+            if s.enabled_key:
+                keys.append(s.enabled_key)
+            if s.fraction:
+                keys.append(s.fraction.get("numerator_key", ""))
+                keys.append(s.fraction.get("denominator_key", "Pin_MW"))
+            else:
+                keys.append(s.value_key)
+            keys.append((s.limit_hi_key if s.sense == "<=" else s.limit_lo_key) or "")
+        self.input_keys: Tuple[str, ...] = tuple(dict.fromkeys(k for k in keys if k))
+
+    def evaluate_registry(self, columns: Columns, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``(value, limit, evaluated)`` arrays of shape ``(n, n_specs)``."""
+        C = len(self.specs)
+        value = np.full((n, C), np.nan, dtype=float)
+        limit = np.full((n, C), np.nan, dtype=float)
+        cache: Dict[str, np.ndarray] = {}
+
+        def col(key: str) -> np.ndarray:
+            arr = cache.get(key)
+            if arr is None:
+                arr = cache[key] = _float_column(columns, key, n)
+            return arr
+
+        enabled = np.ones((n, C), dtype=bool)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for j, s in enumerate(self.specs):
+                if s.enabled_key:
+                    enabled[:, j] = col(s.enabled_key) > 0.5
+                if s.fraction:
+                    num = col(s.fraction.get("numerator_key", ""))
+                    den = col(s.fraction.get("denominator_key", "Pin_MW"))
+                    ok = (den > 0.0) & ~np.isnan(num)
+                    value[:, j] = np.where(ok, num / np.where(ok, den, 1.0), np.nan)
+                else:
+                    value[:, j] = col(s.value_key)
+                limit[:, j] = col((s.limit_hi_key if s.sense == "<=" else s.limit_lo_key) or "")
+        evaluated = enabled & ~np.isnan(value) & ~np.isnan(limit)
+        value[~evaluated] = np.nan
+        limit[~evaluated] = np.nan
+        return value, limit, evaluated
+
+    def evaluate(
+        self,
+        outputs: Union[Rows, Columns],
+        *,
+        include_legacy: bool = True,
+        keep_rows: bool = True,
+        **evaluate_kwargs: Any,
+    ) -> ConstraintBatch:
+        """Evaluate governance constraints for a batch of points.
+
+        ``outputs`` is either a sequence of per-point output dicts or a
+        columnar mapping (e.g. from ``Evaluator.evaluate_batch``; keys starting
+        with ``_`` are ignored for the legacy pipeline). With
+        ``include_legacy=False`` only the registry caps are evaluated (pure
+        column math; feasibility then covers the registry alone).
+        ``evaluate_kwargs`` are forwarded to ``evaluate_constraints``.
+        """
+        if isinstance(outputs, Mapping):
+            columns = outputs
+            n = 0
+            for k, v in columns.items():
+                if not str(k).startswith("_"):
+                    n = len(v)
+                    break
+            rows: Optional[Rows] = _columns_to_rows(columns, n) if (include_legacy or keep_rows) else None
+        else:
+            rows = list(outputs)
+            n = len(rows)
+            columns = _rows_to_columns(rows, self.input_keys)
+
+        R = len(self.specs)
+        reg_value, reg_limit, reg_eval = self.evaluate_registry(columns, n)
+        reg_le = np.broadcast_to(self._le, (n, R))
+        with np.errstate(invalid="ignore"):
+            reg_passed = reg_eval & np.where(reg_le, reg_value <= reg_limit + _TOL, reg_value >= reg_limit - _TOL)
+
+        names: List[str] = list(self.names)
+        senses: List[str] = list(self.senses)
+        col_of: Dict[str, int] = {}
+        # (row, col, value, limit, passed, hard) for legacy entries kept by the merge.
+        entries: List[Tuple[int, int, float, float, bool, bool]] = []
+        legacy_dominant = np.full(n, -1, dtype=np.int64)
+        if include_legacy and rows is not None:
+            reg_norm = np.array(self.norm_names, dtype=object)
+            for i, row in enumerate(rows):
+                present = set(reg_norm[reg_eval[i]].tolist()) if R else set()
+                seen: Dict[str, int] = {}
+                for c in evaluate_constraints(dict(row), **evaluate_kwargs):
+                    if _norm_name(c.name) in present:
+                        continue
+                    k = seen.get(c.name, 0)
+                    seen[c.name] = k + 1
+                    key = c.name if k == 0 else f"{c.name}#{k}"
+                    j = col_of.get(key)
+                    if j is None:
+                        j = col_of[key] = len(names)
+                        names.append(key)
+                        senses.append(str(c.sense))
+                    hard = constraint_is_hard(c)
+                    passed = bool(getattr(c, "passed", True))
+                    entries.append((i, j, _as_float(c.value), _as_float(c.limit), passed, hard))
+                    if hard and not passed and legacy_dominant[i] < 0:
+                        legacy_dominant[i] = j
+
+        C = len(names)
+        value = np.full((n, C), np.nan, dtype=float)
+        limit = np.full((n, C), np.nan, dtype=float)
+        passed = np.zeros((n, C), dtype=bool)
+        evaluated = np.zeros((n, C), dtype=bool)
+        hard = np.zeros((n, C), dtype=bool)
+        value[:, :R] = reg_value
+        limit[:, :R] = reg_limit
+        passed[:, :R] = reg_passed
+        evaluated[:, :R] = reg_eval
+        hard[:, :R] = reg_eval
+        if entries:
+            ii, jj, vv, ll, pp, hh = (np.array(x) for x in zip(*entries))
+            value[ii, jj] = vv
+            limit[ii, jj] = ll
+            passed[ii, jj] = pp
+            evaluated[ii, jj] = True
+            hard[ii, jj] = hh
+
+        le = np.array([s.strip() == "<=" for s in senses], dtype=bool)
+        margin = np.where(evaluated, _margin(value, limit, np.broadcast_to(le, (n, C))), np.nan)
+
+        failing = hard & evaluated & ~passed
+        feasible = ~failing.any(axis=1)
+        reg_fail = failing[:, :R]
+        dominant = np.where(
+            reg_fail.any(axis=1) if R else np.zeros(n, dtype=bool),
+            reg_fail.argmax(axis=1) if R else -1,
+            legacy_dominant,
+        ).astype(np.int64)
+
+        return ConstraintBatch(
+            names=tuple(names),
+            senses=tuple(senses),
+            value=value,
+            limit=limit,
+            margin=margin,
+            passed=passed,
+            evaluated=evaluated,
+            hard=hard,
+            feasible=feasible,
+            dominant_index=dominant,
+            n_registry=R,
+            _rows=rows if keep_rows else None,
+            _evaluate_kwargs=dict(evaluate_kwargs),
+        )
+
+
+_PLAN: Optional[ConstraintPlan] = None
+
+
+def get_constraint_plan(*, refresh: bool = False) -> ConstraintPlan:
+    """Process-wide plan compiled from the authority registry (built once)."""
+    global _PLAN
+    if _PLAN is None or refresh:
+        _PLAN = ConstraintPlan(load_authority_specs(refresh=refresh))
+    return _PLAN
+
+
+def evaluate_constraint_batch(
+    outputs: Union[Rows, Columns],
+    *,
+    include_legacy: bool = True,
+    keep_rows: bool = True,
+    **evaluate_kwargs: Any,
+) -> ConstraintBatch:
+    """Batch governance feasibility with the shared compiled plan."""
+    return get_constraint_plan().evaluate(
+        outputs, include_legacy=include_legacy, keep_rows=keep_rows, **evaluate_kwargs
+    )
@@ -16,6 +16,7 @@ Design rules:
 - Deterministic + side-effect free.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
 
@@ -146,7 +147,27 @@ def enrich_constraint_meta(
     mechanism_group: Optional[str] = None,
     subsystem: Optional[str] = None,
 ) -> Dict[str, str]:
-    """Return a small metadata dict for constraint enrichment."""
+    """Return a small metadata dict for constraint enrichment.
+
+    Pure function of its arguments (and the static authority contracts), so
+    results are memoized per (name, group, mechanism_group, subsystem).
+    """
+    try:
+        return dict(_enrich_constraint_meta_cached(name, group, mechanism_group, subsystem))
+    except TypeError:  # unhashable argument: compute directly
+        return dict(_enrich_constraint_meta_items(name, group, mechanism_group, subsystem))
+
+
+@lru_cache(maxsize=4096)
+def _enrich_constraint_meta_cached(
+    name: Any, group: Any, mechanism_group: Any, subsystem: Any
+) -> Tuple[Tuple[str, str], ...]:
+    return _enrich_constraint_meta_items(name, group, mechanism_group, subsystem)
+
+
+def _enrich_constraint_meta_items(
+    name: Any, group: Any, mechanism_group: Any, subsystem: Any
+) -> Tuple[Tuple[str, str], ...]:
     mg = _norm(mechanism_group).upper() if mechanism_group else infer_mechanism_group(name, group)
     if mg not in _MECHANISM_GROUPS:
         mg = "GENERAL"
@@ -154,9 +175,9 @@ def enrich_constraint_meta(
     ss = _norm(subsystem) if subsystem else infer_subsystem(name, mg)
     tier, dom = authority_metadata(ss)
 
-    return {
-        "mechanism_group": mg,
-        "subsystem": ss,
-        "authority_tier": tier,
-        "validity_domain": dom,
-    }
+    return (
+        ("mechanism_group", mg),
+        ("subsystem", ss),
+        ("authority_tier", tier),
+        ("validity_domain", dom),
+    )
@@ -6,6 +6,7 @@ reports parity between pipelines.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .authority_registry import (
@@ -41,8 +42,13 @@ class ConstraintBundle:
         return all(c.ok for c in self.ledger if c.name != "Radial build closes" or c.value >= 0.5)
 
 
+@lru_cache(maxsize=8192)
+def _norm_name_cached(name: str) -> str:
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+
 def _norm_name(name: str) -> str:
-    return "".join(ch for ch in str(name).lower() if ch.isalnum())
+    return _norm_name_cached(str(name))
 
 
 def diff_constraint_pipelines(
@@ -122,14 +128,15 @@ def build_all_constraints(
     **evaluate_kwargs: Any,
 ) -> ConstraintBundle:
     """Build governance + ledger constraints and parity report."""
-    reg_gov = evaluate_registry_governance(out)
-    reg_led = evaluate_registry_ledger(out)
+    specs = load_authority_specs()
+    reg_gov = evaluate_registry_governance(out, specs)
+    reg_led = evaluate_registry_ledger(out, specs)
     legacy_gov = evaluate_constraints(out, **evaluate_kwargs)
     legacy_led = build_constraints_from_outputs(out, design_intent=design_intent)
     gov = _merge_governance(legacy_gov, reg_gov)
     led = _merge_ledger(legacy_led, reg_led)
     parity = diff_constraint_pipelines(gov, led)
-    parity["registry_n_specs"] = len(load_authority_specs())
+    parity["registry_n_specs"] = len(specs)
     parity["registry_n_governance"] = len(reg_gov)
     parity["registry_n_ledger"] = len(reg_led)
     return ConstraintBundle(governance=gov, ledger=led, parity=parity)
@@ -2,3 +2,4 @@
 
 # v329.0
 from .exhaust_radiation_regime_contract import CONTRACT as EXHAUST_REGIME_CONTRACT, CONTRACT_SHA256 as EXHAUST_REGIME_CONTRACT_SHA256
+from .registry import ContractRegistry, contract_registry, reload_contracts
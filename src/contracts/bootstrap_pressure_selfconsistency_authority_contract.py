@@ -12,6 +12,8 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
+from .registry import load_cached
+
 
 def _canonical_json_bytes(obj: Any) -> bytes:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
@@ -19,7 +21,11 @@ def _canonical_json_bytes(obj: Any) -> bytes:
 
 def load_bootstrap_pressure_selfconsistency_contract(repo_root: Path) -> Tuple[Dict[str, Any], str]:
     """Load contract JSON and return (contract_dict, sha256_hex)."""
-    p = repo_root / "contracts" / "bootstrap_pressure_selfconsistency_authority_contract.json"
+    p = Path(repo_root) / "contracts" / "bootstrap_pressure_selfconsistency_authority_contract.json"
+    return load_cached(p, _build_bootstrap_pressure_selfconsistency_contract)
+
+
+def _build_bootstrap_pressure_selfconsistency_contract(p: Path) -> Tuple[Dict[str, Any], str]:
     data = json.loads(p.read_text(encoding="utf-8"))
     sha = hashlib.sha256(_canonical_json_bytes(data)).hexdigest()
     return data, sha
@@ -6,6 +6,8 @@ from typing import Any, Dict, Tuple
 import hashlib
 import json
 
+from .registry import load_cached
+
 
 def _canon(x: Any) -> Any:
     if isinstance(x, dict):
@@ -43,6 +45,10 @@ class CDLibraryV357Contract:
 
 def load_cd_library_v357_contract(repo_root: Path) -> Tuple[CDLibraryV357Contract, str]:
     path = Path(repo_root) / "contracts" / "cd_library_v357_contract.json"
+    return load_cached(path, _build_cd_library_v357_contract)
+
+
+def _build_cd_library_v357_contract(path: Path) -> Tuple[CDLibraryV357Contract, str]:
     data = json.loads(path.read_text(encoding="utf-8"))
     sha = _sha256_of_canon_json(data)
 
@@ -6,6 +6,8 @@ from typing import Any, Dict, Tuple
 import hashlib
 import json
 
+from .registry import load_cached
+
 
 def _canon(x: Any) -> Any:
     if isinstance(x, dict):
@@ -43,6 +45,10 @@ class CDTechAuthorityContract:
 
 def load_cd_tech_authority_contract(repo_root: Path) -> Tuple[CDTechAuthorityContract, str]:
     path = Path(repo_root) / "contracts" / "cd_tech_authority_contract.json"
+    return load_cached(path, _build_cd_tech_authority_contract)
+
+
+def _build_cd_tech_authority_contract(path: Path) -> Tuple[CDTechAuthorityContract, str]:
     data = json.loads(path.read_text(encoding="utf-8"))
     sha = _sha256_of_canon_json(data)
 
@@ -7,6 +7,8 @@ import hashlib
 import json
 import math
 
+from .registry import load_cached
+
 
 def _canon(x: Any) -> Any:
     if isinstance(x, dict):
@@ -40,15 +42,19 @@ class ControlStabilityContract:
     sha256: str
 
 
-def load_control_stability_contract(repo_root: str | Path) -> ControlStabilityContract:
-    repo_root = Path(repo_root)
-    p = repo_root / 'contracts' / 'control_stability_authority_contract.json'
+def _build_control_stability_contract(p: Path) -> ControlStabilityContract:
     data = json.loads(p.read_text(encoding='utf-8'))
     canon = _canonical_json(data)
     sha = hashlib.sha256(canon.encode('utf-8')).hexdigest()
     return ControlStabilityContract(data=data, sha256=sha)
 
 
+def load_control_stability_contract(repo_root: str | Path) -> ControlStabilityContract:
+    repo_root = Path(repo_root)
+    p = repo_root / 'contracts' / 'control_stability_authority_contract.json'
+    return load_cached(p, _build_control_stability_contract)
+
+
 def contract_defaults(contract: ControlStabilityContract) -> Dict[str, Any]:
     d = contract.data.get('defaults')
     return d if isinstance(d, dict) else {}
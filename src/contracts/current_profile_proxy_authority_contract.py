@@ -7,6 +7,8 @@ import hashlib
 import json
 import math
 
+from .registry import load_cached
+
 
 def _canon(x: Any) -> Any:
     if isinstance(x, dict):
@@ -50,7 +52,11 @@ def _repo_root_from_here() -> Path:
 
 def load_current_profile_proxy_contract(repo_root: Path | None = None) -> Tuple[CurrentProfileProxyThresholds, str]:
     rr = repo_root or _repo_root_from_here()
-    p = rr / "contracts" / "current_profile_proxy_authority_contract.json"
+    p = Path(rr) / "contracts" / "current_profile_proxy_authority_contract.json"
+    return load_cached(p, _build_current_profile_proxy_contract)
+
+
+def _build_current_profile_proxy_contract(p: Path) -> Tuple[CurrentProfileProxyThresholds, str]:
     raw = json.loads(p.read_text(encoding="utf-8"))
     canon = _canonical_json(raw)
     sha = hashlib.sha256(canon.encode("utf-8")).hexdigest()
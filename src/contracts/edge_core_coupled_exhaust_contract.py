@@ -22,6 +22,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
 
+from .registry import load_cached
+
 _CONTRACT_PATH = Path(__file__).resolve().parents[2] / "contracts" / "edge_core_coupled_exhaust_contract.json"
 
 
@@ -29,10 +31,20 @@ def _sha256_file(p: Path) -> str:
     return hashlib.sha256(p.read_bytes()).hexdigest()
 
 
-def _load_contract() -> Dict[str, Any]:
-    return json.loads(_CONTRACT_PATH.read_text(encoding="utf-8"))
+def _load_contract(p: Path = _CONTRACT_PATH) -> Dict[str, Any]:
+    return json.loads(p.read_text(encoding="utf-8"))
+
+
+def contract() -> Dict[str, Any]:
+    """The edge–core coupled exhaust contract, via the process-wide registry (reloaded if the file changes)."""
+    return load_cached(_CONTRACT_PATH, _load_contract)
+
+
+def contract_sha256() -> str:
+    return load_cached(_CONTRACT_PATH, _sha256_file)
 
 
+# Import-time snapshot for existing importers; evaluation paths call contract()/contract_sha256().
 CONTRACT: Dict[str, Any] = _load_contract()
 CONTRACT_SHA256: str = _sha256_file(_CONTRACT_PATH)
 
@@ -72,7 +84,7 @@ def apply_edge_core_coupling(
     All caps are algebraic; no back-substitution.
     """
 
-    params = CONTRACT.get("params") or {}
+    params = contract().get("params") or {}
     chi_min = float(params.get("chi_core_min", 0.0))
     chi_max = float(params.get("chi_core_max", 1.0))
     eps = float(params.get("eps_P_SOL_MW", 1e-9))
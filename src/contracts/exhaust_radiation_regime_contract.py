@@ -6,15 +6,24 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
 
+from .registry import load_cached
+
 _CONTRACT_REL_PATH = Path(__file__).resolve().parents[2] / "contracts" / "exhaust_radiation_regime_contract.json"
 
-def _load_contract() -> Dict[str, Any]:
-    p = _CONTRACT_REL_PATH
+def _load_contract(p: Path = _CONTRACT_REL_PATH) -> Dict[str, Any]:
     return json.loads(p.read_text(encoding="utf-8"))
 
 def _sha256_file(p: Path) -> str:
     return hashlib.sha256(p.read_bytes()).hexdigest()
 
+def contract() -> Dict[str, Any]:
+    """The exhaust/radiation regime contract, via the process-wide registry (reloaded if the file changes)."""
+    return load_cached(_CONTRACT_REL_PATH, _load_contract)
+
+def contract_sha256() -> str:
+    return load_cached(_CONTRACT_REL_PATH, _sha256_file)
+
+# Import-time snapshot for existing importers; evaluation paths call contract()/contract_sha256().
 CONTRACT: Dict[str, Any] = _load_contract()
 CONTRACT_SHA256: str = _sha256_file(_CONTRACT_REL_PATH)
 
@@ -53,12 +62,12 @@ class ExhaustRegimeClassification:
             "exhaust_f_rad_div_eff": float(self.f_rad_div_eff),
             "exhaust_radiation_dominated": float(self.radiation_dominated_flag),
             "exhaust_f_sol_div_required": float(self.f_sol_div_required),
-            "exhaust_contract_sha256": str(CONTRACT_SHA256),
+            "exhaust_contract_sha256": str(contract_sha256()),
         }
 
 def classify_fragility(min_margin_frac: float) -> str:
     try:
-        thr = float((CONTRACT.get("global") or {}).get("fragile_margin_frac", 0.05))
+        thr = float((contract().get("global") or {}).get("fragile_margin_frac", 0.05))
     except Exception:
         thr = 0.05
     if min_margin_frac != min_margin_frac:
@@ -104,7 +113,7 @@ def classify_exhaust_regime(
     m_detach_frac = detach_margin / max(thr, 1e-9)
 
     # Radiation-dominated criteria
-    g = CONTRACT.get("global") or {}
+    g = contract().get("global") or {}
     f_rad_dom = float(g.get("radiation_dominated_f_rad_min", 0.90))
     f_req_dom = float(g.get("radiation_required_min", 0.70))
 
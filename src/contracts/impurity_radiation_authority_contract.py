@@ -13,6 +13,8 @@ import json
 import hashlib
 from typing import Any, Dict
 
+from .registry import load_cached
+
 
 @dataclass(frozen=True)
 class ImpurityRadiationAuthorityContract:
@@ -40,6 +42,10 @@ def load_impurity_radiation_contract(repo_root: Path) -> ImpurityRadiationAuthor
     Load contracts/impurity_radiation_authority_contract.json from repo root.
     """
     path = Path(repo_root) / "contracts" / "impurity_radiation_authority_contract.json"
+    return load_cached(path, _build_impurity_radiation_contract)
+
+
+def _build_impurity_radiation_contract(path: Path) -> ImpurityRadiationAuthorityContract:
     raw = json.loads(path.read_text(encoding="utf-8"))
     sha = _sha256_bytes(_canonical_json_bytes(raw))
     return ImpurityRadiationAuthorityContract(
@@ -6,10 +6,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+from .registry import load_cached
+
 _CONTRACT_REL_PATH = Path(__file__).resolve().parents[2] / "contracts" / "magnet_tech_contract.json"
 
-def _load_contract() -> Dict[str, Any]:
-    p = _CONTRACT_REL_PATH
+def _load_contract(p: Path = _CONTRACT_REL_PATH) -> Dict[str, Any]:
     data = json.loads(p.read_text(encoding="utf-8"))
     return data
 
@@ -17,6 +18,14 @@ def _sha256_file(p: Path) -> str:
     b = p.read_bytes()
     return hashlib.sha256(b).hexdigest()
 
+def contract() -> Dict[str, Any]:
+    """The magnet technology contract, via the process-wide registry (reloaded if the file changes)."""
+    return load_cached(_CONTRACT_REL_PATH, _load_contract)
+
+def contract_sha256() -> str:
+    return load_cached(_CONTRACT_REL_PATH, _sha256_file)
+
+# Import-time snapshot for existing importers; evaluation paths call contract()/contract_sha256().
 CONTRACT: Dict[str, Any] = _load_contract()
 CONTRACT_SHA256: str = _sha256_file(_CONTRACT_REL_PATH)
 
@@ -63,7 +72,7 @@ def infer_magnet_regime(magnet_technology: str) -> str:
     return "HTS"
 
 def _regime_entry(regime: str) -> Dict[str, Any]:
-    reg = (CONTRACT.get("regimes") or {}).get(regime, None)
+    reg = (contract().get("regimes") or {}).get(regime, None)
     if not isinstance(reg, dict):
         raise KeyError(f"Unknown magnet regime: {regime}")
     return reg
@@ -107,7 +116,7 @@ def regime_consistent(magnet_technology: str, regime: str) -> bool:
 
 def classify_fragility(min_margin_frac: float) -> str:
     try:
-        thr = float((CONTRACT.get("global") or {}).get("fragile_margin_frac", 0.05))
+        thr = float((contract().get("global") or {}).get("fragile_margin_frac", 0.05))
     except Exception:
         thr = 0.05
     if min_margin_frac != min_margin_frac:
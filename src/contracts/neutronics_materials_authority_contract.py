@@ -7,6 +7,8 @@ import hashlib
 import json
 import math
 
+from .registry import load_cached
+
 
 def _canon(x: Any) -> Any:
     if isinstance(x, dict):
@@ -40,8 +42,12 @@ class NeutronicsMaterialsContract:
         return float((self.data.get("fragility") or {}).get("fragile_margin_frac", 0.10))
 
 
-def load_neutronics_materials_contract(repo_root: Path) -> NeutronicsMaterialsContract:
-    p = repo_root / "contracts" / "neutronics_materials_authority_contract.json"
+def _build_neutronics_materials_contract(p: Path) -> NeutronicsMaterialsContract:
     data = json.loads(p.read_text(encoding="utf-8"))
     sha = _sha256_of_canon_json(data)
     return NeutronicsMaterialsContract(data=data, sha256=sha)
+
+
+def load_neutronics_materials_contract(repo_root: Path) -> NeutronicsMaterialsContract:
+    p = Path(repo_root) / "contracts" / "neutronics_materials_authority_contract.json"
+    return load_cached(p, _build_neutronics_materials_contract)
@@ -10,6 +10,8 @@ import json
 import hashlib
 from typing import Any, Dict, Tuple
 
+from .registry import load_cached
+
 def _canonical_json_bytes(obj: Any) -> bytes:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
@@ -18,7 +20,10 @@ def load_ni_closure_authority_contract(repo_root: Path) -> Tuple[Dict[str, Any],
     Load contracts/ni_closure_authority_contract.json and return (contract_dict, sha256_hex).
     Never mutates input; deterministic bytes via canonical JSON encoding.
     """
-    p = repo_root / "contracts" / "ni_closure_authority_contract.json"
+    p = Path(repo_root) / "contracts" / "ni_closure_authority_contract.json"
+    return load_cached(p, _build_ni_closure_authority_contract)
+
+def _build_ni_closure_authority_contract(p: Path) -> Tuple[Dict[str, Any], str]:
     data = json.loads(p.read_text(encoding="utf-8"))
     h = hashlib.sha256(_canonical_json_bytes(data)).hexdigest()
     return data, h
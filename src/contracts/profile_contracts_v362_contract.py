@@ -19,6 +19,8 @@ import hashlib
 import json
 import math
 
+from .registry import load_cached
+
 
 def _canon(x: Any) -> Any:
     if isinstance(x, dict):
@@ -61,7 +63,11 @@ class ProfileContractsV362:
 
 def load_profile_contracts_v362(repo_root: Path | None = None) -> Tuple[ProfileContractsV362, str]:
     rr = repo_root or _repo_root_from_here()
-    p = rr / "contracts" / "profile_contracts_v362_contract.json"
+    p = Path(rr) / "contracts" / "profile_contracts_v362_contract.json"
+    return load_cached(p, _build_profile_contracts_v362)
+
+
+def _build_profile_contracts_v362(p: Path) -> Tuple[ProfileContractsV362, str]:
     raw = json.loads(p.read_text(encoding="utf-8"))
     canon = _canonical_json(raw)
     sha = hashlib.sha256(canon.encode("utf-8")).hexdigest()
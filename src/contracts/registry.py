@@ -0,0 +1,121 @@
+"""Process-wide contract registry (load + fingerprint once per process).
+
+Every ``src/contracts/*_contract.py`` loader reads a JSON file from
+``<repo>/contracts/``, parses it, canonicalizes it and SHA-256 hashes it.
+Those contracts are immutable within a run, yet ``hot_ion_point`` used to
+repeat the full read/parse/hash cycle for every evaluated point.
+
+This registry memoizes the *loader result* per (loader, file path) and
+revalidates the entry with a single ``os.stat`` call:
+
+- the cached object is reused while ``(st_mtime_ns, st_size)`` is unchanged
+- an edited contract file is reloaded transparently on the next call
+- ``reload()`` drops one or all entries explicitly (tests, UI "refresh")
+- ``stats()`` exposes hit/miss/reload counters for telemetry
+
+Each loader keeps its own canonicalization and hashing rules, so contract
+SHA-256 stamps in outputs are bit-identical to the uncached path.
+
+Cached contract objects are shared; callers must treat them as read-only
+(all in-repo consumers already do).
+
+Author: © 2026 Afshin Arjhangmehr
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class _Entry:
+    stamp: Tuple[int, int]
+    value: Any
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    st = os.stat(path)
+    return (int(st.st_mtime_ns), int(st.st_size))
+
+
+class ContractRegistry:
+    """Thread-safe memo of contract loader results with mtime invalidation."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+
+    def get(self, path: str | Path, build: Callable[[Path], T], *, key: Optional[str] = None) -> T:
+        """Return ``build(path)``, cached until the file's mtime/size changes.
+
+        ``key`` distinguishes loaders that read the same file but build
+        different objects; it defaults to the builder's qualified name.
+        """
+        p = Path(path)
+        k = (str(key or f"{getattr(build, '__module__', '')}.{getattr(build, '__qualname__', repr(build))}"), str(p))
+        stamp = _file_stamp(p)
+        with self._lock:
+            e = self._entries.get(k)
+            if e is not None and e.stamp == stamp:
+                self._hits += 1
+                return e.value
+            if e is not None:
+                self._reloads += 1
+            self._misses += 1
+        # Build outside the lock: loaders do file I/O and hashing.
+        value = build(p)
+        with self._lock:
+            self._entries[k] = _Entry(stamp=stamp, value=value)
+        return value
+
+    def reload(self, path: str | Path | None = None) -> None:
+        """Drop cached entries (all, or only those for ``path``)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            sp = str(Path(path))
+            for k in [k for k in self._entries if k[1] == sp]:
+                del self._entries[k]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": int(len(self._entries)),
+                "hits": int(self._hits),
+                "misses": int(self._misses),
+                "reloads": int(self._reloads),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._reloads = 0
+
+
+_REGISTRY = ContractRegistry()
+
+
+def contract_registry() -> ContractRegistry:
+    """Return the process-wide contract registry."""
+    return _REGISTRY
+
+
+def load_cached(path: str | Path, build: Callable[[Path], T], *, key: Optional[str] = None) -> T:
+    """Convenience wrapper: ``contract_registry().get(path, build, key=key)``."""
+    return _REGISTRY.get(path, build, key=key)
+
+
+def reload_contracts(path: str | Path | None = None) -> None:
+    """Invalidate cached contracts (all, or only those for ``path``)."""
+    _REGISTRY.reload(path)
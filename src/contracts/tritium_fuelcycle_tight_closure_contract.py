@@ -15,6 +15,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
 
+from .registry import load_cached
+
 _CONTRACT_PATH = Path(__file__).resolve().parents[2] / "contracts" / "tritium_fuelcycle_tight_closure_contract.json"
 
 
@@ -22,10 +24,20 @@ def _sha256_file(p: Path) -> str:
     return hashlib.sha256(p.read_bytes()).hexdigest()
 
 
-def _load_contract() -> Dict[str, Any]:
-    return json.loads(_CONTRACT_PATH.read_text(encoding="utf-8"))
+def _load_contract(p: Path = _CONTRACT_PATH) -> Dict[str, Any]:
+    return json.loads(p.read_text(encoding="utf-8"))
+
+
+def contract() -> Dict[str, Any]:
+    """The tritium fuel-cycle contract, via the process-wide registry (reloaded if the file changes)."""
+    return load_cached(_CONTRACT_PATH, _load_contract)
+
+
+def contract_sha256() -> str:
+    return load_cached(_CONTRACT_PATH, _sha256_file)
 
 
+# Import-time snapshot for existing importers; evaluation paths call contract()/contract_sha256().
 CONTRACT: Dict[str, Any] = _load_contract()
 CONTRACT_SHA256: str = _sha256_file(_CONTRACT_PATH)
 
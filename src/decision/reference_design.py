@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 import math
 
-def _get_kpi(art: Dict[str, Any], key: str, default: float = float("nan")) -> float:
+def get_kpi(art: Dict[str, Any], key: str, default: float = float("nan")) -> float:
     kpis = art.get("kpis", {}) if isinstance(art.get("kpis", {}), dict) else {}
     v = kpis.get(key, art.get("outputs", {}).get(key, default))
     try:
@@ -11,7 +11,7 @@ def _get_kpi(art: Dict[str, Any], key: str, default: float = float("nan")) -> fl
     except Exception:
         return default
 
-def _hard_feasible(art: Dict[str, Any]) -> bool:
+def hard_feasible(art: Dict[str, Any]) -> bool:
     cons = art.get("constraints", [])
     ok = True
     for c in cons:
@@ -39,7 +39,7 @@ def synthesize_reference_design(artifacts: List[Dict[str, Any]], *, waive_decisi
     for a in artifacts:
         if not isinstance(a, dict):
             continue
-        if not _hard_feasible(a):
+        if not hard_feasible(a):
             continue
         decision = a.get("decision", {}) if isinstance(a.get("decision", {}), dict) else {}
         if not waive_decision_grade and decision.get("decision_grade_ok") is False:
@@ -53,10 +53,10 @@ def synthesize_reference_design(artifacts: List[Dict[str, Any]], *, waive_decisi
     # Lower is better for COE; higher is better for net power; higher is better for robustness.
     vals = []
     for a in candidates:
-        coe = _get_kpi(a, "COE_$MWh", _get_kpi(a, "coe_$MWh", float("nan")))
-        pnet = _get_kpi(a, "P_e_net_MW", _get_kpi(a, "P_net_MW", float("nan")))
-        prob = _get_kpi(a, "p_feasible", _get_kpi(a, "prob_feasible", float("nan")))
-        mhm = _get_kpi(a, "min_hard_margin", float("nan"))
+        coe = get_kpi(a, "COE_$MWh", get_kpi(a, "coe_$MWh", float("nan")))
+        pnet = get_kpi(a, "P_e_net_MW", get_kpi(a, "P_net_MW", float("nan")))
+        prob = get_kpi(a, "p_feasible", get_kpi(a, "prob_feasible", float("nan")))
+        mhm = get_kpi(a, "min_hard_margin", float("nan"))
         vals.append((coe, pnet, prob, mhm))
 
     # Compute ideal and worst for normalization
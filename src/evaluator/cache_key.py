@@ -14,50 +14,15 @@ Design goals:
 Author: © 2026 Afshin Arjhangmehr
 """
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import is_dataclass
 from typing import Any, Dict
 import hashlib
 import json
-import math
 
-
-def _canon(x: Any) -> Any:
-    """Canonicalize to JSON-safe primitives with stable float handling."""
-    # Dataclasses -> dict
-    if is_dataclass(x):
-        return _canon(asdict(x))
-
-    # Dict -> recurse with sorted keys (enforced later by json.dumps(sort_keys=True))
-    if isinstance(x, dict):
-        return {str(k): _canon(v) for k, v in x.items()}
-
-    # List/Tuple -> list
-    if isinstance(x, (list, tuple)):
-        return [_canon(v) for v in x]
-
-    # Floats -> stable tokens (strings) so JSON serialization is version-stable
-    if isinstance(x, float):
-        if math.isnan(x):
-            return "NaN"
-        if math.isinf(x):
-            return "Infinity" if x > 0 else "-Infinity"
-        # repr(float) is round-trip and stable for a given value
-        return repr(float(x))
-
-    # Int/bool/str/None are already JSON-safe
-    if x is None or isinstance(x, (bool, int, str)):
-        return x
-
-    # Other numeric-like types
-    try:
-        # numpy scalars etc.
-        if hasattr(x, "item"):
-            return _canon(x.item())
-    except Exception:
-        pass
-
-    # Fallback: stable string representation
-    return str(x)
+try:
+    from ..schema.canonical import canonicalize as _canon  # type: ignore
+except Exception:
+    from schema.canonical import canonicalize as _canon  # type: ignore
 
 
 def canonical_json(obj: Any) -> str:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
 import math
+import os
 import time
 
 try:
@@ -12,15 +13,22 @@ except Exception:
 try:
     # Preferred when imported as `src.*`
     from ..physics.hot_ion import hot_ion_point  # type: ignore
+    from ..physics.hot_ion_batch import hot_ion_point_batch, VECTORIZED_KEY  # type: ignore
     from ..calibration.calibration import apply_calibration  # type: ignore
-    from ..provenance.model_cards import model_cards_index  # type: ignore
+    from ..provenance.model_cards import ModelCardsRef, check_model_card_validity, model_cards_index  # type: ignore
+    from ..utils.lru import LRUCache  # type: ignore
 except Exception:
     # Back-compat for entrypoints that add `<repo>/src` to sys.path
     from physics.hot_ion import hot_ion_point  # type: ignore
+    from physics.hot_ion_batch import hot_ion_point_batch, VECTORIZED_KEY  # type: ignore
     from calibration.calibration import apply_calibration  # type: ignore
-    from provenance.model_cards import model_cards_index  # type: ignore
-from .derivatives import get_derivative
+    from provenance.model_cards import ModelCardsRef, check_model_card_validity, model_cards_index  # type: ignore
+    from utils.lru import LRUCache  # type: ignore
 from .cache_key import sha256_cache_key
+from .jacobian import fd_jacobian
+from .persistent_cache import PersistentEvalCache
+
+MODEL_CARD_MODES = ("eager", "lazy")
 
 
 @dataclass
@@ -42,40 +50,84 @@ class Evaluator:
     (precheck/scout/atlas) and other iterative routines.
 
     Cache is an acceleration feature only; it must not change numerical results.
+
+    ``model_cards="lazy"`` is meant for optimizer/scan inner loops that only
+    read scalar KPIs: ``_inputs``, ``model_cards`` and ``model_cards_validity``
+    hold one shared :class:`~provenance.model_cards.ModelCardsRef` instead of
+    per-result copies. ``provenance.model_cards.materialize_model_cards(out)``
+    (called by ``build_run_artifact``) yields the eager audit view exactly.
+
+    ``persistent_cache`` (a :class:`~evaluator.persistent_cache.PersistentEvalCache`
+    or a file path) adds a second, on-disk tier behind the in-memory cache,
+    shared across processes and runs; entries are keyed by the inputs
+    fingerprint, the evaluator label / model-card mode and the code version.
     """
 
-    def __init__(self, *, label: str = "hot_ion_point", cache_enabled: bool = True, cache_max: int = 256):
+    def __init__(
+        self,
+        *,
+        label: str = "hot_ion_point",
+        cache_enabled: bool = True,
+        cache_max: int = 256,
+        cache_max_bytes: Optional[int] = None,
+        model_cards: str = "eager",
+        persistent_cache: Any = None,
+    ):
+        if model_cards not in MODEL_CARD_MODES:
+            raise ValueError(f"model_cards must be one of {MODEL_CARD_MODES}, got {model_cards!r}")
         self.label = str(label)
+        self._model_cards = model_cards
+        self.last_jacobian_info: Dict[str, Any] = {}
         self._cache_enabled = bool(cache_enabled)
         self._cache_max = int(cache_max)
 
         # Memoization cache keyed by sha256(canonical_json(PointInputs))
-        # (stable across Python processes and hash seeds)
-        self._cache: dict[str, EvalResult] = {}
-        self._cache_order: list[str] = []
-
-        # Simple stats for debugging/telemetry
-        self._cache_hits = 0
-        self._cache_misses = 0
-        self._cache_evictions = 0
+        # (stable across Python processes and hash seeds).
+        # O(1) LRU bounded by entry count and, optionally, an approximate
+        # byte budget; thread-safe so one Evaluator can serve a thread pool.
+        self._cache = LRUCache(self._cache_max, max_bytes=cache_max_bytes)
+        # Paths are opened here; cache objects are used as-is (duck-typed so the
+        # ``src.`` and bare import aliases of the module are interchangeable).
+        if isinstance(persistent_cache, (str, os.PathLike)):
+            persistent_cache = PersistentEvalCache(persistent_cache)
+        self._persistent: Optional[PersistentEvalCache] = persistent_cache
+        self._persistent_variant = f"{self.label}|model_cards={model_cards}"
 
     def cache_stats(self) -> Dict[str, Any]:
-        return {
-            "enabled": bool(getattr(self, "_cache_enabled", True)),
-            "max": int(getattr(self, "_cache_max", 0) or 0),
-            "size": int(len(getattr(self, "_cache", {}) or {})),
-            "hits": int(getattr(self, "_cache_hits", 0) or 0),
-            "misses": int(getattr(self, "_cache_misses", 0) or 0),
-            "evictions": int(getattr(self, "_cache_evictions", 0) or 0),
-        }
+        st = self._cache.stats()
+        st["enabled"] = bool(self._cache_enabled)
+        if self._persistent is not None:
+            st["persistent"] = self._persistent.stats()
+        return st
 
     def reset_cache_stats(self) -> None:
-        self._cache_hits = 0
-        self._cache_misses = 0
-        self._cache_evictions = 0
+        self._cache.reset_stats()
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
 
+    @staticmethod
+    def _cache_key(inp: PointInputs, Paux_for_Q_MW: Optional[float] = None) -> str:
+        # Deterministic cache key (canonical JSON -> SHA-256) for caching.
+        # PointInputs serves it from its per-instance fingerprint cache.
+        fingerprint = getattr(inp, "fingerprint", None)
+        if callable(fingerprint):
+            return fingerprint(Paux_for_Q_MW) if Paux_for_Q_MW is not None else fingerprint()
+        cache_payload: Any = (inp, Paux_for_Q_MW) if Paux_for_Q_MW is not None else inp
+        return sha256_cache_key(cache_payload)
+
+    def cache_lookup(self, inp: PointInputs, Paux_for_Q_MW: Optional[float] = None) -> Optional[EvalResult]:
+        """In-memory cache hit for ``inp`` (as ``evaluate`` would return it), or None."""
+        if not self._cache_enabled:
+            return None
+        return self._cache.get(self._cache_key(inp, Paux_for_Q_MW))
+
+    def cache_store(self, res: EvalResult, Paux_for_Q_MW: Optional[float] = None) -> None:
+        """Insert a result computed elsewhere (e.g. by a worker process running an
+        identically configured Evaluator) so later ``evaluate`` calls hit it."""
+        if res.ok and self._cache_enabled:
+            self._cache.put(self._cache_key(res.inp, Paux_for_Q_MW), res)
 
-    
     def evaluate(self, inp: PointInputs, Paux_for_Q_MW: Optional[float] = None) -> EvalResult:
             """
             Evaluate the reactor point model with transparent calibration + provenance.
@@ -88,14 +140,18 @@ class Evaluator:
             """
             t0 = time.perf_counter()
 
-            # Deterministic cache key (canonical JSON -> SHA-256) for caching
-            cache_payload: Any = (inp, Paux_for_Q_MW) if Paux_for_Q_MW is not None else inp
-            cache_key = sha256_cache_key(cache_payload)
-            cache = getattr(self, "_cache", {})
-            if bool(getattr(self, "_cache_enabled", True)) and cache_key in cache:
-                self._cache_hits = int(getattr(self, "_cache_hits", 0) or 0) + 1
-                return cache[cache_key]
-            self._cache_misses = int(getattr(self, "_cache_misses", 0) or 0) + 1
+            cache_key = self._cache_key(inp, Paux_for_Q_MW)
+            if self._cache_enabled:
+                hit = self._cache.get(cache_key)
+                if hit is not None:
+                    return hit
+            if self._persistent is not None:
+                stored = self._persistent.get(cache_key, self._persistent_variant)
+                if stored is not None:
+                    res = EvalResult(inp=inp, out=stored[0], elapsed_s=stored[1], ok=True, message="")
+                    if self._cache_enabled:
+                        self._cache.put(cache_key, res)
+                    return res
 
             ok = True
             msg = ""
@@ -127,26 +183,33 @@ class Evaluator:
                     },
                 }
 
-                # Provide inputs for downstream validity-range selection (if used)
-                out["_inputs"] = dict(getattr(inp, "__dict__", {}))
+                lazy_cards = self._model_cards == "lazy"
+                # Provide inputs for downstream validity-range selection (if used).
+                # Lazy mode reserves the key (same position) and defers the copy.
+                out["_inputs"] = None if lazy_cards else dict(getattr(inp, "__dict__", {}))
 
                 # Apply transparent calibration factors (defaults are 1.0)
                 out = apply_calibration(out, calib)
 
-                # Model cards (auditability / provenance) + validity checks
-                try:
-                    mc_index = model_cards_index()
-                except Exception:
-                    mc_index = {}
-                out["model_cards"] = mc_index
-
-                try:
-                    from provenance.model_cards import check_model_card_validity
-                    out["model_cards_validity"] = check_model_card_validity(
-                        mc_index, out.get("_inputs", {}), out
-                    )
-                except Exception:
-                    out["model_cards_validity"] = {}
+                if lazy_cards:
+                    ref = ModelCardsRef(inp, out)
+                    out["_inputs"] = ref
+                    out["model_cards"] = ref
+                    out["model_cards_validity"] = ref
+                else:
+                    # Model cards (auditability / provenance) + validity checks
+                    try:
+                        mc_index = model_cards_index()
+                    except Exception:
+                        mc_index = {}
+                    out["model_cards"] = mc_index
+
+                    try:
+                        out["model_cards_validity"] = check_model_card_validity(
+                            mc_index, out.get("_inputs", {}), out
+                        )
+                    except Exception:
+                        out["model_cards_validity"] = {}
 
             except Exception as e:
                 out = {}
@@ -156,23 +219,45 @@ class Evaluator:
             elapsed = time.perf_counter() - t0
             res = EvalResult(inp=inp, out=out, elapsed_s=float(elapsed), ok=ok, message=msg)
 
-            # Update cache with simple LRU eviction
-            if ok and bool(getattr(self, "_cache_enabled", True)):
-                if not hasattr(self, "_cache"):
-                    self._cache = {}
-                if not hasattr(self, "_cache_order"):
-                    self._cache_order = []
-                self._cache[cache_key] = res
-                self._cache_order.append(cache_key)
-                if len(self._cache_order) > int(getattr(self, "_cache_max", 256)):
-                    self._cache_evictions = int(getattr(self, "_cache_evictions", 0) or 0) + 1
-                    old = self._cache_order.pop(0)
-                    try:
-                        del self._cache[old]
-                    except Exception:
-                        pass
+            # Update cache (O(1) LRU; evicts oldest entries over count/byte budget)
+            if ok and self._cache_enabled:
+                self._cache.put(cache_key, res)
+            if ok and self._persistent is not None:
+                self._persistent.put(cache_key, self._persistent_variant, out, elapsed)
 
             return res
+
+    def evaluate_batch(
+        self,
+        base: PointInputs,
+        columns: Mapping[str, Sequence[Any]],
+        *,
+        outputs: Optional[Iterable[str]] = None,
+        Paux_for_Q_MW: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Columnar evaluation of ``base`` with ``columns`` varied per row.
+
+        See :func:`physics.hot_ion_batch.hot_ion_point_batch`. Vectorized rows
+        get the same inline confinement calibration as :meth:`evaluate`; rows
+        that need the scalar path go through :meth:`evaluate` (and its cache).
+        """
+
+        def _scalar(inp: PointInputs) -> Dict[str, Any]:
+            res = self.evaluate(inp, Paux_for_Q_MW=Paux_for_Q_MW)
+            if not res.ok:
+                raise RuntimeError(res.message)
+            return res.out
+
+        cols = hot_ion_point_batch(
+            base, columns, outputs=outputs, Paux_for_Q_MW=Paux_for_Q_MW, scalar_fn=_scalar
+        )
+        # apply_calibration scales H98 by the (non-zero) confinement factor.
+        f_conf = float(getattr(base, "calib_confinement", 1.0) or 1.0)
+        vec = cols[VECTORIZED_KEY]
+        if f_conf != 1.0 and "H98" in cols and vec.any():
+            cols["H98"][vec] = cols["H98"][vec] * f_conf
+        return cols
+
     def get(self, inp: PointInputs, key: str, default: float = float("nan")) -> float:
         """Convenience: evaluate and fetch a single output key."""
         res = self.evaluate(inp)
@@ -230,41 +315,27 @@ class Evaluator:
         targets: list[str],
         variables: list[str],
         step_frac: float = 1e-4,
+        scheme: str = "forward",
+        engine: str = "serial",
+        max_workers: Optional[int] = None,
     ) -> list[list[float]]:
         """Hybrid Jacobian: analytic where registered, otherwise finite-difference.
 
-        Returns J with shape (len(targets), len(variables)).
-        """
-        base_res = self.evaluate(base)
-        y0 = {k: float(base_res.out.get(k, float("nan"))) for k in targets}
-        J = [[0.0 for _ in variables] for __ in targets]
-
-        for j, var in enumerate(variables):
-            # analytic partials if available
-            used_any_analytic = False
-            for i, t in enumerate(targets):
-                fn = get_derivative(t, var)
-                if fn is not None:
-                    used_any_analytic = True
-                    try:
-                        J[i][j] = float(fn(base, base_res.out))
-                    except Exception:
-                        J[i][j] = 0.0
-            if used_any_analytic:
-                continue
+        scheme: "forward" | "central" differences for FD columns.
+        engine: "serial" | "batch" | "process" (see :mod:`evaluator.jacobian`).
 
-            # finite diff fallback
-            try:
-                x0 = float(getattr(base, var))
-            except Exception:
-                x0 = float("nan")
-            h = step_frac * max(abs(x0), 1.0) if math.isfinite(x0) else step_frac
-            if h == 0.0:
-                h = step_frac
-            d = base.to_dict()
-            d[var] = (x0 + h) if math.isfinite(x0) else h
-            inp1 = PointInputs.from_dict(d)
-            y1 = self.evaluate(inp1).out
-            for i, t in enumerate(targets):
-                J[i][j] = (float(y1.get(t, float("nan"))) - y0[t]) / h
+        Returns J with shape (len(targets), len(variables)); evaluation count and
+        wall time are kept in ``self.last_jacobian_info``.
+        """
+        J, info = fd_jacobian(
+            self,
+            base,
+            targets=targets,
+            variables=variables,
+            step_frac=step_frac,
+            scheme=scheme,
+            engine=engine,
+            max_workers=max_workers,
+        )
+        self.last_jacobian_info = info
         return J
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+"""
+Persistent, cross-process evaluation cache for SHAMS evaluators.
+
+The :class:`~evaluator.core.Evaluator` memoization cache lives in one process
+and is lost at exit. Campaign reruns and Pareto searches over overlapping
+regions revisit the same points run after run, so this module keeps
+successful evaluations in a single SQLite file:
+
+- key: (inputs fingerprint, evaluator variant, code version); the variant is
+  the evaluator label plus its model-card mode, the code version defaults to
+  the repo ``VERSION`` plus a content hash of ``src/`` (a release bump or any
+  edit to the model sources or their contract data invalidates everything)
+- value: zlib-compressed pickle of ``(out, elapsed_s)`` (compact binary; the
+  file is a local acceleration artifact, never load one from an untrusted
+  source)
+- WAL journaling: any number of readers proceed while one writer commits, so
+  pool workers can share one file; writers wait on ``busy_timeout``
+- LRU eviction under ``max_bytes`` (sum of stored value sizes). Reads only
+  queue recency updates, which are written with the next ``put``/``flush``,
+  so a read-mostly workload does not serialize on the write lock
+
+Cache is an acceleration feature only; a hit returns exactly the outputs
+that were computed and stored for that key.
+
+Author: © 2026 Afshin Arjhangmehr
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Evict down to this fraction of max_bytes so eviction is not run on every put.
+_EVICT_TO = 0.9
+_TOUCH_FLUSH = 256
+
+
+_SOURCE_SUFFIXES = (".py", ".json", ".yaml", ".yml")
+
+
+def source_fingerprint(src_root: str | Path) -> str:
+    """sha256 over the model sources and contract data under ``src_root`` (paths + bytes)."""
+    root = Path(src_root)
+    h = hashlib.sha256()
+    for p in sorted(root.rglob("*")):
+        if p.suffix not in _SOURCE_SUFFIXES or "__pycache__" in p.parts or not p.is_file():
+            continue
+        h.update(p.relative_to(root).as_posix().encode("utf-8"))
+        h.update(b"\0")
+        h.update(p.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def default_code_version() -> str:
+    """``<VERSION>+src.<hash>``: repo release string plus :func:`source_fingerprint` of ``src/``.
+
+    The release string alone misses edits between releases, which would
+    replay stale outputs; computed once per process.
+    """
+    root = Path(__file__).resolve().parents[2]
+    version = "unknown"
+    for name in ("VERSION", "VERSION.txt"):
+        try:
+            v = (root / name).read_text(encoding="utf-8").strip().splitlines()[0].strip()
+            if v:
+                version = v
+                break
+        except Exception:
+            continue
+    return f"{version}+src.{source_fingerprint(root / 'src')[:16]}"
+
+
+class PersistentEvalCache:
+    """Single-file SQLite evaluation cache shared across processes.
+
+    Instances are picklable (the connection is reopened in the receiving
+    process), so an :class:`~evaluator.core.Evaluator` holding one can be
+    shipped to pool workers.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        code_version: Optional[str] = None,
+        timeout_s: float = 30.0,
+    ):
+        self.path = Path(path)
+        self.max_bytes = int(max_bytes)
+        self.code_version = str(code_version) if code_version is not None else default_code_version()
+        self.timeout_s = float(timeout_s)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = -1
+        self._touched: Dict[Tuple[str, str], float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        self.evictions = 0
+        self._connect()
+
+    # -----------------------------
+    # Connection (per process)
+    # -----------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.timeout_s, check_same_thread=False, isolation_level=None)
+        conn.execute(f"PRAGMA busy_timeout={int(self.timeout_s * 1000)}")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""CREATE TABLE IF NOT EXISTS entries (
+            fingerprint TEXT NOT NULL,
+            variant TEXT NOT NULL,
+            code_version TEXT NOT NULL,
+            value BLOB NOT NULL,
+            nbytes INTEGER NOT NULL,
+            last_used REAL NOT NULL,
+            PRIMARY KEY (fingerprint, variant, code_version)
+        ) WITHOUT ROWID""")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries(last_used)")
+        # Running total of value bytes (kept in the same transactions as the entries).
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v INTEGER NOT NULL)")
+        conn.execute("INSERT OR IGNORE INTO meta(k, v) SELECT 'total_bytes', COALESCE(SUM(nbytes), 0) FROM entries")
+        self._conn = conn
+        self._pid = os.getpid()
+        self._touched = {}
+        return conn
+
+    def __getstate__(self) -> Dict[str, Any]:
+        st = dict(self.__dict__)
+        st["_conn"] = None
+        st["_lock"] = None
+        st["_touched"] = {}
+        return st
+
+    def __setstate__(self, st: Dict[str, Any]) -> None:
+        self.__dict__.update(st)
+        self._lock = threading.Lock()
+        self._pid = -1
+
+    # -----------------------------
+    # Get / put
+    # -----------------------------
+
+    def get(self, fingerprint: str, variant: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """``(out, elapsed_s)`` stored for the key, or None."""
+        with self._lock:
+            conn = self._connect()
+            r = conn.execute(
+                "SELECT value FROM entries WHERE fingerprint = ? AND variant = ? AND code_version = ?",
+                (fingerprint, variant, self.code_version),
+            ).fetchone()
+            if r is None:
+                self.misses += 1
+                return None
+            try:
+                out, elapsed_s = pickle.loads(zlib.decompress(r[0]))
+            except Exception:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[(fingerprint, variant)] = time.time()
+            if len(self._touched) >= _TOUCH_FLUSH:
+                self._flush_touches(conn)
+            return out, float(elapsed_s)
+
+    def put(self, fingerprint: str, variant: str, out: Dict[str, Any], elapsed_s: float) -> None:
+        try:
+            blob = zlib.compress(pickle.dumps((out, float(elapsed_s)), protocol=pickle.HIGHEST_PROTOCOL), 6)
+        except Exception:
+            return  # unpicklable outputs are simply not persisted
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._write_touches(conn)
+                prev = conn.execute(
+                    "SELECT nbytes FROM entries WHERE fingerprint = ? AND variant = ? AND code_version = ?",
+                    (fingerprint, variant, self.code_version),
+                ).fetchone()
+                self._add_bytes(conn, len(blob) - (int(prev[0]) if prev else 0))
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries(fingerprint, variant, code_version, value, nbytes, last_used) "
+                    "VALUES (?,?,?,?,?,?)",
+                    (fingerprint, variant, self.code_version, blob, len(blob), time.time()),
+                )
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self.puts += 1
+
+    def _write_touches(self, conn: sqlite3.Connection) -> None:
+        if self._touched:
+            conn.executemany(
+                "UPDATE entries SET last_used = MAX(last_used, ?) WHERE fingerprint = ? AND variant = ? AND code_version = ?",
+                [(t, fp, var, self.code_version) for (fp, var), t in self._touched.items()],
+            )
+            self._touched = {}
+
+    def _flush_touches(self, conn: sqlite3.Connection) -> None:
+        if not self._touched:
+            return
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self._write_touches(conn)
+            conn.execute("COMMIT")
+        except sqlite3.OperationalError:
+            # Write lock busy: recency is advisory, keep the reads going.
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.OperationalError:
+                pass
+
+    @staticmethod
+    def _add_bytes(conn: sqlite3.Connection, delta: int) -> None:
+        conn.execute("UPDATE meta SET v = v + ? WHERE k = 'total_bytes'", (int(delta),))
+
+    @staticmethod
+    def _total_bytes(conn: sqlite3.Connection) -> int:
+        r = conn.execute("SELECT v FROM meta WHERE k = 'total_bytes'").fetchone()
+        return int(r[0]) if r else 0
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = self._total_bytes(conn)
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * _EVICT_TO)
+        victims: List[Tuple[str, str, str]] = []
+        freed = 0
+        for fp, var, ver, nb in conn.execute(
+            "SELECT fingerprint, variant, code_version, nbytes FROM entries ORDER BY last_used"
+        ):
+            if total - freed <= target:
+                break
+            victims.append((fp, var, ver))
+            freed += int(nb)
+        self._add_bytes(conn, -freed)
+        conn.executemany(
+            "DELETE FROM entries WHERE fingerprint = ? AND variant = ? AND code_version = ?", victims
+        )
+        self.evictions += len(victims)
+
+    # -----------------------------
+    # Maintenance
+    # -----------------------------
+
+    def flush(self) -> None:
+        """Write queued recency updates."""
+        with self._lock:
+            self._flush_touches(self._connect())
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM entries")
+            conn.execute("UPDATE meta SET v = 0 WHERE k = 'total_bytes'")
+            conn.execute("COMMIT")
+            self._touched = {}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            n = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            total = self._total_bytes(conn)
+        return {
+            "path": str(self.path),
+            "code_version": self.code_version,
+            "entries": int(n),
+            "bytes": int(total),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "puts": self.puts,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._flush_touches(self._conn)
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+            self._conn = None
@@ -0,0 +1,448 @@
+"""Long-lived, pre-warmed evaluation worker pool.
+
+``run_study`` and ``pareto_optimize`` used to start a fresh spawn-context
+``ProcessPoolExecutor`` per call, so every study paid for re-importing the
+physics stack and reloading the authority contracts in each worker, and
+campaigns / uncertainty contracts had no pool at all. :class:`WarmWorkerPool`
+keeps its workers alive across jobs:
+
+- workers import the evaluation stack and compile the constraint plan once at
+  start-up (``DEFAULT_WARM``), before any task is dispatched;
+- process-level caches (``evaluator_bridge`` Evaluators keyed by origin, the
+  compiled Lz tables, authority specs) stay hot from one job to the next;
+- each worker runs one task at a time over its own pipe, so a worker that
+  dies (segfault, ``os._exit``, OOM kill) fails only its own task with
+  :class:`WorkerCrashed`, and a task exceeding its timeout fails with
+  :class:`TaskTimeout`; in both cases the worker is replaced and the other
+  tasks carry on (a ``ProcessPoolExecutor`` breaks as a whole instead);
+- ``submit`` returns a ``concurrent.futures.Future``, so drivers keep using
+  ``as_completed`` / ``asyncio.wrap_future`` unchanged.
+
+Drivers opt in by taking a ``pool`` argument; :func:`get_worker_pool` is the
+shared process-wide instance (``SHAMS_POOL_WORKERS`` sets its size). Tasks and
+their arguments must be picklable module-level callables, as for any spawn
+pool.
+"""
+from __future__ import annotations
+
+import atexit
+import importlib
+import itertools
+import multiprocessing as mp
+import os
+import pickle
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import wait as _wait_connections
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Package prefix ("src." or "") so warm-up imports the same module copies the tasks use.
+_PKG = __name__[: -len("evaluator.worker_pool")]
+
+# Imported (``module``) or called (``module:function``, no arguments) in each new worker.
+DEFAULT_WARM: Tuple[str, ...] = (
+    "evaluator.core",
+    "solvers.evaluator_bridge",
+    "solvers.constraint_solver",
+    "constraints.constraints",
+    "shams_io.run_artifact",
+    "constraints.authority_registry:load_authority_specs",
+    "constraints.plan:get_constraint_plan",
+)
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker process running a task exited before returning a result."""
+
+
+class TaskTimeout(TimeoutError):
+    """A task ran longer than its timeout; its worker was terminated and replaced."""
+
+
+# -----------------------------
+# Worker side
+# -----------------------------
+
+
+def _warm(entries: Sequence[str]) -> None:
+    for entry in entries:
+        mod_name, _, fn_name = str(entry).partition(":")
+        try:
+            mod = importlib.import_module(_PKG + mod_name)
+            if fn_name:
+                getattr(mod, fn_name)()
+        except Exception:
+            continue  # warm-up is best effort; the task imports what it needs
+
+
+def _worker_main(conn: Any, warm: Sequence[str]) -> None:
+    _warm(warm)
+    conn.send_bytes(pickle.dumps(("ready", None, os.getpid())))
+    while True:
+        try:
+            msg = conn.recv_bytes()
+        except (EOFError, OSError):
+            return  # parent went away
+        if not msg:
+            return  # orderly shutdown
+        tid, payload = pickle.loads(msg)
+        try:
+            fn, args, kwargs = pickle.loads(payload)
+            reply = ("ok", tid, fn(*args, **kwargs))
+        except BaseException as e:  # reported on the task's future
+            reply = ("err", tid, _portable_exception(e))
+        try:
+            data = pickle.dumps(reply)
+        except Exception as e:
+            data = pickle.dumps(("err", tid, RuntimeError(f"task result is not picklable: {type(e).__name__}: {e}")))
+        conn.send_bytes(data)
+
+
+def _portable_exception(e: BaseException) -> BaseException:
+    tb = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+    try:
+        pickle.loads(pickle.dumps(e))
+        e.__cause__ = None
+        e.__context__ = None
+        e.__traceback__ = None
+        setattr(e, "remote_traceback", tb)
+        return e
+    except Exception:
+        return RuntimeError(f"{type(e).__name__}: {e}\n\nRemote traceback:\n{tb}")
+
+
+# -----------------------------
+# Parent side
+# -----------------------------
+
+
+class _Task:
+    __slots__ = ("tid", "payload", "future", "timeout_s")
+
+    def __init__(self, tid: int, payload: bytes, future: Future, timeout_s: Optional[float]) -> None:
+        self.tid = tid
+        self.payload = payload
+        self.future = future
+        self.timeout_s = timeout_s
+
+
+class _Worker:
+    __slots__ = ("proc", "conn", "ready", "task", "deadline", "n_done")
+
+    def __init__(self, proc: Any, conn: Any) -> None:
+        self.proc = proc
+        self.conn = conn
+        self.ready = False
+        self.task: Optional[_Task] = None
+        self.deadline: Optional[float] = None
+        self.n_done = 0
+
+
+class WarmWorkerPool:
+    """Process pool whose workers stay alive (and warm) across jobs.
+
+    ``task_timeout_s`` is the default per-task timeout (None: unlimited),
+    counted from dispatch to a worker. ``max_tasks_per_worker`` recycles a
+    worker after that many tasks (None: never).
+    """
+
+    # Failures meaning "the task was lost", not "the task raised" (drivers
+    # test against these instead of importing the classes, which may come
+    # from either the ``src.`` or the bare module copy).
+    LOST_TASK_ERRORS: Tuple[type, ...] = (WorkerCrashed, TaskTimeout)
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        *,
+        warm: Sequence[str] = DEFAULT_WARM,
+        task_timeout_s: Optional[float] = None,
+        max_tasks_per_worker: Optional[int] = None,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers or os.cpu_count() or 1))
+        self.task_timeout_s = task_timeout_s
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._warm_entries = tuple(warm)
+        self._ctx = mp.get_context("spawn")
+        self._lock = threading.RLock()  # future callbacks run under it and may submit
+        self._pending: Deque[_Task] = deque()
+        self._workers: List[_Worker] = []
+        self._ids = itertools.count()
+        self._wake_r, self._wake_w = self._ctx.Pipe(duplex=False)
+        self._shutdown = False
+        self._broken = ""
+        self._startup_failures = 0
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "crashes": 0, "timeouts": 0, "workers_started": 0}
+        self._ready_cv = threading.Condition(self._lock)
+        self._thread = threading.Thread(target=self._run, name="shams-warm-pool", daemon=True)
+        self._thread.start()
+
+    # ---- public API ----
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, timeout_s: Optional[float] = None, **kwargs: Any) -> Future:
+        """Schedule ``fn(*args, **kwargs)``; ``timeout_s`` overrides the pool default."""
+        fut: Future = Future()
+        try:
+            payload = pickle.dumps((fn, args, kwargs))
+        except Exception as e:
+            fut.set_exception(e)
+            return fut
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit to a shut-down WarmWorkerPool")
+            if self._broken:
+                raise RuntimeError(self._broken)
+            t = timeout_s if timeout_s is not None else self.task_timeout_s
+            self._pending.append(_Task(next(self._ids), payload, fut, t))
+            self._stats["submitted"] += 1
+            self._wake_w.send_bytes(b"s")
+        return fut
+
+    def map(
+        self,
+        fn: Callable[..., Any],
+        iterable: Iterable[Any],
+        *,
+        timeout_s: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """``[fn(x) for x in iterable]`` in input order.
+
+        With ``return_exceptions=True`` a failed task (including
+        :class:`WorkerCrashed` / :class:`TaskTimeout`) yields its exception in
+        place of the result; otherwise the first failure in order is raised
+        after every task has finished.
+        """
+        futs = [self.submit(fn, x, timeout_s=timeout_s) for x in iterable]
+        out: List[Any] = []
+        first_error: Optional[BaseException] = None
+        for f in futs:
+            e = f.exception()
+            if e is None:
+                out.append(f.result())
+            else:
+                out.append(e)
+                first_error = first_error or e
+        if first_error is not None and not return_exceptions:
+            raise first_error
+        return out
+
+    def wait_ready(self, timeout_s: Optional[float] = None) -> bool:
+        """Block until every worker finished warming up (True) or the timeout passed."""
+        end = None if timeout_s is None else time.monotonic() + float(timeout_s)
+        with self._ready_cv:
+            while not self._shutdown and not self._broken:
+                if sum(1 for w in self._workers if w.ready) >= self.max_workers:
+                    return True
+                left = None if end is None else end - time.monotonic()
+                if left is not None and left <= 0:
+                    return False
+                self._ready_cv.wait(left)
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            d = dict(self._stats)
+            d.update(
+                max_workers=self.max_workers,
+                n_workers=len(self._workers),
+                n_ready=sum(1 for w in self._workers if w.ready),
+                n_busy=sum(1 for w in self._workers if w.task is not None),
+                n_pending=len(self._pending),
+            )
+        return d
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                while self._pending:
+                    self._pending.popleft().future.cancel()
+            self._wake_w.send_bytes(b"q")
+        if wait:
+            self._thread.join()
+
+    def __enter__(self) -> "WarmWorkerPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown(wait=True)
+
+    # ---- dispatcher thread ----
+
+    def _spawn(self) -> None:
+        parent, child = self._ctx.Pipe(duplex=True)
+        proc = self._ctx.Process(target=_worker_main, args=(child, self._warm_entries), name="shams-warm-worker")
+        proc.start()
+        child.close()
+        self._workers.append(_Worker(proc, parent))
+        self._stats["workers_started"] += 1
+
+    def _retire(self, w: _Worker, *, kill: bool = False) -> None:
+        if w in self._workers:
+            self._workers.remove(w)
+        try:
+            if kill:
+                w.proc.terminate()
+            else:
+                w.conn.send_bytes(b"")
+        except Exception:
+            pass
+        w.proc.join(timeout=5.0)
+        if w.proc.is_alive():
+            w.proc.kill()
+            w.proc.join()
+        w.conn.close()
+
+    def _fail(self, w: _Worker, exc: BaseException, counter: str) -> None:
+        task = w.task
+        w.task = None
+        if task is not None:
+            self._stats[counter] += 1
+            self._stats["failed"] += 1
+            task.future.set_exception(exc)
+
+    def _dispatch(self) -> None:
+        for w in self._workers:
+            if not self._pending:
+                return
+            if not w.ready or w.task is not None:
+                continue
+            while self._pending:
+                task = self._pending.popleft()
+                if not task.future.set_running_or_notify_cancel():
+                    continue  # cancelled while queued
+                w.task = task
+                w.deadline = None if task.timeout_s is None else time.monotonic() + float(task.timeout_s)
+                try:
+                    w.conn.send_bytes(pickle.dumps((task.tid, task.payload)))
+                except Exception:
+                    pass  # dead pipe: the sentinel reports the crash
+                break
+
+    def _on_message(self, w: _Worker) -> None:
+        try:
+            kind, tid, value = pickle.loads(w.conn.recv_bytes())
+        except Exception:
+            self._on_exit(w)
+            return
+        if kind == "ready":
+            w.ready = True
+            self._startup_failures = 0
+            self._ready_cv.notify_all()
+            return
+        task, w.task, w.deadline = w.task, None, None
+        if task is None or task.tid != tid:
+            return
+        w.n_done += 1
+        if kind == "ok":
+            self._stats["completed"] += 1
+            task.future.set_result(value)
+        else:
+            self._stats["failed"] += 1
+            task.future.set_exception(value)
+        if self.max_tasks_per_worker and w.n_done >= int(self.max_tasks_per_worker):
+            self._retire(w)
+
+    def _on_exit(self, w: _Worker) -> None:
+        w.proc.join(timeout=1.0)
+        code = w.proc.exitcode
+        if not w.ready:
+            self._startup_failures += 1
+        self._fail(w, WorkerCrashed(f"worker pid {w.proc.pid} exited with code {code} while running the task"), "crashes")
+        self._retire(w, kill=True)
+        if self._startup_failures >= 3:
+            self._broken = f"WarmWorkerPool workers fail to start (last exit code {code})"
+            while self._pending:
+                t = self._pending.popleft()
+                if t.future.set_running_or_notify_cancel():
+                    t.future.set_exception(WorkerCrashed(self._broken))
+            self._ready_cv.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._shutdown and not self._pending and all(w.task is None for w in self._workers):
+                    break
+                if not self._broken:
+                    while len(self._workers) < self.max_workers:
+                        self._spawn()
+                self._dispatch()
+                waitables: List[Any] = [self._wake_r]
+                for w in self._workers:
+                    waitables += [w.conn, w.proc.sentinel]
+                deadlines = [w.deadline for w in self._workers if w.deadline is not None]
+            timeout = None if not deadlines else max(0.0, min(deadlines) - time.monotonic())
+            ready = set(_wait_connections(waitables, timeout))
+            with self._lock:
+                if self._wake_r in ready:
+                    while self._wake_r.poll():
+                        self._wake_r.recv_bytes()
+                now = time.monotonic()
+                for w in list(self._workers):
+                    if w.conn in ready:
+                        self._on_message(w)
+                    elif w.proc.sentinel in ready:
+                        self._on_exit(w)
+                    elif w.deadline is not None and now >= w.deadline:
+                        t = w.task.timeout_s if w.task is not None else None
+                        self._fail(w, TaskTimeout(f"task exceeded its {t} s timeout; worker pid {w.proc.pid} terminated"), "timeouts")
+                        self._retire(w, kill=True)
+        with self._lock:
+            for w in list(self._workers):
+                self._retire(w)
+            self._ready_cv.notify_all()
+
+
+# -----------------------------
+# Shared instance and stock tasks
+# -----------------------------
+
+_SHARED: Optional[WarmWorkerPool] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def _env_workers() -> int:
+    try:
+        n = int(os.environ.get("SHAMS_POOL_WORKERS", "") or 0)
+    except ValueError:
+        n = 0
+    return max(1, n or (os.cpu_count() or 1))
+
+
+def get_worker_pool(max_workers: Optional[int] = None) -> WarmWorkerPool:
+    """Process-wide warm pool (created on first use; ``SHAMS_POOL_WORKERS`` sets its size)."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = WarmWorkerPool(max_workers or _env_workers())
+        return _SHARED
+
+
+def shutdown_worker_pool(*, cancel_futures: bool = True) -> None:
+    """Stop the shared pool (also runs at exit); the next ``get_worker_pool`` starts a new one."""
+    global _SHARED
+    with _SHARED_LOCK:
+        pool, _SHARED = _SHARED, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=cancel_futures)
+
+
+atexit.register(shutdown_worker_pool)
+
+
+def evaluate_outputs_task(inputs: Any, origin: str = "worker_pool", Paux_for_Q_MW: Optional[float] = None) -> Dict[str, Any]:
+    """Pool task: outputs of one point from the worker's pooled Evaluator (``evaluator_bridge``).
+
+    ``inputs`` is a ``PointInputs`` or its dict; the Evaluator for ``origin``
+    and its cache persist in the worker across jobs.
+    """
+    bridge = importlib.import_module(_PKG + "solvers.evaluator_bridge")
+    if isinstance(inputs, dict):
+        inputs = bridge.PointInputs.from_dict(inputs)
+    return bridge.evaluate_point(inputs, origin=str(origin), Paux_for_Q_MW=Paux_for_Q_MW)
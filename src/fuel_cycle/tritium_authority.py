@@ -160,8 +160,8 @@ def compute_tritium_authority(out: Dict[str, Any], inp_dict: Dict[str, Any]) ->
     # Contract fingerprint (if available)
     contract_sha = ""
     try:
-        from contracts.tritium_fuelcycle_tight_closure_contract import CONTRACT_SHA256  # type: ignore
-        contract_sha = str(CONTRACT_SHA256)
+        from contracts.tritium_fuelcycle_tight_closure_contract import contract_sha256  # type: ignore
+        contract_sha = str(contract_sha256())
     except Exception:
         contract_sha = ""
 
@@ -20,6 +20,11 @@ from typing import Any, Dict, List, Optional, Tuple
 import hashlib
 import math
 
+try:
+    from ..contracts.registry import load_cached  # type: ignore
+except Exception:
+    from contracts.registry import load_cached  # type: ignore
+
 
 def _finite(x: float) -> bool:
     return (x == x) and math.isfinite(x)
@@ -220,7 +225,7 @@ def compute_maintenance_schedule_v368(out: Dict[str, Any], inp: Any) -> Maintena
     try:
         here = Path(__file__).resolve()
         contract_path = here.parents[2] / "contracts" / "maintenance_scheduling_v368_contract.json"
-        contract_sha = _sha256_file(contract_path)
+        contract_sha = load_cached(contract_path, _sha256_file)
     except Exception:
         contract_sha = ""
 
@@ -10,7 +10,8 @@ Propose-only multi-objective search **outside** L0. The driver:
 * Pure-Python NSGA-II (seeded) as ``nsga2_fallback``; optional ``pymoo``
   backend as ``nsga2`` when installed (not a required dependency).
 * Reuses ``solvers.optimize.dominates`` / ``pareto_front`` for nondominated
-  filtering — does not reinvent Pareto algebra.
+  filtering — does not reinvent Pareto algebra; population sorting and
+  crowding run on ``solvers.pareto_engine`` (same relation, NumPy-backed).
 * Emits stamp-ready shortlist + CCFS hooks; dominated / REJECTED rows carry
   ``no_solution_atlas.v1`` dominant hard mechanism (Phase 3.2).
 
@@ -20,7 +21,9 @@ Driver ids: ``nsga2`` | ``nsga2_fallback``.
 from __future__ import annotations
 
 import math
+import os
 import random
+import time
 from dataclasses import dataclass, field, replace
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
@@ -247,29 +250,25 @@ def _metric_vector(
 
 def _constraint_violation(out: Mapping[str, Any]) -> float:
     """Non-negative violation measure for constrained domination (infeasible only)."""
+    return _governance_feasibility(out)[1]
+
+
+def _governance_feasibility(out: Mapping[str, Any]) -> Tuple[bool, float]:
+    """``(hard_feasible, violation)`` from one compiled-plan pass over the governance set.
+
+    Same verdict as ``build_all_constraints(out).governance_feasible``; the
+    violation counts failing hard constraints (governance records carry no
+    fractional margin, so each contributes 1.0). Skips the ledger/parity
+    pipelines, which the search never reads.
+    """
     try:
-        from constraints.unified import build_all_constraints  # type: ignore
-        from constraints.constraints import constraint_is_hard  # type: ignore
+        from constraints.plan import evaluate_constraint_batch  # type: ignore
     except ImportError:
-        from src.constraints.unified import build_all_constraints  # type: ignore
-        from src.constraints.constraints import constraint_is_hard  # type: ignore
+        from src.constraints.plan import evaluate_constraint_batch  # type: ignore
 
-    bundle = build_all_constraints(dict(out))
-    viol = 0.0
-    for c in list(getattr(bundle, "governance", []) or []):
-        if not constraint_is_hard(c):
-            continue
-        if bool(getattr(c, "passed", False)):
-            continue
-        mf = getattr(c, "margin_frac", None)
-        if mf is None:
-            viol += 1.0
-        else:
-            try:
-                viol += max(0.0, -float(mf))
-            except Exception:
-                viol += 1.0
-    return float(viol)
+    batch = evaluate_constraint_batch([dict(out)], keep_rows=False)
+    failing = batch.hard[0] & batch.evaluated[0] & ~batch.passed[0]
+    return bool(batch.feasible[0]), float(failing.sum())
 
 
 def _import_dominates():
@@ -360,6 +359,11 @@ class Nsga2SearchResult:
     atlas_dominatee_hook: Dict[str, Any] = field(
         default_factory=lambda: dict(ATLAS_DOMINATEE_HOOK)
     )
+    # Fallback driver only: one entry per evaluated generation (0 = initial
+    # population) with n_individuals / n_evaluated / n_duplicates / wall_s /
+    # evals_per_s. Timing is diagnostic and never part of the stamp.
+    generation_stats: Tuple[Dict[str, Any], ...] = ()
+    max_workers: int = 1
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -379,6 +383,8 @@ class Nsga2SearchResult:
             "certification_required": "CCFS",
             "atlas_dominatee_hook": dict(self.atlas_dominatee_hook or ATLAS_DOMINATEE_HOOK),
             "feasible_first": True,
+            "generation_stats": [dict(g) for g in self.generation_stats],
+            "max_workers": int(self.max_workers),
         }
 
     def to_ccfs_bundle(self) -> Dict[str, Any]:
@@ -467,40 +473,38 @@ class Nsga2SearchResult:
         return rows
 
 
+def _import_pareto_engine():
+    try:
+        from solvers import pareto_engine  # type: ignore
+    except ImportError:
+        from src.solvers import pareto_engine  # type: ignore
+    return pareto_engine
+
+
 def _fast_nondominated_sort(
     individuals: List[Dict[str, Any]],
     objectives: Mapping[str, str],
 ) -> List[List[int]]:
-    """NSGA-II fast nondominated sort using constrained domination."""
-    n = len(individuals)
-    S: List[List[int]] = [[] for _ in range(n)]
-    n_dom = [0] * n
-    fronts: List[List[int]] = [[]]
-
-    for p in range(n):
-        for q in range(n):
-            if p == q:
-                continue
-            if _constrained_dominates(individuals[p], individuals[q], objectives):
-                S[p].append(q)
-            elif _constrained_dominates(individuals[q], individuals[p], objectives):
-                n_dom[p] += 1
-        if n_dom[p] == 0:
-            individuals[p]["front_rank"] = 0
-            fronts[0].append(p)
-
-    i = 0
-    while fronts[i]:
-        nxt: List[int] = []
-        for p in fronts[i]:
-            for q in S[p]:
-                n_dom[q] -= 1
-                if n_dom[q] == 0:
-                    individuals[q]["front_rank"] = i + 1
-                    nxt.append(q)
-        i += 1
-        fronts.append(nxt)
-    return fronts[:-1]
+    """NSGA-II nondominated sort using constrained domination.
+
+    Same relation as ``_constrained_dominates``, evaluated on a metric matrix
+    + violation vector by ``solvers.pareto_engine`` (sort-based). Members are
+    listed in the pairwise algorithm's discovery order, which crowding-distance
+    tie breaks depend on.
+    """
+    if not individuals:
+        return []
+    eng = _import_pareto_engine()
+    keys = list(objectives.keys())
+    F = eng.metric_matrix([ind.get("metrics") or {} for ind in individuals], keys)
+    feasible = [bool(ind.get("feasible")) for ind in individuals]
+    violation = [float(ind.get("violation", 0.0)) for ind in individuals]
+    senses = [objectives[k] for k in keys]
+    ranks = eng.constrained_front_ranks(F, senses, feasible, violation)
+    for ind, r in zip(individuals, ranks.tolist()):
+        ind["front_rank"] = int(r)
+    fronts = eng.discovery_order_fronts(ranks, eng.minimization_form(F, senses), feasible, violation)
+    return [fr.tolist() for fr in fronts]
 
 
 def _crowding_distance(
@@ -509,34 +513,12 @@ def _crowding_distance(
     objectives: Mapping[str, str],
 ) -> None:
     """Assign crowding_distance on individuals for indices in ``front``."""
-    if not front:
+    if not len(front):
         return
-    for idx in front:
-        individuals[idx]["crowding_distance"] = 0.0
-    keys = list(objectives.keys())
-    for key in keys:
-        sorted_idx = sorted(
-            front,
-            key=lambda i: float((individuals[i].get("metrics") or {}).get(key, float("nan"))),
-        )
-        individuals[sorted_idx[0]]["crowding_distance"] = float("inf")
-        individuals[sorted_idx[-1]]["crowding_distance"] = float("inf")
-        vals = [
-            float((individuals[i].get("metrics") or {}).get(key, float("nan")))
-            for i in sorted_idx
-        ]
-        finite = [v for v in vals if math.isfinite(v)]
-        if len(finite) < 2:
-            continue
-        span = max(finite) - min(finite)
-        if span <= 0.0:
-            continue
-        for j in range(1, len(sorted_idx) - 1):
-            if not (math.isfinite(vals[j - 1]) and math.isfinite(vals[j + 1])):
-                continue
-            individuals[sorted_idx[j]]["crowding_distance"] = float(
-                individuals[sorted_idx[j]]["crowding_distance"]
-            ) + (vals[j + 1] - vals[j - 1]) / span
+    eng = _import_pareto_engine()
+    F = eng.metric_matrix([individuals[i].get("metrics") or {} for i in front], list(objectives.keys()))
+    for idx, d in zip(front, eng.crowding_distance(F).tolist()):
+        individuals[idx]["crowding_distance"] = float(d)
 
 
 def _tournament(
@@ -617,30 +599,158 @@ def _eval_individual(
     origin: str,
     eval_counter: List[int],
 ) -> Dict[str, Any]:
+    """Compact search row: decision vector + scores only.
+
+    The full inputs dict and the infeasible-row atlas are rebuilt from
+    ``(base, names, x)`` by ``_materialize_individual`` for rows that reach
+    the shortlist / export, so a long run keeps no per-individual copies.
+    """
     xc = _clip(x, bound_pairs)
     inp = _apply_x(base, names, xc)
     out = _evaluate_outputs(inp, origin=origin)
     eval_counter[0] += 1
-    feas = _hard_feasible(out)
+    feas, viol = _governance_feasibility(out)
     metrics = _metric_vector(out, multi)
-    viol = 0.0 if feas else _constraint_violation(out)
-    row: Dict[str, Any] = {
+    return {
         "x": list(xc),
-        "inputs": _point_to_dict(inp),
         "metrics": metrics,
         "feasible": feas,
         "violation": float(viol),
         "front_rank": 10**9,
         "crowding_distance": 0.0,
     }
+
+
+def _materialize_individual(
+    row: Mapping[str, Any],
+    *,
+    names: Sequence[str],
+    base: Any,
+    origin: str,
+) -> Dict[str, Any]:
+    """Full row for export: ``inputs`` dict and, when hard-infeasible, ``no_solution_atlas``.
+
+    The atlas is rebuilt from the (deterministic, normally cached) evaluator
+    outputs of the same point; this is not counted as a search evaluation.
+    """
+    full = dict(row)
+    if "inputs" in full:
+        return full
+    inp = _apply_x(base, names, full["x"])
+    full["inputs"] = _point_to_dict(inp)
     # Phase 3.2: hard-infeasible search individuals carry atlas (propose-only stamp).
-    if not feas:
+    if not bool(full.get("feasible")):
         intent = getattr(inp, "design_intent", None)
-        row["no_solution_atlas"] = _atlas_for_outputs(
-            out,
+        full["no_solution_atlas"] = _atlas_for_outputs(
+            _evaluate_outputs(inp, origin=origin),
             design_intent=str(intent) if intent else None,
         )
-    return row
+    return full
+
+
+# -----------------------------
+# Population evaluation (serial or process pool)
+# -----------------------------
+
+# Per-worker evaluation context, set once by _init_nsga2_worker (lives in the worker process).
+_WORKER_CTX: Dict[str, Any] = {}
+
+
+def _init_nsga2_worker(ctx: Dict[str, Any]) -> None:
+    """Worker initializer: build this process's Evaluator once under the run origin."""
+    _WORKER_CTX.clear()
+    _WORKER_CTX.update(ctx)
+    try:
+        _evaluate_outputs(ctx["base"], origin=str(ctx["origin"]))
+    except Exception:
+        pass
+
+
+def _eval_individual_worker(x: Sequence[float]) -> Dict[str, Any]:
+    c = _WORKER_CTX
+    return _eval_individual(
+        x=x,
+        names=c["names"],
+        bound_pairs=c["bound_pairs"],
+        base=c["base"],
+        multi=c["multi"],
+        origin=c["origin"],
+        eval_counter=[0],
+    )
+
+
+def _eval_population(
+    xs: Sequence[Sequence[float]],
+    *,
+    names: Sequence[str],
+    bound_pairs: Sequence[Tuple[float, float]],
+    base: Any,
+    multi: MultiObjectiveContract,
+    origin: str,
+    eval_counter: List[int],
+    executor: Any = None,
+    generation: int = 0,
+    stats: Optional[List[Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """Evaluate ``xs`` in order; identical clipped vectors are evaluated once.
+
+    ``executor`` (a process pool) maps the unique vectors across workers; its
+    ordered ``map`` keeps the result order identical to the serial path.
+    """
+    t0 = time.perf_counter()
+    clipped = [tuple(_clip(x, bound_pairs)) for x in xs]
+    first: Dict[Tuple[float, ...], int] = {}
+    unique: List[Tuple[float, ...]] = []
+    for xc in clipped:
+        if xc not in first:
+            first[xc] = len(unique)
+            unique.append(xc)
+    if executor is not None and len(unique) > 1:
+        rows = list(executor.map(_eval_individual_worker, [list(u) for u in unique]))
+        eval_counter[0] += len(unique)
+    else:
+        rows = [
+            _eval_individual(
+                x=list(u),
+                names=names,
+                bound_pairs=bound_pairs,
+                base=base,
+                multi=multi,
+                origin=origin,
+                eval_counter=eval_counter,
+            )
+            for u in unique
+        ]
+    used = [False] * len(rows)
+    out: List[Dict[str, Any]] = []
+    for xc in clipped:
+        j = first[xc]
+        # Duplicates get their own row (front_rank / crowding are per individual);
+        # the x / metrics payloads are never mutated and stay shared.
+        out.append(dict(rows[j]) if used[j] else rows[j])
+        used[j] = True
+    if stats is not None:
+        wall = time.perf_counter() - t0
+        stats.append(
+            {
+                "generation": int(generation),
+                "n_individuals": len(clipped),
+                "n_evaluated": len(unique),
+                "n_duplicates": len(clipped) - len(unique),
+                "wall_s": float(wall),
+                "evals_per_s": float(len(unique) / wall) if wall > 0.0 else 0.0,
+            }
+        )
+    return out
+
+
+def _resolve_workers(max_workers: Optional[int]) -> int:
+    if max_workers is None:
+        return 1
+    n = int(max_workers)
+    if n <= 0:
+        n = os.cpu_count() or 1
+    return max(1, n)
 
 
 def _select_next_generation(
@@ -679,11 +789,18 @@ def _run_nsga2_fallback(
     n_generations: int,
     origin: str,
     eval_counter: List[int],
+    max_workers: int = 1,
+    generation_stats: Optional[List[Dict[str, Any]]] = None,
 ) -> List[Dict[str, Any]]:
-    """Deterministic pure-Python NSGA-II (no pymoo / SciPy)."""
+    """Deterministic pure-Python NSGA-II (no pymoo / SciPy).
+
+    Each generation's offspring vectors are drawn first and then evaluated as
+    one batch (serially or across ``max_workers`` spawn-context processes).
+    Evaluation never touches ``rng``, so the seeded search and its result are
+    identical for any worker count.
+    """
     rng = random.Random(int(seed))
     objectives = multi.metric_senses()
-    dim = len(x0)
 
     def _random_x() -> List[float]:
         return [
@@ -691,69 +808,62 @@ def _run_nsga2_fallback(
             for (lo, hi) in bound_pairs
         ]
 
-    population: List[Dict[str, Any]] = []
-    # Seed population with clipped baseline + random individuals.
-    population.append(
-        _eval_individual(
-            x=x0,
-            names=names,
-            bound_pairs=bound_pairs,
-            base=base,
-            multi=multi,
-            origin=origin,
-            eval_counter=eval_counter,
-        )
+    eval_kw: Dict[str, Any] = dict(
+        names=names,
+        bound_pairs=bound_pairs,
+        base=base,
+        multi=multi,
+        origin=origin,
+        eval_counter=eval_counter,
+        stats=generation_stats,
     )
-    while len(population) < pop_size:
-        population.append(
-            _eval_individual(
-                x=_random_x(),
-                names=names,
-                bound_pairs=bound_pairs,
-                base=base,
-                multi=multi,
-                origin=origin,
-                eval_counter=eval_counter,
-            )
+    executor = None
+    if max_workers > 1:
+        import multiprocessing as mp
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_nsga2_worker,
+            initargs=(
+                {
+                    "names": tuple(names),
+                    "bound_pairs": list(bound_pairs),
+                    "base": base,
+                    "multi": multi,
+                    "origin": origin,
+                },
+            ),
         )
-
-    fronts0 = _fast_nondominated_sort(population, objectives)
-    for fr in fronts0:
-        _crowding_distance(population, fr, objectives)
-
-    for _gen in range(max(0, int(n_generations))):
-        offspring: List[Dict[str, Any]] = []
-        while len(offspring) < pop_size:
-            p1 = _tournament(rng, population)
-            p2 = _tournament(rng, population)
-            c1x, c2x = _sbx_crossover(rng, p1["x"], p2["x"], bound_pairs)
-            c1x = _poly_mutation(rng, c1x, bound_pairs)
-            c2x = _poly_mutation(rng, c2x, bound_pairs)
-            offspring.append(
-                _eval_individual(
-                    x=c1x,
-                    names=names,
-                    bound_pairs=bound_pairs,
-                    base=base,
-                    multi=multi,
-                    origin=origin,
-                    eval_counter=eval_counter,
-                )
-            )
-            if len(offspring) < pop_size:
-                offspring.append(
-                    _eval_individual(
-                        x=c2x,
-                        names=names,
-                        bound_pairs=bound_pairs,
-                        base=base,
-                        multi=multi,
-                        origin=origin,
-                        eval_counter=eval_counter,
-                    )
-                )
-        combined = population + offspring
-        population = _select_next_generation(combined, pop_size, objectives)
+    try:
+        # Seed population with clipped baseline + random individuals.
+        xs0: List[List[float]] = [list(x0)]
+        while len(xs0) < pop_size:
+            xs0.append(_random_x())
+        population = _eval_population(xs0, executor=executor, generation=0, **eval_kw)
+
+        fronts0 = _fast_nondominated_sort(population, objectives)
+        for fr in fronts0:
+            _crowding_distance(population, fr, objectives)
+
+        for gen in range(max(0, int(n_generations))):
+            child_xs: List[List[float]] = []
+            while len(child_xs) < pop_size:
+                p1 = _tournament(rng, population)
+                p2 = _tournament(rng, population)
+                c1x, c2x = _sbx_crossover(rng, p1["x"], p2["x"], bound_pairs)
+                c1x = _poly_mutation(rng, c1x, bound_pairs)
+                c2x = _poly_mutation(rng, c2x, bound_pairs)
+                child_xs.append(c1x)
+                if len(child_xs) < pop_size:
+                    child_xs.append(c2x)
+            offspring = _eval_population(child_xs, executor=executor, generation=gen + 1, **eval_kw)
+            combined = population + offspring
+            population = _select_next_generation(combined, pop_size, objectives)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     # Final ranking for export.
     fronts = _fast_nondominated_sort(population, objectives)
@@ -879,6 +989,7 @@ def run_nsga2_search(
     force_fallback: bool = False,
     prefer_feasible_front: bool = True,
     origin: str = "nsga2_search_driver",
+    max_workers: Optional[int] = None,
 ) -> Nsga2SearchResult:
     """Run feasible-first NSGA-II-style search; return propose-only shortlist.
 
@@ -902,6 +1013,11 @@ def run_nsga2_search(
         Skip optional pymoo even when installed (lock-tests the pure-Python path).
     prefer_feasible_front:
         Prefer hard-feasible nondominated proposals when building shortlist.
+    max_workers:
+        Fallback driver only: evaluate each generation across this many
+        spawn-context worker processes (``0`` = CPU count; ``None`` / ``1`` =
+        in-process). Each worker builds its own ``Evaluator`` under ``origin``;
+        results and their order are identical to the serial path.
     """
     multi = _as_multi_contract(objective_contracts)
     bounds = _normalize_bounds(variables)
@@ -933,6 +1049,8 @@ def run_nsga2_search(
     n_gen = max(0, int(n_generations))
     pymoo_used = False
     population: Optional[List[Dict[str, Any]]] = None
+    n_workers = _resolve_workers(max_workers)
+    generation_stats: List[Dict[str, Any]] = []
 
     if (not force_fallback) and pymoo_available():
         population = _try_pymoo_nsga2(
@@ -962,6 +1080,8 @@ def run_nsga2_search(
             n_generations=n_gen,
             origin=origin,
             eval_counter=eval_counter,
+            max_workers=n_workers,
+            generation_stats=generation_stats,
         )
         pymoo_used = False
 
@@ -987,6 +1107,7 @@ def run_nsga2_search(
         picked.append(row)
         if len(picked) >= max(1, int(shortlist_k)):
             break
+    picked = [_materialize_individual(r, names=names, base=base_inp, origin=origin) for r in picked]
 
     # Proposed front = nondominated among shortlist (reuse pareto_front helper
     # for feasible metric rows; fall back to front_rank==0).
@@ -1054,6 +1175,8 @@ def run_nsga2_search(
         proposed_front=tuple(proposed_front),
         notes=notes,
         atlas_dominatee_hook=dict(ATLAS_DOMINATEE_HOOK),
+        generation_stats=tuple(generation_stats),
+        max_workers=n_workers if not pymoo_used else 1,
     )
 
 
@@ -21,18 +21,6 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 
-def _record_overlay_failure(
-    out: Dict[str, Any],
-    *,
-    enabled_key: str,
-    error_key: str,
-    exc: Exception,
-) -> None:
-    """Stamp governance overlay import/eval failures for _authority_warnings aggregation."""
-    out[enabled_key] = False
-    out[error_key] = f"{type(exc).__name__}: {exc}"
-
-
 try:
     # Preferred when imported as `src.physics.*` (application/runtime)
     from ..models.inputs import PointInputs  # type: ignore
@@ -84,11 +72,9 @@ try:
     from ..analysis.plasma_regime import evaluate_plasma_regime  # type: ignore
     from ..analysis.availability import compute_availability  # type: ignore
     from ..availability.ledger_v359 import compute_availability_replacement_v359  # type: ignore
-    from ..availability.reliability_v391 import compute_availability_reliability_bundle_v391  # type: ignore
     from ..maintenance.scheduling_v368 import compute_maintenance_schedule_v368  # type: ignore
     # v367.0 module is under repo-root `analysis/` namespace for test/runtime wiring
     from analysis.materials_lifetime_v367 import compute_materials_lifetime_closure_v367  # type: ignore
-    from analysis.materials_lifetime_v384 import compute_materials_lifetime_tightening_v384  # type: ignore
     from ..analysis.tritium import compute_tritium_cycle  # type: ignore
     from ..engineering.pf_system import pf_system_proxy  # type: ignore
 except Exception:
@@ -102,10 +88,8 @@ except Exception:
     from analysis.plasma_regime import evaluate_plasma_regime  # type: ignore
     from analysis.availability import compute_availability  # type: ignore
     from availability.ledger_v359 import compute_availability_replacement_v359  # type: ignore
-    from availability.reliability_v391 import compute_availability_reliability_bundle_v391  # type: ignore
     from maintenance.scheduling_v368 import compute_maintenance_schedule_v368  # type: ignore
     from analysis.materials_lifetime_v367 import compute_materials_lifetime_closure_v367  # type: ignore
-    from analysis.materials_lifetime_v384 import compute_materials_lifetime_tightening_v384  # type: ignore
     from analysis.tritium import compute_tritium_cycle  # type: ignore
     from engineering.pf_system import pf_system_proxy  # type: ignore
 from .profiles import build_profiles_from_volume_avgs, gradient_proxy_at_pedestal
@@ -114,44 +98,13 @@ from .exhaust import evaluate_exhaust_with_known_lambda_q, q_midplane_from_lambd
 from .control_stability import compute_vertical_stability, compute_pf_envelope
 from .mhd_rwm import compute_rwm_screening
 from .neutronics import neutronics_proxies
-
-# Governance-only post-processing authorities (must be import-safe).
-try:
-    from analysis.transport_contracts_v371 import evaluate_transport_contracts_v371  # type: ignore
-except Exception:
-    evaluate_transport_contracts_v371 = None  # type: ignore
-
-try:
-    from analysis.transport_envelope_v396 import evaluate_transport_envelope_v396  # type: ignore
-except Exception:
-    evaluate_transport_envelope_v396 = None  # type: ignore
-
-try:
-    from analysis.profile_proxy_v397 import evaluate_profile_proxy_v397  # type: ignore
-except Exception:
-    evaluate_profile_proxy_v397 = None  # type: ignore
-
-
-try:
-    from analysis.control_stability_v398 import evaluate_control_stability_v398  # type: ignore
-except Exception:
-    evaluate_control_stability_v398 = None  # type: ignore
-
-try:
-    from analysis.magnet_technology_authority_v400 import evaluate_magnet_technology_authority_v400  # type: ignore
-except Exception:
-    evaluate_magnet_technology_authority_v400 = None  # type: ignore
-
-try:
-    from analysis.neutronics_materials_coupling_v372 import evaluate_neutronics_materials_coupling_v372  # type: ignore
-except Exception:
-    evaluate_neutronics_materials_coupling_v372 = None  # type: ignore
-
-try:
-    from analysis.nuclear_data_authority_v407 import evaluate_nuclear_data_authority_v407  # type: ignore
-except Exception:
-    evaluate_nuclear_data_authority_v407 = None  # type: ignore
-
+from .overlay_pipeline import OverlayPipeline, OverlayStage, merge_fill
+from . import point_cache as _point_cache
+from .stage_profiler import (
+    finish as finish_stage_profile,
+    new_stage_profiler,
+    stage_profiling_enabled as _stage_profiling_enabled,
+)
 
 try:
     # Preferred when imported as `src.physics.*`
@@ -170,8 +123,6 @@ try:
     )  # type: ignore
     from ..engineering.pf_cs import cs_flux_swing_proxy  # type: ignore
     from ..engineering.coil_thermal import tf_coil_heat_proxy  # type: ignore
-    from ..engineering.structural_stress_authority_v389 import compute_structural_stress_bundle_v389  # type: ignore
-    from ..engineering.neutronics_activation_authority_v390 import compute_neutronics_activation_bundle_v390  # type: ignore
     from ..phase1_models import (
         tokamak_volume,
         tokamak_surface_area,
@@ -236,7 +187,6 @@ except Exception:
     )  # type: ignore
     from engineering.pf_cs import cs_flux_swing_proxy  # type: ignore
     from engineering.coil_thermal import tf_coil_heat_proxy  # type: ignore
-    from engineering.neutronics_activation_authority_v390 import compute_neutronics_activation_bundle_v390  # type: ignore
     from phase1_models import (
         tokamak_volume,
         tokamak_surface_area,
@@ -285,12 +235,6 @@ except Exception:
         net_electric_MW,
     )  # type: ignore
 
-    # v371.0: transport contract library (governance only; post-processing)
-    from analysis.transport_contracts_v371 import evaluate_transport_contracts_v371  # type: ignore
-
-    # v372.0: neutronics–materials coupling (governance only; post-processing)
-    from analysis.neutronics_materials_coupling_v372 import evaluate_neutronics_materials_coupling_v372  # type: ignore
-
 _B_peak_T_tf = B_peak_T_tf  # keep a stable alias for the coil-geometry helper
 
 # Inboard radial-stack solver. Hoisted to module scope (was previously imported
@@ -309,6 +253,246 @@ except Exception:
         suggest_stack_repairs,
     )  # type: ignore
 
+def _couple_elm_availability_v409(out: Dict[str, Any]) -> None:
+    """PHYS-009: couple ELM duty-cycle downtime into the availability ledger."""
+    elm_down = float(out.get("elm_availability_downtime_frac_v409", float("nan")))
+    if elm_down == elm_down and elm_down > 0.0:
+        av0 = float(out.get("availability_model", float("nan")))
+        if av0 == av0:
+            out["availability_model_before_elm_v409"] = av0
+            out["availability_model"] = max(0.0, av0 * (1.0 - min(elm_down, 0.5)))
+            out["elm_availability_coupled_v409"] = 1.0
+
+
+_V384_POLICY_INPUTS = (
+    "fw_lifetime_min_yr_v384",
+    "blanket_lifetime_min_yr_v384",
+    "divertor_lifetime_min_yr_v384",
+    "magnet_lifetime_min_yr_v384",
+    "replacement_cost_max_MUSD_per_y_v384",
+    "capacity_factor_min_v384",
+)
+
+_V391_POLICY_INPUTS = (
+    "availability_min_v391",
+    "planned_outage_max_frac_v391",
+    "unplanned_downtime_max_frac_v391",
+    "maint_downtime_max_frac_v391",
+)
+
+_V398_PARTIAL_KEYS = (
+    "cs_flux_required_Wb",
+    "cs_flux_available_Wb",
+    "cs_flux_margin",
+    "vs_margin",
+    "vs_control_power_req_MW",
+    "vs_control_power_max_MW",
+    "vs_bandwidth_req_Hz",
+    "vs_bandwidth_max_Hz",
+    "rwm_chi",
+    "rwm_control_power_req_MW",
+    "rwm_control_power_max_MW",
+    "rwm_bandwidth_req_Hz",
+    "rwm_bandwidth_max_Hz",
+    "q0_proxy_v397",
+    "q95_proxy_v397",
+    "li_proxy_v397",
+    "profile_peaking_p_v397",
+    "bootstrap_localization_index_v397",
+)
+
+
+def _record_policy_inputs_v384(out: Dict[str, Any], inp: Any) -> None:
+    """Record v384 policy inputs for downstream constraint evaluation and evidence packs."""
+    out["include_materials_lifetime_v384"] = bool(getattr(inp, "include_materials_lifetime_v384", False))
+    for k in _V384_POLICY_INPUTS:
+        out[k] = float(getattr(inp, k, float("nan")))
+
+
+def _record_policy_inputs_v391(out: Dict[str, Any], inp: Any) -> None:
+    """Pass-through optional v391 caps/minima for constraint visibility."""
+    out["include_availability_reliability_v391"] = bool(getattr(inp, "include_availability_reliability_v391", False))
+    for k in _V391_POLICY_INPUTS:
+        out[k] = float(getattr(inp, k, float("nan")))
+
+
+def _control_partial_v398(out: Dict[str, Any]) -> Dict[str, Any]:
+    """v398 sees only the CS flux / VS / RWM / v397 profile fields."""
+    return {k: out.get(k) for k in _V398_PARTIAL_KEYS}
+
+
+# Transport diagnostics evaluated early from local confinement quantities
+# (``OverlayPipeline.evaluate``) and fill-merged after the contract authorities.
+_TRANSPORT_OVERLAYS = OverlayPipeline(
+    name="overlays_transport",
+    stages=[
+        # v371 transport contract library
+        OverlayStage("transport_contracts_v371", "transport_contracts_v371", "evaluate_transport_contracts_v371",
+                     enabled_key="transport_contracts_v371_enabled", error_key="transport_contracts_v371_error",
+                     keyword_call=True, out_kw="out_partial", merge="fill"),
+        # v396 transport envelope 2.0
+        OverlayStage("transport_envelope_v396", "transport_envelope_v396", "evaluate_transport_envelope_v396",
+                     enabled_key="transport_envelope_v396_enabled", error_key="transport_envelope_v396_error",
+                     keyword_call=True, out_kw="out_partial", merge="fill"),
+        # v397 1.5D profile proxy authority
+        OverlayStage("profile_proxy_v397", "profile_proxy_v397", "evaluate_profile_proxy_v397",
+                     enabled_key="profile_proxy_v397_enabled", error_key="profile_proxy_v397_error",
+                     keyword_call=True, out_kw="out_partial", merge="fill"),
+    ]
+)
+
+# v400 magnet technology margin ledger (sees the magnet block of ``out``).
+_MAGNET_OVERLAYS = OverlayPipeline(
+    name="overlays_magnet",
+    stages=[
+        OverlayStage("magnet_technology_v400", "magnet_technology_authority_v400", "evaluate_magnet_technology_authority_v400",
+                     enabled_key="magnet_v400_enabled", error_key="magnet_v400_error",
+                     keyword_call=True, out_kw="out_partial"),
+    ]
+)
+
+# Governance overlays run after the neutronics proxies (before plant closure).
+# v390/v392 are silent algebraic bundles (v392 has no module in this tree);
+# the rest return a disabled-stamp patch when off, so none is flag-skipped.
+_NEUTRONICS_OVERLAYS = OverlayPipeline(
+    name="overlays_neutronics",
+    stages=[
+        # v390 neutronics & activation authority 3.0
+        OverlayStage("neutronics_activation_v390", "neutronics_activation_authority_v390",
+                     "compute_neutronics_activation_bundle_v390",
+                     enabled_key=None, error_key=None, package="engineering"),
+        # v392 neutronics shield attenuation authority
+        OverlayStage("shield_attenuation_v392", "neutronics_shield_attenuation_authority_v392",
+                     "compute_neutronics_shield_attenuation_bundle_v392",
+                     enabled_key=None, error_key=None, package="engineering", optional=True),
+        # v403 Neutronics & Materials 4.0 library stack (multi-layer, 3-group, DPA/He, TBR-lite)
+        OverlayStage("nm_library_v403", "neutronics_materials_library_v403", "evaluate_neutronics_materials_library_v403",
+                     enabled_key="include_neutronics_materials_library_v403", error_key="nm_library_v403_error"),
+        # v407 nuclear data deepening (multi-group attenuation + dataset provenance); optional module
+        OverlayStage("nuclear_data_v407", "nuclear_data_authority_v407", "evaluate_nuclear_data_authority_v407",
+                     enabled_key="include_nuclear_data_authority_v407", error_key="nuclear_data_authority_v407_error",
+                     optional=True),
+        # v404 structural life 3.0 (fatigue / creep / buckling envelopes)
+        OverlayStage("structural_life_v404", "structural_life_authority_v404", "evaluate_structural_life_authority_v404",
+                     enabled_key="include_structural_life_v404", error_key="structural_life_v404_error"),
+        # v401 neutronics & materials 3.0 contract tiers
+        OverlayStage("nm_authority_v401", "neutronics_materials_authority_v401", "evaluate_neutronics_materials_authority_v401",
+                     enabled_key="include_neutronics_materials_authority_v401", error_key="nm_authority_v401_error"),
+    ]
+)
+
+# Post-truth overlays (MATCH-as-overlay; algebraic only; no iteration in L0).
+# Order matters: v399 before v402 so dominance ranking sees the partition keys;
+# v402 last so it ranks every authority. Stages with a flag return ``{}`` when
+# disabled and are skipped outright.
+_POST_TRUTH_OVERLAYS = OverlayPipeline(
+    name="overlays_post_truth",
+    stages=[
+        # v399 multi-species impurity radiation partition (PROPOSAL-022/021)
+        OverlayStage("impurity_v399", "impurity_radiation_v399", "evaluate_impurity_radiation_authority_v399",
+                     enabled_key="include_impurity_v399", error_key="impurity_v399_error"),
+        # v409 ELM / transient heat load (PHYS-004) + availability coupling (PHYS-009)
+        OverlayStage("elm_transient_heat_v409", "elm_transient_heat_v409", "evaluate_elm_transient_heat_v409",
+                     enabled_key="include_elm_transient_heat_v409", error_key="elm_transient_heat_v409_error",
+                     post=_couple_elm_availability_v409),
+        # v408 CD mix plant electric ledger (PHYS-006)
+        OverlayStage("cd_mix_plant_ledger_v408", "cd_mix_plant_ledger_v408", "evaluate_cd_mix_plant_ledger_v408",
+                     enabled_key="cd_mix_enable", error_key="cd_mix_plant_ledger_v408_error"),
+        # v410 magnet SC system authority (TF/PF/CS depth beyond v400)
+        OverlayStage("magnet_sc_system_v410", "magnet_sc_system_authority_v410", "evaluate_magnet_sc_system_authority_v410",
+                     enabled_key="include_magnet_sc_system_authority_v410", error_key="magnet_sc_system_authority_v410_error",
+                     flag="include_magnet_sc_system_authority_v410"),
+        # v412 machine-build / radial closure narrative
+        OverlayStage("machine_build_v412", "machine_build_authority_v412", "evaluate_machine_build_authority_v412",
+                     enabled_key="include_machine_build_authority_v412", error_key="machine_build_authority_v412_error",
+                     flag="include_machine_build_authority_v412"),
+        # v419 plant Sankey-grade ledger (Pe_net watermarked via plant_kpi_honesty.v1)
+        OverlayStage("plant_sankey_ledger_v419", "plant_sankey_ledger_authority_v419", "evaluate_plant_sankey_ledger_authority_v419",
+                     enabled_key="include_plant_sankey_ledger_authority_v419", error_key="plant_sankey_ledger_authority_v419_error",
+                     flag="include_plant_sankey_ledger_authority_v419"),
+        # v420 availability -> OPEX / LCOE coupling (Independence 2.4)
+        OverlayStage("availability_opex_lcoe_v420", "availability_opex_lcoe_authority_v420", "evaluate_availability_opex_lcoe_authority_v420",
+                     enabled_key="include_availability_opex_lcoe_authority_v420", error_key="availability_opex_lcoe_authority_v420_error",
+                     flag="include_availability_opex_lcoe_authority_v420"),
+        # v421 bottom-up modular costing (Independence 2.5)
+        OverlayStage("bottom_up_costing_v421", "bottom_up_costing_authority_v421", "evaluate_bottom_up_costing_authority_v421",
+                     enabled_key="include_bottom_up_costing_authority_v421", error_key="bottom_up_costing_authority_v421_error",
+                     flag="include_bottom_up_costing_authority_v421"),
+        # v402 authority dominance engine 2.0 (global cross-authority ranking)
+        OverlayStage("authority_dominance_v402", "authority_dominance_v402", "evaluate_authority_dominance_v402",
+                     enabled_key="include_authority_dominance_v402", error_key="authority_dominance_v402_error",
+                     keyword_call=True),
+    ]
+)
+
+
+# v384 materials & lifetime tightening; run twice (after the v367 closure and
+# again once downtime/CF are known). Policy inputs are recorded even when off.
+_LIFETIME_OVERLAYS = OverlayPipeline(
+    name="overlays_lifetime",
+    stages=[
+        OverlayStage("materials_lifetime_v384", "materials_lifetime_v384", "compute_materials_lifetime_tightening_v384",
+                     enabled_key=None, error_key=None, pre=_record_policy_inputs_v384),
+    ]
+)
+
+# v389 structural stress authority (silent algebraic bundle).
+_STRUCTURAL_OVERLAYS = OverlayPipeline(
+    name="overlays_structural",
+    stages=[
+        OverlayStage("structural_stress_v389", "structural_stress_authority_v389", "compute_structural_stress_bundle_v389",
+                     enabled_key=None, error_key=None, package="engineering"),
+    ]
+)
+
+# v391 availability 2.0 reliability envelope; caps are passed through even when off.
+_AVAILABILITY_OVERLAYS = OverlayPipeline(
+    name="overlays_availability",
+    stages=[
+        OverlayStage("availability_reliability_v391", "reliability_v391", "compute_availability_reliability_bundle_v391",
+                     enabled_key=None, error_key=None, package="availability",
+                     flag="include_availability_reliability_v391", pre=_record_policy_inputs_v391),
+    ]
+)
+
+# Control / coupling diagnostics after the v397 τE coupling: v398 needs the
+# merged v397 profile fields, v372 the full neutronics ledger. Fill-merged.
+_CONTROL_OVERLAYS = OverlayPipeline(
+    name="overlays_control",
+    stages=[
+        # v398 control & stability ledger
+        OverlayStage("control_stability_v398", "control_stability_v398", "evaluate_control_stability_v398",
+                     enabled_key="control_stability_v398_enabled", error_key="control_stability_v398_error",
+                     keyword_call=True, out_kw="out_partial", merge="fill", partial=_control_partial_v398),
+        # v372 neutronics–materials coupling
+        OverlayStage("nm_coupling_v372", "neutronics_materials_coupling_v372", "evaluate_neutronics_materials_coupling_v372",
+                     enabled_key="nm_coupling_v372_enabled", error_key="nm_coupling_v372_error",
+                     keyword_call=True, merge="fill"),
+    ]
+)
+
+
+def overlay_stages() -> Dict[str, Any]:
+    """Inspect the declarative overlay pipelines (order, wiring, cumulative timings)."""
+    return {
+        name: {"stages": pl.describe(), "timings": pl.stage_timings()}
+        for name, pl in (
+            ("transport", _TRANSPORT_OVERLAYS),
+            ("magnet", _MAGNET_OVERLAYS),
+            ("neutronics", _NEUTRONICS_OVERLAYS),
+            ("lifetime", _LIFETIME_OVERLAYS),
+            ("structural", _STRUCTURAL_OVERLAYS),
+            ("availability", _AVAILABILITY_OVERLAYS),
+            ("control", _CONTROL_OVERLAYS),
+            ("post_truth", _POST_TRUTH_OVERLAYS),
+        )
+    }
+
+
+# Resolved once per process; contract loaders key their registry entries on it.
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
 def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = None) -> Dict[str, float]:
     """
     Compute a Phase-1 operating point (0-D) with additional screening models.
@@ -331,7 +515,9 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     out: Dict[str, Any] = {}
     # Repository root (used only for governance contracts / artifact stamping).
     # Must not influence physics beyond explicit contract defaults.
-    repo_root = Path(__file__).resolve().parents[2]
+    repo_root = _REPO_ROOT
+    # Opt-in per-stage timing (None when off; every mark site is a single check).
+    _prof = new_stage_profiler()
     # ---------------------------
     # Geometry (tokamak proxies)
     # ---------------------------
@@ -396,6 +582,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
         except Exception:
             pass
 
+    if _prof is not None:
+        _prof.mark("profile_build")
     # Fusion power (0-D, Maxwellian)
     # ---------------------------
     sv_DT = bosch_hale_sigmav(Ti, "DT")
@@ -541,6 +729,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     P_n_captured_W = eps_n * P_n_W
     S_n_W_m2 = P_n_W / max(A_fw, 1e-9)
 
+    if _prof is not None:
+        _prof.mark("fusion_power")
     # ---------------------------
     # Radiation & power balance
     # ---------------------------
@@ -717,6 +907,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     M_ign_core = Palpha_MW / max(Ploss_MW, 1e-12)
     M_ign_total = Palpha_MW / max((Ploss_MW + Prad_core_MW), 1e-12)
 
+    if _prof is not None:
+        _prof.mark("radiation")
     # ---------------------------
     # Thermal stored energy and confinement
     # ---------------------------
@@ -879,54 +1071,40 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     # -----------------------------------------------------------------
     # v371.0: Transport Contract Library (governance-only; no truth edits)
     # -----------------------------------------------------------------
-    transport_contract_v371: Dict[str, Any] = {}
-    try:
-        if evaluate_transport_contracts_v371 is None:
-            raise RuntimeError("transport contract module not importable")
-        transport_contract_v371 = evaluate_transport_contracts_v371(
-            inp=inp,
-            out_partial={
-                "ne20": ne20,
-                "P_SOL_MW": Ploss_MW,
-                "S_m2": S,
-                "Paux_MW": float(getattr(inp, "Paux_MW", 0.0) or 0.0),
-                "Palpha_dep_MW": float(locals().get("Palpha_dep_MW", 0.0) or 0.0),
-                "Pin_MW": Pin_MW,
-                "tauIPB_s": tauIPB_s,
-                "tauE_required_s": tauE_required_s,
-                "H_required": H_required,
-            },
-        )
-    except Exception as e:
-        transport_contract_v371 = {
-            "transport_contracts_v371_enabled": False,
-            "transport_contracts_v371_error": f"{type(e).__name__}: {e}",
-        }
+    transport_contract_v371 = _TRANSPORT_OVERLAYS.evaluate(
+        "transport_contracts_v371",
+        {
+            "ne20": ne20,
+            "P_SOL_MW": Ploss_MW,
+            "S_m2": S,
+            "Paux_MW": float(getattr(inp, "Paux_MW", 0.0) or 0.0),
+            "Palpha_dep_MW": float(locals().get("Palpha_dep_MW", 0.0) or 0.0),
+            "Pin_MW": Pin_MW,
+            "tauIPB_s": tauIPB_s,
+            "tauE_required_s": tauE_required_s,
+            "H_required": H_required,
+        },
+        inp,
+        _prof,
+    )
 
     
     # -----------------------------------------------------------------
     # v396.0: Transport Envelope 2.0 (governance-only; no truth edits)
     # -----------------------------------------------------------------
-    transport_envelope_v396: Dict[str, Any] = {}
-    try:
-        if evaluate_transport_envelope_v396 is None:
-            raise RuntimeError("transport envelope module not importable")
-        transport_envelope_v396 = evaluate_transport_envelope_v396(
-            inp=inp,
-            out_partial={
-                "ne20": ne20,
-                "P_SOL_MW": Ploss_MW,
-                "Pin_MW": Pin_MW,
-                "tauIPB_s": tauIPB_s,
-                "tauE_required_s": tauE_required_s,
-                "H_required": H_required,
-            },
-        )
-    except Exception as e:
-        transport_envelope_v396 = {
-            "transport_envelope_v396_enabled": False,
-            "transport_envelope_v396_error": f"{type(e).__name__}: {e}",
-        }
+    transport_envelope_v396 = _TRANSPORT_OVERLAYS.evaluate(
+        "transport_envelope_v396",
+        {
+            "ne20": ne20,
+            "P_SOL_MW": Ploss_MW,
+            "Pin_MW": Pin_MW,
+            "tauIPB_s": tauIPB_s,
+            "tauE_required_s": tauE_required_s,
+            "H_required": H_required,
+        },
+        inp,
+        _prof,
+    )
 
     # -----------------------------------------------------------------
     # v397.0: 1.5D Profile Proxy Authority (governance-only; no truth edits)
@@ -937,22 +1115,10 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     # below, so this overlay always died with UnboundLocalError and was silently
     # disabled on every evaluation.
     q95 = q95_proxy_cyl(inp.R0_m, inp.a_m, inp.Bt_T, inp.Ip_MA, inp.kappa)
-    profile_proxy_v397: Dict[str, Any] = {}
-    try:
-        if evaluate_profile_proxy_v397 is None:
-            raise RuntimeError("profile proxy module not importable")
-        profile_proxy_v397 = evaluate_profile_proxy_v397(
-            inp=inp,
-            out_partial={
-                "q95": q95,
-            },
-        )
-    except Exception as e:
-        profile_proxy_v397 = {
-            "profile_proxy_v397_enabled": False,
-            "profile_proxy_v397_error": f"{type(e).__name__}: {e}",
-        }
+    profile_proxy_v397 = _TRANSPORT_OVERLAYS.evaluate("profile_proxy_v397", {"q95": q95}, inp, _prof)
 
+    if _prof is not None:
+        _prof.mark("confinement_transport")
     # ---------------------------
     # Particle sustainability (optional diagnostic closure)
     # ---------------------------
@@ -1349,6 +1515,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     out["I_cd_MA"] = I_cd_A / 1e6
     out["f_NI"] = f_NI
 
+    if _prof is not None:
+        _prof.mark("screening_bootstrap_cd")
         # =========================================================================
     # Added: (1) radial build + TF peak field mapping + hoop stress
     # =========================================================================
@@ -1392,6 +1560,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
 
     
 
+    if _prof is not None:
+        _prof.mark("radial_stack")
     # =========================================================================
     # Added: (2) Magnet Technology Authority 4.1 (LTS/HTS/Cu) -> regime contract
     # =========================================================================
@@ -1402,7 +1572,7 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     # Contract-driven regime and limits (no runtime overrides).
     try:
         from ..contracts.magnet_tech_contract import (
-            CONTRACT_SHA256,
+            contract_sha256 as _magnet_contract_sha256,
             infer_magnet_regime,
             limits_for_regime,
             regime_consistent,
@@ -1411,7 +1581,7 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
         regime = infer_magnet_regime(tech)
         lims = limits_for_regime(regime)
         out["magnet_regime"] = str(regime)
-        out["magnet_contract_sha256"] = str(CONTRACT_SHA256)
+        out["magnet_contract_sha256"] = str(_magnet_contract_sha256())
         out.update(lims.to_outputs_dict())
         out["magnet_regime_consistent"] = float(1.0 if regime_consistent(tech, regime) else 0.0)
     except Exception:
@@ -1505,21 +1675,7 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     # -----------------------------------------------------------------
     # v400.0: Magnet Technology Authority (margin ledger overlay; no truth edits)
     # -----------------------------------------------------------------
-    magnet_v400: Dict[str, Any] = {}
-    try:
-        if evaluate_magnet_technology_authority_v400 is None:
-            raise RuntimeError("magnet technology v400 module not importable")
-        magnet_v400 = evaluate_magnet_technology_authority_v400(inp=inp, out_partial=out)
-    except Exception as e:
-        magnet_v400 = {
-            "magnet_v400_enabled": False,
-            "magnet_v400_error": f"{type(e).__name__}: {e}",
-        }
-    try:
-        for k, v in magnet_v400.items():
-            out[k] = v
-    except Exception:
-        pass
+    _MAGNET_OVERLAYS.run(out, inp, _prof)
 
     # Stored energy / dump voltage proxy (TF system)
     # Effective magnetic volume proxy:
@@ -1547,6 +1703,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     out["tau_dump_s"] = inp.tau_dump_s
     out["N_tf_turns"] = float(inp.N_tf_turns)
 
+    if _prof is not None:
+        _prof.mark("magnet_technology")
     # =========================================================================
     # Added: (3) Divertor / SOL exhaust (unified API)
     # =========================================================================
@@ -1711,7 +1869,7 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
                 try:
                     from src.contracts.edge_core_coupled_exhaust_contract import (
                         apply_edge_core_coupling,
-                        CONTRACT_SHA256 as _EC_CONTRACT_SHA,
+                        contract_sha256 as _ec_contract_sha256,
                     )
 
                     chi_core = float(getattr(inp, "edge_core_coupling_chi_core", 0.25) or 0.25)
@@ -1729,7 +1887,7 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
 
                     out["edge_core_coupling_active"] = 1.0
                     out["edge_core_coupling_chi_core"] = float(chi_core)
-                    out["edge_core_coupling_contract_sha256"] = str(_EC_CONTRACT_SHA)
+                    out["edge_core_coupling_contract_sha256"] = str(_ec_contract_sha256())
                     out["edge_core_coupling_delta_Prad_core_MW"] = float(res.delta_Prad_core_MW)
                     out["P_SOL_edge_core_MW"] = float(res.P_SOL_eff_MW)
                     out["f_rad_core_edge_core"] = float(res.f_rad_core_edge_core)
@@ -1826,7 +1984,7 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     # v329.0 Exhaust & Radiation Regime Authority (deterministic)
     # ---------------------------
     try:
-        from src.contracts.exhaust_radiation_regime_contract import classify_exhaust_regime, CONTRACT_SHA256 as _EXH_CONTRACT_SHA
+        from src.contracts.exhaust_radiation_regime_contract import classify_exhaust_regime, contract_sha256 as _exh_contract_sha256
         _q = float(out.get('q_div_MW_m2', float('nan')))
         _qmax = float(out.get('q_div_max_MW_m2', float('nan')))
         _fr = float(out.get('f_rad_div_eff', out.get('f_rad_div', float('nan'))))
@@ -1842,7 +2000,7 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
             f_sol_div_required=float(_freq),
         )
         out.update(cls.to_outputs_dict())
-        out['exhaust_regime_validity'] = {'contract_sha256': str(_EXH_CONTRACT_SHA)}
+        out['exhaust_regime_validity'] = {'contract_sha256': str(_exh_contract_sha256())}
     except Exception:
         out['exhaust_regime'] = 'unknown'
         out['exhaust_fragility_class'] = 'UNKNOWN'
@@ -1854,6 +2012,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
         out['exhaust_radiation_dominated'] = float('nan')
         out['exhaust_contract_sha256'] = ''
 
+    if _prof is not None:
+        _prof.mark("exhaust_divertor")
     # ---------------------------
     # v296.0 Disruption risk tiering (screening)
     # ---------------------------
@@ -1882,6 +2042,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     out["q_midplane_max_MW_m2"] = float(getattr(inp, "q_midplane_max_MW_m2", float("nan")))
     out["P_SOL_over_R_limit_MW_m"] = float(getattr(inp, "P_SOL_over_R_limit_MW_m", float("nan")))
 
+    if _prof is not None:
+        _prof.mark("disruption_risk")
     # =========================================================================
     # Added: (4) Neutronics lifetime/TBR feasibility
     # =========================================================================
@@ -1946,121 +2108,17 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
         out.setdefault("P_nuc_total_MW", float("nan"))
 
 
+    if _prof is not None:
+        _prof.mark("neutronics")
     # =========================================================================
-    # Added: Neutronics & Activation Authority 3.0 (v390.0.0) — optional, algebraic
-    # =========================================================================
-    try:
-        na390 = compute_neutronics_activation_bundle_v390(out, inp)
-        if isinstance(na390, dict):
-            out.update(na390)
-    except Exception:
-        pass
-
-    # =========================================================================
-    # Added: Neutronics Shield Attenuation Authority (v392.0.0) — optional, algebraic
-    # =========================================================================
-    try:
-        from ..engineering.neutronics_shield_attenuation_authority_v392 import (
-            compute_neutronics_shield_attenuation_bundle_v392,
-        )
-        na392 = compute_neutronics_shield_attenuation_bundle_v392(out, inp)
-        if isinstance(na392, dict):
-            out.update(na392)
-    except Exception:
-        pass
-
-    # =========================================================================
-    # Added: Neutronics & Materials Authority 4.0 — Library Stack (v403.0.0)
-    # Deterministic multi-layer + 3-group attenuation + DPA/He/activation + TBR-lite.
-    # Governance-only overlay; no truth edits.
+    # Neutronics / materials / structural governance overlays
+    # (v390 activation, v392 shield attenuation, v403 library stack,
+    # v407 nuclear data, v404 structural life, v401 contract tiers).
+    # Declarative; see _NEUTRONICS_OVERLAYS.
     # =========================================================================
-    try:
-        try:
-            from analysis.neutronics_materials_library_v403 import (
-                evaluate_neutronics_materials_library_v403,
-            )
-        except ImportError:
-            from ..analysis.neutronics_materials_library_v403 import (
-                evaluate_neutronics_materials_library_v403,
-            )
-        nm403 = evaluate_neutronics_materials_library_v403(out, inp)
-        if isinstance(nm403, dict):
-            out.update(nm403)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_neutronics_materials_library_v403",
-            error_key="nm_library_v403_error",
-            exc=e,
-        )
-
-    # =========================================================================
-    # Added: Nuclear Data Authority Deepening (v407.0.0) — optional, algebraic
-    # Multi-group attenuation + dataset provenance (screening only).
-    # Governance-only overlay; no truth edits.
-    # =========================================================================
-    try:
-        if evaluate_nuclear_data_authority_v407 is not None:
-            nd407 = evaluate_nuclear_data_authority_v407(out, inp)
-            if isinstance(nd407, dict):
-                out.update(nd407)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_nuclear_data_authority_v407",
-            error_key="nuclear_data_authority_v407_error",
-            exc=e,
-        )
-
-    # =========================================================================
-    # Added: Structural Life Authority 3.0 (v404.0.0)
-    # Fatigue / creep / buckling envelopes + irradiation–temperature allowables.
-    # Governance-only overlay; no truth edits.
-    # =========================================================================
-    try:
-        try:
-            from analysis.structural_life_authority_v404 import (
-                evaluate_structural_life_authority_v404,
-            )
-        except ImportError:
-            from ..analysis.structural_life_authority_v404 import (
-                evaluate_structural_life_authority_v404,
-            )
-        st404 = evaluate_structural_life_authority_v404(out, inp)
-        if isinstance(st404, dict):
-            out.update(st404)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_structural_life_v404",
-            error_key="structural_life_v404_error",
-            exc=e,
-        )
-
-
-    # =========================================================================
-    # Added: Neutronics & Materials Authority 3.0 — Contract Tiers (v401.0.0)
-    # Governance-only overlay: computes tiered margins + dominance.
-    # =========================================================================
-    try:
-        try:
-            from analysis.neutronics_materials_authority_v401 import (
-                evaluate_neutronics_materials_authority_v401,
-            )
-        except ImportError:
-            from ..analysis.neutronics_materials_authority_v401 import (
-                evaluate_neutronics_materials_authority_v401,
-            )
-        nm401 = evaluate_neutronics_materials_authority_v401(out, inp)
-        if isinstance(nm401, dict):
-            out.update(nm401)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_neutronics_materials_authority_v401",
-            error_key="nm_authority_v401_error",
-            exc=e,
-        )
+    _NEUTRONICS_OVERLAYS.run(out, inp, _prof)
+    if _prof is not None:
+        _prof.mark("overlays_neutronics")
 
     # Optional screening cap (NaN disables)
     out["neutron_wall_load_max_MW_m2"] = float(getattr(inp, "neutron_wall_load_max_MW_m2", float("nan")))
@@ -2301,21 +2359,7 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     # -----------------------------------------------------------------
     # (v384.0.0) Materials & lifetime tightening (governance overlay; OFF by default)
     # -----------------------------------------------------------------
-    try:
-        # Record policy inputs for downstream constraint evaluation and evidence packs.
-        out["include_materials_lifetime_v384"] = bool(getattr(inp, "include_materials_lifetime_v384", False))
-        out["fw_lifetime_min_yr_v384"] = float(getattr(inp, "fw_lifetime_min_yr_v384", float("nan")))
-        out["blanket_lifetime_min_yr_v384"] = float(getattr(inp, "blanket_lifetime_min_yr_v384", float("nan")))
-        out["divertor_lifetime_min_yr_v384"] = float(getattr(inp, "divertor_lifetime_min_yr_v384", float("nan")))
-        out["magnet_lifetime_min_yr_v384"] = float(getattr(inp, "magnet_lifetime_min_yr_v384", float("nan")))
-        out["replacement_cost_max_MUSD_per_y_v384"] = float(getattr(inp, "replacement_cost_max_MUSD_per_y_v384", float("nan")))
-        out["capacity_factor_min_v384"] = float(getattr(inp, "capacity_factor_min_v384", float("nan")))
-
-        ml384 = compute_materials_lifetime_tightening_v384(out, inp)
-        if isinstance(ml384, dict):
-            out.update(ml384)
-    except Exception:
-        pass
+    _LIFETIME_OVERLAYS.run(out, inp, _prof)
 
     # CS flux swing proxy (for pulsed feasibility); recorded even in steady-state for transparency.
     try:
@@ -2340,15 +2384,12 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     except Exception:
         pass
 
+    if _prof is not None:
+        _prof.mark("plant_closure")
     # =========================================================================
     # Added: Structural Stress Authority (v389.0.0) — optional, algebraic
     # =========================================================================
-    try:
-        ss389 = compute_structural_stress_bundle_v389(out, inp)
-        if isinstance(ss389, dict):
-            out.update(ss389)
-    except Exception:
-        pass
+    _STRUCTURAL_OVERLAYS.run(out, inp, _prof)
 
     out["P_net_min_MW"] = getattr(inp, "P_net_min_MW", float("nan"))
 
@@ -2452,6 +2493,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
         out.setdefault("pulse_scenario_used", "as_input")
 
 
+    if _prof is not None:
+        _prof.mark("structural_thermal_pulsed")
     # =========================================================================
 
     # =========================================================================
@@ -2652,20 +2695,7 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     # -----------------------------------------------------------------
     # (v384.0.0) Materials & lifetime tightening (divertor+magnet + downtime→CF + annualized replacement cost)
     # -----------------------------------------------------------------
-    try:
-        out["include_materials_lifetime_v384"] = bool(getattr(inp, "include_materials_lifetime_v384", False))
-        out["fw_lifetime_min_yr_v384"] = float(getattr(inp, "fw_lifetime_min_yr_v384", float("nan")))
-        out["blanket_lifetime_min_yr_v384"] = float(getattr(inp, "blanket_lifetime_min_yr_v384", float("nan")))
-        out["divertor_lifetime_min_yr_v384"] = float(getattr(inp, "divertor_lifetime_min_yr_v384", float("nan")))
-        out["magnet_lifetime_min_yr_v384"] = float(getattr(inp, "magnet_lifetime_min_yr_v384", float("nan")))
-        out["replacement_cost_max_MUSD_per_y_v384"] = float(getattr(inp, "replacement_cost_max_MUSD_per_y_v384", float("nan")))
-        out["capacity_factor_min_v384"] = float(getattr(inp, "capacity_factor_min_v384", float("nan")))
-
-        ml384 = compute_materials_lifetime_tightening_v384(out, inp)
-        if isinstance(ml384, dict):
-            out.update(ml384)
-    except Exception:
-        pass
+    _LIFETIME_OVERLAYS.run(out, inp, _prof)
 
     # Availability-aware annual net generation (MWh/year)
     try:
@@ -2735,19 +2765,7 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     # -----------------------------------------------------------------
     # (v391.0.0) Availability 2.0 — Reliability Envelope Authority (optional)
     # -----------------------------------------------------------------
-    try:
-        # Pass-through optional caps/minima for constraint visibility
-        out["include_availability_reliability_v391"] = bool(getattr(inp, "include_availability_reliability_v391", False))
-        out["availability_min_v391"] = float(getattr(inp, "availability_min_v391", float("nan")))
-        out["planned_outage_max_frac_v391"] = float(getattr(inp, "planned_outage_max_frac_v391", float("nan")))
-        out["unplanned_downtime_max_frac_v391"] = float(getattr(inp, "unplanned_downtime_max_frac_v391", float("nan")))
-        out["maint_downtime_max_frac_v391"] = float(getattr(inp, "maint_downtime_max_frac_v391", float("nan")))
-        if bool(getattr(inp, "include_availability_reliability_v391", False)):
-            ar391 = compute_availability_reliability_bundle_v391(out, inp)
-            if isinstance(ar391, dict):
-                out.update(ar391)
-    except Exception:
-        pass
+    _AVAILABILITY_OVERLAYS.run(out, inp, _prof)
 
     # Pass-through optional caps (constraint-visible, deterministic)
     try:
@@ -2757,6 +2775,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     except Exception:
         pass
 
+    if _prof is not None:
+        _prof.mark("risk_availability")
     # Added: Economics / COE proxy
     # =========================================================================
     out["COE_max_USD_per_MWh"] = float(getattr(inp, "COE_max_USD_per_MWh", float("nan")))
@@ -2884,6 +2904,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
         pass
 
 
+    if _prof is not None:
+        _prof.mark("costing")
     # ---------------------------------------------------------------------
     # Heating & current-drive closure (proxy, deterministic)
     # ---------------------------------------------------------------------
@@ -3040,6 +3062,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     except Exception:
         out["_maturity_contract"] = {"tier": str(getattr(inp, "tech_tier", "TRL7"))}
 
+    if _prof is not None:
+        _prof.mark("diagnostics_provenance")
     # ---------------------------------------------------------------------
     # Plant power ledger overlay (non-authoritative) + optional fuel-cycle ledger
     # ---------------------------------------------------------------------
@@ -3100,6 +3124,8 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     except Exception:
         pass
 
+    if _prof is not None:
+        _prof.mark("plant_ledger_tritium")
     # ---------------------------------------------------------------------
     # v336.0 Plasma Regime Authority (deterministic classifier + margins)
     # ---------------------------------------------------------------------
@@ -3342,53 +3368,12 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
         out.setdefault("neutronics_materials_min_margin_frac", float("nan"))
         out.setdefault("neutronics_materials_contract_sha256", "")
 
-    # v371.0 transport contracts (governance-only diagnostics)
-    try:
-        if isinstance(transport_contract_v371, dict):
-            for k, v in transport_contract_v371.items():
-                # Do not overwrite canonical scalars except when identical-key duplication is benign.
-                if k not in out:
-                    out[k] = v
-                else:
-                    # Keep existing but allow filling NaNs
-                    try:
-                        if (out.get(k) != out.get(k)) and (v == v):
-                            out[k] = v
-                    except Exception:
-                        pass
-    except Exception:
-        pass
-
-
-    # v396.0 transport envelope 2.0 (governance-only diagnostics)
-    try:
-        if isinstance(transport_envelope_v396, dict):
-            for k, v in transport_envelope_v396.items():
-                if k not in out:
-                    out[k] = v
-                else:
-                    try:
-                        if (out.get(k) != out.get(k)) and (v == v):
-                            out[k] = v
-                    except Exception:
-                        pass
-    except Exception:
-        pass
-
-    # v397.0 profile proxy authority (governance-only diagnostics)
-    try:
-        if isinstance(profile_proxy_v397, dict):
-            for k, v in profile_proxy_v397.items():
-                if k not in out:
-                    out[k] = v
-                else:
-                    try:
-                        if (out.get(k) != out.get(k)) and (v == v):
-                            out[k] = v
-                    except Exception:
-                        pass
-    except Exception:
-        pass
+    if _prof is not None:
+        _prof.mark("contract_authorities")
+    # v371.0 / v396.0 / v397.0 transport diagnostics (governance-only): fill-merge
+    # the patches evaluated above without overwriting canonical scalars.
+    for _patch in (transport_contract_v371, transport_envelope_v396, profile_proxy_v397):
+        merge_fill(out, _patch)
 
     # PHYS-002: v397 density peaking → τE coupling (when profile proxy enabled)
     try:
@@ -3411,294 +3396,18 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
         pass
 
     # v398.0 control & stability ledger (after v397 merge + CS flux fields in out)
-    control_stability_v398: Dict[str, Any] = {}
-    try:
-        if evaluate_control_stability_v398 is None:
-            raise RuntimeError("control stability v398 module not importable")
-        control_stability_v398 = evaluate_control_stability_v398(
-            inp=inp,
-            out_partial={
-                "cs_flux_required_Wb": out.get("cs_flux_required_Wb"),
-                "cs_flux_available_Wb": out.get("cs_flux_available_Wb"),
-                "cs_flux_margin": out.get("cs_flux_margin"),
-                "vs_margin": out.get("vs_margin"),
-                "vs_control_power_req_MW": out.get("vs_control_power_req_MW"),
-                "vs_control_power_max_MW": out.get("vs_control_power_max_MW"),
-                "vs_bandwidth_req_Hz": out.get("vs_bandwidth_req_Hz"),
-                "vs_bandwidth_max_Hz": out.get("vs_bandwidth_max_Hz"),
-                "rwm_chi": out.get("rwm_chi"),
-                "rwm_control_power_req_MW": out.get("rwm_control_power_req_MW"),
-                "rwm_control_power_max_MW": out.get("rwm_control_power_max_MW"),
-                "rwm_bandwidth_req_Hz": out.get("rwm_bandwidth_req_Hz"),
-                "rwm_bandwidth_max_Hz": out.get("rwm_bandwidth_max_Hz"),
-                "q0_proxy_v397": out.get("q0_proxy_v397"),
-                "q95_proxy_v397": out.get("q95_proxy_v397"),
-                "li_proxy_v397": out.get("li_proxy_v397"),
-                "profile_peaking_p_v397": out.get("profile_peaking_p_v397"),
-                "bootstrap_localization_index_v397": out.get("bootstrap_localization_index_v397"),
-            },
-        )
-    except Exception as e:
-        control_stability_v398 = {
-            "control_stability_v398_enabled": False,
-            "control_stability_v398_error": f"{type(e).__name__}: {e}",
-        }
-
-    try:
-        if isinstance(control_stability_v398, dict):
-            for k, v in control_stability_v398.items():
-                if k not in out:
-                    out[k] = v
-                else:
-                    try:
-                        if (out.get(k) != out.get(k)) and (v == v):
-                            out[k] = v
-                    except Exception:
-                        pass
-    except Exception:
-        pass
-
-    # v372.0 neutronics–materials coupling (governance-only diagnostics)
-    try:
-        if evaluate_neutronics_materials_coupling_v372 is None:
-            raise RuntimeError("nm coupling module not importable")
-        nm_cpl_v372 = evaluate_neutronics_materials_coupling_v372(out=out, inp=inp)
-        if isinstance(nm_cpl_v372, dict):
-            for k, v in nm_cpl_v372.items():
-                if k not in out:
-                    out[k] = v
-                else:
-                    try:
-                        if (out.get(k) != out.get(k)) and (v == v):
-                            out[k] = v
-                    except Exception:
-                        pass
-    except Exception as e:
-        out.setdefault('nm_coupling_v372_enabled', False)
-        out["nm_coupling_v372_error"] = f"{type(e).__name__}: {e}"
+    # and v372.0 neutronics–materials coupling. Declarative; see _CONTROL_OVERLAYS.
+    _CONTROL_OVERLAYS.run(out, inp, _prof)
 
+    if _prof is not None:
+        _prof.mark("transport_control_merge")
     # =========================================================================
-    # Multi-species impurity radiation authority (v399) — post-truth overlay (PROPOSAL-022/021)
-    # Must run before v402 dominance so ranking sees v399 partition keys.
+    # Post-truth authority overlays (v399 … v421, then v402 dominance).
+    # Declarative; see _POST_TRUTH_OVERLAYS for order and wiring.
     # =========================================================================
-    try:
-        try:
-            from analysis.impurity_radiation_v399 import (
-                evaluate_impurity_radiation_authority_v399,
-            )
-        except ImportError:
-            from ..analysis.impurity_radiation_v399 import (
-                evaluate_impurity_radiation_authority_v399,
-            )
-        v399_patch = evaluate_impurity_radiation_authority_v399(out, inp)
-        if isinstance(v399_patch, dict):
-            out.update(v399_patch)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_impurity_v399",
-            error_key="impurity_v399_error",
-            exc=e,
-        )
-
-    # =========================================================================
-    # ELM / transient heat-load authority (v409) — PHYS-004
-    # =========================================================================
-    try:
-        try:
-            from analysis.elm_transient_heat_v409 import evaluate_elm_transient_heat_v409
-        except ImportError:
-            from ..analysis.elm_transient_heat_v409 import evaluate_elm_transient_heat_v409
-        elm409 = evaluate_elm_transient_heat_v409(out, inp)
-        if isinstance(elm409, dict):
-            out.update(elm409)
-            # PHYS-009: couple ELM duty-cycle downtime into availability ledger
-            elm_down = float(out.get("elm_availability_downtime_frac_v409", float("nan")))
-            if elm_down == elm_down and elm_down > 0.0:
-                av0 = float(out.get("availability_model", float("nan")))
-                if av0 == av0:
-                    out["availability_model_before_elm_v409"] = av0
-                    out["availability_model"] = max(0.0, av0 * (1.0 - min(elm_down, 0.5)))
-                    out["elm_availability_coupled_v409"] = 1.0
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_elm_transient_heat_v409",
-            error_key="elm_transient_heat_v409_error",
-            exc=e,
-        )
-
-    # =========================================================================
-    # CD mix plant electric ledger (v408) — PHYS-006
-    # =========================================================================
-    try:
-        try:
-            from analysis.cd_mix_plant_ledger_v408 import evaluate_cd_mix_plant_ledger_v408
-        except ImportError:
-            from ..analysis.cd_mix_plant_ledger_v408 import evaluate_cd_mix_plant_ledger_v408
-        cd408 = evaluate_cd_mix_plant_ledger_v408(out, inp)
-        if isinstance(cd408, dict):
-            out.update(cd408)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="cd_mix_enable",
-            error_key="cd_mix_plant_ledger_v408_error",
-            exc=e,
-        )
-
-    # =========================================================================
-    # Magnet SC system authority (v410) — TF/PF/CS depth beyond v400
-    # MATCH-as-overlay; algebraic only; no magnet iteration in L0.
-    # Runs after PF/CS proxies so family ledgers see full magnet outputs.
-    # =========================================================================
-    try:
-        try:
-            from analysis.magnet_sc_system_authority_v410 import (
-                evaluate_magnet_sc_system_authority_v410,
-            )
-        except ImportError:
-            from ..analysis.magnet_sc_system_authority_v410 import (
-                evaluate_magnet_sc_system_authority_v410,
-            )
-        mag410 = evaluate_magnet_sc_system_authority_v410(out, inp)
-        if isinstance(mag410, dict):
-            out.update(mag410)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_magnet_sc_system_authority_v410",
-            error_key="magnet_sc_system_authority_v410_error",
-            exc=e,
-        )
-
-    # =========================================================================
-    # Machine-build / radial closure authority (v412)
-    # MATCH-as-overlay; algebraic narrative from L0 stack; no build solvers in L0.
-    # =========================================================================
-    try:
-        try:
-            from analysis.machine_build_authority_v412 import (
-                evaluate_machine_build_authority_v412,
-            )
-        except ImportError:
-            from ..analysis.machine_build_authority_v412 import (
-                evaluate_machine_build_authority_v412,
-            )
-        mb412 = evaluate_machine_build_authority_v412(out, inp)
-        if isinstance(mb412, dict):
-            out.update(mb412)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_machine_build_authority_v412",
-            error_key="machine_build_authority_v412_error",
-            exc=e,
-        )
-
-    # =========================================================================
-    # Plant Sankey-grade ledger authority (v419) — extend v408 / plant closure
-    # MATCH-as-overlay; algebraic source→sink flows + conservation checks.
-    # No plant power iteration / solvers in L0. Pe_net still watermarked via
-    # plant_kpi_honesty.v1 in artifacts / UI.
-    # =========================================================================
-    try:
-        try:
-            from analysis.plant_sankey_ledger_authority_v419 import (
-                evaluate_plant_sankey_ledger_authority_v419,
-            )
-        except ImportError:
-            from ..analysis.plant_sankey_ledger_authority_v419 import (
-                evaluate_plant_sankey_ledger_authority_v419,
-            )
-        plant419 = evaluate_plant_sankey_ledger_authority_v419(out, inp)
-        if isinstance(plant419, dict):
-            out.update(plant419)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_plant_sankey_ledger_authority_v419",
-            error_key="plant_sankey_ledger_authority_v419_error",
-            exc=e,
-        )
-
-    # =========================================================================
-    # Availability → OPEX / LCOE coupling authority (v420) — Independence 2.4
-    # MATCH-as-overlay; one availability chain feeds hours → energy → OPEX →
-    # LCOE consistently. No availability/economics iteration in L0. LCOE and
-    # Pe_net display stay watermarked via plant_kpi_honesty.v1.
-    # =========================================================================
-    try:
-        try:
-            from analysis.availability_opex_lcoe_authority_v420 import (
-                evaluate_availability_opex_lcoe_authority_v420,
-            )
-        except ImportError:
-            from ..analysis.availability_opex_lcoe_authority_v420 import (
-                evaluate_availability_opex_lcoe_authority_v420,
-            )
-        avail420 = evaluate_availability_opex_lcoe_authority_v420(out, inp)
-        if isinstance(avail420, dict):
-            out.update(avail420)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_availability_opex_lcoe_authority_v420",
-            error_key="availability_opex_lcoe_authority_v420_error",
-            exc=e,
-        )
-
-    # =========================================================================
-    # Bottom-up modular costing authority (v421) — Independence 2.5
-    # MATCH-as-overlay; modular direct/indirect CAPEX account ledger with
-    # explicit drivers, transparent in-repo unit rates, and PROXY provenance
-    # (not 1990 Generomak). No costing iteration in L0. COE/LCOE display
-    # stays watermarked via plant_kpi_honesty.v1. Empty patch when OFF.
-    # =========================================================================
-    try:
-        try:
-            from analysis.bottom_up_costing_authority_v421 import (
-                evaluate_bottom_up_costing_authority_v421,
-            )
-        except ImportError:
-            from ..analysis.bottom_up_costing_authority_v421 import (
-                evaluate_bottom_up_costing_authority_v421,
-            )
-        costing421 = evaluate_bottom_up_costing_authority_v421(out, inp)
-        if isinstance(costing421, dict):
-            out.update(costing421)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_bottom_up_costing_authority_v421",
-            error_key="bottom_up_costing_authority_v421_error",
-            exc=e,
-        )
-
-    # =========================================================================
-    # Added: Authority Dominance Engine 2.0 (v402.0.0)
-    # Global cross-authority dominance ranking + regime classification.
-    # Governance-only overlay; deterministic; no truth edits.
-    # =========================================================================
-    try:
-        try:
-            from analysis.authority_dominance_v402 import (
-                evaluate_authority_dominance_v402,
-            )
-        except ImportError:
-            from ..analysis.authority_dominance_v402 import (
-                evaluate_authority_dominance_v402,
-            )
-        dom402 = evaluate_authority_dominance_v402(out=out, inp=inp)
-        if isinstance(dom402, dict):
-            out.update(dom402)
-    except Exception as e:
-        _record_overlay_failure(
-            out,
-            enabled_key="include_authority_dominance_v402",
-            error_key="authority_dominance_v402_error",
-            exc=e,
-        )
+    _POST_TRUTH_OVERLAYS.run(out, inp, _prof)
+    if _prof is not None:
+        _prof.mark("overlays_post_truth")
 
     # -------------------------------------------------------------------------
     # Authority failure surfacing (governance-only; deterministic).
@@ -3714,25 +3423,36 @@ def _hot_ion_point_uncached(inp: PointInputs, Paux_for_Q_MW: Optional[float] = N
     ]
     out["_authority_warnings"] = _auth_warnings
     out["_authority_warning_count"] = float(len(_auth_warnings))
+    if _prof is not None:
+        _prof.mark("authority_warnings")
+        finish_stage_profile(_prof, out)
 
     return out
 
 
-import pickle
-from functools import lru_cache
+def _point_cache_key(inp: PointInputs, Paux_for_Q_MW: Optional[float]) -> Any:
+    # The PointInputs fingerprint replaces hashing/comparing all ~640 fields.
+    fingerprint = getattr(inp, "fingerprint", None)
+    return (fingerprint() if callable(fingerprint) else inp, Paux_for_Q_MW)
 
-@lru_cache(maxsize=2048)
-def _hot_ion_point_cached(inp: PointInputs, Paux_for_Q_MW: Optional[float]) -> bytes:
-    # Cache a serialized dict to preserve nested outputs (e.g. profile_meta).
-    out = _hot_ion_point_uncached(inp, Paux_for_Q_MW)
-    return pickle.dumps(out, protocol=4)
 
-def hot_ion_point(inp: PointInputs, Paux_for_Q_MW: Optional[float] = None) -> Dict[str, float]:
+def hot_ion_point(
+    inp: PointInputs, Paux_for_Q_MW: Optional[float] = None, *, cache_mode: Optional[str] = None
+) -> Dict[str, float]:
     """Public entrypoint.
 
     Uses an LRU cache when inputs.enable_point_cache is True (default) to accelerate scans/optimizers.
+    Cached outputs are returned as a defensive deep copy by default;
+    ``cache_mode="view"`` (or the process-wide mode, see
+    :mod:`physics.point_cache`) returns a read-only copy-on-write view instead.
+    Points evaluated with stage profiling on (``SHAMS_PROFILE_STAGES=1`` or
+    ``set_stage_profiling(True)``) bypass the cache so ``_stage_timings_ms``
+    always reflects a real evaluation.
     """
-    if bool(getattr(inp, "enable_point_cache", True)):
-        blob = _hot_ion_point_cached(inp, Paux_for_Q_MW)
-        return pickle.loads(blob)
+    if bool(getattr(inp, "enable_point_cache", True)) and not _stage_profiling_enabled():
+        key = _point_cache_key(inp, Paux_for_Q_MW)
+        out = _point_cache.lookup(key, cache_mode)
+        if out is None:
+            out = _point_cache.store(key, _hot_ion_point_uncached(inp, Paux_for_Q_MW), cache_mode)
+        return out
     return _hot_ion_point_uncached(inp, Paux_for_Q_MW)
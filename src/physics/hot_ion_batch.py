@@ -0,0 +1,421 @@
+from __future__ import annotations
+"""Columnar batch evaluation of ``hot_ion_point``.
+
+Scans (Scan Lab, sensitivity sweeps, surrogate training sets) evaluate one
+base :class:`PointInputs` with a handful of fields varied over many rows.
+Calling ``hot_ion_point`` row by row pays for the full ~700-key point model
+even when the caller only reads a few core figures of merit.
+
+:func:`hot_ion_point_batch` takes the base point plus column arrays for the
+varied fields and returns columnar NumPy outputs:
+
+- the core algebraic blocks (geometry, Greenwald density, Bosch–Hale fusion
+  power, alpha heating, fractional radiation / P_SOL, stored energy,
+  IPB98(y,2) / ITER89-P confinement with transport stiffness, Q, q95 and β
+  screening proxies, plant power closure) are evaluated as array operations
+  for every row in one pass (:data:`VECTOR_OUTPUTS`)
+- a row falls back to the scalar ``hot_ion_point`` when it cannot be
+  vectorized: a switch the kernel does not model is active (see
+  :func:`batch_unsupported_reason`), a varied column is not a kernel input,
+  an output outside :data:`VECTOR_OUTPUTS` is requested, the row fails
+  ``PointInputs`` validation, or the kernel produced a non-finite value
+  (the scalar path then decides, including raising)
+
+Vectorized rows reproduce the scalar expressions term by term in the same
+evaluation order. Additions, products and square roots are bit-identical;
+NumPy's ``power``/``exp`` may differ from libm by an ulp, so the stated
+agreement is ``rtol = BATCH_RTOL`` (1e-12) against ``hot_ion_point``.
+
+Acceleration only: the scalar model remains the authority.
+
+Author: © 2026 Afshin Arjhangmehr
+"""
+
+import dataclasses
+import math
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from ..phase1_models import BH_COEFFS, KEV_TO_J, MU0  # type: ignore
+    from ..engineering.thermal_hydraulics import COOLANTS  # type: ignore
+except ImportError:
+    from phase1_models import BH_COEFFS, KEV_TO_J, MU0  # type: ignore
+    from engineering.thermal_hydraulics import COOLANTS  # type: ignore
+
+BATCH_RTOL = 1e-12
+
+VECTORIZED_KEY = "_vectorized"
+OK_KEY = "_ok"
+
+# Numeric PointInputs fields the kernel reads. A column on any other field
+# routes every row through the scalar path.
+KERNEL_FIELDS: Tuple[str, ...] = (
+    "R0_m", "a_m", "kappa", "Bt_T", "Ip_MA", "Ti_keV", "fG", "Paux_MW", "Ti_over_Te",
+    "tau_T_loss_s", "tritium_retention", "f_He_ash", "dilution_fuel", "t_shield_m",
+    "f_rad_core", "f_rad_div", "alpha_loss_frac", "alpha_prompt_loss_k",
+    "confinement_mult", "A_eff", "transport_stiffness_c", "Ploss_ref_MW",
+    "blanket_energy_mult", "P_pumps_MW", "T_outlet_K", "eta_elec", "eta_aux_wallplug",
+    "eta_cd_wallplug", "eta_tf_wallplug", "P_balance_of_plant_MW", "P_cryo_20K_MW", "cryo_COP",
+)
+
+VECTOR_OUTPUTS: Tuple[str, ...] = (
+    "V", "A_fw_m2", "nGW", "ne20", "ne_m3", "Te_keV",
+    "Pfus_DT_MW", "Pfus_DD_MW", "Pfus_DT_adj_MW", "P_n_DT_MW", "P_n_DD_MW",
+    "eps_n", "S_n_W_m2", "rho_star", "alpha_loss_frac_eff", "Palpha_MW", "Pin_MW",
+    "Prad_core_MW", "Prad_SOL_MW", "P_SOL_MW", "P_SOL_over_R_MW_m", "Ploss_MW",
+    "W_MJ", "tauE_s", "tauIPB98_s", "tauITER89_s", "tauScaling_s", "tauE_eff_s",
+    "H98", "H_scaling", "tauE_required_s", "H_required", "Q_DT_eqv",
+    "q95_proxy", "beta_proxy", "betaN_proxy",
+    "Pfus_total_MW", "Pth_total_MW", "P_e_gross_MW", "P_recirc_MW", "P_e_net_MW", "Qe",
+)
+
+# Outputs that are legitimately NaN for valid inputs (NaN-disabled knobs).
+_NAN_ALLOWED = frozenset({"Prad_SOL_MW"})
+
+_SCALING_IPB = "IPB98"
+_SCALING_ITER89 = "ITER89P"
+_ITER89_ALIASES = frozenset({"ITER89P", "ITER89-P", "89P"})
+_OTHER_SCALINGS = frozenset({
+    "KG", "KAYE", "KAYE-GOLDSTON", "KAYEGOLDSTON",
+    "NEOALC", "NEO-ALCATOR", "NEOALCATOR", "NA",
+    "MIRNOV", "SHIMOMURA", "SHIMO",
+})
+
+J_PER_MEV = 1.602176634e-13
+
+
+def _scaling_name(inp: Any) -> str:
+    scaling_raw = getattr(inp, "confinement_scaling", None)
+    if scaling_raw is None:
+        scaling_raw = getattr(inp, "confinement_model", "ipb98y2")
+    scaling = (str(scaling_raw) or "IPB98y2").upper().replace(" ", "")
+    if scaling in _ITER89_ALIASES:
+        return _SCALING_ITER89
+    if scaling in _OTHER_SCALINGS:
+        return scaling
+    return _SCALING_IPB
+
+
+def batch_unsupported_reason(inp: Any) -> str:
+    """Why ``inp``'s switch settings need the scalar path ("" when the kernel covers them).
+
+    Each switch listed here feeds a branch that changes a :data:`VECTOR_OUTPUTS`
+    value and is not modelled by the array kernel.
+    """
+    if str(inp.fuel_mode or "DT").upper() not in ("DT", "DD"):
+        return "fuel_mode"
+    if str(inp.profile_model or "none").lower() != "none":
+        return "profile_model"
+    if bool(inp.include_radiation) and str(inp.radiation_model or "fractional").lower() != "fractional":
+        return "radiation_model"
+    if str(getattr(inp, "alpha_loss_model", "fixed") or "fixed").lower() not in ("fixed", "rho_star"):
+        return "alpha_loss_model"
+    if bool(getattr(inp, "include_profile_family_v358", False)):
+        return "include_profile_family_v358"
+    if bool(getattr(inp, "include_profile_proxy_v397", False)):
+        return "include_profile_proxy_v397"
+    if _scaling_name(inp) not in (_SCALING_IPB, _SCALING_ITER89):
+        return "confinement_scaling"
+    if str(getattr(inp, "magnet_technology", "HTS_REBCO") or "HTS_REBCO").strip().upper() == "COPPER":
+        return "magnet_technology"
+    if bool(getattr(inp, "include_current_drive", False)):
+        return "include_current_drive"
+    return ""
+
+
+# Python's max(a, b) / min(a, b) keep ``a`` unless ``b`` compares strictly
+# greater / smaller, so a NaN in either position resolves like the scalar code.
+def _pmax(a: Any, b: Any) -> np.ndarray:
+    return np.where(b > a, b, a)
+
+
+def _pmin(a: Any, b: Any) -> np.ndarray:
+    return np.where(b < a, b, a)
+
+
+def _or(x: np.ndarray, default: float) -> np.ndarray:
+    """``float(x or default)`` elementwise (NaN is truthy)."""
+    return np.where(x == 0.0, default, x)
+
+
+def _sigmav(Ti: np.ndarray, reaction: str) -> np.ndarray:
+    """Array form of ``phase1_models.bosch_hale_sigmav`` (requires Ti > 0)."""
+    c = BH_COEFFS[reaction]
+    denom = 1.0 + Ti * (c.C3 + Ti * (c.C5 + Ti * c.C7))
+    numer = Ti * (c.C2 + Ti * (c.C4 + Ti * c.C6))
+    theta = Ti / (1.0 - numer / denom)
+    xi = ((c.BG * c.BG) / (4.0 * theta)) ** (1.0 / 3.0)
+    sigmav = c.C1 * theta * np.sqrt(xi / (c.MRC2 * Ti**3)) * np.exp(-3.0 * xi) * 1e-6
+    return _pmax(sigmav, 0.0)
+
+
+def _electric_efficiency(coolant: str, T: np.ndarray) -> np.ndarray:
+    c = (coolant or "").strip().lower()
+    if c == "water":
+        eta = 0.33 + 1.2e-4 * (T - 550.0)
+    elif c in ("helium", "flibe"):
+        eta = 0.40 + 1.6e-4 * (T - 900.0)
+    else:
+        eta = 0.35 + 1.3e-4 * (T - 700.0)
+    return _pmax(0.25, _pmin(0.55, eta))
+
+
+def _kernel(base: Any, col: Callable[[str], np.ndarray], Paux_for_Q_MW: Optional[float]) -> Dict[str, np.ndarray]:
+    """Core ``hot_ion_point`` algebra over arrays; mirrors the scalar expressions."""
+    R = col("R0_m")
+    a = col("a_m")
+    kappa = col("kappa")
+    Bt = col("Bt_T")
+    Ip = col("Ip_MA")
+    Ti = col("Ti_keV")
+    Paux = col("Paux_MW")
+
+    # Geometry / density
+    V = 2.0 * math.pi**2 * R * (a**2) * kappa
+    A_fw = 4.0 * math.pi**2 * R * a * kappa
+    Te = Ti / _pmax(col("Ti_over_Te"), 1e-9)
+    nGW20 = Ip / (math.pi * a**2)
+    ne20 = col("fG") * nGW20
+    ne_m3 = ne20 * 1e20
+
+    # Fusion power (Bosch–Hale; DT 50/50 or pure D with optional secondary DT)
+    sigv_DT = _sigmav(Ti, "DT")
+    sigv_DD_Tp = _sigmav(Ti, "DD_Tp")
+    sigv_DD_He3n = _sigmav(Ti, "DD_He3n")
+    fuel_mode = str(base.fuel_mode or "DT").upper()
+    if fuel_mode == "DT":
+        nD = 0.5 * ne_m3
+        nT = 0.5 * ne_m3
+    else:
+        nD = ne_m3
+        nT = 0.0
+    R_DT = nD * nT * sigv_DT
+    R_DD_Tp = 0.5 * nD * nD * sigv_DD_Tp
+    R_DD_He3n = 0.5 * nD * nD * sigv_DD_He3n
+    if fuel_mode == "DD" and bool(base.include_secondary_DT):
+        tau_T = _pmax(col("tau_T_loss_s"), 1e-6)
+        f_ret = _pmin(_pmax(col("tritium_retention"), 0.0), 1.0)
+        nT = (f_ret * R_DD_Tp) / ((1.0 / tau_T) + (nD * sigv_DT))
+        R_DT = nD * nT * sigv_DT
+
+    Pfus_DT_MW = (R_DT * (17.6 * J_PER_MEV) * V) / 1e6
+    Pfus_DD_MW = ((R_DD_Tp * (4.03 * J_PER_MEV) + R_DD_He3n * (3.27 * J_PER_MEV)) * V) / 1e6
+    P_n_DT_MW = (R_DT * (14.1 * J_PER_MEV) * V) / 1e6
+    P_n_DD_MW = (R_DD_He3n * (2.45 * J_PER_MEV) * V) / 1e6
+
+    ash_mode = str(getattr(base, "ash_dilution_mode", "off") or "off").lower()
+    ash_factor: Any = 1.0
+    if ash_mode == "fixed_fraction":
+        f_he_ash = _pmin(_pmax(_or(col("f_He_ash"), 0.0), 0.0), 0.9)
+        ash_factor = _pmax((1.0 - f_he_ash) ** 2, 0.0)
+    Pfus_DT_adj_MW = (Pfus_DT_MW + Pfus_DD_MW) * col("dilution_fuel") * ash_factor
+
+    P_n_W = (P_n_DT_MW + P_n_DD_MW) * 1e6
+    t_shield = col("t_shield_m")
+    eps_n = np.where(t_shield <= 0.0, 0.0, 1.0 - np.exp(-t_shield / 0.25))
+    S_n_W_m2 = P_n_W / _pmax(A_fw, 1e-9)
+
+    # Alpha heating / power balance
+    m_i = 2.5 * 1.66053906660e-27
+    Ti_J = _pmax(Ti, 1e-9) * KEV_TO_J
+    rho_i = (m_i * Ti_J) ** 0.5 / (1.602176634e-19 * _pmax(Bt, 1e-9))
+    rho_star = rho_i / _pmax(a, 1e-9)
+    alpha_loss_frac_eff = col("alpha_loss_frac")
+    if str(getattr(base, "alpha_loss_model", "fixed") or "fixed").lower() == "rho_star":
+        k_prompt = _or(col("alpha_prompt_loss_k"), 0.0)
+        alpha_loss_frac_eff = alpha_loss_frac_eff + k_prompt * np.where(rho_star == rho_star, rho_star, 0.0)
+    alpha_loss_frac_eff = _pmin(_pmax(alpha_loss_frac_eff, 0.0), 0.9)
+    if bool(base.include_alpha_loss):
+        Palpha_MW = 0.2 * Pfus_DT_adj_MW * (1.0 - alpha_loss_frac_eff)
+    else:
+        Palpha_MW = 0.2 * Pfus_DT_adj_MW
+    Pin_MW = Paux + Palpha_MW
+
+    if bool(base.include_radiation):
+        Prad_core_MW = _pmin(_pmax(col("f_rad_core"), 0.0), 0.95) * Pin_MW
+    else:
+        Prad_core_MW = np.zeros_like(Pin_MW)
+    P_SOL_MW = _pmax(Pin_MW - Prad_core_MW, 1e-9)
+    f_div = col("f_rad_div")
+    Prad_SOL_MW = np.where(f_div == f_div, _pmin(_pmax(f_div, 0.0), 0.95) * P_SOL_MW, np.nan)
+    P_SOL_over_R = P_SOL_MW / _pmax(R, 1e-9)
+    Ploss_MW = P_SOL_MW
+
+    # Stored energy and confinement
+    W_MJ = (1.5 * ne_m3 * ((Te + Ti) * KEV_TO_J) * V) / 1e6
+    cm = col("confinement_mult")
+    tauE_s = (W_MJ / _pmax(Ploss_MW, 1e-9)) * _pmax(cm, 0.0) * 1.0
+    A_eff = col("A_eff")
+    eps = a / _pmax(R, 1e-9)
+    tauIPB_s = (
+        0.0562 * (Ip ** 0.93) * (Bt ** 0.15) * (ne20 ** 0.41) * (Ploss_MW ** -0.69)
+        * (R ** 1.97) * (eps ** 0.58) * (kappa ** 0.78) * (A_eff ** 0.19)
+    )
+    tauITER89_s = (
+        0.048 * (Ip ** 0.85) * (Bt ** 0.20) * (ne20 ** 0.10) * (Ploss_MW ** -0.50)
+        * (R ** 1.20) * (a ** 0.30) * (kappa ** 0.50) * (A_eff ** 0.50) * (eps ** 0.00)
+    )
+    tauScaling_s = tauITER89_s if _scaling_name(base) == _SCALING_ITER89 else tauIPB_s
+    c_stiff = _or(col("transport_stiffness_c"), 0.0)
+    Ploss_ref = _or(col("Ploss_ref_MW"), 100.0)
+    stiff_fac = 1.0 + c_stiff * _pmax(0.0, (Ploss_MW / _pmax(Ploss_ref, 1e-9)) - 1.0)
+    tauE_eff_s = tauE_s / _pmax(stiff_fac, 1e-9)
+    H98 = tauE_eff_s / _pmax(tauIPB_s, 1e-12)
+    H_scaling = tauE_eff_s / _pmax(tauScaling_s, 1e-12)
+    tauE_required_s = (W_MJ / _pmax(Ploss_MW, 1e-9)) * _pmax(_or(cm, 0.0), 0.0) * 1.0
+    H_required = tauE_required_s / _pmax(tauIPB_s, 1e-12)
+    Q_denom = Paux if Paux_for_Q_MW is None else float(Paux_for_Q_MW)
+    Q_DT_eqv = Pfus_DT_adj_MW / _pmax(Q_denom, 1e-9)
+
+    # Screening proxies
+    q95 = (2.0 * math.pi * R * Bt / (MU0 * (Ip * 1e6))) * (a / _pmax(R, 1e-9)) / _pmax(kappa, 1e-6)
+    p_Pa = ne_m3 * ((Te + Ti) * KEV_TO_J)
+    B2_over_2mu0 = (Bt**2) / (2.0 * 4e-7 * math.pi)
+    beta = p_Pa / _pmax(B2_over_2mu0, 1e-30)
+    betaN = (100.0 * beta) * a * Bt / Ip
+
+    # Plant power closure (no current drive, superconducting TF)
+    Pfus_total_MW = _pmax(Pfus_DT_adj_MW + Pfus_DD_MW, 0.0)
+    coolant = getattr(base, "coolant", "Helium")
+    blanket_mult = col("blanket_energy_mult")
+    pump_coeff = COOLANTS.get(coolant, COOLANTS["Helium"]).pump_frac_coeff
+    P_pumps_model = _pmax(0.0, pump_coeff * _pmax(0.0, Pfus_total_MW * blanket_mult))
+    P_pumps_in = col("P_pumps_MW")
+    P_pumps_use = np.where(P_pumps_in == P_pumps_in, P_pumps_in, P_pumps_model)
+    if str(getattr(base, "eta_elec_model", "auto")).strip().lower() == "auto":
+        eta_elec = _electric_efficiency(coolant, col("T_outlet_K"))
+    else:
+        eta_elec = col("eta_elec")
+    Pth_MW = _pmax(blanket_mult, 0.0) * _pmax(Pfus_total_MW, 0.0)
+    Pe_gross = _pmax(eta_elec, 0.0) * Pth_MW
+    Paux_el = _pmax(Paux, 0.0) / _pmax(col("eta_aux_wallplug"), 1e-9)
+    Pcd_el = 0.0 / _pmax(col("eta_cd_wallplug"), 1e-9)
+    Pcryo_el = _pmax(col("P_cryo_20K_MW"), 0.0) / _pmax(col("cryo_COP"), 1e-9)
+    Ptf_el = 0.0 / _pmax(col("eta_tf_wallplug"), 1e-9)
+    Precirc = Paux_el + Pcd_el + Ptf_el + _pmax(col("P_balance_of_plant_MW"), 0.0) + _pmax(P_pumps_use, 0.0) + Pcryo_el
+    Pe_net = Pe_gross - Precirc
+    Qe = Pe_gross / _pmax(Precirc, 1e-9)
+
+    return {
+        "V": V, "A_fw_m2": A_fw, "nGW": nGW20, "ne20": ne20, "ne_m3": ne_m3, "Te_keV": Te,
+        "Pfus_DT_MW": Pfus_DT_MW, "Pfus_DD_MW": Pfus_DD_MW, "Pfus_DT_adj_MW": Pfus_DT_adj_MW,
+        "P_n_DT_MW": P_n_DT_MW, "P_n_DD_MW": P_n_DD_MW, "eps_n": eps_n, "S_n_W_m2": S_n_W_m2,
+        "rho_star": rho_star, "alpha_loss_frac_eff": alpha_loss_frac_eff,
+        "Palpha_MW": Palpha_MW, "Pin_MW": Pin_MW, "Prad_core_MW": Prad_core_MW,
+        "Prad_SOL_MW": Prad_SOL_MW, "P_SOL_MW": P_SOL_MW, "P_SOL_over_R_MW_m": P_SOL_over_R,
+        "Ploss_MW": Ploss_MW, "W_MJ": W_MJ, "tauE_s": tauE_s, "tauIPB98_s": tauIPB_s,
+        "tauITER89_s": tauITER89_s, "tauScaling_s": tauScaling_s, "tauE_eff_s": tauE_eff_s,
+        "H98": H98, "H_scaling": H_scaling, "tauE_required_s": tauE_required_s,
+        "H_required": H_required, "Q_DT_eqv": Q_DT_eqv,
+        "q95_proxy": q95, "beta_proxy": beta, "betaN_proxy": betaN,
+        "Pfus_total_MW": Pfus_total_MW, "Pth_total_MW": Pth_MW, "P_e_gross_MW": Pe_gross,
+        "P_recirc_MW": Precirc, "P_e_net_MW": Pe_net, "Qe": Qe,
+    }
+
+
+def _valid_rows(col: Callable[[str], np.ndarray]) -> np.ndarray:
+    """Array form of the ``PointInputs.__post_init__`` guards."""
+    R, a = col("R0_m"), col("a_m")
+    return (
+        (R > 0.0) & (a > 0.0) & (R > a) & (col("kappa") >= 1.0) & (col("Bt_T") > 0.0)
+        & (col("Ip_MA") > 0.0) & (col("Ti_keV") > 0.0) & (col("fG") > 0.0)
+    )
+
+
+def _py(v: Any) -> Any:
+    return v.item() if isinstance(v, np.generic) else v
+
+
+def hot_ion_point_batch(
+    base: Any,
+    columns: Mapping[str, Sequence[Any]],
+    *,
+    outputs: Optional[Iterable[str]] = None,
+    Paux_for_Q_MW: Optional[float] = None,
+    vectorize: bool = True,
+    scalar_fn: Optional[Callable[[Any], Dict[str, Any]]] = None,
+) -> Dict[str, np.ndarray]:
+    """Evaluate ``base`` with ``columns`` varied row by row; return columnar outputs.
+
+    base:          PointInputs holding every non-varied field
+    columns:       field name -> equal-length sequence of values (one row per index)
+    outputs:       output keys to return (default :data:`VECTOR_OUTPUTS`)
+    Paux_for_Q_MW: forwarded as in ``hot_ion_point``
+    vectorize:     False forces the scalar path for every row (reference mode)
+    scalar_fn:     per-row fallback (default ``hot_ion_point(inp, Paux_for_Q_MW)``)
+
+    Returns ``{key: ndarray}`` (float64; object dtype if a scalar row produced
+    a non-numeric value) plus ``"_vectorized"`` and ``"_ok"`` boolean masks.
+    Rows whose scalar evaluation raises have ``_ok`` False and NaN outputs.
+    """
+    field_names = {f.name for f in dataclasses.fields(base)}
+    unknown = sorted(k for k in columns if k not in field_names)
+    if unknown:
+        raise ValueError(f"hot_ion_point_batch: unknown PointInputs fields {unknown}")
+    lengths = {len(v) for v in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"hot_ion_point_batch: columns have unequal lengths {sorted(lengths)}")
+    n = lengths.pop() if lengths else 1
+    keys = tuple(VECTOR_OUTPUTS if outputs is None else outputs)
+
+    vec = np.zeros(n, dtype=bool)
+    ok = np.ones(n, dtype=bool)
+    result: Dict[str, np.ndarray] = {k: np.full(n, np.nan) for k in keys}
+
+    if (
+        vectorize
+        and n > 0
+        and set(keys) <= set(VECTOR_OUTPUTS)
+        and set(columns) <= set(KERNEL_FIELDS)
+        and not batch_unsupported_reason(base)
+    ):
+        arrays = {k: np.asarray(v, dtype=float) for k, v in columns.items()}
+
+        def col(name: str) -> np.ndarray:
+            x = arrays.get(name)
+            if x is None:
+                x = arrays[name] = np.full(n, float(getattr(base, name)))
+            return x
+
+        with np.errstate(all="ignore"):
+            valid = _valid_rows(col)
+            kout = _kernel(base, col, Paux_for_Q_MW)
+        finite = valid.copy()
+        for k in keys:
+            if k not in _NAN_ALLOWED:
+                finite &= np.isfinite(kout[k])
+        vec = finite
+        for k in keys:
+            result[k][vec] = kout[k][vec]
+
+    if not vec.all():
+        if scalar_fn is None:
+            try:
+                from .hot_ion import hot_ion_point  # type: ignore
+            except ImportError:
+                from physics.hot_ion import hot_ion_point  # type: ignore
+
+            def scalar_fn(inp: Any) -> Dict[str, Any]:
+                return hot_ion_point(inp, Paux_for_Q_MW=Paux_for_Q_MW)
+
+        replace = getattr(base, "replace", None)
+        for i in np.flatnonzero(~vec):
+            row = {k: _py(v[i]) for k, v in columns.items()}
+            try:
+                inp = replace(**row) if callable(replace) else dataclasses.replace(base, **row)
+                out = scalar_fn(inp)
+            except Exception:
+                ok[i] = False
+                continue
+            for k in keys:
+                v = out.get(k, float("nan"))
+                arr = result[k]
+                if arr.dtype != object and not isinstance(v, (int, float)):
+                    arr = result[k] = arr.astype(object)
+                arr[i] = v
+
+    result[VECTORIZED_KEY] = vec
+    result[OK_KEY] = ok
+    return result
@@ -57,6 +57,18 @@ def _clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
 
+# Species peak parameters (log-space): (mu_logT, sigma, floor, peak) in W m^3.
+_LZ_ENVELOPE_PARAMS: Dict[str, Tuple[float, float, float, float]] = {
+    # Light impurities peak at lower temperatures.
+    "C":  (math.log(0.25), 0.50, 8e-35, 2.5e-33),
+    "N":  (math.log(0.35), 0.52, 8e-35, 3.0e-33),
+    "Ne": (math.log(0.50), 0.55, 8e-35, 5.0e-33),
+    "Ar": (math.log(1.00), 0.60, 8e-35, 8.0e-33),
+    # Tungsten: very high-Z; use a broad high-T envelope (proxy).
+    "W":  (math.log(4.00), 0.85, 5e-35, 3.0e-32),
+}
+
+
 def _lz_envelope_Wm3(species: Species, t_keV: float) -> float:
     """Smooth bounded proxy for Lz(T) in W m^3.
 
@@ -66,18 +78,7 @@ def _lz_envelope_Wm3(species: Species, t_keV: float) -> float:
 
     t_keV = max(0.05, min(50.0, t_keV))
     logt = math.log(t_keV)
-
-    # Species peak parameters (log-space)
-    params = {
-        # Light impurities peak at lower temperatures.
-        "C":  (math.log(0.25), 0.50, 8e-35, 2.5e-33),
-        "N":  (math.log(0.35), 0.52, 8e-35, 3.0e-33),
-        "Ne": (math.log(0.50), 0.55, 8e-35, 5.0e-33),
-        "Ar": (math.log(1.00), 0.60, 8e-35, 8.0e-33),
-        # Tungsten: very high-Z; use a broad high-T envelope (proxy).
-        "W":  (math.log(4.00), 0.85, 5e-35, 3.0e-32),
-    }
-    mu, sigma, floor, peak = params[str(species)]
+    mu, sigma, floor, peak = _LZ_ENVELOPE_PARAMS[str(species)]
     bump = math.exp(-0.5 * ((logt - mu) / sigma) ** 2)
     lz = floor + (peak - floor) * bump
     return lz
@@ -21,10 +21,12 @@ Notes:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Tuple, Any
+from typing import Dict, Tuple, Any, Sequence
 import math
 import json
 
+import numpy as np
+
 # ----------------------------
 # Species definitions (proxy)
 # ----------------------------
@@ -77,6 +79,25 @@ def lz_envelope_Wm3(species: str, t_keV: float) -> float:
     return float(floor + (peak - floor) * bump)
 
 
+def lz_envelope_Wm3_array(species: str, t_keV: Any) -> np.ndarray:
+    """``lz_envelope_Wm3`` over an array of temperatures [keV] (same clamp / fallback)."""
+    sp = str(species).strip()
+    if sp not in _SPECIES:
+        sp = "Ne"
+    mu, sigma, floor, peak = _SPECIES[sp].lz_params
+    logt = np.log(np.clip(np.asarray(t_keV, dtype=float), 0.05, 50.0))
+    return floor + (peak - floor) * np.exp(-0.5 * ((logt - mu) / sigma) ** 2)
+
+
+def lz_envelope_matrix_Wm3(species: Sequence[str], t_keV: Any) -> np.ndarray:
+    """``(len(species),) + shape(t_keV)`` Lz envelopes for a species set at once."""
+    t = np.asarray(t_keV, dtype=float)
+    out = np.empty((len(species),) + t.shape, dtype=float)
+    for k, sp in enumerate(species):
+        out[k] = lz_envelope_Wm3_array(sp, t)
+    return out
+
+
 # ----------------------------
 # Contracts and results
 # ----------------------------
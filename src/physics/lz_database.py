@@ -0,0 +1,198 @@
+"""Compiled Lz(Te) atomic-data tables for impurity line radiation.
+
+``physics.radiation.load_lz_db`` used to re-read, hash and re-parse the JSON
+table on every point evaluation, and ``_loglog_interp`` scanned the table
+linearly with fresh ``math.log`` calls. This module holds the compiled form:
+
+- each table file is read and SHA-256 hashed once per process, keyed by
+  ``(path, mtime_ns, size)`` so an edited file is picked up on the next call;
+- per species, ``log(Te)`` / ``log(Lz)`` are precomputed (as tuples for the
+  scalar path and NumPy arrays for the batch path);
+- the scalar lookup is a binary search followed by the same log-log formula
+  as ``_loglog_interp`` (bit-identical results), and ``lz_array`` /
+  ``lz_matrix`` evaluate many Te values and/or species at once.
+
+Tables are treated as read-only once compiled.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+_SPECIES_ALIASES = {"CARBON": "C", "NEON": "NE", "ARGON": "AR", "TUNGSTEN": "W"}
+
+
+def normalize_species(species: Optional[str]) -> str:
+    """Upper-case species key with the common long-name aliases folded."""
+    sp = (species or "C").strip().upper()
+    return _SPECIES_ALIASES.get(sp, sp)
+
+
+@dataclass(frozen=True)
+class LzTable:
+    """One species' Lz(Te) table in log space (clamped at both ends)."""
+
+    Te_keV: Tuple[float, ...]
+    Lz_W_m3: Tuple[float, ...]
+    log_Te: Tuple[float, ...]
+    log_Lz: Tuple[float, ...]
+    log_Te_arr: np.ndarray
+    log_Lz_arr: np.ndarray
+
+    @staticmethod
+    def from_lists(Te_keV: Sequence[Any], Lz_W_m3: Sequence[Any]) -> "LzTable":
+        xs = tuple(float(x) for x in Te_keV)
+        ys = tuple(float(y) for y in Lz_W_m3)
+        if not xs or len(xs) != len(ys):
+            raise ValueError("Lz table needs matching, non-empty Te_keV / Lz_W_m3")
+        lx = tuple(math.log(x) for x in xs)
+        ly = tuple(math.log(max(y, 1e-300)) for y in ys)
+        return LzTable(
+            Te_keV=xs,
+            Lz_W_m3=ys,
+            log_Te=lx,
+            log_Lz=ly,
+            log_Te_arr=np.asarray(lx, dtype=float),
+            log_Lz_arr=np.asarray(ly, dtype=float),
+        )
+
+    def lz(self, Te_keV: float) -> float:
+        """Lz [W m^3] at one temperature (same arithmetic as ``_loglog_interp``)."""
+        xs = self.Te_keV
+        x = max(float(Te_keV), 1e-12)
+        if x <= xs[0]:
+            return self.Lz_W_m3[0]
+        if x >= xs[-1]:
+            return self.Lz_W_m3[-1]
+        i = bisect_right(xs, x) - 1
+        lx0, lx1 = self.log_Te[i], self.log_Te[i + 1]
+        t = (math.log(x) - lx0) / max(lx1 - lx0, 1e-12)
+        return float(math.exp(self.log_Lz[i] * (1 - t) + self.log_Lz[i + 1] * t))
+
+    def lz_array(self, Te_keV: Any) -> np.ndarray:
+        """Vectorized ``lz`` over an array of temperatures (agrees to rounding)."""
+        x = np.maximum(np.asarray(Te_keV, dtype=float), 1e-12)
+        lx = self.log_Te_arr
+        if lx.size == 1:
+            return np.full(x.shape, self.Lz_W_m3[0], dtype=float)
+        i = np.clip(np.searchsorted(lx, np.log(x), side="right") - 1, 0, lx.size - 2)
+        lx0, lx1 = lx[i], lx[i + 1]
+        t = (np.log(x) - lx0) / np.maximum(lx1 - lx0, 1e-12)
+        y = np.exp(self.log_Lz_arr[i] * (1 - t) + self.log_Lz_arr[i + 1] * t)
+        y = np.where(x <= self.Te_keV[0], self.Lz_W_m3[0], y)
+        return np.where(x >= self.Te_keV[-1], self.Lz_W_m3[-1], y)
+
+
+class LzDatabase:
+    """Species -> ``LzTable`` with the provenance ``load_lz_db`` reports.
+
+    ``tables`` keeps the raw species dict (the legacy ``load_lz_db`` return
+    value); lookups of an unknown species fall back to ``fallback`` ("C").
+    """
+
+    def __init__(
+        self,
+        tables: Mapping[str, Mapping[str, Any]],
+        db_id: str,
+        sha256: str = "",
+        *,
+        fallback: Optional["LzDatabase"] = None,
+    ) -> None:
+        self.tables: Dict[str, Dict[str, Any]] = {str(k).upper(): v for k, v in tables.items()}  # type: ignore[misc]
+        self.db_id = str(db_id)
+        self.sha256 = str(sha256)
+        self._fallback = fallback
+        self._compiled: Dict[str, LzTable] = {}
+        for sp, tbl in self.tables.items():
+            try:
+                self._compiled[sp] = LzTable.from_lists(tbl["Te_keV"], tbl["Lz_W_m3"])
+            except (KeyError, TypeError, ValueError):
+                continue  # malformed species entry: lookups fall back to carbon
+
+    def table(self, species: Optional[str]) -> LzTable:
+        sp = normalize_species(species)
+        t = self._compiled.get(sp) or self._compiled.get("C")
+        if t is None and self._fallback is not None:
+            return self._fallback.table("C")
+        if t is None:
+            raise KeyError(sp)
+        return t
+
+    def lz(self, species: Optional[str], Te_keV: float) -> float:
+        return self.table(species).lz(Te_keV)
+
+    def lz_array(self, species: Optional[str], Te_keV: Any) -> np.ndarray:
+        return self.table(species).lz_array(Te_keV)
+
+    def lz_matrix(self, species: Sequence[str], Te_keV: Any) -> np.ndarray:
+        """``(len(species),) + shape(Te_keV)`` array of Lz for every species/temperature pair."""
+        Te = np.asarray(Te_keV, dtype=float)
+        out = np.empty((len(species),) + Te.shape, dtype=float)
+        for k, sp in enumerate(species):
+            out[k] = self.table(sp).lz_array(Te)
+        return out
+
+
+# (resolved path, mtime_ns, size) -> compiled database
+_FILE_CACHE: Dict[Tuple[str, int, int], LzDatabase] = {}
+_FILE_CACHE_LOCK = threading.Lock()
+# id(tables dict) -> database, so ``Lz_W_m3(db_tables=...)`` can reuse compiled tables.
+_BY_TABLES_ID: Dict[int, LzDatabase] = {}
+
+
+def register_database(db: LzDatabase) -> LzDatabase:
+    """Make ``db.tables`` resolvable through :func:`database_for_tables`."""
+    _BY_TABLES_ID[id(db.tables)] = db
+    return db
+
+
+def database_for_tables(tables: Any) -> Optional[LzDatabase]:
+    """Compiled database owning this exact ``tables`` dict (None for foreign dicts)."""
+    db = _BY_TABLES_ID.get(id(tables))
+    return db if db is not None and db.tables is tables else None
+
+
+def load_lz_file(path: Union[str, Path], db_id: str, *, fallback: Optional[LzDatabase] = None) -> LzDatabase:
+    """Compiled database for a ``{"species": {...}}`` JSON file, cached per file version.
+
+    Raises ``OSError`` / ``ValueError`` on unreadable or invalid files; the
+    caller decides the fallback.
+    """
+    st = os.stat(path)
+    key = (str(path), int(st.st_mtime_ns), int(st.st_size))
+    db = _FILE_CACHE.get(key)
+    if db is not None and db.db_id == db_id:
+        return db
+    with open(path, "rb") as f:
+        raw = f.read()
+    h = hashlib.sha256(raw).hexdigest()
+    obj = json.loads(raw.decode("utf-8"))
+    species = obj.get("species")
+    if not isinstance(species, dict) or len(species) == 0:
+        raise ValueError("lz db missing 'species'")
+    tables = {str(k).upper(): v for k, v in species.items() if isinstance(v, dict)}
+    if len(tables) == 0:
+        raise ValueError("lz db had no valid species tables")
+    db = register_database(LzDatabase(tables, db_id, h, fallback=fallback))
+    with _FILE_CACHE_LOCK:
+        for k in [k for k in _FILE_CACHE if k[0] == key[0]]:
+            _BY_TABLES_ID.pop(id(_FILE_CACHE.pop(k).tables), None)
+        _FILE_CACHE[key] = db
+    return db
+
+
+def clear_lz_cache() -> None:
+    """Drop every cached file database (built-in tables stay registered)."""
+    with _FILE_CACHE_LOCK:
+        for db in _FILE_CACHE.values():
+            _BY_TABLES_ID.pop(id(db.tables), None)
+        _FILE_CACHE.clear()
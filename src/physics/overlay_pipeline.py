@@ -0,0 +1,251 @@
+from __future__ import annotations
+"""Declarative authority-overlay pipeline for ``hot_ion_point``.
+
+Governance overlays (v371 … v421) used to be written as
+hand-rolled ``try: from analysis... import ...; out.update(...)`` blocks
+inside ``_hot_ion_point_uncached``. Every evaluated point paid for the
+import lookup and exception frame of every overlay, even when the overlay
+was switched off.
+
+This module replaces those blocks with an ordered, inspectable list of
+:class:`OverlayStage` records:
+
+- each overlay callable is resolved ONCE when the pipeline is built
+  (at ``hot_ion`` import time)
+- a stage with a ``flag`` is skipped (no call, no dict merge) when the
+  corresponding ``include_*`` input is off; only overlays documented to
+  return an empty patch when disabled declare a flag, so outputs are
+  unchanged
+- import/evaluation failures are stamped exactly as before via
+  :func:`_record_overlay_failure`; stages without an ``enabled_key`` are
+  silent (the old ``except Exception: pass`` blocks)
+- the older diagnostics overlays (v371 … v400) keep their ``fill`` merge
+  (add missing keys, replace only NaNs) and their ``out_partial`` calling
+  convention; those evaluated early against local quantities use
+  :meth:`OverlayPipeline.evaluate` and are merged later with :func:`merge_fill`
+- per-stage wall time is accumulated and can be read with
+  :meth:`OverlayPipeline.stage_timings`; an opt-in per-point
+  :class:`~physics.stage_profiler.StageProfiler` also receives each stage
+
+Governance only: stages never edit truth beyond what the overlay function
+returns; the merge is the same ``out.update(patch)`` (or NaN-filling
+merge) used previously.
+"""
+
+import importlib
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def _record_overlay_failure(
+    out: Dict[str, Any],
+    *,
+    enabled_key: str,
+    error_key: str,
+    exc: Exception,
+) -> None:
+    """Stamp governance overlay import/eval failures for _authority_warnings aggregation."""
+    out[enabled_key] = False
+    out[error_key] = f"{type(exc).__name__}: {exc}"
+
+
+def merge_fill(out: Dict[str, Any], patch: Dict[str, Any]) -> None:
+    """Merge ``patch`` without overwriting canonical scalars (NaNs may be filled)."""
+    for k, v in patch.items():
+        if k not in out:
+            out[k] = v
+            continue
+        try:
+            if (out.get(k) != out.get(k)) and (v == v):
+                out[k] = v
+        except Exception:
+            pass
+
+
+_MERGES: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], None]] = {
+    "update": lambda out, patch: out.update(patch),
+    "fill": merge_fill,
+}
+
+
+@dataclass(frozen=True)
+class OverlayStage:
+    """One governance overlay: ``patch = fn(out, inp)`` then ``out.update(patch)``.
+
+    name:         short stage label (used for timings / inspection)
+    module:       module name under the ``package`` namespace
+    func:         evaluator function name in that module
+    enabled_key:  output key set False on failure (None: failures are silent)
+    error_key:    output key carrying the failure message
+    flag:         optional ``include_*`` input; stage is skipped when off
+    keyword_call: call as ``fn(<out_kw>=out, inp=inp)`` instead of positionally
+    optional:     silently skip (no failure stamp) when the module is missing
+    post:         optional hook run on ``out`` after a successful merge
+    package:      top-level namespace holding ``module`` (``analysis``, ``engineering``, ...)
+    out_kw:       keyword carrying ``out`` when ``keyword_call`` (e.g. ``out_partial``)
+    merge:        ``"update"`` (``out.update``) or ``"fill"`` (:func:`merge_fill`)
+    partial:      optional builder of the dict passed in place of ``out``
+    pre:          optional hook ``pre(out, inp)`` run before the flag check
+                  (policy-input pass-through recorded even when the stage is off)
+    """
+
+    name: str
+    module: str
+    func: str
+    enabled_key: Optional[str]
+    error_key: Optional[str]
+    flag: Optional[str] = None
+    keyword_call: bool = False
+    optional: bool = False
+    post: Optional[Callable[[Dict[str, Any]], None]] = None
+    package: str = "analysis"
+    out_kw: str = "out"
+    merge: str = "update"
+    partial: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    pre: Optional[Callable[[Dict[str, Any], Any], None]] = None
+
+
+def _resolve(package: str, module: str, func: str) -> Tuple[Optional[Callable[..., Any]], Optional[Exception]]:
+    """Resolve ``<package>.<module>.<func>``; fall back to the package-relative ``..<package>``."""
+    try:
+        return getattr(importlib.import_module(f"{package}.{module}"), func), None
+    except (ImportError, AttributeError):
+        pass
+    except Exception as e:
+        return None, e
+    try:
+        return getattr(importlib.import_module(f"..{package}.{module}", package=__package__), func), None
+    except Exception as e:
+        return None, e
+
+
+class OverlayPipeline:
+    """Ordered overlay stages with callables resolved once at construction."""
+
+    def __init__(self, stages: Sequence[OverlayStage], *, name: str = "overlays") -> None:
+        self.name = str(name)
+        self._stages: Tuple[OverlayStage, ...] = tuple(stages)
+        self._fns: List[Optional[Callable[..., Any]]] = []
+        self._errors: List[Optional[Exception]] = []
+        for st in self._stages:
+            fn, err = _resolve(st.package, st.module, st.func)
+            self._fns.append(fn)
+            self._errors.append(err)
+        self._calls: Dict[str, int] = {st.name: 0 for st in self._stages}
+        self._skips: Dict[str, int] = {st.name: 0 for st in self._stages}
+        self._total_s: Dict[str, float] = {st.name: 0.0 for st in self._stages}
+        self._by_name: Dict[str, int] = {st.name: i for i, st in enumerate(self._stages)}
+
+    @property
+    def stages(self) -> Tuple[OverlayStage, ...]:
+        return self._stages
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """Inspectable stage table (order, wiring, resolution status)."""
+        rows: List[Dict[str, Any]] = []
+        for st, fn, err in zip(self._stages, self._fns, self._errors):
+            rows.append(
+                {
+                    "name": st.name,
+                    "module": f"{st.package}.{st.module}",
+                    "func": st.func,
+                    "flag": st.flag,
+                    "merge": st.merge,
+                    "optional": st.optional,
+                    "resolved": fn is not None,
+                    "import_error": (f"{type(err).__name__}: {err}" if (fn is None and err is not None) else ""),
+                }
+            )
+        return rows
+
+    def stage_timings(self) -> Dict[str, Dict[str, float]]:
+        """Cumulative per-stage wall time (ms) and call/skip counts for this process."""
+        return {
+            st.name: {
+                "calls": float(self._calls[st.name]),
+                "skipped": float(self._skips[st.name]),
+                "total_ms": float(self._total_s[st.name] * 1e3),
+            }
+            for st in self._stages
+        }
+
+    def reset_timings(self) -> None:
+        for st in self._stages:
+            self._calls[st.name] = 0
+            self._skips[st.name] = 0
+            self._total_s[st.name] = 0.0
+
+    def _fail(self, st: OverlayStage, out: Dict[str, Any], exc: Exception) -> None:
+        if st.enabled_key is None or st.error_key is None:
+            return
+        if st.merge == "update":
+            _record_overlay_failure(out, enabled_key=st.enabled_key, error_key=st.error_key, exc=exc)
+        else:
+            _MERGES[st.merge](out, {st.enabled_key: False, st.error_key: f"{type(exc).__name__}: {exc}"})
+
+    def _call(self, st: OverlayStage, fn: Callable[..., Any], out: Dict[str, Any], inp: Any) -> Any:
+        arg = st.partial(out) if st.partial is not None else out
+        if st.keyword_call:
+            return fn(inp=inp, **{st.out_kw: arg})
+        return fn(arg, inp)
+
+    def _timed(self, st: OverlayStage, dt: float, profiler: Any) -> None:
+        self._total_s[st.name] += dt
+        self._calls[st.name] += 1
+        if profiler is not None:
+            profiler.record((self.name, st.name), dt)
+
+    def evaluate(self, name: str, out_partial: Dict[str, Any], inp: Any, profiler: Any = None) -> Dict[str, Any]:
+        """Evaluate one stage against ``out_partial`` and return its patch (never raises).
+
+        For overlays computed early from local quantities and merged later;
+        failures come back as the ``{enabled_key: False, error_key: msg}`` patch.
+        """
+        i = self._by_name[name]
+        st, fn, err = self._stages[i], self._fns[i], self._errors[i]
+        if fn is None:
+            failed: Dict[str, Any] = {}
+            if not st.optional:
+                self._fail(st, failed, err or ImportError(f"{st.module}.{st.func} not importable"))
+            return failed
+        t0 = time.perf_counter()
+        try:
+            patch = self._call(st, fn, out_partial, inp)
+            patch = patch if isinstance(patch, dict) else {}
+        except Exception as e:
+            patch = {}
+            self._fail(st, patch, e)
+        self._timed(st, time.perf_counter() - t0, profiler)
+        return patch
+
+    def run(self, out: Dict[str, Any], inp: Any, profiler: Any = None) -> None:
+        """Apply every enabled stage to ``out`` in order (never raises).
+
+        ``profiler`` (a :class:`~physics.stage_profiler.StageProfiler`) receives
+        each executed stage as a ``(pipeline name, stage name)`` child frame.
+        """
+        for st, fn, err in zip(self._stages, self._fns, self._errors):
+            if st.pre is not None:
+                try:
+                    st.pre(out, inp)
+                except Exception as e:
+                    self._fail(st, out, e)
+                    continue
+            if st.flag is not None and not bool(getattr(inp, st.flag, False)):
+                self._skips[st.name] += 1
+                continue
+            if fn is None:
+                if not st.optional:
+                    self._fail(st, out, err or ImportError(f"{st.module}.{st.func} not importable"))
+                continue
+            t0 = time.perf_counter()
+            try:
+                patch = self._call(st, fn, out, inp)
+                if isinstance(patch, dict):
+                    _MERGES[st.merge](out, patch)
+                    if st.post is not None:
+                        st.post(out)
+            except Exception as e:
+                self._fail(st, out, e)
+            self._timed(st, time.perf_counter() - t0, profiler)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+"""In-process point cache for ``hot_ion_point``.
+
+The previous cache stored ``pickle.dumps(out)`` in an ``lru_cache`` and paid
+a full ``pickle.loads`` of the ~700-key nested output dict on every hit.
+Entries are now stored once, deep-frozen, and served in one of two modes:
+
+- ``"copy"`` (default): a fully independent, mutable deep copy (the
+  previous defensive behaviour, without the pickle round-trip). Callers see
+  plain ``dict`` / ``list`` values exactly as before.
+- ``"view"`` (opt-in): a shallow top-level copy of the frozen entry.
+  Top-level writes (``out[k] = v``, ``out.update(...)``) only touch the
+  caller's copy (copy-on-write); nested dicts/lists are shared read-only
+  (:class:`FrozenDict` / :class:`FrozenList`) and raise ``TypeError`` on
+  mutation. ``copy.deepcopy`` / pickling yield plain mutable containers.
+  A hit costs a few microseconds.
+
+Opt into ``"view"`` with ``SHAMS_POINT_CACHE_MODE=view`` (read at import),
+:func:`set_point_cache_mode` or per call (``hot_ion_point(...,
+cache_mode="view")``). :func:`point_cache_stats` reports hits,
+misses, hit rate and the approximate memory footprint of cached entries
+(a one-level ``sys.getsizeof`` estimate; the cache has no byte budget).
+
+Cache is an acceleration feature only; it must not change numerical results.
+"""
+
+import os
+from typing import Any, Dict, Hashable, Optional
+
+try:
+    from ..utils.lru import LRUCache  # type: ignore
+except ImportError:
+    from utils.lru import LRUCache  # type: ignore
+
+POINT_CACHE_MODES = ("view", "copy")
+ENV_MODE = "SHAMS_POINT_CACHE_MODE"
+DEFAULT_MAX_ENTRIES = 2048
+
+_CONTAINERS = (dict, list, tuple)
+_READ_ONLY_MSG = "cached hot_ion_point outputs are read-only; copy first (dict(x), list(x) or copy.deepcopy(out))"
+
+
+def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError(_READ_ONLY_MSG)
+
+
+class FrozenDict(dict):
+    """Read-only ``dict`` used for nested containers of cached outputs."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (dict, (thaw(self),))
+
+    def __copy__(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return thaw(self)
+
+
+class FrozenList(list):
+    """Read-only ``list`` used for nested containers of cached outputs."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (list, (thaw(self),))
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return thaw(self)
+
+
+def freeze(x: Any) -> Any:
+    """Deep-freeze nested dicts/lists (tuples are rebuilt with frozen members)."""
+    if isinstance(x, dict):
+        return FrozenDict({k: (freeze(v) if isinstance(v, _CONTAINERS) else v) for k, v in x.items()})
+    if isinstance(x, list):
+        return FrozenList([freeze(v) if isinstance(v, _CONTAINERS) else v for v in x])
+    if isinstance(x, tuple) and not hasattr(x, "_fields"):
+        return tuple(freeze(v) if isinstance(v, _CONTAINERS) else v for v in x)
+    return x
+
+
+def thaw(x: Any) -> Any:
+    """Plain mutable deep copy of a (possibly frozen) container tree."""
+    if isinstance(x, dict):
+        return {k: (thaw(v) if isinstance(v, _CONTAINERS) else v) for k, v in x.items()}
+    if isinstance(x, list):
+        return [thaw(v) if isinstance(v, _CONTAINERS) else v for v in x]
+    if isinstance(x, tuple) and not hasattr(x, "_fields"):
+        return tuple(thaw(v) if isinstance(v, _CONTAINERS) else v for v in x)
+    return x
+
+
+_MODE = os.environ.get(ENV_MODE, "copy").strip().lower() or "copy"
+if _MODE not in POINT_CACHE_MODES:
+    _MODE = "copy"
+_CACHE = LRUCache(DEFAULT_MAX_ENTRIES)
+
+
+def set_point_cache_mode(mode: str) -> None:
+    """Select ``"view"`` (read-only copy-on-write) or ``"copy"`` (defensive deep copy)."""
+    global _MODE
+    m = str(mode).strip().lower()
+    if m not in POINT_CACHE_MODES:
+        raise ValueError(f"point cache mode must be one of {POINT_CACHE_MODES}, got {mode!r}")
+    _MODE = m
+
+
+def point_cache_mode() -> str:
+    return _MODE
+
+
+def _resolve_mode(mode: Optional[str]) -> str:
+    if mode is None:
+        return _MODE
+    m = str(mode).strip().lower()
+    if m not in POINT_CACHE_MODES:
+        raise ValueError(f"point cache mode must be one of {POINT_CACHE_MODES}, got {mode!r}")
+    return m
+
+
+def lookup(key: Hashable, mode: Optional[str] = None) -> Any:
+    """Return the cached outputs for ``key`` (``mode`` overrides the active mode), or ``None``."""
+    m = _resolve_mode(mode)
+    entry = _CACHE.get(key)
+    if entry is None:
+        return None
+    return dict(entry) if m == "view" else thaw(entry)
+
+
+def store(key: Hashable, out: Dict[str, Any], mode: Optional[str] = None) -> Dict[str, Any]:
+    """Freeze and cache ``out``; return what a hit for ``key`` would return."""
+    m = _resolve_mode(mode)
+    entry = freeze(out)
+    _CACHE.put(key, entry)
+    return dict(entry) if m == "view" else out
+
+
+def point_cache_stats() -> Dict[str, Any]:
+    """Hits, misses, hit rate, entry count and approximate bytes held."""
+    st = _CACHE.stats()
+    st["mode"] = _MODE
+    return st
+
+
+def clear_point_cache(*, reset_stats: bool = True) -> None:
+    _CACHE.clear()
+    if reset_stats:
+        _CACHE.reset_stats()
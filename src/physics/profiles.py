@@ -1,8 +1,11 @@
 from __future__ import annotations
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Tuple
 
+import numpy as np
+
 @dataclass(frozen=True)
 class AnalyticProfiles:
     """Lightweight analytic profile set.
@@ -25,6 +28,19 @@ def _parabolic(shape_alpha: float, r: float) -> float:
     x = 1.0 - r*r
     return (x if x > 0.0 else 0.0) ** shape_alpha
 
+@lru_cache(maxsize=16)
+def _radial_grid(ngrid: int) -> np.ndarray:
+    """Uniform rho grid on [0, 1] (read-only, shared across calls)."""
+    r = np.array([i / (ngrid - 1) for i in range(ngrid)], dtype=float)
+    r.setflags(write=False)
+    return r
+
+def _parabolic_array(shape_alpha: float, r: np.ndarray) -> np.ndarray:
+    # Vectorized _parabolic; 0**negative raises as the scalar form did.
+    x = 1.0 - r * r
+    with np.errstate(divide="raise", invalid="raise"):
+        return np.where(x > 0.0, x, 0.0) ** shape_alpha
+
 def volume_average_parabolic(f0: float, alpha: float) -> float:
     """Volume average of f(r)=f0*(1-r^2)^alpha in a circular cross-section.
 
@@ -56,37 +72,31 @@ def build_profiles_from_volume_avgs(
     limits the edge value to a fraction of the core central value. This is used as a
     diagnostic profile only.
     """
-    r = [i/(ngrid-1) for i in range(ngrid)]
+    r = _radial_grid(int(ngrid))
     # Determine central values such that the *core* parabolic profile has the requested volume average.
     T0 = central_from_volume_avg_parabolic(Tbar_keV, alpha_T)
     n0 = central_from_volume_avg_parabolic(nbar20, alpha_n)
 
-    def pedestal_factor(rr: float, top_frac: float, edge_frac: float) -> float:
+    model = (pedestal_model or "tanh").strip().lower()
+    # pedestal location in normalized radius
+    r_ped = max(0.0, 1.0 - float(ped_width_a))
+
+    def pedestal_factor(top_frac: float, edge_frac: float) -> np.ndarray:
+        # Multiplicative factor applied to the *core parabolic* value.
         if not pedestal_enabled:
-            return 1.0
-        model = (pedestal_model or "tanh").strip().lower()
-        # pedestal location in normalized radius
-        r_ped = max(0.0, 1.0 - float(ped_width_a))
-        # Core value factor is 1.0 in the core; this function returns a multiplicative
-        # factor applied to the *core parabolic* value.
+            return np.ones_like(r)
         if model == "two_zone":
             # Piecewise: core factor ~1 up to r_ped, then linearly ramps from top_frac to edge_frac.
-            if rr <= r_ped:
-                return 1.0
             # The pedestal "top" is enforced by clamping to top_frac (relative to central) later,
             # so here we return the ramp factor only.
-            t = (rr - r_ped) / max(1e-6, 1.0 - r_ped)
-            return max(edge_frac, top_frac + (edge_frac - top_frac) * t)
+            t = (r - r_ped) / max(1e-6, 1.0 - r_ped)
+            return np.where(r <= r_ped, 1.0, np.maximum(edge_frac, top_frac + (edge_frac - top_frac) * t))
         # Default: smooth tanh transition from 1.0 in the core to top_frac at the edge.
         k = 12.0 / max(1e-6, float(ped_width_a))
-        s = 0.5*(1.0 - math.tanh(k*(rr - r_ped)))
+        s = 0.5 * (1.0 - np.tanh(k * (r - r_ped)))
         # s≈1 in core (rr<<r_ped), s≈0 at edge
-        return max(edge_frac, top_frac + (1.0 - top_frac)*s)
+        return np.maximum(edge_frac, top_frac + (1.0 - top_frac) * s)
 
-    T = []
-    n = []
-    model = (pedestal_model or "tanh").strip().lower()
-    r_ped = max(0.0, 1.0 - float(ped_width_a))
     # Two-zone pedestal: core parabolic until r_ped, then a linear pedestal from top->edge
     # specified as fractions of central values. This is deterministic and deliberately simple.
     T_ped_top = float(ped_top_T_frac) * T0
@@ -94,16 +104,13 @@ def build_profiles_from_volume_avgs(
     T_edge = float(pedestal_edge_T_frac) * T0
     n_edge = float(pedestal_edge_n_frac) * n0
 
-    for rr in r:
-        if pedestal_enabled and model == "two_zone" and rr >= r_ped:
-            t = (rr - r_ped) / max(1e-6, 1.0 - r_ped)
-            T_val = T_ped_top + (T_edge - T_ped_top) * t
-            n_val = n_ped_top + (n_edge - n_ped_top) * t
-        else:
-            T_val = T0 * _parabolic(alpha_T, rr) * pedestal_factor(rr, ped_top_T_frac, pedestal_edge_T_frac)
-            n_val = n0 * _parabolic(alpha_n, rr) * pedestal_factor(rr, ped_top_n_frac, pedestal_edge_n_frac)
-        T.append(T_val)
-        n.append(n_val)
+    T = T0 * _parabolic_array(alpha_T, r) * pedestal_factor(ped_top_T_frac, pedestal_edge_T_frac)
+    n = n0 * _parabolic_array(alpha_n, r) * pedestal_factor(ped_top_n_frac, pedestal_edge_n_frac)
+    if pedestal_enabled and model == "two_zone":
+        edge = r >= r_ped
+        t = (r - r_ped) / max(1e-6, 1.0 - r_ped)
+        T = np.where(edge, T_ped_top + (T_edge - T_ped_top) * t, T)
+        n = np.where(edge, n_ped_top + (n_edge - n_ped_top) * t, n)
 
     meta = {
         "T0_keV": T0,
@@ -118,7 +125,7 @@ def build_profiles_from_volume_avgs(
         "pedestal_edge_T_frac": pedestal_edge_T_frac,
         "pedestal_edge_n_frac": pedestal_edge_n_frac,
     }
-    return AnalyticProfiles(tuple(r), tuple(T), tuple(n), meta)
+    return AnalyticProfiles(tuple(r.tolist()), tuple(T.tolist()), tuple(n.tolist()), meta)
 
 def gradient_proxy_at_pedestal(profiles: AnalyticProfiles) -> Dict[str, float]:
     """Return simple gradient proxies near the pedestal top.
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import hashlib
-import json
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .lz_database import LzDatabase, database_for_tables, load_lz_file, register_database
 
 # NOTE:
 # These models are intentionally lightweight and Windows-friendly.
@@ -137,6 +140,45 @@ def _radiation_data_dir() -> Path:
     return Path(__file__).resolve().parents[1] / "data" / "radiation"
 
 
+_BUILTIN_DB: Optional[LzDatabase] = None
+
+
+def _builtin_lz_db() -> LzDatabase:
+    global _BUILTIN_DB
+    if _BUILTIN_DB is None:
+        _BUILTIN_DB = register_database(LzDatabase(_LZ_TABLES, "builtin_proxy", ""))
+    return _BUILTIN_DB
+
+
+def get_lz_database(db_id: str | None) -> LzDatabase:
+    """Compiled Lz(Te) database for ``db_id`` (see :func:`load_lz_db` for ids).
+
+    Each table file is read, hashed and compiled once per process (re-read when
+    its mtime/size changes); unloadable ids fall back to the built-in proxy.
+    """
+    builtin = _builtin_lz_db()
+    try:
+        path, used = _lz_db_location((db_id or "").strip())
+        return load_lz_file(path, used, fallback=builtin)
+    except Exception:
+        # Built-in fallback.
+        return builtin
+
+
+@lru_cache(maxsize=64)
+def _lz_db_location(raw_id: str) -> Tuple[str, str]:
+    """(table file path, db id reported) for a ``load_lz_db`` id."""
+    if raw_id.lower().startswith("file:"):
+        path = Path(raw_id[5:].strip()).expanduser()
+        if not path.is_absolute():
+            # Resolve relative paths against the project root (src/..)
+            path = (_radiation_data_dir().parent.parent / path).resolve()
+        return str(path), f"file:{path}"
+    db = raw_id.lower() or "proxy_v1"
+    # Only allow safe, repo-local file names.
+    return str(_radiation_data_dir() / f"lz_tables_{db}.json"), db
+
+
 def load_lz_db(db_id: str | None) -> Tuple[Dict[str, Dict[str, list]], str, str]:
     """Load an Lz(Te) database.
 
@@ -153,50 +195,16 @@ def load_lz_db(db_id: str | None) -> Tuple[Dict[str, Dict[str, list]], str, str]
 
     Notes
     -----
-    * This function is deterministic and side-effect free.
+    * This function is deterministic and side-effect free. Tables are cached
+      per file version (see :func:`get_lz_database`); treat them as read-only.
     * If the requested DB cannot be loaded, it falls back to built-in proxy tables.
     * For publication-grade work, generate Lz tables from OpenADAS (e.g. via RADAS)
       and supply them as an immutable JSON, then cite its hash in the dossier.
     """
-    raw_id = (db_id or "").strip()
-    if raw_id.lower().startswith("file:"):
-        p = raw_id[5:].strip()
-        try:
-            path = Path(p).expanduser()
-            if not path.is_absolute():
-                # Resolve relative paths against the project root (src/..)
-                path = (_radiation_data_dir().parent.parent / path).resolve()
-            raw = path.read_bytes()
-            h = hashlib.sha256(raw).hexdigest()
-            obj = json.loads(raw.decode("utf-8"))
-            species = obj.get("species")
-            if not isinstance(species, dict) or len(species) == 0:
-                raise ValueError("lz db missing 'species'")
-            tables = {str(k).upper(): v for k, v in species.items() if isinstance(v, dict)}
-            if len(tables) == 0:
-                raise ValueError("lz db had no valid species tables")
-            return tables, f"file:{path}", h
-        except Exception:
-            return _LZ_TABLES, "builtin_proxy", ""
+    db = get_lz_database(db_id)
+    return db.tables, db.db_id, db.sha256
+
 
-    db = raw_id.lower() or "proxy_v1"
-    # Only allow safe, repo-local file names.
-    fname = f"lz_tables_{db}.json"
-    path = _radiation_data_dir() / fname
-    try:
-        raw = path.read_bytes()
-        h = hashlib.sha256(raw).hexdigest()
-        obj = json.loads(raw.decode("utf-8"))
-        species = obj.get("species")
-        if not isinstance(species, dict) or len(species) == 0:
-            raise ValueError("lz db missing 'species'")
-        tables = {str(k).upper(): v for k, v in species.items() if isinstance(v, dict)}
-        if len(tables) == 0:
-            raise ValueError("lz db had no valid species tables")
-        return tables, db, h
-    except Exception:
-        # Built-in fallback.
-        return _LZ_TABLES, "builtin_proxy", ""
 def _loglog_interp(x: float, xs: list[float], ys: list[float]) -> float:
     """Log-log interpolation with clamping."""
     x = max(float(x), 1e-12)
@@ -258,6 +266,9 @@ def Lz_W_m3(Te_keV: float, species: str, *, db_tables: Optional[Dict[str, Dict[s
     This function is deterministic and clamped. If a requested species is not
     found, it falls back to carbon.
     """
+    db = _lz_db_for(db_tables)
+    if db is not None:
+        return db.lz(species, Te_keV)
     sp = (species or "C").strip().upper()
     if sp in ("CARBON",):
         sp = "C"
@@ -268,10 +279,24 @@ def Lz_W_m3(Te_keV: float, species: str, *, db_tables: Optional[Dict[str, Dict[s
     if sp in ("TUNGSTEN",):
         sp = "W"
 
-    tbls = db_tables if isinstance(db_tables, dict) else _LZ_TABLES
-    tbl = tbls.get(sp) or tbls.get("C") or _LZ_TABLES["C"]
+    tbl = db_tables.get(sp) or db_tables.get("C") or _LZ_TABLES["C"]
     return _loglog_interp(float(Te_keV), [float(x) for x in tbl["Te_keV"]], [float(y) for y in tbl["Lz_W_m3"]])
 
+
+def _lz_db_for(db_tables: Any) -> Optional[LzDatabase]:
+    """Compiled database for ``db_tables`` (None for an ad-hoc, uncompiled dict)."""
+    if not isinstance(db_tables, dict):
+        return _builtin_lz_db()
+    return database_for_tables(db_tables)
+
+
+def Lz_W_m3_array(Te_keV: Any, species: str, *, db_tables: Optional[Dict[str, Dict[str, list]]] = None) -> np.ndarray:
+    """Vectorized :func:`Lz_W_m3` over an array of temperatures [keV]."""
+    db = _lz_db_for(db_tables)
+    if db is None:
+        db = LzDatabase(db_tables, "adhoc", fallback=_builtin_lz_db())  # type: ignore[arg-type]
+    return db.lz_array(species, Te_keV)
+
 def line_radiation_W(ne_m3: float, Te_keV: float, volume_m3: float, mix: ImpurityMix) -> float:
     """Impurity line radiation [W] using Lz(Te) and a simple impurity fraction knob."""
     if ne_m3 <= 0.0 or Te_keV <= 0.0 or volume_m3 <= 0.0:
@@ -308,7 +333,8 @@ def total_core_radiation_W(
     """Return radiation channel breakdown in Watts."""
     mix = mix or ImpurityMix()
     out: Dict[str, float] = {}
-    db_tables, db_used, db_sha256 = load_lz_db(lz_db_id)
+    db = get_lz_database(lz_db_id)
+    db_tables, db_used, db_sha256 = db.tables, db.db_id, db.sha256
     out["P_brem_W"] = bremsstrahlung_W(ne_m3, Te_keV, mix.zeff, volume_m3)
     out["P_sync_W"] = synchrotron_W(ne_m3, Te_keV, B_T, R0_m, a_m, volume_m3) if include_synchrotron else 0.0
     if include_line:
@@ -0,0 +1,129 @@
+from __future__ import annotations
+"""Opt-in per-stage timing profile for ``hot_ion_point``.
+
+``_hot_ion_point_uncached`` is a long, sequential function. To see which
+section dominates for a given input deck, it places checkpoint marks at
+section boundaries; each mark attributes the wall time since the previous
+mark to the named section. Overlay pipelines report their individual
+stages as children of the enclosing section.
+
+Enable with the environment ``SHAMS_PROFILE_STAGES=1`` (process-wide, read
+at import) or toggle at runtime with :func:`set_stage_profiling`. The switch
+is deliberately not a ``PointInputs`` field, so it never enters cache keys,
+fingerprints or input hashes.
+
+When enabled, the output carries ``_stage_timings_ms`` (ordered
+``{"section": ms, "section/child": ms, ..., "total": ms}``; entries other
+than ``total`` sum to ``total``). If ``SHAMS_PROFILE_STAGES_OUT`` names a
+file, each profiled point appends collapsed-stack lines
+(``hot_ion_point;section;child <microseconds>``) consumable by
+flamegraph.pl / speedscope / inferno.
+
+When disabled, :func:`new_stage_profiler` returns ``None`` and every mark
+site is a single ``is not None`` check — no timers, no allocations.
+
+Diagnostics only: timings never feed back into physics or constraints.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+ENV_FLAG = "SHAMS_PROFILE_STAGES"
+ENV_OUT = "SHAMS_PROFILE_STAGES_OUT"
+ROOT_FRAME = "hot_ion_point"
+
+_ENABLED = os.environ.get(ENV_FLAG, "").strip().lower() in ("1", "true", "yes", "on")
+_COLLAPSED_OUT = os.environ.get(ENV_OUT, "").strip()
+_WRITE_LOCK = threading.Lock()
+
+
+def set_stage_profiling(enabled: bool, *, collapsed_out: Optional[str] = None) -> None:
+    """Process-wide switch (same effect as ``SHAMS_PROFILE_STAGES``)."""
+    global _ENABLED, _COLLAPSED_OUT
+    _ENABLED = bool(enabled)
+    if collapsed_out is not None:
+        _COLLAPSED_OUT = str(collapsed_out)
+
+
+def stage_profiling_enabled() -> bool:
+    return bool(_ENABLED)
+
+
+class StageProfiler:
+    """Checkpoint timer producing a flat table and collapsed stacks."""
+
+    __slots__ = ("_t0", "_last", "_child_s", "_rows")
+
+    def __init__(self) -> None:
+        self._t0 = self._last = time.perf_counter()
+        self._child_s = 0.0
+        self._rows: List[Tuple[Tuple[str, ...], float]] = []
+
+    def mark(self, section: str) -> None:
+        """Close ``section``: attribute time since the previous mark (minus recorded children)."""
+        now = time.perf_counter()
+        self._rows.append(((section,), max(now - self._last - self._child_s, 0.0)))
+        self._last = now
+        self._child_s = 0.0
+
+    def record(self, path: Tuple[str, ...], seconds: float) -> None:
+        """Record a child frame measured by the caller (e.g. an overlay stage)."""
+        self._rows.append((tuple(path), float(seconds)))
+        self._child_s += float(seconds)
+
+    def table_ms(self) -> Dict[str, float]:
+        tab: Dict[str, float] = {}
+        for path, s in self._rows:
+            k = "/".join(path)
+            tab[k] = tab.get(k, 0.0) + s * 1e3
+        tab["total"] = (self._last - self._t0) * 1e3
+        return tab
+
+    def collapsed(self, root: str = ROOT_FRAME) -> List[str]:
+        return collapsed_stacks(self.table_ms(), root=root)
+
+
+def new_stage_profiler() -> Optional[StageProfiler]:
+    """Return a fresh profiler when profiling is on, else ``None``."""
+    if _ENABLED:
+        return StageProfiler()
+    return None
+
+
+def collapsed_stacks(table_ms: Dict[str, float], *, root: str = ROOT_FRAME) -> List[str]:
+    """Convert a ``_stage_timings_ms`` table to collapsed-stack lines (integer µs)."""
+    lines: List[str] = []
+    for k, ms in table_ms.items():
+        if k == "total":
+            continue
+        us = int(round(float(ms) * 1e3))
+        if us <= 0:
+            continue
+        lines.append(f"{root};{k.replace('/', ';')} {us}")
+    return lines
+
+
+def write_collapsed_stacks(lines: Iterable[str], path: str | Path, *, append: bool = True) -> Path:
+    """Write collapsed-stack lines (one sample per line) for flamegraph tools."""
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    payload = "".join(f"{ln}\n" for ln in lines)
+    with _WRITE_LOCK:
+        with p.open("a" if append else "w", encoding="utf-8") as fh:
+            fh.write(payload)
+    return p
+
+
+def finish(prof: StageProfiler, out: Dict[str, Any]) -> None:
+    """Stamp ``_stage_timings_ms`` into ``out`` and append collapsed stacks if configured."""
+    tab = prof.table_ms()
+    out["_stage_timings_ms"] = tab
+    if _COLLAPSED_OUT:
+        try:
+            write_collapsed_stacks(collapsed_stacks(tab), _COLLAPSED_OUT)
+        except Exception:
+            # Never fail a point evaluation on profiling I/O.
+            pass
@@ -0,0 +1,146 @@
+"""Profile-integration backend for the analytic 1/2-D profiles.
+
+``ParabolicProfile`` / ``PedestalProfile`` used to obtain their line average,
+``<f^2>_V`` and (pedestal) normalization with a pure-Python trapezoid rule of
+400-900 lambda calls each. Both shapes have closed-form moments under the
+circular proxy weighting ``dV ~ 2 rho drho``:
+
+- parabolic ``(1 - rho^2)^a``:
+  ``<g>_V = 1/(a+1)``, ``<g^2>_V = 1/(2a+1)``,
+  ``∫ g drho = B(1/2, a+1)/2 = (sqrt(pi)/2) Γ(a+1)/Γ(a+3/2)``;
+- pedestal: the core is ``g_ped + (1-g_ped)(1-(rho/rho_ped)^2)^a`` on
+  ``[0, rho_ped]`` (same Beta / rational terms scaled by ``rho_ped``), the
+  edge is linear on ``[rho_ped, 1]`` (polynomial moments).
+
+The closed forms are the exact integrals the trapezoid rule approximated, so
+they differ from the former values only by its discretization error (worst
+for small alpha, where ``(1-rho^2)^alpha`` is steep at the edge). Measured
+relative agreement of line average / ``<f^2>_V`` / centre value:
+``<= 1.2e-3`` for any ``alpha >= 0``, ``<= 2.5e-4`` for ``alpha >= 0.25``,
+``<= 5e-5`` for ``alpha >= 0.5`` and ``<= 1.5e-5`` for ``alpha >= 1``
+(``tests/test_profile_integration.py`` pins these bounds).
+
+Every ``*_moments`` function accepts scalars or NumPy arrays (broadcast
+together) so many profile parameter sets can be evaluated at once;
+``grid_quadrature`` is the fixed-grid Gauss-Legendre fallback (cached nodes
+and weights) for shapes without a closed form.
+"""
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+import numpy as np
+
+_SQRT_PI_HALF = 0.5 * math.sqrt(math.pi)
+_lgamma = np.frompyfunc(math.lgamma, 1, 1)
+
+
+def half_beta(a: float) -> float:
+    """``∫_0^1 (1 - x^2)^a dx`` for ``a >= 0`` (``= B(1/2, a+1) / 2``)."""
+    a = max(float(a), 0.0)
+    return _SQRT_PI_HALF * math.exp(math.lgamma(a + 1.0) - math.lgamma(a + 1.5))
+
+
+def _half_beta_array(a: np.ndarray) -> np.ndarray:
+    a = np.maximum(np.asarray(a, dtype=float), 0.0)
+    lg = (_lgamma(a + 1.0) - _lgamma(a + 1.5)).astype(float)
+    return _SQRT_PI_HALF * np.exp(lg)
+
+
+def parabolic_shape_moments(alpha: float) -> Tuple[float, float, float]:
+    """``(<g>_V, ∫ g drho, <g^2>_V)`` of ``g = (1 - rho^2)^alpha`` (``alpha`` floored at 0)."""
+    a = max(float(alpha), 0.0)
+    return 1.0 / max(a + 1.0, 1e-30), half_beta(a), 1.0 / (2.0 * a + 1.0)
+
+
+def _pedestal_terms(alpha_core: Any, rho_ped: Any, f_edge_frac: Any, hb: Any) -> Tuple[Any, Any, Any]:
+    # Works elementwise on floats or arrays; the caller supplies clamped inputs
+    # and the matching half-beta value(s).
+    a, rp = alpha_core, rho_ped
+    g = 1.0 / (1.0 + 0.5 * a)
+    g = np.clip(g, 0.15, 0.85) if isinstance(g, np.ndarray) else min(max(g, 0.15), 0.85)
+    ge = g * f_edge_frac
+    d = ge - g
+    L = 1.0 - rp
+    rp2 = rp * rp
+    core_v = rp2 * (g + (1.0 - g) / (a + 1.0))
+    core_l = rp * (g + (1.0 - g) * hb)
+    core_s = rp2 * (g * g + 2.0 * g * (1.0 - g) / (a + 1.0) + (1.0 - g) ** 2 / (2.0 * a + 1.0))
+    edge_v = 2.0 * L * (g * rp + 0.5 * g * L + 0.5 * d * rp + d * L / 3.0)
+    edge_l = 0.5 * L * (g + ge)
+    edge_s = 2.0 * L * (
+        rp * (g * g + g * d + d * d / 3.0) + L * (0.5 * g * g + 2.0 * g * d / 3.0 + 0.25 * d * d)
+    )
+    return core_v + edge_v, core_l + edge_l, core_s + edge_s
+
+
+def pedestal_shape_moments(alpha_core: float, rho_ped: float, f_edge_frac: float) -> Tuple[float, float, float]:
+    """``(<g>_V, ∫ g drho, <g^2>_V)`` of the ``PedestalProfile`` shape (same input clamps)."""
+    a = max(float(alpha_core), 0.0)
+    rp = min(max(float(rho_ped), 0.2), 0.98)
+    fe = min(max(float(f_edge_frac), 0.0), 1.0)
+    v, l, s = _pedestal_terms(a, rp, fe, half_beta(a))
+    return float(v), float(l), float(s)
+
+
+def _scaled(f_avg: Any, v: Any, l: Any, s: Any) -> Dict[str, np.ndarray]:
+    f = np.asarray(f_avg, dtype=float)
+    scale = f / np.maximum(v, 1e-30)
+    return {
+        "center": scale,
+        "volume_average": np.broadcast_to(f, scale.shape).copy(),
+        "line_average": scale * l,
+        "vol_average_square": scale * scale * s,
+    }
+
+
+def parabolic_moments(f_avg: Any, alpha: Any) -> Dict[str, np.ndarray]:
+    """Batch parabolic profile averages (``center`` is ``value(0)``); inputs broadcast."""
+    a = np.maximum(np.asarray(alpha, dtype=float), 0.0)
+    v = 1.0 / np.maximum(a + 1.0, 1e-30)
+    return _scaled(f_avg, v, _half_beta_array(a), 1.0 / (2.0 * a + 1.0))
+
+
+def pedestal_moments(f_avg: Any, alpha_core: Any, rho_ped: Any, f_edge_frac: Any) -> Dict[str, np.ndarray]:
+    """Batch ``PedestalProfile`` averages (``center`` is ``value(0)``); inputs broadcast."""
+    a = np.maximum(np.asarray(alpha_core, dtype=float), 0.0)
+    rp = np.clip(np.asarray(rho_ped, dtype=float), 0.2, 0.98)
+    fe = np.clip(np.asarray(f_edge_frac, dtype=float), 0.0, 1.0)
+    a, rp, fe = np.broadcast_arrays(a, rp, fe)
+    v, l, s = _pedestal_terms(a, rp, fe, _half_beta_array(a))
+    return _scaled(f_avg, v, l, s)
+
+
+@lru_cache(maxsize=32)
+def _gauss_legendre(n: int, breaks: Tuple[float, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    x, w = np.polynomial.legendre.leggauss(n)
+    edges = (0.0,) + tuple(b for b in breaks if 0.0 < b < 1.0) + (1.0,)
+    nodes, weights = [], []
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        half = 0.5 * (hi - lo)
+        nodes.append(lo + half * (x + 1.0))
+        weights.append(half * w)
+    xs, ws = np.concatenate(nodes), np.concatenate(weights)
+    xs.setflags(write=False)
+    ws.setflags(write=False)
+    return xs, ws
+
+
+def grid_quadrature(
+    fn: Callable[[np.ndarray], Any],
+    *,
+    n: int = 32,
+    breaks: Sequence[float] = (),
+    volume_weight: bool = True,
+) -> np.ndarray:
+    """``∫_0^1 fn(rho) [2 rho] drho`` with cached composite Gauss-Legendre nodes.
+
+    ``fn`` receives the node array and may return shape ``(..., n_nodes)`` to
+    integrate a batch of profiles at once. Put kinks (e.g. a pedestal top) in
+    ``breaks`` so each panel is smooth.
+    """
+    xs, ws = _gauss_legendre(int(n), tuple(float(b) for b in breaks))
+    wt = ws * (2.0 * xs) if volume_weight else ws
+    return np.asarray(fn(xs), dtype=float) @ wt
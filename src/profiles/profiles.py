@@ -15,18 +15,23 @@ Conventions:
 - ``volume_average()`` uses a simple cylindrical weighting ~ rho (good enough for 0-D coupling)
 
 These profiles are *optional*: SHAMS runs with profiles disabled by default.
+
+Averages use the closed-form moments in ``profiles.integration`` (see there
+for the agreement with the former trapezoid integrals and batch helpers).
 """
 
 from dataclasses import dataclass
 import math
-from typing import Callable, Tuple
+from typing import Tuple
+
+from .integration import parabolic_shape_moments, pedestal_shape_moments
 
 # NOTE:
 # This module provides lightweight, PROCESS-inspired analytic ("1/2-D") profile
 # scaffolding for SHAMS. Profiles are defined on normalized radius rho in [0, 1].
 #
 # Design goals:
-# - Pure Python, Windows-friendly (no SciPy dependency).
+# - Windows-friendly (no SciPy dependency); averages are closed-form.
 # - Stable normalization: given a desired volume-average f_avg, the profile is
 #   scaled so that <f>_V = f_avg under a simple circular cross-section proxy
 #   weighting w(rho) ~ 2*rho.
@@ -39,19 +44,6 @@ from typing import Callable, Tuple
 def _clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
-def _vol_weight(rho: float) -> float:
-    # Circular proxy: dV ~ 2*rho drho
-    return 2.0 * rho
-
-def _trapz(fn: Callable[[float], float], n: int = 400) -> float:
-    # Simple trapezoid integral on [0,1]
-    n = max(int(n), 50)
-    h = 1.0 / n
-    s = 0.5 * (fn(0.0) + fn(1.0))
-    for i in range(1, n):
-        s += fn(i * h)
-    return s * h
-
 @dataclass(frozen=True)
 class ParabolicProfile:
     """Parabolic-like profile: f(rho) = f0 * (1 - rho^2)^alpha.
@@ -67,7 +59,7 @@ class ParabolicProfile:
 
     def _shape_vol_avg(self) -> float:
         # Analytic: ∫0^1 (1-rho^2)^a * 2*rho drho = 1/(a+1)
-        return 1.0 / max(max(self.alpha, 0.0) + 1.0, 1e-30)
+        return parabolic_shape_moments(self.alpha)[0]
 
     def _scale(self) -> float:
         return float(self.f_avg) / max(self._shape_vol_avg(), 1e-30)
@@ -82,12 +74,12 @@ class ParabolicProfile:
         return float(self.f_avg)
 
     def line_average(self) -> float:
-        # Very simple chord proxy: <f>_line ≈ ∫0^1 f(rho) d rho
-        return _trapz(lambda r: self.value(r), n=400)
+        # Very simple chord proxy: <f>_line ≈ ∫0^1 f(rho) d rho = f0 * B(1/2, a+1)/2
+        return self._scale() * parabolic_shape_moments(self.alpha)[1]
 
     def vol_average_square(self) -> float:
-        # <f^2>_V ≈ ∫ f(rho)^2 * 2*rho drho
-        return _trapz(lambda r: (self.value(r) ** 2) * _vol_weight(r), n=600)
+        # <f^2>_V = ∫ f(rho)^2 * 2*rho drho = f0^2 / (2a+1)
+        return self._scale() ** 2 * parabolic_shape_moments(self.alpha)[2]
 
 @dataclass(frozen=True)
 class PedestalProfile:
@@ -131,8 +123,11 @@ class PedestalProfile:
         t = (rho - rp) / max(1.0 - rp, 1e-9)
         return (1.0 - t) * gped + t * gedge
 
+    def _moments(self) -> Tuple[float, float, float]:
+        return pedestal_shape_moments(self.alpha_core, self.rho_ped, self.f_edge_frac)
+
     def _shape_vol_avg(self) -> float:
-        return _trapz(lambda r: self._shape(r) * _vol_weight(r), n=800)
+        return self._moments()[0]
 
     def _scale(self) -> float:
         return float(self.f_avg) / max(self._shape_vol_avg(), 1e-30)
@@ -147,10 +142,10 @@ class PedestalProfile:
         return float(self.f_avg)
 
     def line_average(self) -> float:
-        return _trapz(lambda r: self.value(r), n=500)
+        return self._scale() * self._moments()[1]
 
     def vol_average_square(self) -> float:
-        return _trapz(lambda r: (self.value(r) ** 2) * _vol_weight(r), n=900)
+        return self._scale() ** 2 * self._moments()[2]
 
 @dataclass(frozen=True)
 class PlasmaProfiles:
@@ -1,22 +1,49 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet, Optional, Tuple
+import copy
 import hashlib
+import threading
 import yaml
 
 _MODEL_CARD_DIR = Path(__file__).resolve().parent.parent / "model_cards"
 
+# Parsed cards/index are memoized on the card directory signature (name, mtime,
+# size); editing or adding a card file invalidates them. Public loaders still
+# return fresh copies, so callers may mutate what they get.
+_LOCK = threading.Lock()
+_MEMO: Dict[str, Any] = {"sig": None, "cards": None, "index": None, "output_keys": None}
+
 def _sha256_bytes(b: bytes) -> str:
     h = hashlib.sha256()
     h.update(b)
     return h.hexdigest()
 
-def load_model_cards() -> Dict[str, Dict[str, Any]]:
-    """Load all model cards shipped with the repo.
+def _dir_signature() -> Tuple[Tuple[str, int, int], ...]:
+    if not _MODEL_CARD_DIR.exists():
+        return ()
+    sig = []
+    for p in sorted(_MODEL_CARD_DIR.glob("*.yaml")):
+        st = p.stat()
+        sig.append((p.name, st.st_mtime_ns, st.st_size))
+    return tuple(sig)
 
-    Returns dict keyed by card id, with minimal metadata + full card content.
-    """
+
+def _memo() -> Dict[str, Any]:
+    sig = _dir_signature()
+    with _LOCK:
+        if _MEMO["sig"] != sig or _MEMO["cards"] is None:
+            cards = _read_model_cards()
+            index = _build_index(cards)
+            keys = set()
+            for info in index.values():
+                keys.update(((info or {}).get("validity") or {}).get("outputs") or {})
+            _MEMO.update(sig=sig, cards=cards, index=index, output_keys=frozenset(keys))
+        return dict(_MEMO)
+
+
+def _read_model_cards() -> Dict[str, Dict[str, Any]]:
     cards: Dict[str, Dict[str, Any]] = {}
     if not _MODEL_CARD_DIR.exists():
         return cards
@@ -36,6 +63,15 @@ def load_model_cards() -> Dict[str, Dict[str, Any]]:
         }
     return cards
 
+
+def load_model_cards() -> Dict[str, Dict[str, Any]]:
+    """Load all model cards shipped with the repo.
+
+    Returns dict keyed by card id, with minimal metadata + full card content.
+    """
+    return copy.deepcopy(_memo()["cards"])
+
+
 def model_cards_index() -> Dict[str, Dict[str, Any]]:
     """Return a compact index suitable for storing in artifacts.
 
@@ -44,7 +80,15 @@ def model_cards_index() -> Dict[str, Dict[str, Any]]:
       - maturity: TRL + assumption envelope tags
       - validity: ranges used by check_model_card_validity
     """
-    cards = load_model_cards()
+    return copy.deepcopy(_memo()["index"])
+
+
+def shared_model_cards_index() -> Dict[str, Dict[str, Any]]:
+    """Process-wide memoized index (same object on every call; treat as read-only)."""
+    return _memo()["index"]
+
+
+def _build_index(cards: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     idx: Dict[str, Dict[str, Any]] = {}
     for k, v in (cards or {}).items():
         card = (v or {}).get("card") or {}
@@ -103,3 +147,51 @@ def check_model_card_validity(index: Dict[str, Dict[str, Any]], inputs: Dict[str
                     continue
         status[mid] = {"ok": len(failed) == 0, "failed": failed}
     return status
+
+
+class ModelCardsRef:
+    """Deferred model-card attachment for ``Evaluator(model_cards="lazy")``.
+
+    Holds the (frozen) inputs and the few outputs named in card validity
+    ranges, captured at evaluation time. The evaluator stores this one object
+    under ``_inputs``, ``model_cards`` and ``model_cards_validity``;
+    :func:`materialize_model_cards` resolves them to exactly what the eager
+    evaluator would have stored.
+    """
+
+    __slots__ = ("_inp", "_outputs")
+    # Marker checked instead of isinstance: ``src.provenance`` and top-level
+    # ``provenance`` imports of this module define distinct classes.
+    deferred_model_cards = True
+
+    def __init__(self, inp: Any, outputs: Dict[str, Any]) -> None:
+        self._inp = inp
+        keys: FrozenSet[str] = _memo()["output_keys"]
+        self._outputs = {k: outputs[k] for k in keys if k in outputs}
+
+    def materialize(self) -> Dict[str, Any]:
+        """Fresh ``{"_inputs", "model_cards", "model_cards_validity"}`` entries."""
+        inputs = dict(getattr(self._inp, "__dict__", {}))
+        index = model_cards_index()
+        return {
+            "_inputs": inputs,
+            "model_cards": index,
+            "model_cards_validity": check_model_card_validity(index, inputs, self._outputs),
+        }
+
+    def __repr__(self) -> str:
+        return "ModelCardsRef(<deferred>)"
+
+
+def materialize_model_cards(outputs: Optional[Dict[str, Any]]) -> Any:
+    """Return ``outputs`` with deferred model-card entries resolved (key order kept).
+
+    Outputs without a :class:`ModelCardsRef` are returned unchanged (same object).
+    """
+    if not isinstance(outputs, dict):
+        return outputs
+    ref = outputs.get("model_cards")
+    if not getattr(ref, "deferred_model_cards", False):
+        return outputs
+    view = ref.materialize()
+    return {k: (view[k] if (v is ref and k in view) else v) for k, v in outputs.items()}
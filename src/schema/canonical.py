@@ -0,0 +1,54 @@
+"""Canonical JSON-safe form of input values.
+
+Shared by the evaluator cache keys (``evaluator.cache_key``) and the per-instance
+input fingerprint (``schema.fingerprint``). It lives in the schema layer and has
+no package dependencies so that fingerprinting inputs never imports the
+evaluator.
+
+Author: © 2026 Afshin Arjhangmehr
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+
+def canonicalize(x: Any) -> Any:
+    """Canonicalize to JSON-safe primitives with stable float handling."""
+    # Dataclasses -> dict
+    if is_dataclass(x):
+        return canonicalize(asdict(x))
+
+    # Dict -> recurse with sorted keys (enforced later by json.dumps(sort_keys=True))
+    if isinstance(x, dict):
+        return {str(k): canonicalize(v) for k, v in x.items()}
+
+    # List/Tuple -> list
+    if isinstance(x, (list, tuple)):
+        return [canonicalize(v) for v in x]
+
+    # Floats -> stable tokens (strings) so JSON serialization is version-stable
+    if isinstance(x, float):
+        if math.isnan(x):
+            return "NaN"
+        if math.isinf(x):
+            return "Infinity" if x > 0 else "-Infinity"
+        # repr(float) is round-trip and stable for a given value
+        return repr(float(x))
+
+    # Int/bool/str/None are already JSON-safe
+    if x is None or isinstance(x, (bool, int, str)):
+        return x
+
+    # Other numeric-like types
+    try:
+        # numpy scalars etc.
+        if hasattr(x, "item"):
+            return canonicalize(x.item())
+    except Exception:
+        pass
+
+    # Fallback: stable string representation
+    return str(x)
@@ -0,0 +1,110 @@
+"""Cached structural fingerprint for :class:`~schema.inputs.PointInputs`.
+
+Both memoization layers (``Evaluator`` and the ``hot_ion_point`` LRU) need a
+key for a ~640-field frozen dataclass. Recomputing ``sha256(canonical_json)``
+(or the dataclass ``__hash__``/``__eq__`` over every field) on each call is
+comparable in cost to the cheaper physics blocks during scans, where only one
+or two fields change between points.
+
+This module computes the fingerprint ONCE per instance and keeps it in a
+side table keyed by object identity (weak references; nothing is stored on
+the frozen instance, so ``inp.__dict__`` and ``asdict(inp)`` are unchanged):
+
+- the value is exactly ``evaluator.cache_key.sha256_cache_key(inp)`` (same
+  canonical JSON, same SHA-256), so keys stay stable across processes and
+  hash seeds and remain interchangeable with existing stored keys
+- canonicalized field values are kept per instance; :func:`replace_inputs`
+  (also ``PointInputs.replace``) builds a point with ``dataclasses.replace``
+  and re-canonicalizes only the changed fields
+
+Author: © 2026 Afshin Arjhangmehr
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import threading
+import weakref
+from typing import Any, Dict, Tuple
+
+from .canonical import canonicalize as _canon
+
+_LOCK = threading.Lock()
+# id(inp) -> (weakref(inp), canonical field values in sorted-name order, sha256 hex)
+_STATE: Dict[int, Tuple["weakref.ref[Any]", Tuple[str, ...], str]] = {}
+# dataclass type -> (sorted field names, {name: position})
+_LAYOUT: Dict[type, Tuple[Tuple[str, ...], Dict[str, int]]] = {}
+
+
+def _layout(cls: type) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    lay = _LAYOUT.get(cls)
+    if lay is None:
+        # json.dumps(sort_keys=True) orders by the (string) field name.
+        names = tuple(sorted(f.name for f in dataclasses.fields(cls)))
+        lay = (names, {n: i for i, n in enumerate(names)})
+        _LAYOUT[cls] = lay
+    return lay
+
+
+def _digest(names: Tuple[str, ...], values: Tuple[Any, ...], extra: Tuple[Any, ...] = ()) -> str:
+    payload: Any = dict(zip(names, values))
+    if extra:
+        payload = [payload, *(_canon(e) for e in extra)]
+    s = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+
+
+def _forget(oid: int) -> None:
+    with _LOCK:
+        _STATE.pop(oid, None)
+
+
+def _register(inp: Any, values: Tuple[Any, ...]) -> str:
+    names, _ = _layout(type(inp))
+    fp = _digest(names, values)
+    oid = id(inp)
+    ref = weakref.ref(inp, lambda _r, _oid=oid: _forget(_oid))
+    with _LOCK:
+        _STATE[oid] = (ref, values, fp)
+    return fp
+
+
+def _canonical_values(inp: Any) -> Tuple[Tuple[Any, ...], str]:
+    st = _STATE.get(id(inp))
+    if st is not None and st[0]() is inp:
+        return st[1], st[2]
+    names, _ = _layout(type(inp))
+    values = tuple(_canon(getattr(inp, n)) for n in names)
+    return values, _register(inp, values)
+
+
+def fingerprint(inp: Any, *extra: Any) -> str:
+    """SHA-256 hex of canonical JSON of ``inp`` (or of ``(inp, *extra)``); cached per instance.
+
+    Equals ``sha256_cache_key(inp)`` / ``sha256_cache_key((inp, *extra))``.
+    """
+    values, fp = _canonical_values(inp)
+    return _digest(_layout(type(inp))[0], values, extra) if extra else fp
+
+
+def replace_inputs(base: Any, **changes: Any) -> Any:
+    """``dataclasses.replace(base, **changes)`` with an incrementally derived fingerprint.
+
+    ``base`` is fingerprinted once (if it was not already); every derived point
+    then only re-canonicalizes the changed fields.
+    """
+    new = dataclasses.replace(base, **changes)
+    base_values, _ = _canonical_values(base)
+    _, pos = _layout(type(base))
+    values = list(base_values)
+    for k in changes:
+        values[pos[k]] = _canon(getattr(new, k))
+    _register(new, tuple(values))
+    return new
+
+
+def fingerprint_cache_size() -> int:
+    """Number of live instances with a cached fingerprint (telemetry/tests)."""
+    return len(_STATE)
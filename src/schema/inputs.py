@@ -909,6 +909,19 @@ class PointInputs:
         from dataclasses import asdict
         return asdict(self)
 
+    def fingerprint(self, *extra) -> str:
+        """Stable SHA-256 cache key (== sha256_cache_key(self)); computed once per instance.
+
+        With ``extra`` the key covers the tuple ``(self, *extra)``.
+        """
+        from .fingerprint import fingerprint
+        return fingerprint(self, *extra)
+
+    def replace(self, **changes) -> "PointInputs":
+        """``dataclasses.replace`` that derives the fingerprint incrementally from ``self``."""
+        from .fingerprint import replace_inputs
+        return replace_inputs(self, **changes)
+
 
     # --- Engineering proxies (Phase-2 / PROCESS-inspired) ---
     tf_Jop_MA_per_mm2: float = 0.055  # operating current density (MA/mm^2)
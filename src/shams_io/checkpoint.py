@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+"""Append-only case checkpoints for resumable studies and campaigns.
+
+Long sweeps (``studies.runner.run_study``, ``campaign.eval``) record every
+finished case as one JSON line keyed by a stable case fingerprint: the
+SHA-256 of the canonical JSON of everything that determines the case result
+(see :mod:`evaluator.cache_key`). A rerun with ``resume=True`` replays
+completed cases from the checkpoint and evaluates only missing or failed
+ones, so the final outputs match an uninterrupted run.
+
+The file survives crashes by construction: lines are flushed as they are
+written, a torn last line is ignored on load, and the last record per
+fingerprint wins.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from ..evaluator.cache_key import sha256_cache_key  # type: ignore
+except Exception:
+    from evaluator.cache_key import sha256_cache_key  # type: ignore
+
+CHECKPOINT_SCHEMA = "shams_case_checkpoint.v1"
+
+
+def case_fingerprint(payload: Any) -> str:
+    """Stable fingerprint of a case definition (canonical JSON, SHA-256)."""
+    return sha256_cache_key({"schema": CHECKPOINT_SCHEMA, "case": payload})
+
+
+class CaseCheckpoint:
+    """JSONL checkpoint of finished cases (``{"fp", "status", "data"}`` per line)."""
+
+    def __init__(self, path: str | Path, *, resume: bool = True):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self.n_reused = 0
+        if resume and self.path.exists():
+            self._load()
+        # A fresh (non-resumed) run starts a new checkpoint.
+        self._fh = self.path.open("a" if resume else "w", encoding="utf-8")
+        if resume and self._fh.tell() > 0:
+            with self.path.open("rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._fh.write("\n")  # terminate a torn last line
+
+    def _load(self) -> None:
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue  # torn write from an interrupted run
+                if isinstance(rec, dict) and rec.get("schema") == CHECKPOINT_SCHEMA and rec.get("fp"):
+                    self._records[str(rec["fp"])] = rec
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, fp: str) -> Optional[Dict[str, Any]]:
+        """Data recorded for a completed case (None when missing or failed)."""
+        rec = self._records.get(fp)
+        if rec is None or rec.get("status") != "ok":
+            return None
+        return rec.get("data")
+
+    def mark_reused(self) -> None:
+        self.n_reused += 1
+
+    def record(self, fp: str, data: Dict[str, Any], *, status: str = "ok") -> None:
+        rec = {"schema": CHECKPOINT_SCHEMA, "fp": fp, "status": str(status), "data": data}
+        self._records[fp] = rec
+        self._fh.write(json.dumps(rec, default=str) + "\n")
+        self._fh.flush()
+
+    def close(self) -> None:
+        try:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+        except Exception:
+            pass
+        try:
+            self._fh.close()
+        except Exception:
+            pass
+
+    def __enter__(self) -> "CaseCheckpoint":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
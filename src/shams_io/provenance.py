@@ -66,3 +66,20 @@ def collect_provenance(start: Path | None = None) -> Dict[str, Any]:
             prov["git_commit"] = str(env_commit)[:40]
 
     return prov
+
+
+def refresh_artifact_provenance() -> None:
+    """Re-read verification/report.json into the run-artifact provenance snapshot.
+
+    For the UI verification runners: call after regenerating the report.
+    Best-effort (never raises); ``run_artifact`` is imported lazily so UI
+    modules do not pay for it at import.
+    """
+    try:
+        try:
+            from shams_io.run_artifact import refresh_provenance_snapshot
+        except ImportError:
+            from src.shams_io.run_artifact import refresh_provenance_snapshot  # type: ignore
+        refresh_provenance_snapshot()
+    except Exception:
+        pass
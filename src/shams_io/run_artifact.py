@@ -1,12 +1,14 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import time
 import hashlib
 import platform
 import sys
 import os
+import threading
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -46,6 +48,10 @@ except Exception:
         from decision.requirements_trace import trace_requirements  # type: ignore
     except Exception:
         from decision.requirements_trace import trace_requirements  # type: ignore
+try:
+    from ..provenance.model_cards import materialize_model_cards  # type: ignore
+except Exception:
+    from provenance.model_cards import materialize_model_cards  # type: ignore
 from program.risk import schedule_proxy, robustness_from_uq
 from fidelity.config import normalize_fidelity
 from fidelity.maturity import is_low_maturity, decision_grade_check
@@ -484,6 +490,106 @@ def _get_git_commit(root: Optional[Path] = None) -> str:
 
 
 
+# -----------------------------
+# Process-level provenance snapshot
+# -----------------------------
+
+@dataclass(frozen=True)
+class ProvenanceSnapshot:
+    """Repo provenance read once per process and referenced by every artifact.
+
+    VERSION, RELEASE_NOTES.md, git HEAD and verification/report.json do not
+    change while a study or campaign runs, so they are read (and the report
+    hashed) once. Per-artifact fields (``created_unix``, ``pid``) are still
+    stamped fresh. ``build_s`` is the time one uncached collection took,
+    i.e. the time each later artifact saves. Each artifact gets its own copy
+    of the verification report.
+    """
+
+    repo_root: Path
+    repo_version: str
+    release_notes_excerpt: str
+    git_commit: str
+    provenance: Dict[str, Any]
+    verification: Dict[str, Any]
+    verification_hash: str
+    created_unix: float
+    build_s: float
+
+
+_PROVENANCE_LOCK = threading.Lock()
+_PROVENANCE_SNAPSHOT: Optional[ProvenanceSnapshot] = None
+_PROVENANCE_REUSES = 0
+
+
+def _collect_provenance_snapshot() -> ProvenanceSnapshot:
+    t0 = time.perf_counter()
+    here = Path(__file__).resolve()
+    verification = try_load_verification_report()
+    return ProvenanceSnapshot(
+        repo_root=_repo_root(here),
+        repo_version=_read_repo_version(here),
+        release_notes_excerpt=_read_release_notes_excerpt(here, max_lines=60),
+        git_commit=_get_git_commit(),
+        provenance=collect_provenance(here),
+        verification=verification,
+        verification_hash=_stable_hash_json(verification) if verification else "",
+        created_unix=time.time(),
+        build_s=float(time.perf_counter() - t0),
+    )
+
+
+def provenance_snapshot() -> ProvenanceSnapshot:
+    """Return the process-wide provenance snapshot (collected on first use)."""
+    global _PROVENANCE_SNAPSHOT, _PROVENANCE_REUSES
+    with _PROVENANCE_LOCK:
+        snap = _PROVENANCE_SNAPSHOT
+        if snap is not None:
+            _PROVENANCE_REUSES += 1
+            return snap
+    snap = _collect_provenance_snapshot()
+    with _PROVENANCE_LOCK:
+        if _PROVENANCE_SNAPSHOT is None:
+            _PROVENANCE_SNAPSHOT = snap
+        return _PROVENANCE_SNAPSHOT
+
+
+def _drop_provenance_snapshot() -> None:
+    global _PROVENANCE_SNAPSHOT, _PROVENANCE_REUSES
+    with _PROVENANCE_LOCK:
+        _PROVENANCE_SNAPSHOT = None
+        _PROVENANCE_REUSES = 0
+
+
+def refresh_provenance_snapshot() -> ProvenanceSnapshot:
+    """Drop and recollect the snapshot (e.g. after regenerating verification/report.json).
+
+    Both import aliases of this module (``shams_io.`` and ``src.shams_io.``)
+    hold their own snapshot; every loaded alias is dropped.
+    """
+    for name in ("shams_io.run_artifact", "src.shams_io.run_artifact", __name__):
+        mod = sys.modules.get(name)
+        drop = getattr(mod, "_drop_provenance_snapshot", None)
+        if callable(drop):
+            drop()
+    _drop_provenance_snapshot()
+    return provenance_snapshot()
+
+
+def provenance_snapshot_stats() -> Dict[str, Any]:
+    """Telemetry: snapshot build time and how many artifacts reused it."""
+    with _PROVENANCE_LOCK:
+        snap = _PROVENANCE_SNAPSHOT
+        reuses = int(_PROVENANCE_REUSES)
+    build_s = float(snap.build_s) if snap is not None else 0.0
+    return {
+        "collected": snap is not None,
+        "build_s": build_s,
+        "n_reused": reuses,
+        "saved_s": build_s * reuses,
+    }
+
+
 def _compute_kpis(outputs: Dict[str, Any], constraints_json: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Compute a stable KPI dict used across UI + PDF.
 
@@ -562,6 +668,9 @@ def build_run_artifact(
     verification: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """Build a canonical run artifact dict (JSON-serializable)."""
+    # Lazy-evaluator outputs carry a deferred model-card reference; resolve it
+    # so the artifact holds the same audit view as an eager evaluation.
+    outputs = materialize_model_cards(outputs)
     if meta is None:
         meta = RunMeta(created_unix=time.time())
     elif isinstance(meta, dict):
@@ -570,9 +679,11 @@ def build_run_artifact(
         _kw = {k: meta[k] for k in meta.keys() if k in _allowed and k != "created_unix"}
         meta = RunMeta(created_unix=float(meta.get("created_unix", time.time())), **_kw)
 
+    snap = provenance_snapshot()
+
     # Stamp repo version if available (keeps backward compatibility)
     try:
-        rv = _read_repo_version(Path(__file__).resolve())
+        rv = snap.repo_version
         if rv and (not getattr(meta, "shams_version", "") or meta.shams_version == "phase14"):
             meta = RunMeta(created_unix=meta.created_unix, shams_version=rv, label=meta.label, mode=meta.mode, notes=meta.notes)
     except Exception:
@@ -604,8 +715,10 @@ def build_run_artifact(
         "model_cards": (outputs.get("model_cards") if isinstance(outputs, dict) else {}),
         "verification": {},
         "provenance": {
-            **collect_provenance(Path(__file__).resolve()),
-            "release_notes_excerpt": _read_release_notes_excerpt(Path(__file__).resolve(), max_lines=60),
+            **snap.provenance,
+            "created_unix": float(time.time()),
+            "pid": int(os.getpid()),
+            "release_notes_excerpt": snap.release_notes_excerpt,
         },
 
         # PROCESS-inspired but SHAMS-native: make model option selection explicit.
@@ -810,7 +923,7 @@ def build_run_artifact(
 
     # Requirements traceability (if requirements/requirements.yaml exists).
     try:
-        repo_root = _repo_root(Path(__file__).resolve())
+        repo_root = snap.repo_root
         art["requirements_trace"] = trace_requirements(art, repo_root=repo_root)
     except Exception:
         art["requirements_trace"] = {"overall": "UNKNOWN", "requirements": []}
@@ -876,8 +989,10 @@ def build_run_artifact(
 
     # Attach verification compliance matrix (if available).
     if verification is None:
-        verification = try_load_verification_report()
-    if isinstance(verification, dict) and verification:
+        if snap.verification:
+            # Own copy: artifacts get mutated downstream; the snapshot must not be.
+            art["verification"] = {"report": copy.deepcopy(snap.verification), "report_hash": snap.verification_hash}
+    elif isinstance(verification, dict) and verification:
         art["verification"] = {
             "report": verification,
             "report_hash": _stable_hash_json(verification),
@@ -18,6 +18,7 @@ from .report import SolveReport
 from .scaling import default_residual_scaling, default_variable_scaling, scale_bounds
 from typing import Dict, Iterable, Iterator, List, Tuple
 import math
+import time
 
 try:
     from ..models.inputs import PointInputs  # type: ignore
@@ -46,7 +47,7 @@ class SolveResult:
 
 
 
-def _mk_report(*, backend: str, status: str, message: str, iters: int, trace: list, out: Dict[str, float], targets: Dict[str, float], var_keys: List[str], x: List[float], bounds: List[tuple], corners: list | None = None, scaling: dict | None = None) -> dict:
+def _mk_report(*, backend: str, status: str, message: str, iters: int, trace: list, out: Dict[str, float], targets: Dict[str, float], var_keys: List[str], x: List[float], bounds: List[tuple], corners: list | None = None, scaling: dict | None = None, timings: dict | None = None) -> dict:
     rep = SolveReport(
         backend=backend,
         status=status,
@@ -67,6 +68,8 @@ def _mk_report(*, backend: str, status: str, message: str, iters: int, trace: li
     rep.corners = corners
     if scaling:
         rep.scaling = scaling
+    if timings:
+        rep.timings_s = dict(timings)
     # crude residual norm (L2 of target errors)
     try:
         import math
@@ -93,6 +96,28 @@ def _make_inp(base: PointInputs, updates: Dict[str, float]) -> PointInputs:
     return base.__class__(**{**base.__dict__, **updates})
 
 
+def _broyden_rank1(J: List[List[float]], dx: List[float], dr: List[float]) -> List[List[float]] | None:
+    """Good-Broyden update ``J + (dr - J dx) dx^T / (dx^T dx)``; None when unsafe to reuse."""
+    m, n = len(J), len(dx)
+    denom = sum(float(v) * float(v) for v in dx)
+    if not (math.isfinite(denom) and denom > 1e-18):
+        return None
+    Jdx = [sum(float(J[i][j]) * float(dx[j]) for j in range(n)) for i in range(m)]
+    u = [float(dr[i]) - Jdx[i] for i in range(m)]
+    J_new = [[float(J[i][j]) + u[i] * float(dx[j]) / denom for j in range(n)] for i in range(m)]
+    if not all(math.isfinite(v) for row in J_new for v in row):
+        return None
+    if n == 1 and m == 1:
+        det = J_new[0][0]
+    elif n == 2 and m == 2:
+        det = J_new[0][0] * J_new[1][1] - J_new[0][1] * J_new[1][0]
+    else:
+        det = 1.0
+    if not (math.isfinite(det) and abs(det) > 1e-12):
+        return None
+    return J_new
+
+
 def solve_for_targets(
     base: PointInputs,
     targets: Dict[str, float],
@@ -107,6 +132,9 @@ def solve_for_targets(
     cache_max: int = 256,
     Paux_for_Q_MW: float | None = None,
     target_senses: Dict[str, str] | None = None,
+    jacobian_scheme: str = "forward",
+    jacobian_engine: str = "serial",
+    jacobian_reuse: bool = False,
 ) -> SolveResult:
     """Solve for iteration variables so that selected outputs hit targets.
 
@@ -120,8 +148,22 @@ def solve_for_targets(
     variables:
         Mapping from variable name -> (x0, lo, hi). Example:
           {"Ip_MA": (8.0, 4.0, 14.0), "fG": (0.8, 0.1, 1.2)}
+    jacobian_scheme, jacobian_engine:
+        Finite-difference scheme ("forward" | "central") and engine
+        ("serial" | "batch" | "process") passed to ``Evaluator.jacobian_targets``.
+    jacobian_reuse:
+        hybrid_newton only: after an improving step, update the previous
+        Jacobian with a Broyden rank-1 correction instead of a fresh FD
+        Jacobian (at most 3 times in a row; falls back to FD when the update
+        is singular or non-finite).
+
+    Every Jacobian is logged as a ``{"event": "jacobian"}`` trace entry and
+    every return appends a ``{"event": "solve_summary"}`` entry (iterations,
+    wall time, Jacobian counts); the same timings land in ``report["timings_s"]``.
     """
 
+    t_solve0 = time.perf_counter()
+    jac_stats = {"fd": 0, "broyden": 0, "wall_s": 0.0, "n_evals": 0}
     out_keys = list(targets.keys())
     var_keys = list(variables.keys())
     m = len(out_keys)
@@ -131,6 +173,19 @@ def solve_for_targets(
     # Iteration trace for auditability (must exist before any telemetry uses it)
     trace: List[dict] = []
 
+    def _solve_summary(iters: int) -> Dict[str, float]:
+        wall = float(time.perf_counter() - t_solve0)
+        trace.append({
+            "event": "solve_summary",
+            "iters": int(iters),
+            "wall_s": wall,
+            "n_jacobian_fd": int(jac_stats["fd"]),
+            "n_jacobian_broyden": int(jac_stats["broyden"]),
+            "jacobian_wall_s": float(jac_stats["wall_s"]),
+            "n_evals": int(jac_stats["n_evals"]),
+        })
+        return {"total": wall, "jacobian": float(jac_stats["wall_s"])}
+
     # Early exit: targets and variables must have same dimension
     if m != n:
         base_eval = evaluator.evaluate(base)
@@ -138,6 +193,7 @@ def solve_for_targets(
             trace.append({"event": "cache_stats", "cache": evaluator.cache_stats(), "solver_backend": str(solver_backend)})
         except Exception:
             pass
+        timings = _solve_summary(0)
         return SolveResult(
             base,
             base_eval.out,
@@ -156,6 +212,7 @@ def solve_for_targets(
                 var_keys=var_keys,
                 x=[variables[k][0] for k in var_keys],
                 bounds=[(variables[k][1], variables[k][2]) for k in var_keys],
+                timings=timings,
             ),
         )
 
@@ -217,6 +274,8 @@ def solve_for_targets(
     x_s = [x[i] / x_scales[i] if x_scales[i] != 0 else x[i] for i in range(n)]
     out = eval_out(x_s)
     trace.append({"iter": 0, "x": {var_keys[i]: float(x_s[i] * x_scales[i]) for i in range(n)}, "out": {k: float(out.get(k, float('nan'))) for k in out_keys}})
+    jac_prev: dict | None = None
+    last_improved = False
     for it in range(max_iter):
         r = []
         ok_fin = True
@@ -239,45 +298,89 @@ def solve_for_targets(
         })
         if ok_fin:
             inp = _make_inp(base, {k: _clamp(x_s[i] * x_scales[i], *bounds[i]) for i, k in enumerate(var_keys)})
-            return SolveResult(inp, out, True, it, "converged", trace=trace, report=_mk_report(backend="bounded_newton_scaled", status="success", message="converged", iters=it, trace=trace, out=out, targets=targets, var_keys=var_keys, x=[x_s[i]*x_scales[i] for i in range(n)], bounds=bounds, scaling=scaling_dict))
-
-        # Jacobian J (m x n): hybrid analytic/FD via Evaluator when available.
-        # Note: Evaluator.jacobian_targets already uses analytic partials when registered and
-        # falls back to finite-difference for missing entries.
-        try:
-            inp_cur = _make_inp(base, {k: _clamp(x_s[i] * x_scales[i], *bounds[i]) for i, k in enumerate(var_keys)})
-            J_phys = evaluator.jacobian_targets(inp_cur, targets=out_keys, variables=var_keys)
-        except Exception:
-            # Local finite-difference fallback (physical units)
-            J_phys = [[0.0 for _ in range(n)] for __ in range(m)]
-            for j in range(n):
-                x_phys = float(x_s[j]) * float(x_scales[j])
-                step_phys = max(1e-6, 0.02 * abs(x_phys) if x_phys != 0 else 0.02)
-                step_s = step_phys / float(x_scales[j]) if float(x_scales[j]) != 0 else step_phys
-                x2 = list(x_s)
-                x2[j] = _clamp(x2[j] + step_s, b_scaled[j][0], b_scaled[j][1])
-                o2 = eval_out(x2)
-                for i, key in enumerate(out_keys):
-                    v0 = float(out.get(key, float("nan")))
-                    v1 = float(o2.get(key, float("nan")))
-                    if not (math.isfinite(v0) and math.isfinite(v1)):
-                        J_phys[i][j] = 0.0
-                    else:
-                        J_phys[i][j] = (v1 - v0) / max(step_phys, 1e-12)
-
-        # Convert Jacobian to scaled system: dr_scaled/dx_scaled
-        J = [[0.0 for _ in range(n)] for __ in range(m)]
-        for i, key in enumerate(out_keys):
-            sr = float(res_scaling.scale_by_name.get(key, 1.0) or 1.0)
-            for j in range(n):
-                J[i][j] = float(J_phys[i][j]) * float(x_scales[j]) / sr
+            timings = _solve_summary(it)
+            return SolveResult(inp, out, True, it, "converged", trace=trace, report=_mk_report(backend="bounded_newton_scaled", status="success", message="converged", iters=it, trace=trace, out=out, targets=targets, var_keys=var_keys, x=[x_s[i]*x_scales[i] for i in range(n)], bounds=bounds, scaling=scaling_dict, timings=timings))
 
-        
         # --- v76: solver backend selection (auditably opt-in) ---
         backend = str(solver_backend or "hybrid_newton").strip().lower()
         if backend not in ("hybrid_newton", "broyden"):
             backend = "hybrid_newton"
 
+        jac_t0 = time.perf_counter()
+        jac_source = "fd"
+        jac_evals = 0
+        J = None
+        bstate = getattr(evaluator, "_broyden_state", None)
+        if backend == "broyden" and bstate is not None and bstate.get("J") is not None:
+            # The broyden backend only uses the FD Jacobian to initialise its state.
+            J = [row[:] for row in bstate["J"]]
+            jac_source = "broyden"
+        elif jacobian_reuse and backend == "hybrid_newton" and jac_prev is not None and last_improved and jac_prev["age"] < 3:
+            J = _broyden_rank1(
+                jac_prev["J"],
+                [float(x_s[j] - jac_prev["x"][j]) for j in range(n)],
+                [float(r[i] - jac_prev["r"][i]) for i in range(m)],
+            )
+            if J is not None:
+                jac_source = "broyden"
+
+        if J is None:
+            # Jacobian J (m x n): hybrid analytic/FD via Evaluator when available.
+            # Note: Evaluator.jacobian_targets already uses analytic partials when registered and
+            # falls back to finite-difference for missing entries.
+            try:
+                inp_cur = _make_inp(base, {k: _clamp(x_s[i] * x_scales[i], *bounds[i]) for i, k in enumerate(var_keys)})
+                J_phys = evaluator.jacobian_targets(
+                    inp_cur, targets=out_keys, variables=var_keys,
+                    scheme=jacobian_scheme, engine=jacobian_engine,
+                )
+                jac_evals = int((getattr(evaluator, "last_jacobian_info", None) or {}).get("n_evals", 0))
+            except Exception:
+                # Local finite-difference fallback (physical units)
+                J_phys = [[0.0 for _ in range(n)] for __ in range(m)]
+                for j in range(n):
+                    x_phys = float(x_s[j]) * float(x_scales[j])
+                    step_phys = max(1e-6, 0.02 * abs(x_phys) if x_phys != 0 else 0.02)
+                    step_s = step_phys / float(x_scales[j]) if float(x_scales[j]) != 0 else step_phys
+                    x2 = list(x_s)
+                    x2[j] = _clamp(x2[j] + step_s, b_scaled[j][0], b_scaled[j][1])
+                    o2 = eval_out(x2)
+                    jac_evals += 1
+                    for i, key in enumerate(out_keys):
+                        v0 = float(out.get(key, float("nan")))
+                        v1 = float(o2.get(key, float("nan")))
+                        if not (math.isfinite(v0) and math.isfinite(v1)):
+                            J_phys[i][j] = 0.0
+                        else:
+                            J_phys[i][j] = (v1 - v0) / max(step_phys, 1e-12)
+
+            # Convert Jacobian to scaled system: dr_scaled/dx_scaled
+            J = [[0.0 for _ in range(n)] for __ in range(m)]
+            for i, key in enumerate(out_keys):
+                sr = float(res_scaling.scale_by_name.get(key, 1.0) or 1.0)
+                for j in range(n):
+                    J[i][j] = float(J_phys[i][j]) * float(x_scales[j]) / sr
+
+        jac_wall = float(time.perf_counter() - jac_t0)
+        jac_stats["fd" if jac_source == "fd" else "broyden"] += 1
+        jac_stats["wall_s"] += jac_wall
+        jac_stats["n_evals"] += jac_evals
+        jac_prev = {
+            "J": [row[:] for row in J],
+            "x": list(x_s),
+            "r": list(r),
+            "age": 0 if jac_source == "fd" else int(jac_prev["age"]) + 1,
+        }
+        trace.append({
+            "event": "jacobian",
+            "iter": int(it),
+            "source": jac_source,
+            "scheme": str(jacobian_scheme),
+            "engine": str(jacobian_engine),
+            "n_evals": int(jac_evals),
+            "wall_s": jac_wall,
+        })
+
         if backend == "broyden":
             if not hasattr(evaluator, "_broyden_state"):
                 evaluator._broyden_state = {"J": None, "x": None, "r": None}
@@ -381,7 +484,8 @@ def solve_for_targets(
         r0 = _rnorm(out)
         if not math.isfinite(r0):
             inp = _make_inp(base, {k: _clamp(x_s[i] * x_scales[i], *bounds[i]) for i, k in enumerate(var_keys)})
-            return SolveResult(inp, out, False, it, "nonfinite_residual", trace=trace, report=_mk_report(backend="bounded_newton_scaled", status="failed", message="nonfinite_residual", iters=it, trace=trace, out=out, targets=targets, var_keys=var_keys, x=[x_s[i]*x_scales[i] for i in range(n)], bounds=bounds, scaling=scaling_dict))
+            timings = _solve_summary(it)
+            return SolveResult(inp, out, False, it, "nonfinite_residual", trace=trace, report=_mk_report(backend="bounded_newton_scaled", status="failed", message="nonfinite_residual", iters=it, trace=trace, out=out, targets=targets, var_keys=var_keys, x=[x_s[i]*x_scales[i] for i in range(n)], bounds=bounds, scaling=scaling_dict, timings=timings))
 
         step = float(damping)
         best_x = list(x_s)
@@ -413,6 +517,7 @@ def solve_for_targets(
             "n_tries": int(ls_used),
             "improved": bool(improved),
         })
+        last_improved = bool(improved)
 
         # Update trust-region radius based on line-search outcome (non-invasive).
         if improved and ls_used <= 2 and step >= float(damping) * 0.99:
@@ -422,13 +527,15 @@ def solve_for_targets(
         # If we cannot make progress, exit early with an explicit diagnostic.
         if (not improved) and step < 1e-6:
             inp = _make_inp(base, {k: _clamp(x_s[i] * x_scales[i], *bounds[i]) for i, k in enumerate(var_keys)})
-            return SolveResult(inp, out, False, it, "no_descent", trace=trace, report=_mk_report(backend="bounded_newton_scaled", status="failed", message="no_descent", iters=it, trace=trace, out=out, targets=targets, var_keys=var_keys, x=[x_s[i]*x_scales[i] for i in range(n)], bounds=bounds, scaling=scaling_dict))
+            timings = _solve_summary(it)
+            return SolveResult(inp, out, False, it, "no_descent", trace=trace, report=_mk_report(backend="bounded_newton_scaled", status="failed", message="no_descent", iters=it, trace=trace, out=out, targets=targets, var_keys=var_keys, x=[x_s[i]*x_scales[i] for i in range(n)], bounds=bounds, scaling=scaling_dict, timings=timings))
 
         x_s = best_x
         out = best_out
 
     inp = _make_inp(base, {k: _clamp(x_s[i] * x_scales[i], *bounds[i]) for i, k in enumerate(var_keys)})
-    return SolveResult(inp, out, False, max_iter, "max_iter", trace=trace, report=_mk_report(backend="bounded_newton_scaled", status="failed", message="max_iter", iters=max_iter, trace=trace, out=out, targets=targets, var_keys=var_keys, x=[x_s[i]*x_scales[i] for i in range(n)], bounds=bounds, scaling=scaling_dict))
+    timings = _solve_summary(max_iter)
+    return SolveResult(inp, out, False, max_iter, "max_iter", trace=trace, report=_mk_report(backend="bounded_newton_scaled", status="failed", message="max_iter", iters=max_iter, trace=trace, out=out, targets=targets, var_keys=var_keys, x=[x_s[i]*x_scales[i] for i in range(n)], bounds=bounds, scaling=scaling_dict, timings=timings))
 
 
 def solve_for_targets_stream(
@@ -3,9 +3,14 @@
 NiceGUI sets an override via ``set_evaluate_point_override`` so Pareto / optimize
 paths route through ``ui_evaluate`` without importing ``ui_nicegui`` into ``src/``.
 CLI and tests keep the bare ``Evaluator`` fallback.
+
+``set_persistent_eval_cache`` attaches a shared on-disk evaluation cache
+(:class:`evaluator.persistent_cache.PersistentEvalCache`) to every fallback
+``Evaluator`` so campaign / Pareto reruns reuse points from earlier runs.
 """
 from __future__ import annotations
 
+import os
 from typing import Any, Callable, Dict, Optional
 
 try:
@@ -17,6 +22,8 @@ except Exception:
 _EVALUATE_OVERRIDE: Optional[Callable[..., Dict[str, Any]]] = None
 # Fallback Evaluator pool keyed by origin (avoids sticky first-label singleton).
 _EVALUATOR_POOL: Dict[str, Any] = {}
+# Optional persistent cache shared by the fallback pool (path or PersistentEvalCache).
+_PERSISTENT_CACHE: Any = None
 
 
 def set_evaluate_point_override(fn: Optional[Callable[..., Dict[str, Any]]] = None) -> None:
@@ -25,6 +32,23 @@ def set_evaluate_point_override(fn: Optional[Callable[..., Dict[str, Any]]] = No
     _EVALUATE_OVERRIDE = fn
 
 
+def set_persistent_eval_cache(cache: Any = None) -> None:
+    """Install or clear the persistent cache used by fallback Evaluators.
+
+    ``cache`` is a :class:`~evaluator.persistent_cache.PersistentEvalCache` or a
+    file path. The fallback pool is rebuilt so existing Evaluators pick it up.
+    """
+    global _PERSISTENT_CACHE
+    if isinstance(cache, (str, os.PathLike)):
+        try:
+            from evaluator.persistent_cache import PersistentEvalCache  # type: ignore
+        except ImportError:
+            from src.evaluator.persistent_cache import PersistentEvalCache  # type: ignore
+        cache = PersistentEvalCache(cache)
+    _PERSISTENT_CACHE = cache
+    _EVALUATOR_POOL.clear()
+
+
 def evaluate_point(
     inp: PointInputs,
     *,
@@ -49,6 +73,8 @@ def evaluate_point(
     key = str(origin or "solver")
     ev = _EVALUATOR_POOL.get(key)
     if ev is None:
+        if _PERSISTENT_CACHE is not None:
+            evaluator_kwargs.setdefault("persistent_cache", _PERSISTENT_CACHE)
         ev = Evaluator(label=key, cache_enabled=True, **evaluator_kwargs)
         _EVALUATOR_POOL[key] = ev
     res = ev.evaluate(inp, Paux_for_Q_MW=Paux_for_Q_MW)
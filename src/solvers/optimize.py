@@ -12,7 +12,7 @@ exploration with transparent behavior.
 import random
 import os
 from dataclasses import replace
-from typing import Callable, Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 
 try:
     from ..models.inputs import PointInputs  # type: ignore
@@ -22,6 +22,7 @@ from constraints.system import build_constraints_from_outputs
 from constraints.system import build_constraints_from_outputs
 from constraints.unified import build_all_constraints
 from solvers.evaluator_bridge import evaluate_point
+from solvers.pareto_engine import metric_matrix, nondominated_mask
 from optimization.objectives import get_objective, list_objectives
 
 def default_objectives() -> Dict[str, str]:
@@ -193,19 +194,16 @@ def _pareto_worker(payload):
     return row
 
 def pareto_front(points: List[Dict[str, float]], objectives: Dict[str, str]) -> List[Dict[str, float]]:
-    """Filter nondominated points."""
-    front: List[Dict[str, float]] = []
-    for p in points:
-        dominated = False
-        for q in points:
-            if q is p:
-                continue
-            if dominates(q, p, objectives):
-                dominated = True
-                break
-        if not dominated:
-            front.append(p)
-    return front
+    """Filter nondominated points (``dominates`` semantics, input order kept).
+
+    Vectorized via :mod:`solvers.pareto_engine` (sort-based, no pairwise loop).
+    """
+    if not points:
+        return []
+    keys = list(objectives.keys())
+    F = metric_matrix(points, keys)
+    mask = nondominated_mask(F, [objectives[k] for k in keys])
+    return [p for p, keep in zip(points, mask) if keep]
 
 
 # ---- Intent-aware feasibility + dominance annotations (Pareto Lab) ----
@@ -270,12 +268,17 @@ def pareto_optimize(
     intent_key: str = "Reactor",
     parallel: bool = False,
     workers: Optional[int] = None,
+    pool: Optional[Any] = None,
 ) -> Dict[str, object]:
     """
     Pareto search: Latin hypercube sampling within bounds, keep feasible points, return Pareto front.
 
     objectives example:
       {'R0_m': 'min', 'B_peak_T': 'min', 'P_e_net_MW': 'max'}
+
+    ``pool`` (a :class:`evaluator.worker_pool.WarmWorkerPool`) evaluates the
+    samples in its warm workers instead of a per-call process pool; samples
+    whose worker crashed or timed out are dropped like failed evaluations.
     """
     import time as _time
     t_wall0 = _time.perf_counter()
@@ -283,7 +286,16 @@ def pareto_optimize(
     samples = latin_hypercube_samples(n_samples, bounds, seed=seed)
     feasible: List[Dict[str, float]] = []
     all_rows: List[Dict[str, float]] = []  # includes infeasible samples for "failure atlas" / honesty panels
-    if parallel:
+    if pool is not None:
+        payloads = [{"base": base.__dict__, "sample": s, "intent_key": intent_key} for s in samples]
+        for res in pool.map(_pareto_worker, payloads, return_exceptions=True):
+            if isinstance(res, BaseException) and not isinstance(res, pool.LOST_TASK_ERRORS):
+                raise res
+            if isinstance(res, dict):
+                all_rows.append(res)
+                if bool(res.get('is_feasible', False)):
+                    feasible.append(res)
+    elif parallel:
         import concurrent.futures
         payloads = [{"base": base.__dict__, "sample": s, "intent_key": intent_key} for s in samples]
         with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
@@ -327,8 +339,8 @@ def pareto_optimize(
     wall_s = float(_time.perf_counter() - t_wall0)
     eval_sum_s = float(sum(float(r.get('eval_s', 0.0) or 0.0) for r in feasible))
     perf = {
-        'parallel': bool(parallel),
-        'workers': int(workers) if workers is not None else 0,
+        'parallel': bool(parallel or pool is not None),
+        'workers': int(pool.max_workers) if pool is not None else (int(workers) if workers is not None else 0),
         'n_samples': int(n_samples),
         'n_feasible': int(len(feasible)),
         'wall_s': wall_s,
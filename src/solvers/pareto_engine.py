@@ -0,0 +1,265 @@
+"""NumPy Pareto engine shared by ``solvers.optimize`` and the NSGA-II driver.
+
+Works on an ``(N, M)`` metric matrix (plus, for constrained sorting, a
+feasibility mask and a violation vector) instead of per-pair dict compares.
+
+Domination semantics are exactly those of ``solvers.optimize.dominates``:
+
+- senses are ``"min"`` or anything else (= max); max columns are negated
+- a row with a NaN in any objective neither dominates nor is dominated
+- identical rows do not dominate each other
+
+Nondominated sorting is the efficient non-dominated sort with binary search
+over fronts (ENS-BS): rows are visited in lexicographic order, so a row can
+only be dominated by rows already placed, and "front k dominates p" is
+monotone in k. Two objectives use an O(N log N) staircase sweep; three or
+more compare each row against one front at a time with vectorized checks.
+
+Member order: the sorts list fronts in the order Deb's fast nondominated sort
+discovers them (front 0 ascending; a later row follows the position of its
+last dominator in the previous front, then its index). ``crowding_distance``
+breaks value ties by position in the front (stable sort), so this order is
+what keeps seeded NSGA-II selection identical to the pairwise implementation.
+``fronts_from_ranks`` is the cheaper ascending-index grouping.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+
+def metric_matrix(rows: Sequence[Mapping[str, Any]], keys: Sequence[str]) -> np.ndarray:
+    """``(N, len(keys))`` float matrix of ``rows[i][key]``; missing / non-numeric -> NaN."""
+    F = np.full((len(rows), len(keys)), np.nan, dtype=float)
+    for i, r in enumerate(rows):
+        for j, k in enumerate(keys):
+            v = r.get(k)
+            if v is None:
+                continue
+            try:
+                F[i, j] = float(v)
+            except (TypeError, ValueError):
+                pass
+    return F
+
+
+def minimization_form(F: np.ndarray, senses: Iterable[str]) -> np.ndarray:
+    """Copy of ``F`` with every non-``"min"`` column negated (all objectives minimized)."""
+    sign = np.array([1.0 if s == "min" else -1.0 for s in senses], dtype=float)
+    return np.asarray(F, dtype=float) * sign if sign.size else np.asarray(F, dtype=float).copy()
+
+
+def _ens_ranks(F: np.ndarray, *, first_front_only: bool = False) -> np.ndarray:
+    """Front rank per row of a minimization matrix (NaN rows: rank 0).
+
+    With ``first_front_only`` dominated rows get rank 1 without being sorted
+    further (enough for a nondominated filter).
+    """
+    n, m = F.shape
+    ranks = np.zeros(n, dtype=np.int64)
+    if n == 0 or m == 0:
+        return ranks
+    valid = np.flatnonzero(~np.isnan(F).any(axis=1))
+    if valid.size == 0:
+        return ranks
+    G = F[valid]
+    order = np.lexsort(tuple(G[:, j] for j in range(m - 1, -1, -1)))
+    Gs = G[order]
+    dup = np.zeros(len(order), dtype=bool)
+    dup[1:] = (Gs[1:] == Gs[:-1]).all(axis=1)
+    rs = np.zeros(len(order), dtype=np.int64)
+
+    if m == 2:
+        # Staircase: last_f1[k] = smallest second objective placed in front k
+        # (non-decreasing in k). Front k dominates p iff last_f1[k] <= p[1].
+        last_f1: List[float] = []
+        for i in range(len(order)):
+            if dup[i]:
+                rs[i] = rs[i - 1]
+                continue
+            f1 = float(Gs[i, 1])
+            k = bisect_right(last_f1, f1)
+            if first_front_only and k > 0:
+                rs[i] = 1
+                continue
+            if k == len(last_f1):
+                last_f1.append(f1)
+            else:
+                last_f1[k] = f1
+            rs[i] = k
+    else:
+        # Earlier rows are lexicographically smaller and distinct, so
+        # q <= p elementwise already implies strict improvement somewhere.
+        members: List[List[int]] = []
+        cache: List[Optional[np.ndarray]] = []
+
+        def _dominated_by(k: int, p: np.ndarray) -> bool:
+            A = cache[k]
+            if A is None:
+                A = cache[k] = Gs[members[k]]
+            return bool((A <= p).all(axis=1).any())
+
+        for i in range(len(order)):
+            if dup[i]:
+                rs[i] = rs[i - 1]
+                continue
+            p = Gs[i]
+            if first_front_only:
+                if members and _dominated_by(0, p):
+                    rs[i] = 1
+                    continue
+                lo = 0
+            else:
+                lo, hi = 0, len(members)
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if _dominated_by(mid, p):
+                        lo = mid + 1
+                    else:
+                        hi = mid
+            if lo == len(members):
+                members.append([])
+                cache.append(None)
+            members[lo].append(i)
+            cache[lo] = None
+            rs[i] = lo
+
+    ranks[valid[order]] = rs
+    return ranks
+
+
+def nondominated_mask(F: np.ndarray, senses: Iterable[str]) -> np.ndarray:
+    """Boolean mask of rows not dominated by any other row (``dominates`` semantics)."""
+    return _ens_ranks(minimization_form(F, senses), first_front_only=True) == 0
+
+
+def fronts_from_ranks(ranks: np.ndarray) -> List[np.ndarray]:
+    """Group row indices by front rank (fronts in rank order, indices ascending)."""
+    if ranks.size == 0:
+        return []
+    order = np.argsort(ranks, kind="stable")  # ascending index within each front
+    bounds = np.searchsorted(ranks[order], np.arange(int(ranks.max()) + 2))
+    return [order[bounds[k]:bounds[k + 1]] for k in range(len(bounds) - 1)]
+
+
+def _constrained_dominance(
+    Fa: np.ndarray, fa: np.ndarray, va: np.ndarray, Fb: np.ndarray, fb: np.ndarray, vb: np.ndarray
+) -> np.ndarray:
+    """``D[i, j]``: row ``i`` of set a constrained-dominates row ``j`` of set b (minimization form)."""
+    with np.errstate(invalid="ignore"):
+        A, B = Fa[:, None, :], Fb[None, :, :]
+        pareto = (A <= B).all(axis=2) & (A < B).any(axis=2)
+        pareto &= ~np.isnan(Fa).any(axis=1)[:, None] & ~np.isnan(Fb).any(axis=1)[None, :]
+        lower_violation = va[:, None] < vb[None, :]
+    both_feasible = fa[:, None] & fb[None, :]
+    both_infeasible = ~fa[:, None] & ~fb[None, :]
+    return np.where(both_feasible, pareto, np.where(both_infeasible, lower_violation, fa[:, None] & ~fb[None, :]))
+
+
+def discovery_order_fronts(
+    ranks: np.ndarray,
+    Fm: np.ndarray,
+    feasible: Optional[np.ndarray] = None,
+    violation: Optional[np.ndarray] = None,
+) -> List[np.ndarray]:
+    """Fronts of ``ranks`` in fast-nondominated-sort discovery order.
+
+    ``Fm`` is the minimization-form matrix the ranks came from. Each row of
+    front ``k >= 1`` is placed by the position of its last dominator in front
+    ``k - 1`` (ties: ascending index), which is when the pairwise algorithm's
+    domination counter reaches zero.
+    """
+    n = len(ranks)
+    fa = np.ones(n, dtype=bool) if feasible is None else np.asarray(feasible, dtype=bool)
+    va = np.zeros(n, dtype=float) if violation is None else np.asarray(violation, dtype=float)
+    fronts = fronts_from_ranks(np.asarray(ranks))
+    for k in range(1, len(fronts)):
+        prev, cur = fronts[k - 1], fronts[k]
+        D = _constrained_dominance(Fm[prev], fa[prev], va[prev], Fm[cur], fa[cur], va[cur])
+        last = len(prev) - 1 - np.argmax(D[::-1], axis=0)
+        fronts[k] = cur[np.lexsort((cur, last))]
+    return fronts
+
+
+def nondominated_sort(F: np.ndarray, senses: Iterable[str]) -> List[np.ndarray]:
+    """Pareto fronts (index arrays, discovery order) of the metric matrix ``F``."""
+    Fm = minimization_form(F, senses)
+    return discovery_order_fronts(_ens_ranks(Fm), Fm)
+
+
+def constrained_front_ranks(
+    F: np.ndarray,
+    senses: Iterable[str],
+    feasible: np.ndarray,
+    violation: np.ndarray,
+) -> np.ndarray:
+    """Front rank under feasible-first constrained domination (Deb et al.).
+
+    Feasible rows are ranked by Pareto domination; infeasible rows follow,
+    one front per distinct violation value (lower first). A NaN violation is
+    never compared, so such rows land in the first infeasible front.
+    """
+    feasible = np.asarray(feasible, dtype=bool)
+    violation = np.asarray(violation, dtype=float)
+    ranks = np.zeros(len(feasible), dtype=np.int64)
+    fi = np.flatnonzero(feasible)
+    n_fronts = 0
+    if fi.size:
+        ranks[fi] = _ens_ranks(minimization_form(np.asarray(F, dtype=float)[fi], senses))
+        n_fronts = int(ranks[fi].max()) + 1
+    ii = np.flatnonzero(~feasible)
+    if ii.size:
+        v = violation[ii]
+        dense = np.zeros(ii.size, dtype=np.int64)
+        ok = ~np.isnan(v)
+        if ok.any():
+            dense[ok] = np.unique(v[ok], return_inverse=True)[1].reshape(-1)
+        ranks[ii] = n_fronts + dense
+    return ranks
+
+
+def constrained_nondominated_sort(
+    F: np.ndarray,
+    senses: Iterable[str],
+    feasible: np.ndarray,
+    violation: np.ndarray,
+) -> List[np.ndarray]:
+    """Fronts (index arrays, discovery order) under feasible-first constrained domination."""
+    senses = list(senses)
+    ranks = constrained_front_ranks(F, senses, feasible, violation)
+    return discovery_order_fronts(ranks, minimization_form(F, senses), feasible, violation)
+
+
+def crowding_distance(F: np.ndarray) -> np.ndarray:
+    """NSGA-II crowding distance of the rows of ``F`` (one front, raw metric values).
+
+    Per objective: stable sort by value (NaN last), boundary rows get +inf,
+    interior rows add ``(next - prev) / span`` when both neighbours are
+    finite; objectives with fewer than two finite values or zero span add
+    nothing.
+    """
+    F = np.asarray(F, dtype=float)
+    n, m = F.shape
+    d = np.zeros(n, dtype=float)
+    if n == 0:
+        return d
+    for j in range(m):
+        v = F[:, j]
+        order = np.argsort(v, kind="stable")
+        d[order[0]] = np.inf
+        d[order[-1]] = np.inf
+        fin = np.isfinite(v)
+        if int(fin.sum()) < 2:
+            continue
+        span = float(v[fin].max() - v[fin].min())
+        if span <= 0.0 or n < 3:
+            continue
+        vs = v[order]
+        prev, nxt = vs[:-2], vs[2:]
+        ok = np.isfinite(prev) & np.isfinite(nxt)
+        with np.errstate(invalid="ignore"):
+            d[order[1:-1]] += np.where(ok, (nxt - prev) / span, 0.0)
+    return d
@@ -13,16 +13,14 @@ This module is intentionally lightweight:
 
 Returned sensitivities are *local* derivatives at the chosen point.
 """
-from dataclasses import replace
-from typing import Dict, Iterable, Callable, Optional, Any
+from typing import Dict, Iterable, Callable, List, Optional, Any, Tuple
 
 try:
     from ..models.inputs import PointInputs  # type: ignore
+    from ..schema.fingerprint import replace_inputs  # type: ignore
 except Exception:
-    try:
-        from models.inputs import PointInputs  # type: ignore
-    except Exception:
-        from models.inputs import PointInputs  # type: ignore
+    from models.inputs import PointInputs  # type: ignore
+    from schema.fingerprint import replace_inputs  # type: ignore
 
 MetricFn = Callable[[PointInputs], Dict[str, float]]
 
@@ -35,26 +33,19 @@ def _default_evaluator(inp: PointInputs) -> Dict[str, Any]:
     return evaluate_point(inp, origin="local_sensitivities")
 
 
-def finite_difference_sensitivities(
+def central_difference_stencil(
     base: PointInputs,
-    evaluator: MetricFn,
     params: Iterable[str],
-    outputs: Iterable[str],
     rel_step: float = 1e-3,
     abs_steps: Dict[str, float] | None = None,
-) -> Dict[str, Dict[str, float]]:
-    """
-    Compute d(output)/d(param) using central differences.
+) -> List[Tuple[str, float, PointInputs, PointInputs]]:
+    """``(param, h, base+h, base-h)`` for every numeric parameter (the FD stencil).
 
-    - rel_step: default relative perturbation (e.g. 1e-3 -> 0.1%)
-    - abs_steps: optional per-parameter absolute step override
-
-    Returns: sens[output][param] = derivative (output units per param unit)
+    Exposed so callers can evaluate the points up front (e.g. concurrently)
+    and then run ``finite_difference_sensitivities`` against cached results.
     """
     abs_steps = abs_steps or {}
-    base_out = evaluator(base)
-    sens: Dict[str, Dict[str, float]] = {o: {} for o in outputs}
-
+    stencil: List[Tuple[str, float, PointInputs, PointInputs]] = []
     for p in params:
         if not hasattr(base, p):
             continue
@@ -71,9 +62,30 @@ def finite_difference_sensitivities(
             h = rel_step
 
         # Build +h and -h points
-        plus = replace(base, **{p: x0f + h})
-        minus = replace(base, **{p: x0f - h})
+        stencil.append((p, h, replace_inputs(base, **{p: x0f + h}), replace_inputs(base, **{p: x0f - h})))
+    return stencil
+
+
+def finite_difference_sensitivities(
+    base: PointInputs,
+    evaluator: MetricFn,
+    params: Iterable[str],
+    outputs: Iterable[str],
+    rel_step: float = 1e-3,
+    abs_steps: Dict[str, float] | None = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compute d(output)/d(param) using central differences.
+
+    - rel_step: default relative perturbation (e.g. 1e-3 -> 0.1%)
+    - abs_steps: optional per-parameter absolute step override
+
+    Returns: sens[output][param] = derivative (output units per param unit)
+    """
+    base_out = evaluator(base)
+    sens: Dict[str, Dict[str, float]] = {o: {} for o in outputs}
 
+    for p, h, plus, minus in central_difference_stencil(base, params, rel_step, abs_steps):
         out_p = evaluator(plus)
         out_m = evaluator(minus)
 
@@ -1,19 +1,107 @@
 from __future__ import annotations
+import math
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+def _num(v: Any) -> Optional[float]:
+    if isinstance(v, bool) or not isinstance(v, (int, float)):
+        return None
+    f = float(v)
+    return None if math.isnan(f) else f
+
+
+def _kpi(*keys: str) -> Callable[[Dict[str, Any]], Optional[float]]:
+    def get(art: Dict[str, Any]) -> Optional[float]:
+        kpis = art.get("kpis") if isinstance(art.get("kpis"), dict) else {}
+        outs = art.get("outputs") if isinstance(art.get("outputs"), dict) else {}
+        for k in keys:
+            for src in (kpis, outs):
+                v = _num(src.get(k))
+                if v is not None:
+                    return v
+        return None
+    return get
+
+
+def _inp(key: str) -> Callable[[Dict[str, Any]], Optional[float]]:
+    def get(art: Dict[str, Any]) -> Optional[float]:
+        inputs = art.get("inputs") if isinstance(art.get("inputs"), dict) else {}
+        return _num(inputs.get(key))
+    return get
+
+
+def _hard_feasible(art: Dict[str, Any]) -> Optional[int]:
+    kpis = art.get("kpis") if isinstance(art.get("kpis"), dict) else {}
+    v = kpis.get("feasible_hard")
+    return None if v is None else int(bool(v))
+
+
+def _dominant_constraint(art: Dict[str, Any]) -> Optional[str]:
+    v = art.get("dominant_constraint")
+    if not v:
+        cs = art.get("constraints_summary") if isinstance(art.get("constraints_summary"), dict) else {}
+        v = cs.get("worst_hard")
+    return str(v) if v else None
+
+
+# Queryable per-case columns: name -> (SQL type, extractor from a run artifact).
+INDEX_COLUMNS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Any]]] = {
+    "hard_feasible": ("INTEGER", _hard_feasible),
+    "min_hard_margin": ("REAL", _kpi("min_hard_margin")),
+    "dominant_constraint": ("TEXT", _dominant_constraint),
+    "Q": ("REAL", _kpi("Q_DT_eqv", "Q")),
+    "H98": ("REAL", _kpi("H98")),
+    "Pfus_MW": ("REAL", _kpi("Pfus_DT_adj_MW", "Pfus_total_MW", "P_fus_MW")),
+    "P_e_net_MW": ("REAL", _kpi("P_e_net_MW", "P_net_e_MW")),
+    "COE_USD_per_MWh": ("REAL", _kpi("COE_proxy_USD_per_MWh", "COE_$MWh")),
+    "R0_m": ("REAL", _inp("R0_m")),
+    "a_m": ("REAL", _inp("a_m")),
+    "Bt_T": ("REAL", _inp("Bt_T")),
+    "Ip_MA": ("REAL", _inp("Ip_MA")),
+    "fG": ("REAL", _inp("fG")),
+}
+_BASE_COLUMNS = ("case_id", "ok", "iters", "message", "artifact_path")
+_INDEXED = ("hard_feasible", "min_hard_margin", "dominant_constraint", "Q", "P_e_net_MW", "R0_m")
+_OPS = {"<": "<", "<=": "<=", ">": ">", ">=": ">=", "==": "=", "=": "=", "!=": "!="}
+
+
+def index_columns(artifact: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the queryable index columns from a run artifact (None when absent)."""
+    out: Dict[str, Any] = {}
+    for name, (_, get) in INDEX_COLUMNS.items():
+        try:
+            out[name] = get(artifact)
+        except Exception:
+            out[name] = None
+    return out
+
 
 class SQLiteIndex:
-    """Tiny optional index for study case metadata (Windows-friendly, stdlib only)."""
+    """Study case index (Windows-friendly, stdlib only).
 
-    def __init__(self, path: str | Path):
+    WAL journaling with batched inserts: ``add_case`` buffers rows and writes
+    them ``batch_size`` at a time in one transaction (``flush``/``close`` and
+    every query flush the rest). Besides ok/iters/message/path each row holds
+    the :data:`INDEX_COLUMNS` (key KPIs, min hard margin, dominant
+    constraint, main geometry inputs), indexed for filtering large studies
+    without opening artifact files.
+    """
+
+    def __init__(self, path: str | Path, *, batch_size: int = 256):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, int(batch_size))
         self.conn = sqlite3.connect(self.path)
+        self._pending: List[Tuple[Any, ...]] = []
         self._init()
 
     def _init(self) -> None:
         cur = self.conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: durable at checkpoints, no fsync per transaction.
+        cur.execute("PRAGMA synchronous=NORMAL")
         cur.execute("""CREATE TABLE IF NOT EXISTS cases (
             case_id INTEGER PRIMARY KEY,
             ok INTEGER,
@@ -21,18 +109,124 @@ class SQLiteIndex:
             message TEXT,
             artifact_path TEXT
         )""")
+        # Older index files only have the base columns.
+        have = {r[1] for r in cur.execute("PRAGMA table_info(cases)")}
+        for name, (sql_type, _) in INDEX_COLUMNS.items():
+            if name not in have:
+                cur.execute(f'ALTER TABLE cases ADD COLUMN "{name}" {sql_type}')
+        for name in _INDEXED:
+            cur.execute(f'CREATE INDEX IF NOT EXISTS "idx_cases_{name}" ON cases("{name}")')
         self.conn.commit()
 
-    def add_case(self, case_id: int, ok: bool, iters: int, message: str, artifact_path: str) -> None:
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT OR REPLACE INTO cases(case_id, ok, iters, message, artifact_path) VALUES (?,?,?,?,?)",
-            (case_id, int(ok), int(iters), message, artifact_path),
+    def add_case(
+        self,
+        case_id: int,
+        ok: bool,
+        iters: int,
+        message: str,
+        artifact_path: str,
+        *,
+        columns: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Queue one case; ``columns`` comes from :func:`index_columns`."""
+        cols = columns or {}
+        self._pending.append(
+            (case_id, int(ok), int(iters), message, artifact_path)
+            + tuple(cols.get(name) for name in INDEX_COLUMNS)
         )
-        self.conn.commit()
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        names = _BASE_COLUMNS + tuple(INDEX_COLUMNS)
+        sql = "INSERT OR REPLACE INTO cases({}) VALUES ({})".format(
+            ", ".join(f'"{n}"' for n in names), ",".join("?" for _ in names)
+        )
+        with self.conn:
+            self.conn.executemany(sql, self._pending)
+        self._pending = []
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+
+    def query_cases(
+        self,
+        *,
+        feasible: Optional[bool] = None,
+        where: Sequence[Tuple[str, str, Any]] = (),
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Filter cases on index columns, e.g. ``where=[("Q", ">", 10)], order_by="R0_m"``.
+
+        Column names and operators are validated (no free-form SQL).
+        """
+        self.flush()
+        known = set(_BASE_COLUMNS) | set(INDEX_COLUMNS)
+        clauses: List[str] = []
+        params: List[Any] = []
+        if feasible is not None:
+            clauses.append('"hard_feasible" = ?')
+            params.append(int(bool(feasible)))
+        for col, op, value in where:
+            if col not in known:
+                raise ValueError(f"unknown index column {col!r}")
+            if op not in _OPS:
+                raise ValueError(f"unsupported operator {op!r}")
+            clauses.append(f'"{col}" {_OPS[op]} ?')
+            params.append(value)
+        sql = "SELECT * FROM cases"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if order_by is not None:
+            if order_by not in known:
+                raise ValueError(f"unknown index column {order_by!r}")
+            sql += f' ORDER BY "{order_by}" IS NULL, "{order_by}" {"DESC" if descending else "ASC"}, case_id'
+        else:
+            sql += " ORDER BY case_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        cur = self.conn.execute(sql, params)
+        names = [d[0] for d in cur.description]
+        return [dict(zip(names, r)) for r in cur.fetchall()]
+
+    def feasible_cases(
+        self,
+        *,
+        min_Q: Optional[float] = None,
+        order_by: Optional[str] = "R0_m",
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Hard-feasible cases, optionally with ``Q > min_Q``, sorted by ``order_by``."""
+        where = [("Q", ">", float(min_Q))] if min_Q is not None else []
+        return self.query_cases(feasible=True, where=where, order_by=order_by, descending=descending, limit=limit)
+
+    def dominant_constraint_counts(self) -> Dict[str, int]:
+        """Number of cases per dominant constraint (most frequent first)."""
+        self.flush()
+        rows = self.conn.execute(
+            'SELECT "dominant_constraint", COUNT(*) AS n FROM cases WHERE "dominant_constraint" IS NOT NULL '
+            'GROUP BY "dominant_constraint" ORDER BY n DESC, "dominant_constraint"'
+        ).fetchall()
+        return {str(k): int(n) for k, n in rows}
 
     def close(self) -> None:
         try:
-            self.conn.close()
-        except Exception:
-            pass
+            self.flush()
+        finally:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+
+    def __enter__(self) -> "SQLiteIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
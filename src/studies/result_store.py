@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+"""Columnar study result store (stdlib SQLite + NumPy column reads).
+
+A ``run_study`` sweep used to write one pretty-printed JSON artifact per case
+and then re-read every artifact to synthesize the reference design. For
+10k-case sweeps that is tens of GB of indented JSON plus a second full pass
+over disk. This store keeps what studies actually aggregate over:
+
+- ``cases``: one row per case (solver ok/iters/message, hard feasibility,
+  decision-grade flag, run id / input hash, non-feasibility certificate)
+- ``scalars``: numeric inputs, KPIs and constraint margins / pass flags,
+  clustered by ``(kind, key, case_id)`` so one column is one range scan
+- ``constraints``: constraint name -> severity
+
+Full artifacts are optional and go to a compressed sidecar
+(``artifacts.sqlite``, zlib-compressed compact JSON) that is only read by
+:meth:`ColumnarStudyStore.load_artifact`.
+
+Reference-design synthesis runs on the columns: each case becomes a small stub
+carrying exactly the fields ``synthesize_reference_design`` reads, so the
+selection is identical to the artifact-based path.
+"""
+
+import json
+import math
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from ..decision.reference_design import get_kpi, hard_feasible, synthesize_reference_design  # type: ignore
+except Exception:
+    from decision.reference_design import get_kpi, hard_feasible, synthesize_reference_design  # type: ignore
+
+STORE_FILENAME = "results.sqlite"
+SIDECAR_FILENAME = "artifacts.sqlite"
+
+# Keys read by synthesize_reference_design (kpis first, outputs as fallback).
+REFERENCE_KPI_KEYS = ("COE_$MWh", "coe_$MWh", "P_e_net_MW", "P_net_MW", "p_feasible", "prob_feasible", "min_hard_margin")
+
+KIND_INPUT = "input"
+KIND_KPI = "kpi"
+KIND_MARGIN = "margin"
+KIND_PASSED = "passed"
+
+
+def _as_float(v: Any) -> Optional[float]:
+    if isinstance(v, bool):
+        return float(v)
+    if isinstance(v, (int, float)):
+        return float(v)
+    return None
+
+
+def _margin_of(c: Dict[str, Any]) -> Optional[float]:
+    for k in ("margin_frac", "margin"):
+        v = _as_float(c.get(k))
+        if v is not None:
+            return v
+    return None
+
+
+def _db_float(v: Optional[float]) -> Optional[float]:
+    # SQLite REAL has no NaN (it becomes NULL); keep infinities.
+    if v is None or (isinstance(v, float) and math.isnan(v)):
+        return None
+    return float(v)
+
+
+class ColumnarStudyStore:
+    """Append-only columnar store for one study directory.
+
+    ``resume=False`` starts a fresh run: rows left by a previous run into the
+    same directory are dropped (like :class:`~shams_io.checkpoint.CaseCheckpoint`).
+    """
+
+    def __init__(self, out_dir: str | Path, *, sidecar: bool = True, resume: bool = True):
+        self.dir = Path(out_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.dir / STORE_FILENAME
+        self.sidecar_path = self.dir / SIDECAR_FILENAME
+        if not resume and not sidecar and self.sidecar_path.exists():
+            self.sidecar_path.unlink()  # stale artifacts of a previous run
+        self.conn = sqlite3.connect(self.path)
+        self._sidecar = sqlite3.connect(self.sidecar_path) if sidecar else None
+        self._init()
+        if not resume:
+            self._clear()
+
+    def _init(self) -> None:
+        cur = self.conn.cursor()
+        cur.execute("""CREATE TABLE IF NOT EXISTS cases (
+            case_id INTEGER PRIMARY KEY,
+            ok INTEGER,
+            iters INTEGER,
+            message TEXT,
+            hard_feasible INTEGER,
+            decision_grade_ok INTEGER,
+            run_id TEXT,
+            input_hash TEXT,
+            nonfeasibility_json TEXT,
+            row_json TEXT
+        )""")
+        cur.execute("""CREATE TABLE IF NOT EXISTS scalars (
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            case_id INTEGER NOT NULL,
+            value REAL,
+            PRIMARY KEY (kind, key, case_id)
+        ) WITHOUT ROWID""")
+        cur.execute("""CREATE TABLE IF NOT EXISTS constraints (
+            name TEXT PRIMARY KEY,
+            severity TEXT
+        )""")
+        self.conn.commit()
+        if self._sidecar is not None:
+            self._sidecar.execute("""CREATE TABLE IF NOT EXISTS artifacts (
+                case_id INTEGER PRIMARY KEY,
+                codec TEXT,
+                blob BLOB
+            )""")
+            self._sidecar.commit()
+
+    def _clear(self) -> None:
+        for table in ("cases", "scalars", "constraints"):
+            self.conn.execute(f"DELETE FROM {table}")
+        self.conn.commit()
+        if self._sidecar is not None:
+            self._sidecar.execute("DELETE FROM artifacts")
+            self._sidecar.commit()
+
+    # -----------------------------
+    # Write
+    # -----------------------------
+
+    def add_case(self, row: Dict[str, Any], artifact: Dict[str, Any]) -> None:
+        """Record one case: its index ``row`` plus the columns extracted from ``artifact``."""
+        case_id = int(row["case"])
+        scalars: List[Tuple[str, str, int, Optional[float]]] = []
+
+        inputs = artifact.get("inputs") if isinstance(artifact.get("inputs"), dict) else {}
+        for k, v in inputs.items():
+            f = _as_float(v)
+            if f is not None:
+                scalars.append((KIND_INPUT, str(k), case_id, _db_float(f)))
+
+        kpis = artifact.get("kpis") if isinstance(artifact.get("kpis"), dict) else {}
+        seen = set()
+        for k, v in kpis.items():
+            f = _as_float(v)
+            if f is not None:
+                scalars.append((KIND_KPI, str(k), case_id, _db_float(f)))
+                seen.add(str(k))
+        for k in REFERENCE_KPI_KEYS:
+            if k in seen:
+                continue
+            f = get_kpi(artifact, k, default=None)  # type: ignore[arg-type]
+            if f is not None:
+                scalars.append((KIND_KPI, k, case_id, _db_float(f)))
+
+        severities = []
+        for c in artifact.get("constraints") or []:
+            if not isinstance(c, dict) or not c.get("name"):
+                continue
+            name = str(c.get("name"))
+            severities.append((name, str(c.get("severity", "hard")).lower()))
+            scalars.append((KIND_MARGIN, name, case_id, _db_float(_margin_of(c))))
+            scalars.append((KIND_PASSED, name, case_id, 1.0 if bool(c.get("passed", True)) else 0.0))
+
+        decision = artifact.get("decision", {}) if isinstance(artifact.get("decision", {}), dict) else {}
+        dg = decision.get("decision_grade_ok")
+        meta = artifact.get("meta", {}) if isinstance(artifact.get("meta", {}), dict) else {}
+        nonfeas = artifact.get("nonfeasibility_certificate")
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cases(case_id, ok, iters, message, hard_feasible, decision_grade_ok, run_id, input_hash, nonfeasibility_json, row_json) "
+                "VALUES (?,?,?,?,?,?,?,?,?,?)",
+                (
+                    case_id,
+                    int(bool(row.get("ok"))),
+                    int(row.get("iters", 0) or 0),
+                    str(row.get("message", "")),
+                    int(hard_feasible(artifact)),
+                    None if dg is None else int(bool(dg)),
+                    str(meta["run_id"]) if "run_id" in meta else None,
+                    str(artifact.get("input_hash")) if artifact.get("input_hash") is not None else None,
+                    json.dumps(nonfeas, sort_keys=True) if isinstance(nonfeas, dict) and nonfeas else None,
+                    json.dumps(row, sort_keys=True, default=str),
+                ),
+            )
+            self.conn.execute("DELETE FROM scalars WHERE case_id = ?", (case_id,))
+            self.conn.executemany("INSERT OR REPLACE INTO scalars(kind, key, case_id, value) VALUES (?,?,?,?)", scalars)
+            self.conn.executemany("INSERT OR IGNORE INTO constraints(name, severity) VALUES (?,?)", severities)
+
+        if self._sidecar is not None:
+            blob = zlib.compress(json.dumps(artifact, sort_keys=True, separators=(",", ":")).encode("utf-8"), 6)
+            with self._sidecar:
+                self._sidecar.execute(
+                    "INSERT OR REPLACE INTO artifacts(case_id, codec, blob) VALUES (?,?,?)",
+                    (case_id, "zlib+json", blob),
+                )
+
+    # -----------------------------
+    # Read (columns)
+    # -----------------------------
+
+    def case_ids(self) -> np.ndarray:
+        rows = self.conn.execute("SELECT case_id FROM cases ORDER BY case_id").fetchall()
+        return np.asarray([r[0] for r in rows], dtype=np.int64)
+
+    def keys(self, kind: str) -> List[str]:
+        rows = self.conn.execute("SELECT DISTINCT key FROM scalars WHERE kind = ? ORDER BY key", (kind,)).fetchall()
+        return [str(r[0]) for r in rows]
+
+    def column(self, kind: str, key: str) -> np.ndarray:
+        """Float array aligned with :meth:`case_ids` (NaN where a case has no value)."""
+        ids = self.case_ids()
+        out = np.full(ids.shape, np.nan)
+        pos = {int(c): i for i, c in enumerate(ids)}
+        for case_id, value in self.conn.execute(
+            "SELECT case_id, value FROM scalars WHERE kind = ? AND key = ?", (kind, key)
+        ):
+            i = pos.get(int(case_id))
+            if i is not None and value is not None:
+                out[i] = float(value)
+        return out
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Index rows (as returned by the case worker) in case order."""
+        return [json.loads(r[0]) for r in self.conn.execute("SELECT row_json FROM cases ORDER BY case_id")]
+
+    def has_case(self, case_id: int) -> bool:
+        """True when ``case_id`` is fully recorded (row, and artifact when a sidecar is kept)."""
+        if self.conn.execute("SELECT 1 FROM cases WHERE case_id = ?", (int(case_id),)).fetchone() is None:
+            return False
+        if self._sidecar is None:
+            return True
+        return self._sidecar.execute("SELECT 1 FROM artifacts WHERE case_id = ?", (int(case_id),)).fetchone() is not None
+
+    def n_hard_feasible(self) -> int:
+        return int(self.conn.execute("SELECT COUNT(*) FROM cases WHERE hard_feasible = 1").fetchone()[0])
+
+    def _present_kpis(self) -> Dict[int, Dict[str, float]]:
+        marks = ",".join("?" for _ in REFERENCE_KPI_KEYS)
+        out: Dict[int, Dict[str, float]] = {}
+        for case_id, key, value in self.conn.execute(
+            f"SELECT case_id, key, value FROM scalars WHERE kind = ? AND key IN ({marks})",
+            (KIND_KPI, *REFERENCE_KPI_KEYS),
+        ):
+            out.setdefault(int(case_id), {})[str(key)] = float("nan") if value is None else float(value)
+        return out
+
+    def reference_stubs(self) -> Iterable[Dict[str, Any]]:
+        """Minimal artifact stubs with the fields ``synthesize_reference_design`` reads."""
+        kpis = self._present_kpis()
+        # Point at the sidecar only if one exists; otherwise there is nothing to load.
+        has_sidecar = self._sidecar is not None or self.sidecar_path.exists()
+        for case_id, hard_ok, dg, run_id, input_hash in self.conn.execute(
+            "SELECT case_id, hard_feasible, decision_grade_ok, run_id, input_hash FROM cases ORDER BY case_id"
+        ):
+            stub: Dict[str, Any] = {
+                "kpis": dict(kpis.get(int(case_id), {})),
+                "outputs": {},
+                "constraints": [] if hard_ok else [{"severity": "hard", "passed": False}],
+                "_path": f"{self.sidecar_path}#{int(case_id)}" if has_sidecar else None,
+            }
+            if dg is not None:
+                stub["decision"] = {"decision_grade_ok": bool(dg)}
+            if run_id is not None:
+                stub["meta"] = {"run_id": run_id}
+            if input_hash is not None:
+                stub["input_hash"] = input_hash
+            yield stub
+
+    def reference_design(self, *, waive_decision_grade: bool = False) -> Optional[Dict[str, Any]]:
+        return synthesize_reference_design(list(self.reference_stubs()), waive_decision_grade=waive_decision_grade)
+
+    def first_nonfeasibility_certificate(self) -> Optional[Dict[str, Any]]:
+        r = self.conn.execute(
+            "SELECT nonfeasibility_json FROM cases WHERE nonfeasibility_json IS NOT NULL ORDER BY case_id LIMIT 1"
+        ).fetchone()
+        return json.loads(r[0]) if r else None
+
+    # -----------------------------
+    # Sidecar (on demand)
+    # -----------------------------
+
+    def load_artifact(self, case_id: int) -> Optional[Dict[str, Any]]:
+        """Full artifact for ``case_id`` from the compressed sidecar (None when not stored)."""
+        conn = self._sidecar
+        if conn is None:
+            if not self.sidecar_path.exists():
+                return None
+            conn = sqlite3.connect(self.sidecar_path)
+        try:
+            r = conn.execute("SELECT codec, blob FROM artifacts WHERE case_id = ?", (int(case_id),)).fetchone()
+        finally:
+            if conn is not self._sidecar:
+                conn.close()
+        if r is None:
+            return None
+        return json.loads(zlib.decompress(r[1]).decode("utf-8"))
+
+    def close(self) -> None:
+        for c in (self.conn, self._sidecar):
+            try:
+                if c is not None:
+                    c.close()
+            except Exception:
+                pass
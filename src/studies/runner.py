@@ -24,7 +24,8 @@ except Exception:
         from models.reference_machines import REFERENCE_MACHINES  # type: ignore
 from solvers.constraint_solver import solve_for_targets
 from constraints.constraints import evaluate_constraints
-from shams_io.run_artifact import build_run_artifact, write_run_artifact, read_run_artifact
+from shams_io.run_artifact import build_run_artifact, write_run_artifact, read_run_artifact, provenance_snapshot
+from shams_io.checkpoint import CaseCheckpoint, case_fingerprint
 try:
     from ..decision.reference_design import synthesize_reference_design  # type: ignore
 except Exception:
@@ -34,11 +35,12 @@ except Exception:
         from decision.reference_design import synthesize_reference_design  # type: ignore
 from .spec import StudySpec
 from .uq import run_uq
-from .index_db import SQLiteIndex
+from .index_db import SQLiteIndex, index_columns
+from .result_store import ColumnarStudyStore
 from shams_io.provenance import collect_provenance
 
 
-def _build_study_summary(index: Dict[str, Any]) -> Dict[str, Any]:
+def _build_study_summary(index: Dict[str, Any], store: ColumnarStudyStore | None = None) -> Dict[str, Any]:
     cases = index.get("cases", []) or []
     n = int(index.get("n_cases", len(cases)) or len(cases))
     n_ok = sum(1 for c in cases if bool(c.get("ok", False)))
@@ -52,7 +54,7 @@ def _build_study_summary(index: Dict[str, Any]) -> Dict[str, Any]:
         if key:
             blockers[key] = int(blockers.get(key, 0) + 1)
     top_blockers = sorted(blockers.items(), key=lambda kv: kv[1], reverse=True)[:10]
-    return {
+    summary = {
         "schema_version": "study_summary.v1",
         "created_unix": index.get("created_unix"),
         "n_cases": n,
@@ -61,7 +63,17 @@ def _build_study_summary(index: Dict[str, Any]) -> Dict[str, Any]:
         "top_solver_messages": [{"message": k, "count": v} for k, v in top_blockers],
         "reference_design": index.get("reference_design"),
         "nonfeasibility_certificate": index.get("nonfeasibility_certificate"),
+        "provenance_snapshot": index.get("provenance_snapshot"),
     }
+    if store is not None:
+        # Columnar studies: aggregate from the store, never from artifacts.
+        summary["result_store"] = {
+            **(index.get("result_store") or {}),
+            "n_hard_feasible": store.n_hard_feasible(),
+            "n_kpi_columns": len(store.keys("kpi")),
+            "n_constraint_columns": len(store.keys("margin")),
+        }
+    return summary
 
 
 def _run_case_worker(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -85,10 +97,16 @@ def _run_case_worker(args: Dict[str, Any]) -> Dict[str, Any]:
     art = build_run_artifact(inputs=dict(inp.__dict__), outputs=dict(out), constraints=cons,
                              meta={"mode":"study"}, solver={"message": res.message, "trace": res.trace or []},
                              subsystems=subsystems, baseline_inputs=baseline_inputs)
-    fname = out_dir / f"case_{idx:04d}.json"
-    write_run_artifact(fname, art)
+    columnar = args.get("result_store") == "columnar"
+    if columnar:
+        # The parent writes columns (+ optional sidecar); no per-case JSON file.
+        path = ""
+    else:
+        fname = out_dir / f"case_{idx:04d}.json"
+        write_run_artifact(fname, art)
+        path = str(fname)
 
-    row = {"case": idx, "ok": bool(res.ok), "iters": int(res.iters), "message": res.message, "path": str(fname)}
+    row = {"case": idx, "ok": bool(res.ok), "iters": int(res.iters), "message": res.message, "path": path}
     for k,v in upd.items():
         try: row[f"in_{k}"] = float(v)
         except Exception: row[f"in_{k}"] = v
@@ -98,6 +116,10 @@ def _run_case_worker(args: Dict[str, Any]) -> Dict[str, Any]:
     for k in targets.keys():
         try: row[f"ach_{k}"] = float(out.get(k, float("nan")))
         except Exception: row[f"ach_{k}"] = out.get(k)
+    if args.get("index_columns"):
+        row["_index"] = index_columns(art)
+    if columnar:
+        row["_artifact"] = art
     return row
 def _apply_updates(base: PointInputs, upd: Dict[str, Any]) -> PointInputs:
     d = base.to_dict()
@@ -105,8 +127,27 @@ def _apply_updates(base: PointInputs, upd: Dict[str, Any]) -> PointInputs:
         d[str(k)] = v
     return PointInputs.from_dict(d)
 
-def run_study(spec: StudySpec, out_dir: str | Path, *, label_prefix: str = "") -> Dict[str, Any]:
-    """Run a sweep study headlessly and write per-case artifacts + an index."""
+# Case arguments that do not change a case result (excluded from its fingerprint).
+_FINGERPRINT_EXCLUDE = ("out_dir", "index_columns")
+CHECKPOINT_FILENAME = "checkpoint.jsonl"
+
+
+def run_study(spec: StudySpec, out_dir: str | Path, *, label_prefix: str = "", resume: bool = False, pool: Any = None) -> Dict[str, Any]:
+    """Run a sweep study headlessly and write per-case artifacts + an index.
+
+    Every finished case is appended to ``checkpoint.jsonl`` under a
+    fingerprint of its full definition (base inputs, sweep update, targets,
+    solver settings, result store). With ``resume=True`` a rerun into the same
+    directory reuses completed cases whose artifact is still present and
+    evaluates only the missing ones; the index, summary and reference design
+    match an uninterrupted run.
+
+    ``pool`` (a :class:`evaluator.worker_pool.WarmWorkerPool`, e.g.
+    ``get_worker_pool()``) runs the cases in its long-lived warm workers
+    instead of a per-call process pool (``spec.n_workers`` is then unused).
+    A case whose worker crashed or timed out is indexed as a failed case and
+    is not checkpointed, so ``resume=True`` runs it again.
+    """
     outp = Path(out_dir)
     outp.mkdir(parents=True, exist_ok=True)
 
@@ -159,76 +200,142 @@ def run_study(spec: StudySpec, out_dir: str | Path, *, label_prefix: str = "") -
         db = SQLiteIndex(outp/"index.sqlite")
     else:
         db = None
+    result_store = str(getattr(spec, "result_store", "json") or "json").lower()
+    store = ColumnarStudyStore(outp, sidecar=bool(getattr(spec, "store_artifacts", True)), resume=resume) if result_store == "columnar" else None
 
-    if n_workers == 1:
-        for idx, upd in enumerate(cases):
-            row = _run_case_worker({
-                "idx": idx,
-                "base_dict": dict(base.__dict__),
-                "upd": upd,
-                "targets": dict(spec.targets),
-                "variables": variables,
-                "max_iter": spec.max_iter,
-                "tol": spec.tol,
-                "damping": spec.damping,
-                "out_dir": str(outp),
-                "subsystems": subsystems,
-                "baseline_inputs": baseline_inputs,
-            })
-            index_rows.append(row)
-            if db is not None:
-                db.add_case(row["case"], row["ok"], row["iters"], str(row.get("message","")), str(row.get("path","")))
-    else:
-        ctx = mp.get_context("spawn")
-        with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as ex:
-            futs = []
-            for idx, upd in enumerate(cases):
-                futs.append(ex.submit(_run_case_worker, {
-                    "idx": idx,
-                    "base_dict": dict(base.__dict__),
-                    "upd": upd,
-                    "targets": dict(spec.targets),
-                    "variables": variables,
-                    "max_iter": spec.max_iter,
-                    "tol": spec.tol,
-                    "damping": spec.damping,
-                    "out_dir": str(outp),
-                    "subsystems": subsystems,
-                    "baseline_inputs": baseline_inputs,
-                }))
+    ckpt = CaseCheckpoint(outp/CHECKPOINT_FILENAME, resume=resume)
+
+    def _case_args(idx: int, upd: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "idx": idx,
+            "base_dict": dict(base.__dict__),
+            "upd": upd,
+            "targets": dict(spec.targets),
+            "variables": variables,
+            "max_iter": spec.max_iter,
+            "tol": spec.tol,
+            "damping": spec.damping,
+            "out_dir": str(outp),
+            "subsystems": subsystems,
+            "baseline_inputs": baseline_inputs,
+            "result_store": result_store,
+            "index_columns": db is not None,
+        }
+
+    def _record(row: Dict[str, Any], fp: str) -> None:
+        art = row.pop("_artifact", None)
+        cols = row.pop("_index", None)
+        if store is not None and isinstance(art, dict):
+            store.add_case(row, art)
+        index_rows.append(row)
+        if db is not None:
+            db.add_case(row["case"], row["ok"], row["iters"], str(row.get("message","")), str(row.get("path","")), columns=cols)
+        ckpt.record(fp, {"row": row, "index": cols})
+
+    def _replay(done: Dict[str, Any]) -> bool:
+        """Re-record a checkpointed case if its artifact is still there."""
+        row = done.get("row")
+        if not isinstance(row, dict) or "case" not in row:
+            return False
+        idx = int(row["case"])
+        if store is not None:
+            if not store.has_case(idx):
+                return False
+        elif not (row.get("path") and Path(str(row["path"])).exists()):
+            return False
+        cols = done.get("index")
+        if db is not None:
+            if cols is None:
+                # Checkpoint written without the SQLite index: derive from the artifact.
+                try:
+                    art = store.load_artifact(idx) if store is not None else read_run_artifact(Path(str(row["path"])))
+                    cols = index_columns(art) if isinstance(art, dict) else None
+                except Exception:
+                    cols = None
+            db.add_case(idx, row["ok"], row["iters"], str(row.get("message","")), str(row.get("path","")), columns=cols)
+        index_rows.append(dict(row))
+        ckpt.mark_reused()
+        return True
+
+    todo: List[Tuple[Dict[str, Any], str]] = []
+    for idx, upd in enumerate(cases):
+        args = _case_args(idx, upd)
+        fp = case_fingerprint({k: v for k, v in args.items() if k not in _FINGERPRINT_EXCLUDE})
+        done = ckpt.get(fp)
+        if done is not None and _replay(done):
+            continue
+        todo.append((args, fp))
+
+    try:
+        if pool is not None and todo:
+            futs = {pool.submit(_run_case_worker, args): (args, fp) for args, fp in todo}
             for f in as_completed(futs):
-                row = f.result()
-                index_rows.append(row)
-                if db is not None:
-                    db.add_case(row["case"], row["ok"], row["iters"], str(row.get("message","")), str(row.get("path","")))
-        # keep stable order
-        index_rows.sort(key=lambda r: int(r.get("case",0)))
+                args, fp = futs[f]
+                try:
+                    row = f.result()
+                except pool.LOST_TASK_ERRORS as e:
+                    lost = {"case": int(args["idx"]), "ok": False, "iters": 0, "message": f"{type(e).__name__}: {e}", "path": ""}
+                    index_rows.append(lost)
+                    if db is not None:
+                        db.add_case(lost["case"], False, 0, lost["message"], "")
+                    continue
+                _record(row, fp)
+        elif n_workers == 1:
+            for args, fp in todo:
+                _record(_run_case_worker(args), fp)
+        elif todo:
+            ctx = mp.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as ex:
+                futs = {ex.submit(_run_case_worker, args): fp for args, fp in todo}
+                for f in as_completed(futs):
+                    _record(f.result(), futs[f])
+    finally:
+        ckpt.close()
+    # keep stable order (replayed and parallel cases arrive out of order)
+    index_rows.sort(key=lambda r: int(r.get("case",0)))
 
     if db is not None:
         db.close()
 
     # Reference design synthesis (decision-grade): choose one representative design from feasible cases.
-    artifacts=[]
-    for row in index_rows:
-        p=row.get("path")
-        if not p:
-            continue
-        try:
-            a=read_run_artifact(Path(p))
-            if isinstance(a, dict):
-                a["_path"]=p
-                artifacts.append(a)
-        except Exception:
-            pass
-    ref = synthesize_reference_design(artifacts)
-    nonfeas = None
-    if ref is None:
-        # Use the first available non-feasibility certificate, if present.
-        for a in artifacts:
-            n = a.get('nonfeasibility_certificate')
-            if isinstance(n, dict) and n:
-                nonfeas = n
-                break
+    if store is not None:
+        # Columnar store: select from the KPI/verdict columns without reloading artifacts.
+        ref = store.reference_design()
+        nonfeas = None if ref is not None else store.first_nonfeasibility_certificate()
+    else:
+        artifacts=[]
+        for row in index_rows:
+            p=row.get("path")
+            if not p:
+                continue
+            try:
+                a=read_run_artifact(Path(p))
+                if isinstance(a, dict):
+                    a["_path"]=p
+                    artifacts.append(a)
+            except Exception:
+                pass
+        ref = synthesize_reference_design(artifacts)
+        nonfeas = None
+        if ref is None:
+            # Use the first available non-feasibility certificate, if present.
+            for a in artifacts:
+                n = a.get('nonfeasibility_certificate')
+                if isinstance(n, dict) and n:
+                    nonfeas = n
+                    break
+
+    # Repo provenance is collected once per process (parent, or each worker)
+    # and shared by every case artifact; report what that saved.
+    n_procs = int(pool.max_workers) if pool is not None else n_workers
+    n_snapshots = 1 if n_procs == 1 else min(n_procs, len(index_rows))
+    per_artifact_s = float(provenance_snapshot().build_s)
+    provenance_stats = {
+        "per_artifact_saved_s": per_artifact_s,
+        "n_artifacts": len(index_rows),
+        "n_snapshots": int(n_snapshots),
+        "est_saved_s": per_artifact_s * max(len(index_rows) - n_snapshots, 0),
+    }
 
     index = {
         "schema_version": "study_index.v1",
@@ -240,14 +347,23 @@ def run_study(spec: StudySpec, out_dir: str | Path, *, label_prefix: str = "") -
         "reference_design": ref,
         "nonfeasibility_certificate": nonfeas,
         "provenance": collect_provenance(Path(__file__).resolve()),
+        "provenance_snapshot": provenance_stats,
     }
+    if store is not None:
+        index["result_store"] = {
+            "kind": "columnar",
+            "path": str(store.path),
+            "sidecar": str(store.sidecar_path) if bool(getattr(spec, "store_artifacts", True)) else None,
+        }
     (outp/"index.json").write_text(json.dumps(index, indent=2, sort_keys=True), encoding="utf-8")
 
     # Study summary (stable, schema-versioned)
     try:
-        summary = _build_study_summary(index)
+        summary = _build_study_summary(index, store=store)
         (outp/"study_summary.json").write_text(json.dumps(summary, indent=2, sort_keys=True), encoding="utf-8")
     except Exception:
         pass
+    if store is not None:
+        store.close()
 
     return index
@@ -42,6 +42,8 @@ class StudySpec:
     damping: float = 0.6
     n_workers: int = 1  # parallelism for studies (Windows-safe spawn)
     use_sqlite_index: bool = False  # optional sqlite index (else JSON)
+    result_store: str = "json"  # "json" (one artifact file per case) | "columnar" (results.sqlite)
+    store_artifacts: bool = True  # columnar only: full artifacts in the compressed sidecar
 
     # --- Optional subsystem configs recorded in artifacts ---
     fidelity: Optional[Dict[str, Any]] = None
@@ -91,6 +93,8 @@ class StudySpec:
             damping=float(d.get("damping", 0.6) or 0.6),
             n_workers=int(d.get("n_workers", 1) or 1),
             use_sqlite_index=bool(d.get("use_sqlite_index", False)),
+            result_store=str(d.get("result_store", "json") or "json"),
+            store_artifacts=bool(d.get("store_artifacts", True)),
             fidelity=dict(d.get("fidelity", {}) or {}) if d.get("fidelity", None) is not None else None,
             calibration=dict(d.get("calibration", {}) or {}) if d.get("calibration", None) is not None else None,
         )
\ No newline at end of file
@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 from dataclasses import asdict
 import itertools
+import pickle
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
@@ -39,6 +40,14 @@ def _resolve_outputs(
     return hot_ion_point(inp)
 
 
+def _picklable(obj: Any) -> bool:
+    try:
+        pickle.dumps(obj)
+        return True
+    except Exception:
+        return False
+
+
 def _merged_policy(base_out: Dict[str, Any], overrides: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     try:
         pol = base_out.get("_policy_contract") if isinstance(base_out, dict) else None
@@ -76,6 +85,7 @@ def run_uncertainty_contract_for_point(
     include_corner_artifacts: bool = True,
     evaluator: Any = None,
     evaluate_fn: Optional[EvaluateFn] = None,
+    pool: Any = None,
 ) -> Dict[str, Any]:
     """Evaluate feasibility across deterministic interval corners.
 
@@ -88,6 +98,14 @@ def run_uncertainty_contract_for_point(
       corner deterministically, but avoids building full per-corner run artifacts.
       This is useful for diagnostic probes (e.g., mirage pathfinding scans) where
       only the summary verdict + worst margin is required.
+    - ``pool`` (a :class:`evaluator.worker_pool.WarmWorkerPool`) evaluates the
+      corners in its warm workers through the same route as the base point
+      (the picklable ``evaluator`` is shipped along, else bare
+      ``hot_ion_point``). A caller-supplied ``evaluate_fn`` (or an evaluator
+      that cannot be pickled) keeps the corners in-process. Results are
+      consumed in corner order, so the contract is unchanged; a corner lost to
+      a worker crash / timeout counts as infeasible and is reported in
+      ``summary["n_eval_errors"]``.
     """
     intervals = dict(spec.intervals or {})
     if not intervals:
@@ -106,29 +124,51 @@ def run_uncertainty_contract_for_point(
     worst_margin = None
     worst_corner = None
 
-    for i, corner in enumerate(corners):
+    corner_inputs: List[PointInputs] = []
+    for corner in corners:
         base_d = asdict(base_inputs)
         for k, v in corner.items():
             if k in base_d:
                 base_d[k] = v
-        inp = PointInputs(**base_d)
-
-        out = _resolve_outputs(inp, evaluator=evaluator, evaluate_fn=evaluate_fn)
-        cons = evaluate_constraints(out, policy=policy)
-        cs = summarize_constraints(cons).to_dict()
-        feasible = bool(cs.get("feasible", False))
+        corner_inputs.append(PointInputs(**base_d))
+    pooled = None
+    if pool is not None and evaluate_fn is None and _picklable(evaluator):
+        pooled = [pool.submit(_resolve_outputs, inp, evaluator=evaluator) for inp in corner_inputs]
+
+    n_eval_errors = 0
+    for i, (corner, inp) in enumerate(zip(corners, corner_inputs)):
+        eval_error = None
+        if pooled is not None:
+            try:
+                out = pooled[i].result()
+            except pool.LOST_TASK_ERRORS as ex:  # worker crashed / timed out
+                eval_error = f"{type(ex).__name__}: {ex}"
+                out = {}
+        else:
+            out = _resolve_outputs(inp, evaluator=evaluator, evaluate_fn=evaluate_fn)
+
+        if eval_error is None:
+            cons = evaluate_constraints(out, policy=policy)
+            cs = summarize_constraints(cons).to_dict()
+            feasible = bool(cs.get("feasible", False))
+        else:
+            n_eval_errors += 1
+            cons = []
+            cs = {"feasible": False, "eval_error": eval_error}
+            feasible = False
         feas_flags.append(feasible)
 
-        try:
-            wm = cs.get("worst_hard_margin_frac", None)
-            wmf = float(wm) if wm is not None else 0.0
-        except Exception:
-            wmf = 0.0
+        if eval_error is None:
+            try:
+                wm = cs.get("worst_hard_margin_frac", None)
+                wmf = float(wm) if wm is not None else 0.0
+            except Exception:
+                wmf = 0.0
 
-        # Worst = most negative margin (smallest)
-        if worst_margin is None or wmf < float(worst_margin):
-            worst_margin = float(wmf)
-            worst_corner = i
+            # Worst = most negative margin (smallest)
+            if worst_margin is None or wmf < float(worst_margin):
+                worst_margin = float(wmf)
+                worst_corner = i
 
         if include_corner_artifacts:
             art = build_run_artifact(
@@ -164,6 +204,8 @@ def run_uncertainty_contract_for_point(
         "worst_corner_index": int(worst_corner) if worst_corner is not None else None,
         "worst_hard_margin_frac": float(worst_margin) if worst_margin is not None else None,
     }
+    if n_eval_errors:
+        summary["n_eval_errors"] = int(n_eval_errors)
 
     return {
         "schema_version": "uncertainty_contract.v1",
@@ -0,0 +1,196 @@
+"""Out-of-tree bytecode cache and import-time reporting.
+
+Repo hygiene law: no ``__pycache__`` / ``*.pyc`` in the working tree, so
+``sitecustomize`` and the launchers disable bytecode writing. The cost is that
+every CLI process and every spawn-context pool worker (``run_study``,
+``pareto_optimize``, campaigns, the API / UI pools) recompiles ``src/`` from
+source before doing any work.
+
+``SHAMS_BYTECODE_CACHE`` opts into the supported alternative: bytecode goes to
+a user cache directory through ``sys.pycache_prefix`` (the
+``PYTHONPYCACHEPREFIX`` mechanism), so the tree stays clean and later
+processes load compiled code.
+
+- ``SHAMS_BYTECODE_CACHE=1`` (or ``on`` / ``true`` / ``user``): default user cache dir
+- ``SHAMS_BYTECODE_CACHE=<dir>``: explicit directory
+- unset / ``0`` / ``off``: no bytecode at all (the hygiene default)
+- ``PYTHONPYCACHEPREFIX`` set by the caller is honoured the same way
+
+A prefix inside the repository is refused (it would put bytecode back into the
+tree). Enabling exports ``PYTHONPYCACHEPREFIX`` and drops
+``PYTHONDONTWRITEBYTECODE`` so spawned workers use the cache from interpreter
+start. ``sitecustomize`` itself is compiled before any of this runs, so keep
+``PYTHONDONTWRITEBYTECODE=1`` exported (as the launch scripts do); the policy
+lifts it once the prefix is in place.
+
+Stdlib only: ``sitecustomize`` imports this before anything else.
+"""
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+ENV_VAR = "SHAMS_BYTECODE_CACHE"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_ON = ("1", "on", "true", "yes", "user")
+_OFF = ("", "0", "off", "false", "no")
+
+
+def user_cache_dir() -> Path:
+    """Default bytecode cache directory (per user, outside any checkout)."""
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local") / "SHAMS" / "Cache"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches" / "SHAMS"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "shams"
+    return base / "pycache"
+
+
+def _inside_repo(path: Path) -> bool:
+    try:
+        path.resolve().relative_to(REPO_ROOT)
+        return True
+    except ValueError:
+        return False
+
+
+def requested_bytecode_cache_dir(environ: Optional[Mapping[str, str]] = None) -> Optional[Path]:
+    """Cache directory requested by the environment, or None (bytecode stays off)."""
+    env = os.environ if environ is None else environ
+    raw = str(env.get(ENV_VAR, "")).strip()
+    if raw.lower() in _ON:
+        path: Optional[Path] = user_cache_dir()
+    elif raw.lower() not in _OFF:
+        path = Path(raw).expanduser()
+    elif str(env.get("PYTHONPYCACHEPREFIX", "")).strip():
+        path = Path(str(env["PYTHONPYCACHEPREFIX"]).strip()).expanduser()
+    else:
+        path = None
+    if path is None or _inside_repo(path):
+        return None
+    return path
+
+
+def enable_bytecode_cache(prefix: Optional[os.PathLike] = None) -> Optional[str]:
+    """Write/read bytecode under ``prefix`` (default: user cache dir) for this process and its children.
+
+    Returns the prefix in use, or None if it was refused (inside the
+    repository) or cannot be created.
+    """
+    path = Path(prefix).expanduser() if prefix is not None else user_cache_dir()
+    if _inside_repo(path):
+        return None
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    resolved = str(path.resolve())
+    sys.pycache_prefix = resolved
+    sys.dont_write_bytecode = False
+    os.environ["PYTHONPYCACHEPREFIX"] = resolved
+    os.environ.pop("PYTHONDONTWRITEBYTECODE", None)
+    return resolved
+
+
+def configure_bytecode_policy(environ: Optional[Mapping[str, str]] = None) -> Optional[str]:
+    """Apply the startup policy: out-of-tree cache when requested, else no bytecode."""
+    path = requested_bytecode_cache_dir(environ)
+    if path is not None:
+        used = enable_bytecode_cache(path)
+        if used is not None:
+            return used
+    sys.dont_write_bytecode = True
+    return None
+
+
+# -----------------------------
+# Import-time report (python -X importtime)
+# -----------------------------
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S.*)$")
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Rows of ``-X importtime`` output: module, self_us, cumulative_us, depth."""
+    rows: List[Dict[str, Any]] = []
+    for line in stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m is None:
+            continue
+        rows.append(
+            {
+                "module": m.group(4).strip(),
+                "self_us": int(m.group(1)),
+                "cumulative_us": int(m.group(2)),
+                "depth": max(0, (len(m.group(3)) - 1) // 2),
+            }
+        )
+    return rows
+
+
+def import_time_report(
+    module: str = "physics.hot_ion",
+    *,
+    top: int = 25,
+    bytecode_cache: Optional[os.PathLike] = None,
+    python: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Import ``module`` in a fresh interpreter and rank the slowest imports by self time.
+
+    ``bytecode_cache`` runs the child with that ``PYTHONPYCACHEPREFIX``
+    (run twice to see the warm-cache number); otherwise the child inherits
+    this process's policy (cache prefix if enabled, else no bytecode).
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(REPO_ROOT / "src"), str(REPO_ROOT)])
+    prefix = str(Path(bytecode_cache).expanduser()) if bytecode_cache is not None else sys.pycache_prefix
+    env.pop(ENV_VAR, None)
+    if prefix:
+        env["PYTHONPYCACHEPREFIX"] = prefix
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+    else:
+        env.pop("PYTHONPYCACHEPREFIX", None)
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(REPO_ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall_s = time.perf_counter() - t0
+    rows = parse_importtime(proc.stderr)
+    total = next((r["cumulative_us"] for r in reversed(rows) if r["module"] == module), None)
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "error": proc.stderr.strip().splitlines()[-1] if proc.returncode != 0 and proc.stderr.strip() else "",
+        "wall_s": wall_s,
+        "module_cumulative_us": total,
+        "n_modules": len(rows),
+        "bytecode_cache": prefix or None,
+        "slowest": sorted(rows, key=lambda r: (-r["self_us"], r["module"]))[: max(0, int(top))],
+    }
+
+
+def format_import_report(report: Mapping[str, Any]) -> str:
+    cum = report.get("module_cumulative_us")
+    lines = [
+        f"import {report['module']}: wall {report['wall_s']:.2f} s, "
+        f"{report['n_modules']} modules, cumulative {('%.2f s' % (cum / 1e6)) if cum else 'n/a'}, "
+        f"bytecode cache: {report.get('bytecode_cache') or 'off'}",
+        f"{'self ms':>9} {'cum ms':>9}  module",
+    ]
+    for r in report.get("slowest", []):
+        lines.append(f"{r['self_us'] / 1e3:9.1f} {r['cumulative_us'] / 1e3:9.1f}  {r['module']}")
+    if report.get("error"):
+        lines.append(f"ERROR: {report['error']}")
+    return "\n".join(lines)
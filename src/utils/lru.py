@@ -0,0 +1,190 @@
+"""Thread-safe O(1) LRU with optional approximate byte budget.
+
+Backs the :class:`~evaluator.core.Evaluator` memoization cache and the
+``hot_ion_point`` point cache. Dependency-free so any layer can import it.
+
+Design:
+
+- ``collections.OrderedDict`` gives O(1) lookup, recency bump
+  (``move_to_end``) and eviction (``popitem(last=False)``)
+- capacity is bounded by ``max_entries`` and, optionally, by ``max_bytes``
+  (approximate deep ``sys.getsizeof`` of each value, measured once on insert;
+  without a byte budget ``bytes`` reports the cheaper one-level
+  :func:`shallow_nbytes` estimate instead of the deep walk)
+- every operation (including hit/miss/eviction counters) runs under one
+  lock, so a single cache may be shared by a thread pool
+
+Sizes are estimates for budgeting only; objects shared between entries are
+counted once per entry, so the reported total is a conservative upper bound.
+
+Author: © 2026 Afshin Arjhangmehr
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+_CONTAINERS = (dict, list, tuple, set, frozenset)
+# Immutable scalars whose getsizeof is a per-type constant (skip the call).
+_FIXED_SIZE = {float: sys.getsizeof(0.0), bool: sys.getsizeof(True), type(None): sys.getsizeof(None)}
+
+
+def approx_nbytes(obj: Any) -> int:
+    """Approximate deep size of ``obj`` in bytes (containers, dataclasses, scalars).
+
+    Iterative walk; each container is counted once per call.
+    """
+    getsize = sys.getsizeof
+    fixed = _FIXED_SIZE.get
+    n = 0
+    seen: set = set()
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        s = fixed(type(o))
+        if s is not None:
+            n += s
+            continue
+        if isinstance(o, _CONTAINERS) or (is_dataclass(o) and not isinstance(o, type)):
+            if id(o) in seen:
+                continue
+            seen.add(id(o))
+            n += getsize(o, 64)
+            if isinstance(o, dict):
+                n += sum(map(getsize, o))
+                stack.extend(o.values())
+            elif isinstance(o, _CONTAINERS):
+                stack.extend(o)
+            else:
+                stack.extend(getattr(o, f.name, None) for f in fields(o))
+            continue
+        n += getsize(o, 64)
+        nb = getattr(o, "nbytes", None)  # numpy arrays
+        if isinstance(nb, int):
+            n += nb
+    return n
+
+
+def shallow_nbytes(obj: Any) -> int:
+    """Cheap size estimate: ``obj`` plus the ``sys.getsizeof`` of its direct members.
+
+    Dict keys are not counted (typically names shared by every entry). A
+    dataclass counts each field this way, so an ``EvalResult`` includes the top
+    level of its ``out`` dict.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return sys.getsizeof(obj) + sum(_one_level(getattr(obj, f.name, None)) for f in fields(obj))
+    return _one_level(obj)
+
+
+def _one_level(o: Any) -> int:
+    getsize = sys.getsizeof
+    if isinstance(o, dict):
+        return getsize(o) + sum(map(getsize, o.values()))
+    if isinstance(o, _CONTAINERS):
+        return getsize(o) + sum(map(getsize, o))
+    return getsize(o)
+
+
+class LRUCache:
+    """Ordered LRU bounded by entry count and (optionally) approximate bytes."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        *,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = approx_nbytes,
+    ) -> None:
+        self.max_entries = max(int(max_entries), 0)
+        self.max_bytes = int(max_bytes) if max_bytes is not None and int(max_bytes) > 0 else None
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (bumping recency) or ``default``; counts hit/miss."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: Hashable, value: Any, *, nbytes: Optional[int] = None) -> None:
+        """Insert/replace ``key`` and evict least-recently-used entries over budget."""
+        if nbytes is not None:
+            size = int(nbytes)
+        elif self.max_bytes is None:
+            size = shallow_nbytes(value)  # no byte budget: reporting only, skip the deep walk
+        else:
+            size = int(self._sizeof(value))
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if self.max_entries <= 0 or (self.max_bytes is not None and size > self.max_bytes):
+                # Would never fit: do not cache (and do not flush everything else for it).
+                return
+            self._data[key] = (value, size)
+            self._bytes += size
+            while len(self._data) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes and len(self._data) > 1
+            ):
+                _, (_, sz) = self._data.popitem(last=False)
+                self._bytes -= sz
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.pop(key, None)
+            if item is None:
+                return default
+            self._bytes -= item[1]
+            return item[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._bytes)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max": int(self.max_entries),
+                "max_bytes": (int(self.max_bytes) if self.max_bytes is not None else None),
+                "size": int(len(self._data)),
+                "bytes": int(self._bytes),
+                "hits": int(self.hits),
+                "misses": int(self.misses),
+                "evictions": int(self.evictions),
+                "hit_rate": (float(self.hits) / (self.hits + self.misses) if (self.hits + self.misses) else 0.0),
+            }
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+import api
+
+
+@pytest.fixture(scope="module")
+def client():
+    mp = pytest.MonkeyPatch()
+    mp.setenv("SHAMS_API_WORKERS", "2")
+    with TestClient(api.app) as c:  # lifespan shuts the pool down on exit
+        yield c
+    mp.undo()
+
+
+def _specs():
+    return [{"Ip_MA": 8.0 + 0.5 * i, "R0_m": 1.85, "a_m": 0.57, "Bt_T": 12.2, "Paux_MW": 25.0} for i in range(4)]
+
+
+def test_batch_matches_single_point_endpoint(client) -> None:
+    specs = _specs()
+    r = client.post("/point/evaluate_batch", json={"specs": specs + [{"R0_m": "bad"}]})
+    assert r.status_code == 422  # pydantic validation, nothing submitted
+    r = client.post("/point/evaluate_batch", json={"specs": specs})
+    assert r.status_code == 200
+    res = r.json()["results"]
+    assert [x["index"] for x in res] == list(range(len(specs)))
+    assert all(x["ok"] for x in res)
+    single = client.post("/point/evaluate", json=specs[2]).json()["outputs"]
+    assert json.dumps(res[2]["outputs"], sort_keys=True) == json.dumps(single, sort_keys=True)
+
+
+def test_stream_yields_one_ndjson_line_per_spec(client) -> None:
+    specs = _specs()
+    with client.stream("POST", "/point/evaluate_stream", json={"specs": specs}) as r:
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(ln) for ln in r.iter_lines() if ln]
+    assert sorted(x["index"] for x in lines) == list(range(len(specs)))
+
+
+def test_job_submit_poll_and_results(client) -> None:
+    specs = _specs()
+    st = client.post("/jobs", json={"specs": specs}).json()
+    job_id = st["job_id"]
+    assert st["n_total"] == len(specs)
+    for _ in range(600):
+        st = client.get(f"/jobs/{job_id}").json()
+        if st["status"] == "done":
+            break
+        time.sleep(0.1)
+    assert st["status"] == "done" and st["n_done"] == len(specs) and st["n_failed"] == 0
+    res = client.get(f"/jobs/{job_id}/results", params={"offset": 1}).json()["results"]
+    assert [x["index"] for x in res] == [1, 2, 3]
+    # Deleting a finished job forgets it but reports it as done, not cancelled.
+    assert client.delete(f"/jobs/{job_id}").json()["status"] == "done"
+    assert client.get(f"/jobs/{job_id}").status_code == 404
+
+    running = client.post("/jobs", json={"specs": _specs() * 10}).json()["job_id"]
+    assert client.delete(f"/jobs/{running}").json()["status"] == "cancelled"
+
+
+def test_finished_jobs_are_evicted_beyond_the_cap(client, monkeypatch) -> None:
+    monkeypatch.setenv("SHAMS_API_MAX_JOBS", "1")
+    ids = [client.post("/jobs", json={"specs": []}).json()["job_id"] for _ in range(3)]
+    assert client.get(f"/jobs/{ids[0]}").status_code == 404
+    assert client.get(f"/jobs/{ids[1]}").json()["status"] == "done"
+    assert client.get(f"/jobs/{ids[2]}").json()["status"] == "done"
+
+
+def test_dead_worker_does_not_break_later_batches(client) -> None:
+    pool = api._get_pool()
+    lost = pool.submit(os._exit, 1)
+    assert isinstance(lost.exception(timeout=120), BrokenProcessPool)
+    res = client.post("/point/evaluate_batch", json={"specs": _specs()}).json()["results"]
+    assert all(x["ok"] for x in res)
+    assert api._get_pool() is not pool
+
+
+def test_lost_tasks_are_reported_per_item(client, monkeypatch) -> None:
+    def _submit(specs):
+        futs = [Future() for _ in specs]
+        futs[0].set_result(api._evaluate_spec(0, specs[0].model_dump()))
+        for f in futs[1:]:
+            f.set_exception(BrokenProcessPool("worker died"))
+        return futs
+
+    monkeypatch.setattr(api, "_submit", _submit)
+    specs = _specs()[:2]
+    r = client.post("/point/evaluate_batch", json={"specs": specs})
+    assert r.status_code == 200
+    res = r.json()["results"]
+    assert res[0]["ok"] and not res[1]["ok"] and "BrokenProcessPool" in res[1]["error"]
+    with client.stream("POST", "/point/evaluate_stream", json={"specs": specs}) as r:
+        lines = sorted((json.loads(ln) for ln in r.iter_lines() if ln), key=lambda x: x["index"])
+    assert [x["ok"] for x in lines] == [True, False]
+    st = client.post("/jobs", json={"specs": specs}).json()
+    assert st["status"] == "done" and st["n_done"] == 2 and st["n_failed"] == 1
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+from src.utils import bytecode_cache as bc
+
+
+def test_requested_dir_resolution(tmp_path) -> None:
+    assert bc.requested_bytecode_cache_dir({}) is None
+    assert bc.requested_bytecode_cache_dir({bc.ENV_VAR: "0"}) is None
+    assert bc.requested_bytecode_cache_dir({bc.ENV_VAR: "1"}) == bc.user_cache_dir()
+    assert bc.requested_bytecode_cache_dir({bc.ENV_VAR: str(tmp_path)}) == tmp_path
+    assert bc.requested_bytecode_cache_dir({"PYTHONPYCACHEPREFIX": str(tmp_path)}) == tmp_path
+    # A prefix inside the checkout would put bytecode back into the tree.
+    assert bc.requested_bytecode_cache_dir({bc.ENV_VAR: str(bc.REPO_ROOT / "cache")}) is None
+    assert bc.enable_bytecode_cache(bc.REPO_ROOT / "cache") is None
+
+
+def test_sitecustomize_writes_bytecode_outside_tree(tmp_path) -> None:
+    # PYTHONDONTWRITEBYTECODE covers sitecustomize itself; the policy lifts it afterwards.
+    env = dict(os.environ, PYTHONPATH=str(bc.REPO_ROOT), PYTHONDONTWRITEBYTECODE="1", **{bc.ENV_VAR: str(tmp_path)})
+    env.pop("PYTHONPYCACHEPREFIX", None)
+    code = "import os, sys, src.utils.lru; print(sys.pycache_prefix, sys.dont_write_bytecode, os.environ['PYTHONPYCACHEPREFIX'])"
+    out = subprocess.run([sys.executable, "-c", code], cwd=str(tmp_path), env=env, capture_output=True, text=True, check=True)
+    prefix, dont_write, exported = out.stdout.split()
+    assert prefix == exported == str(tmp_path.resolve()) and dont_write == "False"
+    assert any(p.name.startswith("lru.") for p in tmp_path.rglob("*.pyc"))
+    assert not (bc.REPO_ROOT / "src" / "utils" / "__pycache__").exists()
+    assert not (bc.REPO_ROOT / "__pycache__").exists()
+
+
+def test_import_time_report_ranks_modules() -> None:
+    rep = bc.import_time_report("utils.lru", top=5)
+    assert rep["ok"] and rep["n_modules"] > 0 and rep["module_cumulative_us"] is not None
+    selfs = [r["self_us"] for r in rep["slowest"]]
+    assert len(selfs) <= 5 and selfs == sorted(selfs, reverse=True)
+    assert "utils.lru" in bc.format_import_report(rep)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from constraints.authority_registry import load_authority_specs
+from constraints.plan import ConstraintPlan, evaluate_constraint_batch, get_constraint_plan
+from constraints.unified import build_all_constraints, dominant_failing_constraint
+from evaluator.core import Evaluator
+from models.inputs import PointInputs
+
+
+def _points():
+    base = PointInputs(R0_m=1.81, a_m=0.62, kappa=1.8, Bt_T=10.0, Ip_MA=8.0, Ti_keV=12.0, fG=0.8, Paux_MW=25.0)
+    ev = Evaluator(cache_enabled=False)
+    outs = []
+    for R0, Ip in [(1.81, 8.0), (1.6, 11.0), (2.2, 6.0), (1.9, 9.5)]:
+        d = base.to_dict()
+        d.update(R0_m=R0, Ip_MA=Ip)
+        outs.append(dict(ev.evaluate(PointInputs.from_dict(d)).out))
+    # Registry-activating synthetic rows (one passing, one failing, one disabled).
+    outs.append(
+        {
+            "transport_spread_ratio_v396": 1.2,
+            "transport_spread_max_v396": 1.5,
+            "include_elm_transient_heat_v409": 1.0,
+            "elm_transient_q_parallel_MW_m2_v409": 300.0,
+            "elm_transient_q_parallel_max_MW_m2_v409": 200.0,
+        }
+    )
+    outs.append({"transport_spread_ratio_v396": 2.0, "transport_spread_max_v396": 1.5})
+    outs.append(
+        {
+            "include_elm_transient_heat_v409": 0.0,
+            "elm_transient_q_parallel_MW_m2_v409": 300.0,
+            "elm_transient_q_parallel_max_MW_m2_v409": 200.0,
+        }
+    )
+    return outs
+
+
+def _check_against_bundles(batch, outs) -> None:
+    assert len(batch) == len(outs)
+    for i, out in enumerate(outs):
+        bundle = build_all_constraints(dict(out))
+        assert bool(batch.feasible[i]) == bundle.governance_feasible
+        assert batch.dominant[i] == dominant_failing_constraint(bundle)
+        row = {batch.names[j].split("#")[0] for j in np.flatnonzero(batch.evaluated[i])}
+        assert row == {c.name for c in bundle.governance}
+        for c in bundle.governance:
+            j = batch.column(c.name)
+            assert bool(batch.passed[i, j]) == bool(c.passed)
+            for got, want in ((batch.value[i, j], c.value), (batch.margin[i, j], c.margin)):
+                want = float(want)
+                assert (math.isnan(got) and math.isnan(want)) or got == want
+
+
+def test_plan_matches_build_all_constraints_rows() -> None:
+    outs = _points()
+    batch = evaluate_constraint_batch(outs)
+    _check_against_bundles(batch, outs)
+    assert batch.n_registry == len(load_authority_specs())
+    assert batch.dominant[-2] == "Transport spread"
+    assert not batch.feasible[-2]
+
+
+def test_plan_accepts_columns() -> None:
+    outs = _points()[-3:]
+    keys = sorted({k for o in outs for k in o})
+    cols = {k: np.array([o.get(k, np.nan) for o in outs], dtype=float) for k in keys}
+    cols["_ok"] = np.ones(len(outs), dtype=bool)
+    batch = get_constraint_plan().evaluate(cols)
+    rows = [{k: v for k, v in o.items()} for o in outs]
+    ref = evaluate_constraint_batch(rows)
+    assert batch.names[: batch.n_registry] == ref.names[: ref.n_registry]
+    np.testing.assert_array_equal(batch.feasible, ref.feasible)
+    assert batch.dominant == ref.dominant
+
+
+def test_registry_only_and_bundle_roundtrip() -> None:
+    outs = _points()[-3:]
+    plan = ConstraintPlan()
+    batch = plan.evaluate(outs, include_legacy=False)
+    assert batch.value.shape == (3, len(plan.specs))
+    assert list(batch.feasible) == [False, False, True]
+    assert batch.dominant == ("ELM transient heat flux", "Transport spread", None)
+    full = plan.evaluate(outs)
+    b0 = full.bundle(0)
+    assert [c.name for c in b0.governance] == [c.name for c in build_all_constraints(dict(outs[0])).governance]
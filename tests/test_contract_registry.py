@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from src.contracts.registry import ContractRegistry, contract_registry
+from src.contracts.plasma_regime_authority_contract import load_plasma_regime_contract
+from src.contracts.cd_tech_authority_contract import load_cd_tech_authority_contract
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _build(p: Path) -> dict:
+    return json.loads(p.read_text(encoding="utf-8"))
+
+
+def test_registry_hits_after_first_load(tmp_path: Path) -> None:
+    p = tmp_path / "c.json"
+    p.write_text(json.dumps({"a": 1}), encoding="utf-8")
+    reg = ContractRegistry()
+    a = reg.get(p, _build)
+    b = reg.get(p, _build)
+    assert a is b
+    st = reg.stats()
+    assert st["misses"] == 1 and st["hits"] == 1 and st["entries"] == 1
+
+
+def test_registry_invalidates_on_mtime_change(tmp_path: Path) -> None:
+    p = tmp_path / "c.json"
+    p.write_text(json.dumps({"a": 1}), encoding="utf-8")
+    reg = ContractRegistry()
+    assert reg.get(p, _build) == {"a": 1}
+    p.write_text(json.dumps({"a": 22}), encoding="utf-8")
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert reg.get(p, _build) == {"a": 22}
+    assert reg.stats()["reloads"] == 1
+
+
+def test_registry_explicit_reload(tmp_path: Path) -> None:
+    p = tmp_path / "c.json"
+    p.write_text(json.dumps({"a": 1}), encoding="utf-8")
+    reg = ContractRegistry()
+    a = reg.get(p, _build)
+    reg.reload(p)
+    assert reg.stats()["entries"] == 0
+    b = reg.get(p, _build)
+    assert a == b and a is not b
+
+
+def test_contract_loaders_share_cached_object_and_sha() -> None:
+    c1 = load_plasma_regime_contract(REPO_ROOT)
+    c2 = load_plasma_regime_contract(REPO_ROOT)
+    assert c1 is c2
+    (cd1, sha1) = load_cd_tech_authority_contract(REPO_ROOT)
+    before = contract_registry().stats()["hits"]
+    (cd2, sha2) = load_cd_tech_authority_contract(REPO_ROOT)
+    assert cd1 is cd2 and sha1 == sha2
+    assert contract_registry().stats()["hits"] == before + 1
+
+
+def test_module_contracts_are_read_through_the_registry_at_use(tmp_path: Path, monkeypatch) -> None:
+    from src.contracts import magnet_tech_contract as mt
+
+    p = tmp_path / "magnet_tech_contract.json"
+    data = json.loads((REPO_ROOT / "contracts" / "magnet_tech_contract.json").read_text(encoding="utf-8"))
+    data.setdefault("global", {})["fragile_margin_frac"] = 0.5
+    p.write_text(json.dumps(data), encoding="utf-8")
+    monkeypatch.setattr(mt, "_CONTRACT_REL_PATH", p)
+    # The edited file is picked up at the use site, not frozen at import.
+    assert mt.classify_fragility(0.3) == "FRAGILE"
+    assert mt.contract_sha256() != mt.CONTRACT_SHA256
+    before = contract_registry().stats()["hits"]
+    assert mt.contract() is mt.contract()
+    assert contract_registry().stats()["hits"] == before + 2
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from src.evaluator.core import Evaluator
+from src.models.inputs import PointInputs
+from src.physics.hot_ion import hot_ion_point
+from src.physics.hot_ion_batch import BATCH_RTOL, VECTOR_OUTPUTS, batch_unsupported_reason, hot_ion_point_batch
+
+
+def _inp(**kw) -> PointInputs:
+    base = dict(R0_m=1.85, a_m=0.57, kappa=1.8, Bt_T=12.2, Ip_MA=8.7, Ti_keV=12.0, fG=0.85, Paux_MW=25.0)
+    return PointInputs(**{**base, **kw})
+
+
+def _assert_matches_scalar(base: PointInputs, cols: dict, res: dict, **kw) -> None:
+    n = len(next(iter(cols.values())))
+    for i in range(n):
+        out = hot_ion_point(base.replace(**{k: float(v[i]) for k, v in cols.items()}), **kw)
+        for k in VECTOR_OUTPUTS:
+            s, v = float(out[k]), float(res[k][i])
+            if math.isnan(s):
+                assert math.isnan(v), k
+            else:
+                assert v == pytest.approx(s, rel=BATCH_RTOL, abs=0.0), k
+
+
+@pytest.mark.parametrize(
+    "switches",
+    [
+        {},
+        {"fuel_mode": "DD", "include_secondary_DT": True},
+        {"include_radiation": True, "f_rad_core": 0.3, "f_rad_div": 0.5},
+        {"alpha_loss_model": "rho_star", "alpha_prompt_loss_k": 2.0, "include_alpha_loss": True},
+        {"ash_dilution_mode": "fixed_fraction", "f_He_ash": 0.05, "coolant": "Water"},
+        {"confinement_scaling": "ITER89P", "transport_stiffness_c": 0.4, "Ploss_ref_MW": 30.0},
+    ],
+)
+def test_vectorized_rows_match_scalar_within_rtol(switches: dict) -> None:
+    base = _inp(**switches)
+    rng = np.random.default_rng(7)
+    cols = {
+        "Ti_keV": rng.uniform(5.0, 40.0, 5),
+        "fG": rng.uniform(0.4, 1.1, 5),
+        "R0_m": rng.uniform(1.6, 2.4, 5),
+        "Paux_MW": rng.uniform(10.0, 60.0, 5),
+    }
+    res = hot_ion_point_batch(base, cols, Paux_for_Q_MW=30.0)
+    assert res["_vectorized"].all() and res["_ok"].all()
+    assert set(VECTOR_OUTPUTS) <= set(res)
+    _assert_matches_scalar(base, cols, res, Paux_for_Q_MW=30.0)
+
+
+def test_scalar_fallback_for_unsupported_switches_columns_and_outputs() -> None:
+    base = _inp(include_current_drive=True)
+    assert batch_unsupported_reason(base) == "include_current_drive"
+    res = hot_ion_point_batch(base, {"Ti_keV": [10.0, 14.0]}, outputs=["Q_DT_eqv"])
+    assert not res["_vectorized"].any()
+    assert res["Q_DT_eqv"][1] == hot_ion_point(base.replace(Ti_keV=14.0))["Q_DT_eqv"]
+
+    base = _inp()
+    res = hot_ion_point_batch(base, {"delta": [0.3]}, outputs=["H98"])
+    assert not res["_vectorized"].any()
+    res = hot_ion_point_batch(base, {"Ti_keV": [12.0]}, outputs=["H98", "confinement_regime"])
+    assert not res["_vectorized"].any() and res["confinement_regime"].dtype == object
+
+
+def test_invalid_rows_fall_back_and_report_not_ok() -> None:
+    res = hot_ion_point_batch(_inp(), {"Ti_keV": [12.0, -1.0, 15.0]}, outputs=["Pfus_DT_MW"])
+    assert res["_vectorized"].tolist() == [True, False, True]
+    assert res["_ok"].tolist() == [True, False, True]
+    assert math.isnan(res["Pfus_DT_MW"][1])
+    with pytest.raises(ValueError):
+        hot_ion_point_batch(_inp(), {"not_a_field": [1.0]})
+
+
+def test_evaluator_evaluate_batch_applies_calibration() -> None:
+    base = _inp(calib_confinement=1.1)
+    ev = Evaluator(cache_enabled=False)
+    res = ev.evaluate_batch(base, {"fG": [0.7, 0.9]}, outputs=["H98", "Q_DT_eqv"])
+    assert res["_vectorized"].all()
+    ref = ev.evaluate(base.replace(fG=0.9)).out
+    assert res["H98"][1] == pytest.approx(ref["H98"], rel=BATCH_RTOL, abs=0.0)
+    assert res["Q_DT_eqv"][1] == pytest.approx(ref["Q_DT_eqv"], rel=BATCH_RTOL, abs=0.0)
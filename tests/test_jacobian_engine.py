@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from src.evaluator.core import Evaluator
+from src.evaluator.jacobian import shutdown_jacobian_pools
+from src.models.inputs import PointInputs
+from src.physics.hot_ion_batch import BATCH_RTOL
+from src.solvers.constraint_solver import solve_for_targets
+
+TARGETS = ["H98", "Q_DT_eqv"]
+VARIABLES = ["Ip_MA", "fG"]
+
+
+def _inp(**kw) -> PointInputs:
+    base = dict(R0_m=1.85, a_m=0.57, kappa=1.8, Bt_T=12.2, Ip_MA=8.7, Ti_keV=12.0, fG=0.8, Paux_MW=25.0)
+    return PointInputs(**{**base, **kw})
+
+
+def _reference_forward(base: PointInputs, step_frac: float = 1e-4) -> list:
+    ev = Evaluator(cache_enabled=False)
+    y0 = ev.evaluate(base).out
+    J = [[0.0 for _ in VARIABLES] for __ in TARGETS]
+    for j, var in enumerate(VARIABLES):
+        x0 = float(getattr(base, var))
+        h = step_frac * max(abs(x0), 1.0)
+        d = base.to_dict()
+        d[var] = x0 + h
+        y1 = ev.evaluate(PointInputs.from_dict(d)).out
+        for i, t in enumerate(TARGETS):
+            J[i][j] = (float(y1[t]) - float(y0[t])) / h
+    return J
+
+
+def test_serial_forward_matches_dict_roundtrip_fd() -> None:
+    base = _inp()
+    ev = Evaluator()
+    assert ev.jacobian_targets(base, targets=TARGETS, variables=VARIABLES) == _reference_forward(base)
+    assert ev.last_jacobian_info["n_evals"] == 1 + len(VARIABLES)
+
+
+def test_central_and_batch_engines_agree_with_forward() -> None:
+    base = _inp()
+    ev = Evaluator()
+    fwd = ev.jacobian_targets(base, targets=TARGETS, variables=VARIABLES)
+    cen = ev.jacobian_targets(base, targets=TARGETS, variables=VARIABLES, scheme="central")
+    assert ev.last_jacobian_info["n_evals"] == 1 + 2 * len(VARIABLES)
+    batch = ev.jacobian_targets(base, targets=TARGETS, variables=VARIABLES, scheme="central", engine="batch")
+    for i in range(len(TARGETS)):
+        for j in range(len(VARIABLES)):
+            assert cen[i][j] == pytest.approx(fwd[i][j], rel=1e-3)
+            assert batch[i][j] == pytest.approx(cen[i][j], rel=1e-6, abs=BATCH_RTOL)
+    with pytest.raises(ValueError):
+        ev.jacobian_targets(base, targets=TARGETS, variables=VARIABLES, engine="gpu")
+
+
+def test_process_engine_matches_serial() -> None:
+    base = _inp()
+    ev = Evaluator()
+    try:
+        par = ev.jacobian_targets(base, targets=TARGETS, variables=VARIABLES, engine="process", max_workers=2)
+    finally:
+        shutdown_jacobian_pools()
+    assert par == ev.jacobian_targets(base, targets=TARGETS, variables=VARIABLES)
+
+
+def test_solver_trace_reports_jacobian_timing_and_reuse() -> None:
+    kw = dict(targets={"H98": 1.0, "Q_DT_eqv": 10.0}, variables={"Ip_MA": (8.0, 4.0, 14.0), "fG": (0.8, 0.1, 1.2)}, max_iter=8)
+    res = solve_for_targets(_inp(), **kw)
+    summary = [e for e in res.trace if e.get("event") == "solve_summary"]
+    assert len(summary) == 1 and summary[0]["iters"] == res.iters
+    jac = [e for e in res.trace if e.get("event") == "jacobian"]
+    assert jac and all(e["source"] == "fd" for e in jac)
+    assert summary[0]["n_jacobian_fd"] == len(jac)
+    assert res.report["timings_s"]["total"] >= res.report["timings_s"]["jacobian"] > 0.0
+
+    reuse = solve_for_targets(_inp(), jacobian_reuse=True, **kw)
+    summary = [e for e in reuse.trace if e.get("event") == "solve_summary"][0]
+    assert summary["n_jacobian_broyden"] >= 1
+    assert summary["n_jacobian_fd"] + summary["n_jacobian_broyden"] == len([e for e in reuse.trace if e.get("event") == "jacobian"])
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.evaluator.core import Evaluator
+from src.utils.lru import LRUCache, approx_nbytes, shallow_nbytes
+from src.models.inputs import PointInputs
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    c = LRUCache(2)
+    c.put("a", 1)
+    c.put("b", 2)
+    assert c.get("a") == 1  # bump "a"
+    c.put("c", 3)
+    assert "b" not in c and "a" in c and "c" in c
+    st = c.stats()
+    assert st["evictions"] == 1 and st["hits"] == 1 and st["size"] == 2
+
+
+def test_lru_byte_budget_bounds_total_size() -> None:
+    c = LRUCache(1000, max_bytes=250)
+    for i in range(10):
+        c.put(i, b"", nbytes=100)
+    st = c.stats()
+    assert st["size"] == 2 and st["bytes"] == 200 and st["evictions"] == 8
+    c.put("huge", b"", nbytes=10_000)  # never fits: not cached, nothing flushed
+    assert "huge" not in c and len(c) == 2
+
+
+def test_unbudgeted_cache_reports_shallow_size_without_deep_walk() -> None:
+    calls = []
+    c = LRUCache(4, sizeof=lambda v: calls.append(v) or 1)
+    c.put("a", {"x": 1.0})
+    assert calls == [] and c.stats()["bytes"] == shallow_nbytes({"x": 1.0}) > 0
+    b = LRUCache(4, max_bytes=10, sizeof=lambda v: calls.append(v) or 1)
+    b.put("a", {"x": 1.0})
+    assert len(calls) == 1 and b.stats()["bytes"] == 1
+
+
+def test_approx_nbytes_counts_nested_payload() -> None:
+    small = approx_nbytes({"x": 1.0})
+    big = approx_nbytes({"x": 1.0, "nested": {f"k{i}": float(i) for i in range(100)}})
+    assert big > small > 0
+    assert 0 < shallow_nbytes({"x": 1.0, "nested": {f"k{i}": float(i) for i in range(100)}}) < big
+
+
+def test_evaluator_cache_reports_bytes_and_is_thread_safe() -> None:
+    ev = Evaluator(cache_max=4)
+    base = dict(R0_m=1.85, a_m=0.57, kappa=1.8, Bt_T=12.2, Ip_MA=8.7, Ti_keV=12.0, fG=0.85, Paux_MW=25.0)
+    inps = [PointInputs(**{**base, "Paux_MW": 20.0 + i}) for i in range(3)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        res = list(pool.map(ev.evaluate, inps * 4))
+    assert all(r.ok for r in res)
+    st = ev.cache_stats()
+    assert st["enabled"] is True
+    assert st["size"] == 3 and st["bytes"] > 0
+    assert st["hits"] + st["misses"] == 12
+    assert ev.evaluate(inps[0]) is ev.evaluate(inps[0])
+    ev.clear_cache()
+    assert ev.cache_stats()["size"] == 0 and ev.cache_stats()["bytes"] == 0
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import shutil
+
+import numpy as np
+
+from src.physics import radiation as rad
+from src.physics.impurities.species_library_v399 import lz_envelope_matrix_Wm3, lz_envelope_Wm3
+
+
+def _grid():
+    return [10 ** (-2.5 + 4.2 * k / 499) for k in range(500)]
+
+
+def test_compiled_lookup_matches_loglog_interp() -> None:
+    db = rad.get_lz_database("proxy_v1")
+    assert db.db_id == "proxy_v1" and len(db.sha256) == 64
+    for sp, tbl in db.tables.items():
+        xs, ys = tbl["Te_keV"], tbl["Lz_W_m3"]
+        for T in _grid() + list(xs):
+            assert db.lz(sp, T) == rad._loglog_interp(T, xs, ys)
+        arr = db.lz_array(sp, np.asarray(_grid()))
+        ref = np.array([rad._loglog_interp(T, xs, ys) for T in _grid()])
+        np.testing.assert_allclose(arr, ref, rtol=1e-12)
+    # Aliases and unknown species behave as before (fall back to carbon).
+    assert rad.Lz_W_m3(0.7, "Neon", db_tables=db.tables) == db.lz("NE", 0.7)
+    assert rad.Lz_W_m3(0.7, "Xx", db_tables=db.tables) == db.lz("C", 0.7)
+    m = db.lz_matrix(["C", "W"], [0.3, 3.0])
+    assert m.shape == (2, 2) and m[1, 1] == db.lz("W", 3.0)
+
+
+def test_load_lz_db_is_cached_and_tracks_file_changes(tmp_path) -> None:
+    src = os.path.join(os.path.dirname(rad.__file__), "..", "data", "radiation", "lz_tables_proxy_v1.json")
+    p = tmp_path / "lz.json"
+    shutil.copy(src, p)
+    t1, used1, h1 = rad.load_lz_db(f"file:{p}")
+    t2, used2, h2 = rad.load_lz_db(f"file:{p}")
+    assert t1 is t2 and used1 == used2 == f"file:{p}" and h1 == h2
+
+    obj = json.loads(p.read_text(encoding="utf-8"))
+    obj["species"]["C"]["Lz_W_m3"][0] *= 2.0
+    p.write_text(json.dumps(obj), encoding="utf-8")
+    t3, _, h3 = rad.load_lz_db(f"file:{p}")
+    assert h3 != h1 and t3["C"]["Lz_W_m3"][0] == 2.0 * t1["C"]["Lz_W_m3"][0]
+
+    assert rad.load_lz_db(f"file:{tmp_path / 'missing.json'}")[1:] == ("builtin_proxy", "")
+    out = rad.total_core_radiation_W(1e20, 5.0, 5.0, 3.0, 1.0, 100.0, mix=rad.ImpurityMix(frac=1e-3), lz_db_id=f"file:{p}")
+    assert out["LZ_DB_SHA256"] == h3 and out["P_line_W"] > 0.0
+
+
+def test_v399_envelope_matrix_matches_scalar() -> None:
+    T = np.asarray(_grid() + [100.0])
+    m = lz_envelope_matrix_Wm3(["C", "W", "Unobtainium"], T)
+    for k, sp in enumerate(["C", "W", "Unobtainium"]):
+        ref = np.array([lz_envelope_Wm3(sp, t) for t in T])
+        np.testing.assert_allclose(m[k], ref, rtol=1e-12)
+    assert math.isnan(float(lz_envelope_matrix_Wm3(["Ne"], [float("nan")])[0, 0]))
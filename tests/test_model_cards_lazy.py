@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.evaluator.core import Evaluator
+from src.models.inputs import PointInputs
+from src.provenance.model_cards import (
+    materialize_model_cards,
+    model_cards_index,
+    shared_model_cards_index,
+)
+
+
+def _inp(**kw) -> PointInputs:
+    base = dict(R0_m=1.85, a_m=0.57, kappa=1.8, Bt_T=12.2, Ip_MA=8.7, Ti_keV=12.0, fG=0.85, Paux_MW=25.0)
+    return PointInputs(**{**base, **kw})
+
+
+def test_index_is_memoized_but_returned_as_fresh_copy() -> None:
+    a = model_cards_index()
+    b = model_cards_index()
+    assert a == b and a is not b
+    assert shared_model_cards_index() is shared_model_cards_index()
+    a.clear()
+    assert model_cards_index() == b
+
+
+def test_lazy_evaluation_materializes_identical_audit_view() -> None:
+    inp = _inp(calib_confinement=1.1)
+    eager = Evaluator(cache_enabled=False).evaluate(inp).out
+    lazy = Evaluator(cache_enabled=False, model_cards="lazy").evaluate(inp).out
+    ref = lazy["model_cards"]
+    assert lazy["_inputs"] is ref and lazy["model_cards_validity"] is ref
+    assert lazy["H98"] == eager["H98"]
+    view = materialize_model_cards(lazy)
+    assert list(view) == list(eager)
+    assert json.dumps(view, default=str) == json.dumps(eager, default=str)
+    assert materialize_model_cards(eager) is eager
+
+
+def test_invalid_model_card_mode_rejected() -> None:
+    with pytest.raises(ValueError):
+        Evaluator(model_cards="sometimes")
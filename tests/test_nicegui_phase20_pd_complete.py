@@ -1,12 +1,15 @@
 """Phase 20: Point Designer complete parity (solver, deepening, PDF, frontier)."""
 from __future__ import annotations
 
+import asyncio
+
 from ui_nicegui.decks.point_designer.pd_physics_deepening import DEEP_VIEWS
 from ui_nicegui.lib.pd_overlay_knobs import OVERLAY_NUMERIC_PANELS
 from ui_nicegui.lib.pd_solver_helpers import (
     compute_pd_inputs_fingerprint,
     compute_pd_inputs_hash,
     run_point_designer_evaluation,
+    run_point_designer_evaluation_async,
     sync_solver_bounds_from_inputs,
 )
 from ui_nicegui.session import DesignSession
@@ -61,6 +64,17 @@ def test_phase20_direct_evaluate_smoke() -> None:
     assert isinstance(result.get("log_lines"), list)
 
 
+def test_phase20_async_direct_evaluate_matches_sync(monkeypatch) -> None:
+    monkeypatch.setenv("SHAMS_UI_EVAL_WORKERS", "0")
+    s = DesignSession()
+    s.pd_eval_mode = "direct"
+    sync_solver_bounds_from_inputs(s)
+    sync = run_point_designer_evaluation(s)
+    res = asyncio.run(run_point_designer_evaluation_async(s, eval_session="test"))
+    assert res["outputs"] == sync["outputs"]
+    assert res["inputs_hash"] == sync["inputs_hash"] and res["log_lines"] == sync["log_lines"]
+
+
 def test_phase20_solver_evaluate_smoke() -> None:
     s = DesignSession()
     s.pd_eval_mode = "solver"
@@ -20,12 +20,14 @@ from ui_nicegui.lib.pd_parity_helpers import (
     constraint_radar_rows,
     fuel_cycle_metric_groups,
     lever_recipe_tables,
+    local_fd_points,
     local_fd_sensitivity_rows,
     magnet_card_metrics,
     magnet_v400_summary,
     pin_ploss_closure_mw,
     power_ledger_badged_rows,
     regime_compass_rows,
+    perturbation_scan_points,
     run_perturbation_scan,
     tau_peaking_panel_data,
     v396_scaling_rows,
@@ -120,6 +122,22 @@ def test_phase21_local_fd_and_pert_scan_smoke() -> None:
     assert isinstance(scan_rows, list)
 
 
+def test_phase21_scan_points_cover_what_the_scans_evaluate() -> None:
+    # The deck pre-evaluates these points concurrently; the row builders must then only hit the cache.
+    base = DesignSession().build_point_inputs()
+    seen = []
+
+    def _record(pi):
+        seen.append(pi)
+        return ui_evaluate(pi, origin="test:phase21pts")
+
+    local_fd_sensitivity_rows(base, _record)
+    assert seen == local_fd_points(base)
+    seen.clear()
+    run_perturbation_scan(base, _record)
+    assert seen == perturbation_scan_points(base)
+
+
 def test_phase21_v396_v397_helpers() -> None:
     assert v396_scaling_rows({}) == []
     assert v397_profile_summary({}) is None
@@ -8,6 +8,7 @@ SHAMS-evaluated feasible-first filters — no soft negotiation.
 from __future__ import annotations
 
 import ast
+import json
 from pathlib import Path
 from typing import Any, Dict
 
@@ -303,3 +304,66 @@ def test_ccfs_rejects_annotated_with_atlas_dominatees() -> None:
 def test_pymoo_optional_not_required() -> None:
     # Zero new heavy deps: pymoo may or may not be installed.
     assert isinstance(pymoo_available(), bool)
+
+
+def test_fallback_worker_pool_matches_serial_and_reports_throughput() -> None:
+    kwargs: Dict[str, Any] = dict(
+        variables={"Ip_MA": (6.5, 9.5), "fG": (0.7, 0.95)},
+        seed=11,
+        pop_size=6,
+        n_generations=2,
+        shortlist_k=4,
+        force_fallback=True,
+    )
+    serial = run_nsga2_search(_base_inputs(), _multi(11), **kwargs)
+    pooled = run_nsga2_search(_base_inputs(), _multi(11), max_workers=2, **kwargs)
+    assert pooled.max_workers == 2 and serial.max_workers == 1
+    # Canonical JSON: NaN-valued fields compare equal (dict == would not across processes).
+    canon = lambda r: json.dumps([c.to_dict() for c in r.candidates], sort_keys=True, default=str)  # noqa: E731
+    assert canon(pooled) == canon(serial)
+    assert pooled.n_evals == serial.n_evals
+    stats = pooled.to_dict()["generation_stats"]
+    assert [g["generation"] for g in stats] == [0, 1, 2]
+    for g in stats:
+        assert g["n_individuals"] == 6
+        assert g["n_evaluated"] + g["n_duplicates"] == 6
+        assert g["evals_per_s"] > 0.0
+    assert serial.n_evals == sum(g["n_evaluated"] for g in serial.generation_stats)
+
+
+def test_duplicate_individuals_evaluated_once_per_generation() -> None:
+    # Degenerate bounds collapse every individual onto one point.
+    res = run_nsga2_search(
+        _base_inputs(),
+        _multi(3),
+        variables={"Ip_MA": (8.0, 8.0), "fG": (0.85, 0.85)},
+        seed=3,
+        pop_size=5,
+        n_generations=1,
+        shortlist_k=2,
+        force_fallback=True,
+    )
+    assert [g["n_evaluated"] for g in res.generation_stats] == [1, 1]
+    assert res.n_evals == 2
+
+
+def test_search_rows_are_compact_and_materialize_for_export() -> None:
+    from src.optimization import nsga2_search_driver as drv
+
+    base = _base_inputs()
+    multi = _multi(5)
+    names = ("Ip_MA", "fG")
+    row = drv._eval_individual(
+        x=[8.5, 0.9],
+        names=names,
+        bound_pairs=[(6.5, 9.5), (0.7, 0.95)],
+        base=base,
+        multi=multi,
+        origin="test_nsga2_compact",
+        eval_counter=[0],
+    )
+    assert set(row) == {"x", "metrics", "feasible", "violation", "front_rank", "crowding_distance"}
+    full = drv._materialize_individual(row, names=names, base=base, origin="test_nsga2_compact")
+    assert full["inputs"]["Ip_MA"] == 8.5 and full["inputs"]["fG"] == 0.9
+    assert ("no_solution_atlas" in full) == (not row["feasible"])
+    assert "inputs" not in row
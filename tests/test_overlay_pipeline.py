@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from src.physics.hot_ion import overlay_stages
+from src.physics.overlay_pipeline import OverlayPipeline, OverlayStage, merge_fill
+
+
+def test_overlay_pipelines_are_inspectable_and_resolved() -> None:
+    info = overlay_stages()
+    assert set(info) == {
+        "transport", "magnet", "neutronics", "lifetime", "structural", "availability", "control", "post_truth"
+    }
+    names = [r["name"] for r in info["post_truth"]["stages"]]
+    # v399 must precede v402 dominance, and v402 must run last.
+    assert names.index("impurity_v399") < names.index("authority_dominance_v402")
+    assert names[-1] == "authority_dominance_v402"
+    for pl in info.values():
+        for row in pl["stages"]:
+            assert row["resolved"] or row["optional"], row
+    # v398 reads the merged v397 fields, so it runs after them (control pipeline).
+    assert [r["name"] for r in info["control"]["stages"]] == ["control_stability_v398", "nm_coupling_v372"]
+
+
+def test_flagged_stage_is_skipped_without_call() -> None:
+    pl = OverlayPipeline(
+        [
+            OverlayStage("v412", "machine_build_authority_v412", "evaluate_machine_build_authority_v412",
+                         enabled_key="include_machine_build_authority_v412", error_key="mb_error",
+                         flag="include_machine_build_authority_v412"),
+        ]
+    )
+    out: dict = {}
+    pl.run(out, SimpleNamespace(include_machine_build_authority_v412=False))
+    assert out == {}
+    t = pl.stage_timings()["v412"]
+    assert t["skipped"] == 1.0 and t["calls"] == 0.0
+
+
+def test_unresolvable_stage_stamps_failure_or_is_optional() -> None:
+    pl = OverlayPipeline(
+        [
+            OverlayStage("missing", "no_such_overlay_module", "f", enabled_key="inc_missing", error_key="missing_error"),
+            OverlayStage("missing_opt", "no_such_overlay_module", "f", enabled_key="inc_opt", error_key="opt_error",
+                         optional=True),
+        ]
+    )
+    out: dict = {}
+    pl.run(out, SimpleNamespace())
+    assert out["inc_missing"] is False
+    assert "missing_error" in out and "opt_error" not in out
+    assert pl.describe()[0]["resolved"] is False
+
+
+def test_fill_merge_pre_hook_and_silent_stage() -> None:
+    out = {"a": 1.0, "b": float("nan")}
+    merge_fill(out, {"a": 2.0, "b": 3.0, "c": 4.0})
+    assert out == {"a": 1.0, "b": 3.0, "c": 4.0}
+
+    def _pre(out, inp):
+        out["policy_cap"] = float(getattr(inp, "cap", float("nan")))
+
+    pl = OverlayPipeline(
+        [
+            OverlayStage("gated", "no_such_overlay_module", "f", enabled_key=None, error_key=None,
+                         flag="include_gated", pre=_pre),
+            OverlayStage("silent", "no_such_overlay_module", "f", enabled_key=None, error_key=None),
+            OverlayStage("filled", "no_such_overlay_module", "f", enabled_key="inc_filled", error_key="filled_error",
+                         merge="fill"),
+        ]
+    )
+    out = {"inc_filled": True}
+    pl.run(out, SimpleNamespace(include_gated=False, cap=2.5))
+    # Policy inputs are recorded before the flag check; silent stages stamp nothing;
+    # a fill-merged failure never overwrites an existing scalar.
+    assert out["policy_cap"] == 2.5 and out["inc_filled"] is True
+    assert "filled_error" in out and set(out) == {"policy_cap", "inc_filled", "filled_error"}
+    assert pl.stage_timings()["gated"]["skipped"] == 1.0
+
+
+def test_evaluate_returns_patch_or_failure_stamp() -> None:
+    pl = OverlayPipeline(
+        [
+            OverlayStage("v397", "profile_proxy_v397", "evaluate_profile_proxy_v397",
+                         enabled_key="profile_proxy_v397_enabled", error_key="profile_proxy_v397_error",
+                         keyword_call=True, out_kw="out_partial", merge="fill"),
+            OverlayStage("missing", "no_such_overlay_module", "f", enabled_key="inc_missing", error_key="missing_error"),
+        ]
+    )
+    patch = pl.evaluate("v397", {"q95": 4.0}, SimpleNamespace(include_profile_proxy_v397=False))
+    assert patch.get("profile_proxy_v397_enabled") is False and "profile_proxy_v397_error" not in patch
+    failed = pl.evaluate("missing", {}, SimpleNamespace())
+    assert failed["inc_missing"] is False and failed["missing_error"]
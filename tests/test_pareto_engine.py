@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from src.optimization.nsga2_search_driver import (
+    _constrained_dominates,
+    _crowding_distance,
+    _fast_nondominated_sort,
+)
+from src.solvers import pareto_engine as pe
+from src.solvers.optimize import dominates, pareto_front
+
+
+def _rows(rng: random.Random, n: int, keys, *, nan_frac: float = 0.05):
+    rows = []
+    for _ in range(n):
+        # Coarse grid -> many exact ties and duplicate points.
+        r = {k: float(rng.randint(0, 6)) for k in keys}
+        if rng.random() < nan_frac:
+            r[rng.choice(keys)] = float("nan")
+        rows.append(r)
+    return rows
+
+
+def _deb_fronts(inds, senses):
+    # The former pairwise fast nondominated sort (reference member order).
+    n = len(inds)
+    S = [[] for _ in range(n)]
+    n_dom = [0] * n
+    fronts = [[]]
+    for p in range(n):
+        for q in range(n):
+            if p == q:
+                continue
+            if _constrained_dominates(inds[p], inds[q], senses):
+                S[p].append(q)
+            elif _constrained_dominates(inds[q], inds[p], senses):
+                n_dom[p] += 1
+        if n_dom[p] == 0:
+            fronts[0].append(p)
+    i = 0
+    while fronts[i]:
+        nxt = []
+        for p in fronts[i]:
+            for q in S[p]:
+                n_dom[q] -= 1
+                if n_dom[q] == 0:
+                    nxt.append(q)
+        i += 1
+        fronts.append(nxt)
+    return fronts[:-1]
+
+
+def _ref_ranks(rows, better):
+    n = len(rows)
+    rank = [None] * n
+    left = set(range(n))
+    k = 0
+    while left:
+        front = {p for p in left if not any(better(rows[q], rows[p]) for q in left if q != p)}
+        for p in front:
+            rank[p] = k
+        left -= front
+        k += 1
+    return rank
+
+
+@pytest.mark.parametrize("n_obj", [1, 2, 3, 4])
+def test_pareto_front_matches_pairwise_definition(n_obj: int) -> None:
+    rng = random.Random(n_obj)
+    keys = [f"f{i}" for i in range(n_obj)]
+    senses = {k: ("min" if i % 2 == 0 else "max") for i, k in enumerate(keys)}
+    for _ in range(20):
+        pts = _rows(rng, 60, keys)
+        ref = [p for p in pts if not any(dominates(q, p, senses) for q in pts if q is not p)]
+        got = pareto_front(pts, senses)
+        assert [id(p) for p in got] == [id(p) for p in ref]
+
+
+@pytest.mark.parametrize("n_obj", [2, 3])
+def test_constrained_sort_matches_pairwise_ranks(n_obj: int) -> None:
+    rng = random.Random(100 + n_obj)
+    keys = [f"f{i}" for i in range(n_obj)]
+    senses = {k: ("max" if i == 0 else "min") for i, k in enumerate(keys)}
+    for _ in range(10):
+        inds = []
+        for m in _rows(rng, 50, keys):
+            feas = rng.random() < 0.7
+            inds.append({"metrics": m, "feasible": feas, "violation": 0.0 if feas else float(rng.randint(1, 4))})
+        ref = _ref_ranks(inds, lambda a, b: _constrained_dominates(a, b, senses))
+        fronts = _fast_nondominated_sort(inds, senses)
+        assert [ind["front_rank"] for ind in inds] == ref
+        assert fronts == _deb_fronts(inds, senses)
+        assert sorted(i for fr in fronts for i in fr) == list(range(len(inds)))
+
+
+def test_front_member_order_keeps_crowding_ties_stable() -> None:
+    # Tied metrics: crowding breaks ties by position in the front, so the
+    # front order must match the pairwise sort for NSGA-II selection to match.
+    rng = random.Random(2024)
+    keys = ["f0", "f1", "f2"]
+    senses = {"f0": "min", "f1": "max", "f2": "min"}
+    for _ in range(40):
+        inds = []
+        for m in _rows(rng, 30, keys, nan_frac=0.0):
+            feas = rng.random() < 0.8
+            inds.append({"metrics": m, "feasible": feas, "violation": 0.0 if feas else float(rng.randint(1, 3))})
+        ref_fronts = _deb_fronts(inds, senses)
+        fronts = _fast_nondominated_sort(inds, senses)
+        assert fronts == ref_fronts
+        ref = [dict(ind) for ind in inds]
+        for fr_new, fr_ref in zip(fronts, ref_fronts):
+            _crowding_distance(inds, fr_new, senses)
+            _crowding_distance(ref, fr_ref, senses)
+        assert [ind["crowding_distance"] for ind in inds] == [r["crowding_distance"] for r in ref]
+    F = np.array([[1.0, 1.0], [0.0, 2.0], [2.0, 2.0], [3.0, 0.5], [3.0, 3.0]])
+    assert [fr.tolist() for fr in pe.nondominated_sort(F, ["min", "min"])] == [[0, 1, 3], [2], [4]]
+
+
+def test_crowding_distance_matches_reference_loop() -> None:
+    rng = random.Random(7)
+    senses = {"a": "min", "b": "max"}
+    inds = [{"metrics": {"a": rng.uniform(0, 1), "b": float(rng.randint(0, 3))}} for _ in range(25)]
+    front = list(range(3, 20))
+    _crowding_distance(inds, front, senses)
+    # Reference: the pre-vectorization per-key loop (stable sort, ties by front order).
+    ref = {i: 0.0 for i in front}
+    for key in senses:
+        order = sorted(front, key=lambda i: inds[i]["metrics"][key])
+        ref[order[0]] = ref[order[-1]] = math.inf
+        vals = [inds[i]["metrics"][key] for i in order]
+        span = max(vals) - min(vals)
+        for j in range(1, len(order) - 1):
+            ref[order[j]] += (vals[j + 1] - vals[j - 1]) / span
+    assert all(inds[i]["crowding_distance"] == pytest.approx(ref[i]) for i in front)
+
+
+def test_large_two_objective_front_is_fast_and_exact() -> None:
+    rng = np.random.default_rng(0)
+    F = rng.random((50_000, 2))
+    mask = pe.nondominated_mask(F, ["min", "min"])
+    order = np.lexsort((F[:, 1], F[:, 0]))
+    ref = np.zeros(len(F), dtype=bool)
+    best = np.inf
+    for i in order:
+        if F[i, 1] < best:
+            ref[i] = True
+            best = F[i, 1]
+    assert np.array_equal(mask, ref)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from src.evaluator.core import Evaluator
+from src.evaluator.persistent_cache import PersistentEvalCache, default_code_version, source_fingerprint
+from src.models.inputs import PointInputs
+
+
+def _inp(Ip_MA: float = 8.0) -> PointInputs:
+    return PointInputs(R0_m=1.85, a_m=0.57, kappa=1.8, Bt_T=12.2, Ip_MA=Ip_MA, Ti_keV=12.0, fG=0.8, Paux_MW=25.0)
+
+
+def _worker_put(path: str, i: int) -> None:
+    c = PersistentEvalCache(path, code_version="t")
+    c.put(f"fp{i}", "v", {"i": i}, 0.1)
+    c.close()
+
+
+def test_persistent_cache_survives_new_evaluator(tmp_path) -> None:
+    path = tmp_path / "eval_cache.sqlite"
+    inp = _inp()
+    ev1 = Evaluator(label="a", persistent_cache=path)
+    r1 = ev1.evaluate(inp)
+    assert ev1.cache_stats()["persistent"]["puts"] == 1
+
+    ev2 = Evaluator(label="a", persistent_cache=path)  # fresh in-memory cache
+    r2 = ev2.evaluate(inp)
+    st = ev2.cache_stats()["persistent"]
+    assert st["hits"] == 1 and st["puts"] == 0
+    # NaN-valued outputs: compare canonical JSON rather than dict equality.
+    assert json.dumps(r2.out, sort_keys=True, default=str) == json.dumps(r1.out, sort_keys=True, default=str)
+
+    # A different evaluator label or code version is a different key.
+    ev3 = Evaluator(label="b", persistent_cache=path)
+    ev3.evaluate(inp)
+    assert ev3.cache_stats()["persistent"]["hits"] == 0
+    c = PersistentEvalCache(path, code_version="other")
+    assert c.get(inp.fingerprint(), "a|model_cards=eager") is None
+
+
+def test_persistent_cache_lru_eviction_under_size_cap(tmp_path) -> None:
+    c = PersistentEvalCache(tmp_path / "c.sqlite", max_bytes=2000, code_version="t")
+    for i in range(6):
+        c.put(f"fp{i}", "v", {"x": random.Random(i).randbytes(400)}, 0.0)  # incompressible
+        if i >= 1:
+            assert c.get("fp0", "v") is not None  # keep fp0 recently used
+    st = c.stats()
+    assert st["bytes"] <= 2000 and st["evictions"] > 0
+    assert c.get("fp0", "v") is not None
+    assert c.get("fp1", "v") is None
+
+
+def test_persistent_cache_shared_across_processes(tmp_path) -> None:
+    path = str(tmp_path / "shared.sqlite")
+    c = PersistentEvalCache(path, code_version="t")
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        list(ex.map(_worker_put, [path] * 8, range(8)))
+    assert all(c.get(f"fp{i}", "v") == ({"i": i}, 0.1) for i in range(8))
+    c2 = pickle.loads(pickle.dumps(c))
+    assert c2.get("fp3", "v") == ({"i": 3}, 0.1)
+
+
+def test_default_code_version_tracks_source_content(tmp_path) -> None:
+    (tmp_path / "physics").mkdir()
+    mod = tmp_path / "physics" / "model.py"
+    mod.write_text("K = 1.0\n", encoding="utf-8")
+    fp1 = source_fingerprint(tmp_path)
+    (tmp_path / "physics" / "notes.txt").write_text("ignored", encoding="utf-8")
+    assert source_fingerprint(tmp_path) == fp1
+    mod.write_text("K = 1.1\n", encoding="utf-8")
+    assert source_fingerprint(tmp_path) != fp1
+
+    version = default_code_version()
+    assert "+src." in version and version.split("+src.")[0].strip()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from src.models.inputs import PointInputs
+from src.physics import point_cache
+from src.physics.hot_ion import hot_ion_point
+
+
+def _inp(**kw) -> PointInputs:
+    base = dict(R0_m=1.85, a_m=0.57, kappa=1.8, Bt_T=12.2, Ip_MA=8.7, Ti_keV=12.0, fG=0.85, Paux_MW=25.0)
+    return PointInputs(**{**base, **kw})
+
+
+def _nested_key(out: dict) -> str:
+    return next(k for k, v in out.items() if isinstance(v, dict))
+
+
+def test_view_mode_is_copy_on_write_and_read_only_nested() -> None:
+    assert point_cache.point_cache_mode() == "copy"  # view is opt-in
+    point_cache.set_point_cache_mode("view")
+    point_cache.clear_point_cache()
+    inp = _inp(Paux_MW=26.5)
+    a = hot_ion_point(inp)
+    b = hot_ion_point(inp)
+    assert a is not b and a.keys() == b.keys()
+    a["Q_DT_eqv"] = -1.0  # top-level write stays private to the caller
+    assert hot_ion_point(inp)["Q_DT_eqv"] == b["Q_DT_eqv"]
+    k = _nested_key(b)
+    with pytest.raises(TypeError):
+        b[k]["x"] = 1
+    thawed = copy.deepcopy(b)
+    thawed[k]["x"] = 1
+    assert type(pickle.loads(pickle.dumps(b))[k]) is dict
+    st = point_cache.point_cache_stats()
+    assert st["mode"] == "view" and st["hits"] == 2 and st["misses"] == 1
+    assert st["hit_rate"] == pytest.approx(2.0 / 3.0) and st["bytes"] > 0
+    point_cache.set_point_cache_mode("copy")
+    assert type(hot_ion_point(inp)[k]) is dict
+    assert type(hot_ion_point(inp, cache_mode="view")[k]) is point_cache.FrozenDict
+
+
+def test_copy_mode_returns_independent_mutable_outputs() -> None:
+    point_cache.set_point_cache_mode("copy")
+    try:
+        inp = _inp(Paux_MW=27.5)
+        a = hot_ion_point(inp)
+        k = _nested_key(a)
+        a[k]["x"] = 1
+        assert "x" not in hot_ion_point(inp)[k]
+        fresh = hot_ion_point(_inp(Paux_MW=27.5, enable_point_cache=False))
+        assert json.dumps(hot_ion_point(inp), sort_keys=True, default=str) == json.dumps(fresh, sort_keys=True, default=str)
+    finally:
+        point_cache.set_point_cache_mode("copy")
+    with pytest.raises(ValueError):
+        point_cache.set_point_cache_mode("pickle")
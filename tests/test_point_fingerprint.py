@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import dataclasses
+import subprocess
+import sys
+from pathlib import Path
+
+from src.evaluator.cache_key import sha256_cache_key
+from src.evaluator.core import Evaluator
+from src.models.inputs import PointInputs
+from src.schema.fingerprint import replace_inputs
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _base(**kw) -> PointInputs:
+    return PointInputs(R0_m=1.85, a_m=0.57, kappa=1.8, Bt_T=12.2, Ip_MA=8.7, Ti_keV=12.0, fG=0.85, Paux_MW=25.0, **kw)
+
+
+def test_fingerprint_matches_canonical_sha256_key() -> None:
+    inp = _base(q95_enforcement="diagnostic")
+    assert inp.fingerprint() == sha256_cache_key(inp)
+    assert inp.fingerprint() is inp.fingerprint()  # cached per instance
+    assert inp.fingerprint(30.0) == sha256_cache_key((inp, 30.0))
+    # Nothing leaks onto the frozen instance.
+    assert set(inp.__dict__) == {f.name for f in dataclasses.fields(PointInputs)}
+
+
+def test_replace_derives_fingerprint_incrementally() -> None:
+    base = _base()
+    derived = base.replace(Ip_MA=9.0, confinement_scaling="ITER89P")
+    assert derived == dataclasses.replace(base, Ip_MA=9.0, confinement_scaling="ITER89P")
+    assert derived.fingerprint() == sha256_cache_key(derived)
+    chained = replace_inputs(derived, Ip_MA=8.7, confinement_scaling=base.confinement_scaling)
+    assert chained.fingerprint() == base.fingerprint()
+
+
+def test_equal_points_share_evaluator_cache_entry() -> None:
+    ev = Evaluator(cache_max=8)
+    a = ev.evaluate(_base())
+    b = ev.evaluate(_base().replace(Paux_MW=25.0))
+    assert a is b
+    assert ev.cache_stats()["hits"] == 1
+
+
+def test_fingerprinting_does_not_import_the_evaluator() -> None:
+    # Run in a fresh interpreter: the schema layer must fingerprint inputs on its own.
+    script = (
+        "import sys\n"
+        f"sys.path[:0] = [{str(ROOT / 'src')!r}, {str(ROOT)!r}]\n"
+        "from models.inputs import PointInputs\n"
+        "PointInputs(R0_m=1.85, a_m=0.57, kappa=1.8, Bt_T=12.2, Ip_MA=8.7, Ti_keV=12.0, fG=0.85, Paux_MW=25.0).fingerprint()\n"
+        "print(sorted(m for m in sys.modules if m.split('.')[0] == 'evaluator' or m.startswith('src.evaluator')))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", script], cwd=str(ROOT), capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "[]"
@@ -43,12 +43,16 @@ def test_solve_fG_routes_through_bridge(monkeypatch):
 def test_pd_evaluation_sets_override_and_recertifies():
     from ui_nicegui.lib import pd_solver_helpers as h
 
-    src = inspect.getsource(h.run_point_designer_evaluation)
+    src = "".join(
+        inspect.getsource(fn)
+        for fn in (h._pd_solve, h._pd_result, h.run_point_designer_evaluation, h.run_point_designer_evaluation_async)
+    )
     assert "set_evaluate_point_override(_ui_eval)" in src
     assert 'origin="NiceGUI:Point Designer"' in src
     # Re-certify after solver/envelope (not only when out empty).
     assert "solver_audit" in src
     assert "ui_evaluate(" in src
+    assert "await ui_evaluate_async(" in src
 
 
 def test_optimize_nsga_uses_evaluator_bridge():
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from src.physics.profiles import build_profiles_from_volume_avgs
+from src.profiles.integration import grid_quadrature, parabolic_moments, pedestal_moments
+from src.profiles.profiles import ParabolicProfile, PedestalProfile, PlasmaProfiles
+
+
+def _trapz(fn, n):
+    # The former pure-Python rule (reference for the documented tolerance).
+    h = 1.0 / n
+    return (0.5 * (fn(0.0) + fn(1.0)) + sum(fn(i * h) for i in range(1, n))) * h
+
+
+def _former(p, ped):
+    if ped:
+        sv, nl, ns = _trapz(lambda r: p._shape(r) * 2.0 * r, 800), 500, 900
+    else:
+        sv, nl, ns = 1.0 / (max(p.alpha, 0.0) + 1.0), 400, 600
+    sc = p.f_avg / sv
+    return sc, sc * _trapz(p._shape, nl), sc * sc * _trapz(lambda r: p._shape(r) ** 2 * 2.0 * r, ns)
+
+
+@pytest.mark.parametrize("alpha,tol", [(0.05, 1.2e-3), (0.3, 2.5e-4), (0.6, 5e-5), (1.0, 1.5e-5), (2.5, 1.5e-5)])
+def test_closed_form_matches_former_trapezoid(alpha: float, tol: float) -> None:
+    cases = [(ParabolicProfile(3.0, alpha), False)]
+    cases += [(PedestalProfile(3.0, alpha, rp, fe), True) for rp in (0.5, 0.9, 0.95) for fe in (0.0, 0.3, 1.0)]
+    for p, ped in cases:
+        got = (p.center_value(), p.line_average(), p.vol_average_square())
+        for g, w in zip(got, _former(p, ped)):
+            assert abs(g / w - 1.0) <= tol
+
+
+def test_batch_moments_match_scalar_profiles() -> None:
+    alpha = np.array([0.0, 0.4, 1.0, 2.0, 4.0])
+    f_avg = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    par = parabolic_moments(f_avg, alpha)
+    ped = pedestal_moments(f_avg, alpha, 0.9, 0.25)
+    for i, a in enumerate(alpha):
+        for m, prof in ((par, ParabolicProfile(f_avg[i], a)), (ped, PedestalProfile(f_avg[i], a, 0.9, 0.25))):
+            assert m["center"][i] == pytest.approx(prof.center_value(), rel=1e-13)
+            assert m["line_average"][i] == pytest.approx(prof.line_average(), rel=1e-13)
+            assert m["vol_average_square"][i] == pytest.approx(prof.vol_average_square(), rel=1e-13)
+            assert m["volume_average"][i] == f_avg[i]
+
+
+def test_grid_quadrature_reproduces_closed_forms() -> None:
+    p = PedestalProfile(1.0, 2.0, 0.9, 0.2)
+    shape = np.vectorize(p._shape)
+    vol = grid_quadrature(lambda r: shape(r), n=24, breaks=(0.9,))
+    assert vol == pytest.approx(1.0 / p._scale(), rel=1e-12)
+    # Batch form: several parabolic exponents integrated in one call.
+    alphas = np.array([1.0, 2.0, 3.0])[:, None]
+    sq = grid_quadrature(lambda r: (1.0 - r * r) ** (2 * alphas), n=16)
+    np.testing.assert_allclose(sq, 1.0 / (2.0 * alphas[:, 0] + 1.0), rtol=1e-12)
+
+
+def test_derived_averages_and_grid_profiles() -> None:
+    prof = PlasmaProfiles(ne=PedestalProfile(1e20, 1.0), Ti=ParabolicProfile(10.0, 1.5), Te=ParabolicProfile(9.0, 1.5))
+    d = prof.derived_averages()
+    assert d["ne2_over_neV2"] >= 1.0 and all(math.isfinite(v) for v in d.values())
+
+    ap = build_profiles_from_volume_avgs(9.0, 1.1, 1.5, 1.0, ngrid=51, pedestal_enabled=True)
+    r0 = 1.0 - 0.05
+    for r, T in zip(ap.r_grid, ap.T_keV):
+        s = 0.5 * (1.0 - math.tanh(240.0 * (r - r0)))
+        ref = 9.0 * 2.5 * max(1.0 - r * r, 0.0) ** 1.5 * max(0.2, 0.6 + 0.4 * s)
+        assert T == pytest.approx(ref, rel=1e-14, abs=1e-300)
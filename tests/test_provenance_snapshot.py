@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+
+import shams_io.run_artifact as run_artifact
+from shams_io.run_artifact import (
+    build_run_artifact,
+    provenance_snapshot,
+    provenance_snapshot_stats,
+    refresh_provenance_snapshot,
+)
+from studies.runner import run_study
+from studies.spec import StudySpec
+
+
+def test_snapshot_is_shared_and_refresh_rereads(monkeypatch):
+    snap = refresh_provenance_snapshot()
+    assert provenance_snapshot() is snap
+    a = build_run_artifact(inputs={}, outputs={"x": 1.0}, constraints=[], meta={"mode": "point"})
+    b = build_run_artifact(inputs={}, outputs={"x": 1.0}, constraints=[], meta={"mode": "point"})
+    assert a["provenance"]["release_notes_excerpt"] == snap.release_notes_excerpt
+    assert a["provenance"]["python"] == snap.provenance["python"]
+    assert provenance_snapshot_stats()["n_reused"] >= 2
+    if snap.verification:
+        assert a["verification"]["report"] == snap.verification
+        # Mutating one artifact's report must not leak into the snapshot or later artifacts.
+        a["verification"]["report"]["overall"] = "MUTATED"
+        assert snap.verification.get("overall") != "MUTATED"
+        assert b["verification"]["report"].get("overall") != "MUTATED"
+
+    monkeypatch.setattr(run_artifact, "try_load_verification_report", lambda: {"overall": "PASS"})
+    refresh_provenance_snapshot()
+    c = build_run_artifact(inputs={}, outputs={"x": 1.0}, constraints=[], meta={"mode": "point"})
+    assert c["verification"]["report"] == {"overall": "PASS"}
+    # an explicit verification report still wins over the snapshot
+    d = build_run_artifact(inputs={}, outputs={"x": 1.0}, constraints=[], verification={"overall": "FAIL"})
+    assert d["verification"]["report"] == {"overall": "FAIL"}
+    monkeypatch.undo()
+    refresh_provenance_snapshot()
+
+
+def test_study_summary_reports_provenance_savings(tmp_path):
+    spec = StudySpec(
+        name="prov",
+        targets={"H98": 1.0, "Q_DT_eqv": 5.0},
+        variables={"Ip_MA": [8.0, 4.0, 12.0], "fG": [0.8, 0.1, 1.2]},
+        sweeps=[],
+        max_iter=2,
+    )
+    run_study(spec, tmp_path)
+    summary = json.loads((tmp_path / "study_summary.json").read_text(encoding="utf-8"))
+    prov = summary["provenance_snapshot"]
+    assert prov["n_artifacts"] >= 1 and prov["n_snapshots"] == 1
+    assert prov["per_artifact_saved_s"] > 0.0
@@ -0,0 +1,26 @@
+"""Root-first imports must resolve the new ``physics`` modules through the proxy package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_SCRIPT = f"""
+import sys
+sys.path[:0] = [{str(ROOT)!r}, {str(ROOT / 'src')!r}]
+from evaluator.core import Evaluator  # noqa: F401
+import physics.hot_ion_batch, physics.lz_database, physics.overlay_pipeline  # noqa: F401
+import physics.point_cache, physics.stage_profiler  # noqa: F401
+print("ok")
+"""
+
+
+def test_evaluator_imports_with_repo_root_first_on_sys_path() -> None:
+    proc = subprocess.run(
+        [sys.executable, "-c", _SCRIPT], cwd=str(ROOT), capture_output=True, text=True, timeout=300
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip().endswith("ok")
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.evaluator.core import Evaluator
+from src.models.inputs import PointInputs
+from tools.scan_cartography import build_cartography_report
+
+
+def _kw() -> dict:
+    base = PointInputs(R0_m=1.85, a_m=0.57, kappa=1.8, Bt_T=12.2, Ip_MA=8.7, Ti_keV=12.0, fG=0.8, Paux_MW=25.0)
+    return dict(
+        base_inputs=base,
+        x_key="Ip_MA",
+        y_key="fG",
+        x_vals=[7.0, 8.5, 10.0],
+        y_vals=[0.6, 0.9],
+        intents=["Reactor", "Research"],
+        include_outputs=True,
+    )
+
+
+def test_process_engine_report_and_progress_match_serial() -> None:
+    seen_serial: list = []
+    seen_process: list = []
+    serial = build_cartography_report(evaluator=Evaluator(), progress_cb=lambda d, t: seen_serial.append((d, t)), **_kw())
+    process = build_cartography_report(
+        evaluator=Evaluator(),
+        engine="process",
+        max_workers=2,
+        progress_cb=lambda d, t: seen_process.append((d, t)),
+        **_kw(),
+    )
+    assert json.dumps(process, sort_keys=True, default=str) == json.dumps(serial, sort_keys=True, default=str)
+    assert seen_process == seen_serial
+    assert [(p["j"], p["i"]) for p in process["points"]] == sorted((p["j"], p["i"]) for p in serial["points"])
+
+
+def test_unknown_engine_rejected() -> None:
+    with pytest.raises(ValueError):
+        build_cartography_report(evaluator=Evaluator(), engine="threads", **_kw())
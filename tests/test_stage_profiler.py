@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from src.evaluator.cache_key import sha256_cache_key
+from src.models.inputs import PointInputs
+from src.physics.hot_ion import hot_ion_point
+from src.physics.stage_profiler import (
+    collapsed_stacks,
+    set_stage_profiling,
+    stage_profiling_enabled,
+    write_collapsed_stacks,
+)
+
+
+def _base(**kw) -> PointInputs:
+    return PointInputs(R0_m=1.81, a_m=0.62, kappa=1.8, Bt_T=12.2, Ip_MA=7.5, Ti_keV=10.0, fG=0.8, Paux_MW=25.0, **kw)
+
+
+@pytest.fixture()
+def profiling():
+    prev = stage_profiling_enabled()
+    set_stage_profiling(True)
+    yield
+    set_stage_profiling(prev)
+
+
+def test_profile_off_by_default() -> None:
+    out = hot_ion_point(_base(enable_point_cache=False))
+    assert "_stage_timings_ms" not in out
+
+
+def test_profile_stages_table_sums_to_total(profiling) -> None:
+    out = hot_ion_point(_base())
+    tab = out["_stage_timings_ms"]
+    for sec in ("profile_build", "fusion_power", "radial_stack", "overlays_post_truth", "authority_warnings"):
+        assert sec in tab, sec
+    assert any(k.startswith("overlays_post_truth/") for k in tab)
+    assert any(k.startswith("overlays_neutronics/") for k in tab)
+    parts = sum(v for k, v in tab.items() if k != "total")
+    assert abs(parts - tab["total"]) <= 1e-6 * max(1.0, tab["total"]) + 1e-6
+    # Profiled points bypass the point cache: every call is a fresh evaluation,
+    # and the unprofiled (cached) result of the same point never carries a table.
+    tab["total"] = -1.0
+    set_stage_profiling(False)
+    assert "_stage_timings_ms" not in hot_ion_point(_base())
+    set_stage_profiling(True)
+    again = hot_ion_point(_base())["_stage_timings_ms"]
+    assert again["total"] > 0.0 and set(again) >= {"profile_build", "overlays_post_truth"}
+
+
+def test_profiling_switch_does_not_change_input_keys() -> None:
+    assert "profile_stages" not in {f.name for f in dataclasses.fields(PointInputs)}
+    prev = stage_profiling_enabled()
+    keys = []
+    try:
+        for on in (False, True):
+            set_stage_profiling(on)
+            keys.append((_base().fingerprint(), sha256_cache_key(_base())))
+    finally:
+        set_stage_profiling(prev)
+    assert keys[0] == keys[1]
+
+
+def test_collapsed_stacks_roundtrip(tmp_path: Path) -> None:
+    lines = collapsed_stacks({"fusion_power": 1.5, "overlays/v402": 0.25, "idle": 0.0, "total": 1.75})
+    assert lines == ["hot_ion_point;fusion_power 1500", "hot_ion_point;overlays;v402 250"]
+    p = write_collapsed_stacks(lines, tmp_path / "prof" / "stacks.txt")
+    write_collapsed_stacks(lines[:1], p)
+    assert p.read_text(encoding="utf-8").splitlines() == lines + lines[:1]
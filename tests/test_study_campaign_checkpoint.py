@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+
+import studies.runner as runner
+from src.campaign.eval import evaluate_campaign_candidates, write_results_jsonl
+from src.campaign.spec import CampaignSpec, CampaignVariable, GeneratorSpec, ProfileContractSpec
+from src.evaluator.core import Evaluator
+from src.models.reference_machines import REFERENCE_MACHINES
+from shams_io.checkpoint import CaseCheckpoint, case_fingerprint
+from studies.spec import StudySpec, SweepVar
+
+
+def _interrupt(path, keep: int) -> None:
+    """Simulate a crash: keep the first ``keep`` records plus a torn line."""
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    path.write_text("".join(lines[:keep]) + lines[keep][: len(lines[keep]) // 2], encoding="utf-8")
+
+
+def test_checkpoint_last_record_wins_and_skips_failed(tmp_path):
+    p = tmp_path / "ck.jsonl"
+    fp = case_fingerprint({"x": 1.0})
+    assert fp == case_fingerprint({"x": 1.0}) and fp != case_fingerprint({"x": 2.0})
+    with CaseCheckpoint(p) as ck:
+        ck.record(fp, {"v": 1}, status="failed")
+    assert CaseCheckpoint(p).get(fp) is None
+    with CaseCheckpoint(p) as ck:
+        ck.record(fp, {"v": 2})
+    assert CaseCheckpoint(p).get(fp) == {"v": 2}
+    assert CaseCheckpoint(p, resume=False).get(fp) is None
+
+
+def test_resumed_study_matches_uninterrupted(tmp_path, monkeypatch):
+    spec = StudySpec(
+        name="resume",
+        targets={"H98": 1.0, "Q_DT_eqv": 5.0},
+        variables={"Ip_MA": [8.0, 4.0, 12.0], "fG": [0.8, 0.1, 1.2]},
+        sweeps=[SweepVar("Bt_T", [5.0, 5.5, 6.0])],
+        max_iter=2,
+        use_sqlite_index=True,
+    )
+    full = runner.run_study(spec, tmp_path / "full")
+
+    part = tmp_path / "part"
+    runner.run_study(spec, part)
+    _interrupt(part / runner.CHECKPOINT_FILENAME, keep=1)
+    (part / "case_0002.json").unlink()
+
+    calls = []
+    worker = runner._run_case_worker
+    monkeypatch.setattr(runner, "_run_case_worker", lambda a: calls.append(a["idx"]) or worker(a))
+    resumed = runner.run_study(spec, part, resume=True)
+
+    assert calls == [1, 2]
+    strip = lambda rows: [{k: v for k, v in r.items() if k != "path"} for r in rows]  # noqa: E731
+    assert json.dumps(strip(resumed["cases"])) == json.dumps(strip(full["cases"]))
+    ref_a, ref_b = dict(resumed["reference_design"] or {}), dict(full["reference_design"] or {})
+    ref_a.pop("artifact_path", None)
+    ref_b.pop("artifact_path", None)
+    assert ref_a == ref_b
+    assert resumed["nonfeasibility_certificate"] == full["nonfeasibility_certificate"]
+
+    # Everything is checkpointed now: a second resume evaluates nothing.
+    calls.clear()
+    runner.run_study(spec, part, resume=True)
+    assert calls == []
+
+
+def test_resumed_campaign_matches_uninterrupted(tmp_path):
+    base = dict(next(iter(REFERENCE_MACHINES.values())))
+    spec = CampaignSpec(
+        schema="shams_campaign.v1",
+        name="ck",
+        intent="Research",
+        evaluator_label="hot_ion_point",
+        variables=[CampaignVariable(name="Ip_MA", kind="float", lo=6.0, hi=12.0)],
+        fixed_inputs=base,
+        generator=GeneratorSpec(mode="passthrough", n=3),
+        profile_contracts=ProfileContractSpec(tier="optimistic", preset="C8"),
+        include_full_artifact=True,
+    )
+    cands = [{"cid": "c0", "Ip_MA": 7.0}, {"cid": "c1", "Ip_MA": 9.0}, {"cid": "bad", "not_an_input": 1.0}]
+
+    rows, summary = evaluate_campaign_candidates(spec, cands)
+
+    ck = tmp_path / "ck.jsonl"
+    first, _ = evaluate_campaign_candidates(spec, cands, checkpoint_path=ck)
+    _interrupt(ck, keep=1)
+
+    class Counting:
+        def __init__(self):
+            self.ev = Evaluator(label=spec.evaluator_label, cache_enabled=False)
+            self.inputs = []
+
+        def evaluate(self, inp, **kw):
+            self.inputs.append(float(inp.Ip_MA))
+            return self.ev.evaluate(inp, **kw)
+
+    ev = Counting()
+    rows2, summary2 = evaluate_campaign_candidates(spec, cands, evaluator=ev, checkpoint_path=ck)
+
+    assert 7.0 not in ev.inputs and 9.0 in ev.inputs
+    assert summary2 == summary
+    # Artifacts differ only in their timestamps between runs; the replayed one is the checkpointed one.
+    write_results_jsonl(rows, tmp_path / "full.jsonl", include_artifact=False)
+    write_results_jsonl(rows2, tmp_path / "resumed.jsonl", include_artifact=False)
+    assert (tmp_path / "resumed.jsonl").read_text() == (tmp_path / "full.jsonl").read_text()
+    assert json.dumps(rows2[0].artifact, sort_keys=True) == json.dumps(first[0].artifact, sort_keys=True)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from studies.index_db import INDEX_COLUMNS, SQLiteIndex, index_columns
+from studies.runner import run_study
+from studies.spec import StudySpec, SweepVar
+
+
+def _art(R0: float, Q: float, feasible: bool, dominant: str | None) -> dict:
+    return {
+        "inputs": {"R0_m": R0, "Bt_T": 5.3},
+        "outputs": {"P_e_net_MW": 10.0 * Q},
+        "kpis": {"Q_DT_eqv": Q, "feasible_hard": feasible, "min_hard_margin": 0.1 if feasible else -0.2},
+        "constraints_summary": {"worst_hard": dominant},
+    }
+
+
+def test_batched_wal_index_and_queries(tmp_path):
+    db = SQLiteIndex(tmp_path / "index.sqlite", batch_size=2)
+    assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    cases = [(6.2, 12.0, True, None), (5.8, 15.0, True, None), (6.0, 8.0, True, None), (5.5, 30.0, False, "q_div")]
+    for i, (R0, Q, ok, dom) in enumerate(cases):
+        db.add_case(i, True, 3, "converged", f"case_{i}.json", columns=index_columns(_art(R0, Q, ok, dom)))
+    # first batch is written, the remainder stays queued until flush/query
+    assert db.conn.execute("SELECT COUNT(*) FROM cases").fetchone()[0] == 4
+
+    rows = db.feasible_cases(min_Q=10.0)
+    assert [r["case_id"] for r in rows] == [1, 0]
+    assert rows[0]["R0_m"] == 5.8 and rows[0]["P_e_net_MW"] == 150.0
+    rows = db.query_cases(where=[("Q", ">=", 8.0)], order_by="Q", descending=True, limit=2)
+    assert [r["case_id"] for r in rows] == [3, 1]
+    assert db.dominant_constraint_counts() == {"q_div": 1}
+    with pytest.raises(ValueError):
+        db.query_cases(where=[("Q; DROP TABLE cases", ">", 1)])
+    with pytest.raises(ValueError):
+        db.query_cases(where=[("Q", "LIKE", 1)])
+    db.close()
+
+
+def test_legacy_index_file_is_migrated(tmp_path):
+    p = tmp_path / "index.sqlite"
+    conn = sqlite3.connect(p)
+    conn.execute("CREATE TABLE cases (case_id INTEGER PRIMARY KEY, ok INTEGER, iters INTEGER, message TEXT, artifact_path TEXT)")
+    conn.execute("INSERT INTO cases VALUES (0, 1, 2, 'converged', 'case_0000.json')")
+    conn.commit()
+    conn.close()
+    with SQLiteIndex(p) as db:
+        rows = db.query_cases()
+        assert rows[0]["case_id"] == 0 and set(INDEX_COLUMNS) <= set(rows[0])
+
+
+def test_run_study_fills_index_columns(tmp_path):
+    spec = StudySpec(
+        name="idx",
+        targets={"H98": 1.0, "Q_DT_eqv": 5.0},
+        variables={"Ip_MA": [8.0, 4.0, 12.0], "fG": [0.8, 0.1, 1.2]},
+        sweeps=[SweepVar("R0_m", [6.0, 6.4])],
+        max_iter=2,
+        use_sqlite_index=True,
+    )
+    idx = run_study(spec, tmp_path)
+    assert all("_index" not in r for r in idx["cases"])
+    with SQLiteIndex(tmp_path / "index.sqlite") as db:
+        rows = db.query_cases(order_by="R0_m", descending=True)
+        assert [r["R0_m"] for r in rows] == [6.4, 6.0]
+        assert all(r["Q"] is not None and r["dominant_constraint"] for r in rows)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import math
+
+from decision.reference_design import synthesize_reference_design
+from studies.result_store import ColumnarStudyStore
+from studies.runner import run_study
+from studies.spec import StudySpec, SweepVar
+
+
+def _artifact(i: int, *, feasible: bool, kpis: dict, outputs: dict | None = None, dg=None) -> dict:
+    art = {
+        "inputs": {"Ip_MA": 8.0 + i, "fG": 0.8, "magnet_technology": "HTS_REBCO"},
+        "outputs": outputs or {},
+        "kpis": kpis,
+        "constraints": [
+            {"name": "q95", "severity": "hard", "passed": True, "margin_frac": 0.2},
+            {"name": "beta_N", "severity": "hard", "passed": feasible, "margin_frac": 0.1 if feasible else -0.3},
+            {"name": "TBR", "severity": "soft", "passed": False, "margin_frac": -0.05},
+        ],
+        "input_hash": f"h{i}",
+        "meta": {"mode": "study"},
+    }
+    if dg is not None:
+        art["decision"] = {"decision_grade_ok": dg}
+    return art
+
+
+def test_reference_design_from_columns_matches_artifacts(tmp_path):
+    arts = [
+        _artifact(0, feasible=True, kpis={"P_e_net_MW": 300.0, "COE_$MWh": 90.0, "min_hard_margin": 0.1}),
+        _artifact(1, feasible=True, kpis={"P_e_net_MW": 500.0, "coe_$MWh": 120.0, "min_hard_margin": float("nan")}),
+        _artifact(2, feasible=False, kpis={"P_e_net_MW": 900.0, "COE_$MWh": 50.0}),
+        _artifact(3, feasible=True, kpis={"COE_$MWh": None}, outputs={"P_e_net_MW": 450.0, "coe_$MWh": 70.0}),
+        _artifact(4, feasible=True, kpis={"P_e_net_MW": 800.0, "COE_$MWh": 60.0}, dg=False),
+    ]
+    store = ColumnarStudyStore(tmp_path)
+    for i, a in enumerate(arts):
+        store.add_case({"case": i, "ok": True, "iters": 3, "message": "converged"}, a)
+
+    for waive in (False, True):
+        ref_cols = store.reference_design(waive_decision_grade=waive)
+        ref_arts = synthesize_reference_design(arts, waive_decision_grade=waive)
+        ref_cols.pop("artifact_path")
+        ref_arts.pop("artifact_path")
+        assert ref_cols == ref_arts
+
+    assert store.n_hard_feasible() == 4
+    assert store.column("input", "Ip_MA").tolist() == [8.0, 9.0, 10.0, 11.0, 12.0]
+    assert "magnet_technology" not in store.keys("input")
+    passed = store.column("passed", "beta_N").tolist()
+    assert passed == [1.0, 1.0, 0.0, 1.0, 1.0]
+    assert math.isnan(store.column("kpi", "min_hard_margin")[1])
+    assert store.load_artifact(3) == json.loads(json.dumps(arts[3]))
+    store.close()
+
+
+def test_columnar_study_matches_json_study(tmp_path):
+    kw = dict(
+        name="cols",
+        targets={"H98": 1.0, "Q_DT_eqv": 5.0},
+        variables={"Ip_MA": [8.0, 4.0, 12.0], "fG": [0.8, 0.1, 1.2]},
+        sweeps=[SweepVar("Bt_T", [5.0, 6.0])],
+        max_iter=2,
+    )
+    idx_json = run_study(StudySpec(**kw), tmp_path / "json")
+    idx_cols = run_study(StudySpec(result_store="columnar", **kw), tmp_path / "cols")
+
+    assert not list((tmp_path / "cols").glob("case_*.json"))
+    strip = lambda rows: [{k: v for k, v in r.items() if k != "path"} for r in rows]  # noqa: E731
+    assert json.dumps(strip(idx_cols["cases"]), default=str) == json.dumps(strip(idx_json["cases"]), default=str)
+    assert idx_cols["nonfeasibility_certificate"] == idx_json["nonfeasibility_certificate"]
+
+    summary = json.loads((tmp_path / "cols" / "study_summary.json").read_text(encoding="utf-8"))
+    assert summary["result_store"]["kind"] == "columnar"
+    assert summary["n_cases"] == 2
+
+    store = ColumnarStudyStore(tmp_path / "cols")
+    assert store.column("input", "Bt_T").tolist() == [5.0, 6.0]
+    assert store.load_artifact(1)["inputs"]["Bt_T"] == 6.0
+    store.close()
+
+
+def test_reference_design_without_sidecar_has_no_artifact_path(tmp_path):
+    store = ColumnarStudyStore(tmp_path, sidecar=False)
+    store.add_case({"case": 0, "ok": True}, _artifact(0, feasible=True, kpis={"P_e_net_MW": 300.0, "COE_$MWh": 90.0}))
+    ref = store.reference_design()
+    assert ref is not None and ref["artifact_path"] is None
+    assert not store.sidecar_path.exists() and store.load_artifact(0) is None
+    store.close()
+
+
+def test_fresh_rerun_into_same_directory_drops_previous_cases(tmp_path):
+    kw = dict(name="rerun", targets={"H98": 1.0}, variables={"Ip_MA": [8.0, 4.0, 12.0]}, max_iter=2, result_store="columnar")
+    run_study(StudySpec(sweeps=[SweepVar("Bt_T", [5.5, 6.0, 7.0, 8.0])], **kw), tmp_path)
+    idx = run_study(StudySpec(sweeps=[SweepVar("Bt_T", [6.5])], **kw), tmp_path)
+    store = ColumnarStudyStore(tmp_path)
+    assert store.case_ids().tolist() == [0]
+    assert store.column("input", "Bt_T").tolist() == [6.5]
+    assert store.load_artifact(1) is None
+    assert store.n_hard_feasible() == sum(1 for r in idx["cases"] if r.get("hard_feasible"))
+    store.close()
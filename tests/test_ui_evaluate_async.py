@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from src.models.inputs import PointInputs
+from ui_nicegui import evaluate as uev
+
+
+def _inp(Paux_MW: float) -> PointInputs:
+    return PointInputs(R0_m=1.85, a_m=0.57, kappa=1.8, Bt_T=12.2, Ip_MA=8.7, Ti_keV=12.0, fG=0.85, Paux_MW=Paux_MW)
+
+
+def _canon(out) -> str:
+    return json.dumps(out, sort_keys=True, default=str)
+
+
+@pytest.fixture()
+def pool_env(monkeypatch):
+    monkeypatch.setenv("SHAMS_UI_EVAL_WORKERS", "2")
+    monkeypatch.setenv("SHAMS_UI_SESSION_CONCURRENCY", "2")
+    uev._EVALUATOR_POOL.clear()
+    yield
+    uev.shutdown_ui_pool()
+    uev._EVALUATOR_POOL.clear()
+
+
+def test_async_batch_matches_sync_and_fills_shared_cache(pool_env) -> None:
+    inps = [_inp(20.0 + i) for i in range(3)]
+    seen = []
+    outs = asyncio.run(
+        uev.ui_evaluate_batch_async(inps, origin="test:async", session="s1", progress_cb=lambda d, t: seen.append((d, t)))
+    )
+    assert seen[-1] == (3, 3)
+    ev = uev._get_evaluator(label="test:async")
+    st0 = ev.cache_stats()
+    assert st0["size"] == 3  # worker results stored into the process-local cache
+    for inp, out in zip(inps, outs):
+        assert _canon(uev.ui_evaluate(inp, origin="test:async")) == _canon(out)
+    assert ev.cache_stats()["hits"] == st0["hits"] + 3
+
+
+def test_async_thread_fallback_and_cancel(monkeypatch) -> None:
+    monkeypatch.setenv("SHAMS_UI_EVAL_WORKERS", "0")
+    monkeypatch.setenv("SHAMS_UI_SESSION_CONCURRENCY", "1")
+    uev._EVALUATOR_POOL.clear()
+
+    async def _run():
+        outs = await uev.ui_evaluate_batch_async([_inp(30.0), _inp(31.0)], origin="test:t", session="s2")
+        t = asyncio.ensure_future(uev.ui_evaluate_batch_async([_inp(40.0 + i) for i in range(8)], origin="test:t", session="s2"))
+        await asyncio.sleep(0.05)
+        t.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await t
+        return outs
+
+    outs = asyncio.run(_run())
+    assert len(outs) == 2 and all(isinstance(o, dict) and o for o in outs)
+    # Cancelled before most points ran: the shared cache holds far fewer than 10 entries.
+    assert uev._get_evaluator(label="test:t").cache_stats()["size"] < 10
+    uev._EVALUATOR_POOL.clear()
+
+
+def test_end_session_prunes_gates_and_inflight(monkeypatch) -> None:
+    monkeypatch.setenv("SHAMS_UI_EVAL_WORKERS", "0")
+    uev._EVALUATOR_POOL.clear()
+
+    async def _run():
+        await uev.ui_evaluate_async(_inp(50.0), origin="test:end", session="s3")
+        assert "s3" not in uev._SESSION_INFLIGHT  # emptied sets are dropped as work finishes
+        assert any(k[1] == "s3" for k in uev._SESSION_SEMAPHORES)
+        uev.end_session("s3")
+
+    asyncio.run(_run())
+    assert not any(k[1] == "s3" for k in uev._SESSION_SEMAPHORES)
+    assert "s3" not in uev._SESSION_INFLIGHT
+    uev._EVALUATOR_POOL.clear()
+
+
+def test_dead_worker_fails_only_its_own_task(pool_env) -> None:
+    pool = uev._get_ui_pool()
+    lost = pool.submit(os._exit, 1)
+    assert isinstance(lost.exception(timeout=120), pool.LOST_TASK_ERRORS)
+    outs = asyncio.run(uev.ui_evaluate_batch_async([_inp(60.0), _inp(61.0)], origin="test:crash", session="s4"))
+    assert all(isinstance(o, dict) and o for o in outs)
+    assert uev._get_ui_pool() is pool and pool.stats()["crashes"] == 1
+
+
+def test_queued_duplicates_hit_the_cache(pool_env, monkeypatch) -> None:
+    monkeypatch.setenv("SHAMS_UI_SESSION_CONCURRENCY", "1")
+    outs = asyncio.run(uev.ui_evaluate_batch_async([_inp(70.0)] * 3, origin="test:dup", session="s5"))
+    assert len({_canon(o) for o in outs}) == 1
+    assert uev._get_ui_pool().stats()["submitted"] == 1
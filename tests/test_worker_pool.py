@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+from concurrent.futures import Future
+
+import pytest
+
+import studies.runner as runner
+from src.campaign.eval import evaluate_campaign_candidates
+from src.campaign.spec import CampaignSpec, CampaignVariable, GeneratorSpec, ProfileContractSpec
+from src.evaluator.worker_pool import TaskTimeout, WarmWorkerPool, WorkerCrashed
+from src.models.inputs import PointInputs
+from src.models.reference_machines import REFERENCE_MACHINES
+from src.solvers.evaluator_bridge import evaluate_point
+from src.uq_contracts import Interval, UncertaintyContractSpec, run_uncertainty_contract_for_point
+from studies.spec import StudySpec, SweepVar
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with WarmWorkerPool(2, task_timeout_s=120.0) as p:
+        assert p.wait_ready(120.0)
+        yield p
+
+
+def test_pool_isolates_crashes_timeouts_and_errors(pool) -> None:
+    assert pool.map(math.sqrt, [0.0, 4.0, 9.0]) == [0.0, 2.0, 3.0]
+    pids = {pool.submit(os.getpid).result() for _ in range(4)}
+
+    crashed = pool.submit(os._exit, 3)
+    slow = pool.submit(time.sleep, 30.0, timeout_s=0.5)
+    fine = pool.submit(math.sqrt, 16.0)
+    assert isinstance(crashed.exception(), WorkerCrashed)
+    assert isinstance(slow.exception(), TaskTimeout)
+    assert fine.result() == 4.0
+    with pytest.raises(ValueError):
+        pool.submit(int, "not a number").result()
+    assert isinstance(pool.map(int, ["1", "x"], return_exceptions=True)[1], ValueError)
+
+    st = pool.stats()
+    assert st["crashes"] == 1 and st["timeouts"] == 1 and st["n_workers"] == 2
+    assert st["workers_started"] == 4  # two replacements, the rest stayed alive
+    assert pids and all(p != os.getpid() for p in pids)
+
+
+def _uq_case():
+    base = PointInputs(R0_m=1.81, a_m=0.62, kappa=1.8, Bt_T=10.0, Ip_MA=8.0, Ti_keV=10.0, fG=0.8, Paux_MW=50.0)
+    spec = UncertaintyContractSpec(name="uq", intervals={"Paux_MW": Interval(lo=45.0, hi=55.0), "fG": Interval(lo=0.7, hi=0.9)})
+    return base, spec
+
+
+def test_uq_contract_with_pool_matches_serial(pool) -> None:
+    base, spec = _uq_case()
+    serial = run_uncertainty_contract_for_point(base, spec, include_corner_artifacts=False)
+    submitted = pool.stats()["submitted"]
+    pooled = run_uncertainty_contract_for_point(base, spec, include_corner_artifacts=False, pool=pool)
+    assert pool.stats()["submitted"] == submitted + 4
+    assert json.dumps(pooled["summary"], sort_keys=True) == json.dumps(serial["summary"], sort_keys=True)
+
+    # A caller-supplied evaluate_fn is honoured for every corner: the pool is not used.
+    calls = []
+    fn = lambda inp: calls.append(inp) or evaluate_point(inp, origin="uq_contract")  # noqa: E731
+    run_uncertainty_contract_for_point(base, spec, evaluate_fn=fn, include_corner_artifacts=False, pool=pool)
+    assert len(calls) == 5 and pool.stats()["submitted"] == submitted + 4
+
+
+def test_uq_contract_lost_corner_counts_as_infeasible() -> None:
+    class _LosingPool:
+        LOST_TASK_ERRORS = WarmWorkerPool.LOST_TASK_ERRORS
+
+        def __init__(self):
+            self.n = 0
+
+        def submit(self, fn, *args, **kwargs):
+            fut = Future()
+            self.n += 1
+            if self.n == 2:
+                fut.set_exception(WorkerCrashed("worker exited"))
+            else:
+                fut.set_result(fn(*args, **kwargs))
+            return fut
+
+    base, spec = _uq_case()
+    feas = lambda res: [c["corner_constraints_summary"]["feasible"] for c in res["corners"]]  # noqa: E731
+    serial = feas(run_uncertainty_contract_for_point(base, spec))
+    res = run_uncertainty_contract_for_point(base, spec, pool=_LosingPool())
+    assert res["summary"]["n_eval_errors"] == 1
+    assert "WorkerCrashed" in res["corners"][1]["corner_constraints_summary"]["eval_error"]
+    assert feas(res) == serial[:1] + [False] + serial[2:]
+    assert res["summary"]["n_feasible"] == sum(feas(res))
+
+
+def test_campaign_and_study_with_pool_match_serial(pool, tmp_path) -> None:
+    spec = CampaignSpec(
+        schema="shams_campaign.v1",
+        name="pool",
+        intent="Research",
+        evaluator_label="hot_ion_point",
+        variables=[CampaignVariable(name="Ip_MA", kind="float", lo=6.0, hi=12.0)],
+        fixed_inputs=dict(next(iter(REFERENCE_MACHINES.values()))),
+        generator=GeneratorSpec(mode="passthrough", n=3),
+        profile_contracts=ProfileContractSpec(tier="optimistic", preset="C8"),
+        include_full_artifact=False,
+    )
+    cands = [{"cid": f"c{i}", "Ip_MA": ip} for i, ip in enumerate([7.0, 9.0, 11.0])] + [{"cid": "bad", "R0_m": -1.0}]
+    rows_s, summ_s = evaluate_campaign_candidates(spec, cands)
+    rows_p, summ_p = evaluate_campaign_candidates(spec, cands, pool=pool)
+    assert rows_p == rows_s and summ_p == summ_s
+
+    study = StudySpec(
+        name="pool",
+        targets={"H98": 1.0},
+        variables={"Ip_MA": [8.0, 4.0, 12.0]},
+        sweeps=[SweepVar("Bt_T", [5.0, 6.0])],
+        max_iter=2,
+    )
+    serial = runner.run_study(study, tmp_path / "serial")
+    pooled = runner.run_study(study, tmp_path / "pooled", pool=pool)
+    strip = lambda rows: [{k: v for k, v in r.items() if k != "path"} for r in rows]  # noqa: E731
+    assert json.dumps(strip(pooled["cases"])) == json.dumps(strip(serial["cases"]))
@@ -0,0 +1,59 @@
+from __future__ import annotations
+"""CLI: import-time report and out-of-tree bytecode cache
+
+Examples:
+  python -m tools.cli_import_time                       # slowest modules imported by physics.hot_ion
+  python -m tools.cli_import_time --module evaluator.core --top 40
+  python -m tools.cli_import_time --compare             # no bytecode vs cold vs warm cache
+  python -m tools.cli_import_time --print-cache-dir
+
+The cache itself is enabled per process with SHAMS_BYTECODE_CACHE=1 (or a
+directory); see src/utils/bytecode_cache.py.
+"""
+
+import argparse, json, tempfile
+
+from src.utils.bytecode_cache import (
+    format_import_report,
+    import_time_report,
+    requested_bytecode_cache_dir,
+    user_cache_dir,
+)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--module", default="physics.hot_ion")
+    ap.add_argument("--top", type=int, default=25)
+    ap.add_argument("--compare", action="store_true", help="Time no-bytecode, cold-cache and warm-cache imports")
+    ap.add_argument("--json", action="store_true", help="Print the raw report(s) as JSON")
+    ap.add_argument("--print-cache-dir", action="store_true")
+    args = ap.parse_args()
+
+    if args.print_cache_dir:
+        print(requested_bytecode_cache_dir() or user_cache_dir())
+        return 0
+
+    if not args.compare:
+        rep = import_time_report(args.module, top=args.top)
+        print(json.dumps(rep, indent=2) if args.json else format_import_report(rep))
+        return 0 if rep["ok"] else 1
+
+    with tempfile.TemporaryDirectory(prefix="shams_pycache_") as tmp:
+        reps = {
+            "no_bytecode": import_time_report(args.module, top=args.top, bytecode_cache=None),
+            "cold_cache": import_time_report(args.module, top=args.top, bytecode_cache=tmp),
+            "warm_cache": import_time_report(args.module, top=args.top, bytecode_cache=tmp),
+        }
+    if args.json:
+        print(json.dumps(reps, indent=2))
+    else:
+        for label, rep in reps.items():
+            print(f"[{label}] wall {rep['wall_s']:.2f} s, {rep['n_modules']} modules")
+        print()
+        print(format_import_report(reps["warm_cache"]))
+    return 0 if all(r["ok"] for r in reps.values()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
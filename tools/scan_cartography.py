@@ -393,6 +393,180 @@ def _build_field_cube(points: List[Dict[str, Any]], *, x_vals: List[float], y_va
 
 
 
+_COMPACT_OUTPUT_KEYS = [
+    "Q",
+    "Q_DT_eqv",
+    "H98",
+    "H_IPB98y2",
+    "Pfus_total_MW",
+    "P_fus_MW",
+    "Pfus_MW",
+    "Pfus_DT_adj_MW",
+    "P_e_net_MW",
+    "P_net_e_MW",
+    "Pe_net_MW",
+    "q_div_MW_m2",
+    "B_peak_T",
+    "q95_proxy",
+    "q95",
+    "beta_N",
+    "betaN_proxy",
+    "betaN",
+    "tauE_eff_s",
+    "tauE_s",
+    "fG",
+]
+
+SCAN_ENGINES = ("serial", "process")
+
+
+def _cell_inputs(base_inputs: Any, x_key: str, y_key: str, x: float, y: float) -> Any:
+    # dataclass (frozen) => use replace if available
+    try:
+        from dataclasses import replace
+        return replace(base_inputs, **{x_key: float(x), y_key: float(y)})
+    except Exception:
+        # fallback: shallow copy dict
+        d = getattr(base_inputs, "__dict__", {})
+        d2 = dict(d)
+        d2[x_key] = float(x)
+        d2[y_key] = float(y)
+        return type(base_inputs)(**d2)
+
+
+def _scan_cell(
+    evaluator,
+    base_inputs: Any,
+    x_key: str,
+    y_key: str,
+    i: int,
+    j: int,
+    x: float,
+    y: float,
+    intents: List[str],
+    include_outputs: bool,
+    include_margins: bool,
+) -> Dict[str, Any]:
+    """Evaluate one grid cell and build its report row (intent lens, margins, outputs)."""
+    inp = _cell_inputs(base_inputs, x_key, y_key, x, y)
+    res = evaluator.evaluate(inp)
+    out = dict(res.out or {})
+    cons = _constraints_for_scan(out, inp)
+
+    # Per-intent feasibility
+    intent_summ = {it: intent_feasible(cons, it) for it in intents}
+
+    row = {
+        "i": int(i),
+        "j": int(j),
+        "x": float(x),
+        "y": float(y),
+        "inputs": {x_key: float(x), y_key: float(y)},
+        "intent": intent_summ,
+        "failure_order_any": [str(c.get("name")) for c in failure_order(cons, only_failed=True)[:6]],
+    }
+
+    # Optional: include hard-constraint margins for iso-contours and interaction analysis.
+    # Keep this compact: name -> margin_frac, only for hard constraints.
+    if include_margins:
+        mh: Dict[str, float] = {}
+        for c in cons or []:
+            if not isinstance(c, dict):
+                continue
+            if str(c.get("severity", "hard")).lower() != "hard":
+                continue
+            nm = str(c.get("name", "")).strip()
+            if not nm:
+                continue
+            m = _margin(c)
+            if _finite(m):
+                mh[nm] = float(m)
+        row["margins_hard"] = mh
+    if include_outputs:
+        # keep it compact; prefer L0 keys (+ legacy aliases if present)
+        row["outputs"] = {k: out.get(k) for k in _COMPACT_OUTPUT_KEYS if k in out and out.get(k) is not None}
+    return row
+
+
+# -----------------------------
+# Process-pool scan engine
+# -----------------------------
+
+# Per-worker scan context, set once by _init_scan_worker (lives in the worker process).
+_WORKER_SCAN: Dict[str, Any] = {}
+
+
+def _init_scan_worker(spec: Dict[str, Any]) -> None:
+    """Worker initializer: import the evaluator/constraint stack and warm contracts once."""
+    try:
+        from src.evaluator.core import Evaluator  # type: ignore
+    except ImportError:
+        from evaluator.core import Evaluator  # type: ignore
+    try:
+        from constraints.constraints import evaluate_constraints  # noqa: F401
+    except ImportError:
+        from src.constraints.constraints import evaluate_constraints  # type: ignore  # noqa: F401
+
+    # Scan rows never read model cards, so the worker skips the audit copy.
+    ev = Evaluator(label=str(spec.get("label") or "hot_ion_point"), cache_enabled=True, model_cards="lazy")
+    base = spec["base_inputs"]
+    try:
+        # One evaluation of the base point loads every contract into the
+        # process-wide registry before the first real cell arrives.
+        _constraints_for_scan(dict(ev.evaluate(base).out or {}), base)
+    except Exception:
+        pass
+    _WORKER_SCAN.clear()
+    _WORKER_SCAN.update(spec)
+    _WORKER_SCAN["evaluator"] = ev
+
+
+def _scan_cell_worker(cell: Tuple[int, int, float, float]) -> Dict[str, Any]:
+    i, j, x, y = cell
+    w = _WORKER_SCAN
+    return _scan_cell(
+        w["evaluator"], w["base_inputs"], w["x_key"], w["y_key"], i, j, x, y,
+        w["intents"], w["include_outputs"], w["include_margins"],
+    )
+
+
+def _iter_scan_rows_process(
+    *,
+    evaluator,
+    base_inputs,
+    x_key: str,
+    y_key: str,
+    cells: List[Tuple[int, int, float, float]],
+    intents: List[str],
+    include_outputs: bool,
+    include_margins: bool,
+    n_workers: int,
+) -> Iterable[Dict[str, Any]]:
+    """Yield rows for ``cells`` in grid order, evaluated across spawn-context worker processes."""
+    import multiprocessing as mp
+    from concurrent.futures import ProcessPoolExecutor
+
+    spec = {
+        "label": getattr(evaluator, "label", None),
+        "base_inputs": base_inputs,
+        "x_key": x_key,
+        "y_key": y_key,
+        "intents": list(intents),
+        "include_outputs": bool(include_outputs),
+        "include_margins": bool(include_margins),
+    }
+    # ~4 chunks per worker: keeps workers busy while rows stream back in order.
+    chunksize = max(1, len(cells) // (4 * n_workers))
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_scan_worker,
+        initargs=(spec,),
+    ) as ex:
+        for row in ex.map(_scan_cell_worker, cells, chunksize=chunksize):
+            yield row
+
+
 def build_cartography_report(
     *,
     evaluator,
@@ -405,11 +579,22 @@ def build_cartography_report(
     include_outputs: bool = False,
     include_margins: bool = True,
     progress_cb=None,
+    engine: str = "serial",
+    max_workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Run a deterministic 2D scan and compute dominance/topology/intent split.
 
+    ``engine="process"`` splits the grid across ``max_workers`` spawn-context
+    worker processes (default: CPU count; one worker runs serially). Each worker builds its own
+    ``Evaluator`` (same label) and warms contracts once; rows stream back in
+    grid order, so ``progress_cb`` and the report are identical to the serial
+    engine. Wrapper side effects of ``evaluator`` (e.g. UI recording) are not
+    replayed inside the workers.
+
     Returns a JSON-serializable report.
     """
+    if engine not in SCAN_ENGINES:
+        raise ValueError(f"engine must be one of {SCAN_ENGINES}, got {engine!r}")
     if not intents:
         intents = ["Reactor"]
 
@@ -419,97 +604,35 @@ def build_cartography_report(
 
     # Evaluate all points once (constraints are intent-agnostic; policy lens applied later)
     total = max(len(x_vals) * len(y_vals), 1)
+    cells = [(i, j, x, y) for j, y in enumerate(y_vals) for i, x in enumerate(x_vals)]
+    n_workers = 1
+    if engine == "process":
+        import os
+        n_workers = max(1, min(int(max_workers or os.cpu_count() or 1), len(cells)))
+    if n_workers > 1:
+        rows = _iter_scan_rows_process(
+            evaluator=evaluator, base_inputs=base_inputs, x_key=x_key, y_key=y_key, cells=cells,
+            intents=intents, include_outputs=include_outputs, include_margins=include_margins,
+            n_workers=n_workers,
+        )
+    else:
+        rows = (
+            _scan_cell(evaluator, base_inputs, x_key, y_key, i, j, x, y, intents, include_outputs, include_margins)
+            for i, j, x, y in cells
+        )
+
     done = 0
-    for j, y in enumerate(y_vals):
-        for i, x in enumerate(x_vals):
-            inp = base_inputs
-            # dataclass (frozen) => use replace if available
+    for row in rows:
+        for it in intents:
+            ok_grid[it][row["j"]][row["i"]] = bool(row["intent"][it].get("blocking_feasible"))
+        pts.append(row)
+
+        done += 1
+        if callable(progress_cb) and (done == 1 or done == total or (done % max(1, total // 100) == 0)):
             try:
-                from dataclasses import replace
-                inp = replace(inp, **{x_key: float(x), y_key: float(y)})
+                progress_cb(done, total)
             except Exception:
-                # fallback: shallow copy dict
-                d = getattr(base_inputs, "__dict__", {})
-                d2 = dict(d)
-                d2[x_key] = float(x)
-                d2[y_key] = float(y)
-                inp = type(base_inputs)(**d2)
-
-            res = evaluator.evaluate(inp)
-            out = dict(res.out or {})
-            cons = _constraints_for_scan(out, inp)
-
-            # Per-intent feasibility
-            intent_summ = {}
-            for it in intents:
-                s = intent_feasible(cons, it)
-                intent_summ[it] = s
-                ok_grid[it][j][i] = bool(s.get("blocking_feasible"))
-
-            row = {
-                "i": int(i),
-                "j": int(j),
-                "x": float(x),
-                "y": float(y),
-                "inputs": {x_key: float(x), y_key: float(y)},
-                "intent": intent_summ,
-                "failure_order_any": [str(c.get("name")) for c in failure_order(cons, only_failed=True)[:6]],
-            }
-
-            # Optional: include hard-constraint margins for iso-contours and interaction analysis.
-            # Keep this compact: name -> margin_frac, only for hard constraints.
-            if include_margins:
-                mh: Dict[str, float] = {}
-                for c in cons or []:
-                    if not isinstance(c, dict):
-                        continue
-                    if str(c.get("severity", "hard")).lower() != "hard":
-                        continue
-                    nm = str(c.get("name", "")).strip()
-                    if not nm:
-                        continue
-                    m = _margin(c)
-                    if _finite(m):
-                        mh[nm] = float(m)
-                row["margins_hard"] = mh
-            if include_outputs:
-                # keep it compact; prefer L0 keys (+ legacy aliases if present)
-                keep = {
-                    k: out.get(k)
-                    for k in [
-                        "Q",
-                        "Q_DT_eqv",
-                        "H98",
-                        "H_IPB98y2",
-                        "Pfus_total_MW",
-                        "P_fus_MW",
-                        "Pfus_MW",
-                        "Pfus_DT_adj_MW",
-                        "P_e_net_MW",
-                        "P_net_e_MW",
-                        "Pe_net_MW",
-                        "q_div_MW_m2",
-                        "B_peak_T",
-                        "q95_proxy",
-                        "q95",
-                        "beta_N",
-                        "betaN_proxy",
-                        "betaN",
-                        "tauE_eff_s",
-                        "tauE_s",
-                        "fG",
-                    ]
-                    if k in out and out.get(k) is not None
-                }
-                row["outputs"] = keep
-            pts.append(row)
-
-            done += 1
-            if callable(progress_cb) and (done == 1 or done == total or (done % max(1, total // 100) == 0)):
-                try:
-                    progress_cb(done, total)
-                except Exception:
-                    pass
+                pass
 
     # Add local robustness labels
     for row in pts:
@@ -10,10 +10,11 @@ def main() -> int:
     ap.add_argument("spec", help="Path to StudySpec JSON/YAML")
     ap.add_argument("--out", default="study_out", help="Output directory")
     ap.add_argument("--label-prefix", default="", help="Prefix for per-case labels")
+    ap.add_argument("--resume", action="store_true", help="Skip cases already completed in --out (checkpoint.jsonl)")
     args = ap.parse_args()
 
     spec = StudySpec.from_path(args.spec)
-    idx = run_study(spec, args.out, label_prefix=args.label_prefix)
+    idx = run_study(spec, args.out, label_prefix=args.label_prefix, resume=args.resume)
     print(f"Wrote {idx['n_cases']} cases to {Path(args.out).resolve()}")
     return 0
 
@@ -1733,6 +1733,7 @@ def _run_verification_capture():
         )
         dt = time.time() - t0
         ok = (proc.returncode == 0) and os.path.exists(rep)
+        refresh_artifact_provenance()
         return ok, (proc.stdout or ""), (proc.stderr or ""), dt
     except Exception as e:
         dt = time.time() - t0
@@ -1756,6 +1757,7 @@ from constraints.constraints import evaluate_constraints
 from solvers.optimize import scan_feasible_and_pareto, pareto_front
 from docs.variable_registry import registry_dataframe
 from shams_io.run_artifact import build_run_artifact
+from shams_io.provenance import refresh_artifact_provenance
 from shams_io.plotting import plot_radial_build_from_artifact, plot_summary_pdf
 from solvers.sensitivity import finite_difference_sensitivities
 
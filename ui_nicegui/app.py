@@ -304,7 +304,18 @@ def _notify_on_uncaught_exception(exc: Exception) -> None:
 
 
 def main() -> None:
+    import multiprocessing
+
+    # Spawned evaluation-pool workers re-import this module as __mp_main__:
+    # never pick ports / open browsers there.
+    if multiprocessing.current_process().name != "MainProcess":
+        return
+    from ui_nicegui.evaluate import end_session, shutdown_ui_pool
+
     app.on_exception(_notify_on_uncaught_exception)
+    app.on_shutdown(shutdown_ui_pool)
+    # Evaluation sessions are keyed by client id: forget them when the client goes away.
+    app.on_delete(lambda client: end_session(client.id))
     host = os.environ.get("SHAMS_NICEGUI_HOST", "127.0.0.1")
     preferred = int(os.environ.get("SHAMS_NICEGUI_PORT", "8080"))
     port = _pick_port(host, preferred)
@@ -5,7 +5,7 @@ Evaluate path: build_point_inputs → direct or solver → session store.
 """
 from __future__ import annotations
 
-from nicegui import run, ui
+from nicegui import ui
 
 from ui_nicegui.components.empty_state import empty_state
 from ui_nicegui.components.mode_scope import render_mode_scope
@@ -14,7 +14,8 @@ from ui_nicegui.decks.point_designer.constraints import render_constraints
 from ui_nicegui.decks.point_designer.phase_envelopes import render_phase_envelopes
 from ui_nicegui.decks.point_designer.uncertainty_contracts import render_uncertainty_contracts
 from ui_nicegui.decks.point_designer.telemetry import render_telemetry
-from ui_nicegui.lib.pd_solver_helpers import run_point_designer_evaluation
+from ui_nicegui.evaluate import client_session
+from ui_nicegui.lib.pd_solver_helpers import run_point_designer_evaluation_async
 from ui_nicegui.lib.pd_workflow_labels import (
     DECISION_STATES,
     DECISION_TO_TAB,
@@ -161,7 +162,7 @@ def render_point_designer(session: DesignSession) -> None:
         try:
             base = session.build_point_inputs()
             notify_input_guardrails(base, context="Point Designer")
-            result = await run.io_bound(run_point_designer_evaluation, session)
+            result = await run_point_designer_evaluation_async(session, eval_session=client_session())
             if not lease_valid(lease):
                 ui.notify("Run was force-cleared — discarding evaluation results.", type="warning")
                 return
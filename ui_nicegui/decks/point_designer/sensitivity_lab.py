@@ -3,15 +3,17 @@ from __future__ import annotations
 
 import math
 
-from nicegui import run, ui
+from nicegui import ui
 
 from ui_nicegui.decks.point_designer.forensics import render_forensics
-from ui_nicegui.evaluate import ui_evaluate
+from ui_nicegui.evaluate import client_session, ui_evaluate, ui_evaluate_batch_async
 from ui_nicegui.lib.pd_parity_helpers import (
     PERT_SCAN_PARAMS,
     baseline_delta_rows,
     fmt_num,
+    local_fd_points,
     local_fd_sensitivity_rows,
+    perturbation_scan_points,
     run_perturbation_scan,
 )
 from ui_nicegui.session import DesignSession
@@ -73,7 +75,12 @@ def render_sensitivity_lab(session: DesignSession) -> None:
                 def _eval(pi):
                     return ui_evaluate(pi, origin="NiceGUI:LocalFD", Paux_for_Q_MW=session.paux_for_q)
 
-                rows = await run.io_bound(local_fd_sensitivity_rows, base, _eval)
+                # Evaluate the stencil off the event loop; the row builder then only hits the cache.
+                await ui_evaluate_batch_async(
+                    local_fd_points(base), origin="NiceGUI:LocalFD", Paux_for_Q_MW=session.paux_for_q,
+                    session=client_session(),
+                )
+                rows = local_fd_sensitivity_rows(base, _eval)
                 if not lease_valid(lease):
                     ui.notify("Run was force-cleared — discarding results.", type="warning")
                     return
@@ -139,7 +146,11 @@ def render_sensitivity_lab(session: DesignSession) -> None:
                 def _eval(pi):
                     return ui_evaluate(pi, origin="NiceGUI:PertScan", Paux_for_Q_MW=session.paux_for_q)
 
-                rows = await run.io_bound(run_perturbation_scan, base, _eval)
+                await ui_evaluate_batch_async(
+                    perturbation_scan_points(base), origin="NiceGUI:PertScan", Paux_for_Q_MW=session.paux_for_q,
+                    session=client_session(),
+                )
+                rows = run_perturbation_scan(base, _eval)
                 if not lease_valid(lease):
                     ui.notify("Run was force-cleared — discarding results.", type="warning")
                     return
@@ -222,15 +233,18 @@ def render_sensitivity_lab(session: DesignSession) -> None:
                 ui.notify("Invalid baseline value.", type="negative")
                 return
             try:
+                steps = (("-10%", 0.9), ("baseline", 1.0), ("+10%", 1.1))
+                outs = await ui_evaluate_batch_async(
+                    [replace(base, **{k: x0 * mult}) for _label, mult in steps],
+                    origin="NiceGUI:PerturbationProbe",
+                    Paux_for_Q_MW=session.paux_for_q,
+                    session=client_session(),
+                )
+                if not lease_valid(lease):
+                    ui.notify("Run was force-cleared — discarding results.", type="warning")
+                    return
                 rows = []
-                for label, mult in (("-10%", 0.9), ("baseline", 1.0), ("+10%", 1.1)):
-                    pi = replace(base, **{k: x0 * mult})
-                    yo = await run.io_bound(
-                        ui_evaluate, pi, origin="NiceGUI:PerturbationProbe", Paux_for_Q_MW=session.paux_for_q
-                    )
-                    if not lease_valid(lease):
-                        ui.notify("Run was force-cleared — discarding results.", type="warning")
-                        return
+                for (label, mult), yo in zip(steps, outs):
                     q = yo.get("Q_DT_eqv", yo.get("Q"))
                     from ui_nicegui.lib.verdict_core import verdict_summary
 
@@ -6,14 +6,18 @@ without Streamlit deps.
 
 Do not construct ``Evaluator()`` elsewhere under ``ui_nicegui/`` — use
 ``ui_evaluator(origin=...)`` when a tool needs an evaluator-like object.
+Event-loop callers (long points, deck-started scans) use ``ui_evaluate_async``
+/ ``ui_evaluate_batch_async``, which keep the same origin label and cache.
 """
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 _ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if _ROOT not in sys.path:
@@ -165,10 +169,198 @@ def ui_evaluate(
     """Route NiceGUI point evaluation through the Evaluator choke point."""
     evaluator_kwargs.setdefault("label", str(origin or "NiceGUI"))
     ev = _get_evaluator(**evaluator_kwargs)
-    result = ev.evaluate(inp, Paux_for_Q_MW=Paux_for_Q_MW)
+    return _result_outputs(ev.evaluate(inp, Paux_for_Q_MW=Paux_for_Q_MW))
+
+
+def _result_outputs(result: Any) -> Dict[str, Any]:
     out = getattr(result, "out", None)
     if isinstance(out, dict):
         return out
     if hasattr(result, "outputs") and isinstance(result.outputs, dict):
         return result.outputs
     raise TypeError(f"Unexpected Evaluator result type: {type(result)!r}")
+
+
+# -----------------------------
+# Non-blocking evaluation (shared process pool)
+# -----------------------------
+#
+# ``ui_evaluate_async`` / ``ui_evaluate_batch_async`` keep the event loop free:
+# the process-local Evaluator cache (same pool key as ``ui_evaluate``) is
+# consulted first, misses run ``Evaluator.evaluate`` in a shared spawn-context
+# worker pool with the same construction kwargs, and results are stored back
+# into that cache, so a later ``ui_evaluate`` of the same point is a hit.
+# ``SHAMS_UI_EVAL_WORKERS=0`` runs misses on a thread instead of a process.
+# The pool is a ``WarmWorkerPool``: a worker that dies fails only its own point
+# (``WorkerCrashed``) and is replaced, instead of breaking the pool for good.
+
+# Worker warm-up: the UI tasks only need the evaluator stack.
+_UI_POOL_WARM: Tuple[str, ...] = ("evaluator.core",)
+
+_UI_POOL: Any = None
+_UI_POOL_LOCK = threading.Lock()
+# Per-session concurrency gates and in-flight futures (for cancel_session).
+_SESSION_SEMAPHORES: Dict[Tuple[int, str], asyncio.Semaphore] = {}
+_SESSION_INFLIGHT: Dict[str, Set[Any]] = {}
+
+
+def _ui_pool_workers() -> int:
+    try:
+        n = int(os.environ.get("SHAMS_UI_EVAL_WORKERS", "") or -1)
+    except ValueError:
+        n = -1
+    return min(4, os.cpu_count() or 1) if n < 0 else n
+
+
+def _session_limit() -> int:
+    try:
+        return max(1, int(os.environ.get("SHAMS_UI_SESSION_CONCURRENCY", "") or 2))
+    except ValueError:
+        return 2
+
+
+def _get_ui_pool():
+    """Shared worker pool, or None when ``SHAMS_UI_EVAL_WORKERS=0``."""
+    global _UI_POOL
+    with _UI_POOL_LOCK:
+        if _UI_POOL is None and _ui_pool_workers() > 0:
+            try:
+                from src.evaluator.worker_pool import WarmWorkerPool  # type: ignore
+            except Exception:
+                from evaluator.worker_pool import WarmWorkerPool  # type: ignore
+
+            _UI_POOL = WarmWorkerPool(max_workers=_ui_pool_workers(), warm=_UI_POOL_WARM)
+        return _UI_POOL
+
+
+def shutdown_ui_pool() -> None:
+    """Stop the shared worker pool (pending work is cancelled)."""
+    global _UI_POOL
+    with _UI_POOL_LOCK:
+        if _UI_POOL is not None:
+            _UI_POOL.shutdown(wait=False, cancel_futures=True)
+            _UI_POOL = None
+
+
+def _pool_evaluate(inp: Any, Paux_for_Q_MW: Optional[float], evaluator_kwargs: Dict[str, Any]):
+    """Worker task: full ``EvalResult`` from this process's pooled Evaluator."""
+    return _get_evaluator(**evaluator_kwargs).evaluate(inp, Paux_for_Q_MW=Paux_for_Q_MW)
+
+
+def _session_semaphore(session: str) -> asyncio.Semaphore:
+    # Semaphores bind to the running loop; key by loop so tests / reloads are safe.
+    key = (id(asyncio.get_running_loop()), session)
+    sem = _SESSION_SEMAPHORES.get(key)
+    if sem is None:
+        sem = _SESSION_SEMAPHORES[key] = asyncio.Semaphore(_session_limit())
+    return sem
+
+
+async def ui_evaluate_async(
+    inp: Any,
+    *,
+    origin: str = "NiceGUI",
+    Paux_for_Q_MW: Optional[float] = None,
+    session: str = "default",
+    **evaluator_kwargs: Any,
+) -> Dict[str, Any]:
+    """Awaitable ``ui_evaluate``: same outputs, origin label and cache, off the event loop.
+
+    At most ``SHAMS_UI_SESSION_CONCURRENCY`` (default 2) evaluations per
+    ``session`` run at once. Cancelling the awaiting task (or
+    ``cancel_session(session)``) drops queued work; a point already running in
+    a worker finishes there but its result is discarded.
+    """
+    evaluator_kwargs.setdefault("label", str(origin or "NiceGUI"))
+    ev = _get_evaluator(**evaluator_kwargs)
+    hit = ev.cache_lookup(inp, Paux_for_Q_MW=Paux_for_Q_MW)
+    if hit is not None:
+        return _result_outputs(hit)
+
+    session = str(session or "default")
+    async with _session_semaphore(session):
+        # A duplicate queued behind the same point is served from the cache it just filled.
+        hit = ev.cache_lookup(inp, Paux_for_Q_MW=Paux_for_Q_MW)
+        if hit is not None:
+            return _result_outputs(hit)
+        loop = asyncio.get_running_loop()
+        pool = _get_ui_pool()
+        if pool is None:
+            fut = loop.run_in_executor(None, ev.evaluate, inp, Paux_for_Q_MW)
+        else:
+            fut = asyncio.wrap_future(pool.submit(_pool_evaluate, inp, Paux_for_Q_MW, dict(evaluator_kwargs)))
+        inflight = _SESSION_INFLIGHT.setdefault(session, set())
+        inflight.add(fut)
+        try:
+            result = await fut
+        finally:
+            inflight.discard(fut)
+            if not inflight and _SESSION_INFLIGHT.get(session) is inflight:
+                del _SESSION_INFLIGHT[session]
+    if pool is not None:
+        ev.cache_store(result, Paux_for_Q_MW=Paux_for_Q_MW)
+    return _result_outputs(result)
+
+
+async def ui_evaluate_batch_async(
+    inps: Sequence[Any],
+    *,
+    origin: str = "NiceGUI",
+    Paux_for_Q_MW: Optional[float] = None,
+    session: str = "default",
+    progress_cb: Optional[Callable[[int, int], None]] = None,
+    **evaluator_kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Evaluate ``inps`` concurrently (bounded by the session limit); outputs in input order.
+
+    ``progress_cb(n_done, n_total)`` is called on the event loop as points finish.
+    Cancelling the batch cancels every point still queued.
+    """
+    total = len(inps)
+    done = 0
+
+    async def _one(inp: Any) -> Dict[str, Any]:
+        nonlocal done
+        out = await ui_evaluate_async(
+            inp, origin=origin, Paux_for_Q_MW=Paux_for_Q_MW, session=session, **evaluator_kwargs
+        )
+        done += 1
+        if progress_cb is not None:
+            progress_cb(done, total)
+        return out
+
+    tasks = [asyncio.ensure_future(_one(inp)) for inp in inps]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for t in tasks:
+            t.cancel()
+        raise
+
+
+def cancel_session(session: str = "default") -> int:
+    """Cancel this session's in-flight evaluations; returns how many were signalled."""
+    futs = list(_SESSION_INFLIGHT.get(str(session or "default"), ()))
+    for f in futs:
+        f.cancel()
+    return len(futs)
+
+
+def end_session(session: str = "default") -> int:
+    """Cancel and forget a finished session (client gone): drops its gates and in-flight set."""
+    session = str(session or "default")
+    n = cancel_session(session)
+    _SESSION_INFLIGHT.pop(session, None)
+    for key in [k for k in _SESSION_SEMAPHORES if k[1] == session]:
+        del _SESSION_SEMAPHORES[key]
+    return n
+
+
+def client_session() -> str:
+    """Session key for the current NiceGUI client (``"default"`` outside a page context)."""
+    try:
+        from nicegui import context
+
+        return str(context.client.id)
+    except Exception:
+        return "default"
@@ -9,6 +9,13 @@ _ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if _ROOT not in sys.path:
     sys.path.insert(0, _ROOT)
 
+try:
+    from src.utils.bytecode_cache import configure_bytecode_policy
+
+    configure_bytecode_policy()  # opt-in out-of-tree bytecode (SHAMS_BYTECODE_CACHE)
+except Exception:
+    sys.dont_write_bytecode = True
+
 
 def _pause_on_error() -> None:
     if os.environ.get("SHAMS_NICEGUI_NO_PAUSE", "").strip().lower() in ("1", "true", "yes"):
@@ -23,6 +23,11 @@ try:
 except ImportError:
     from src.schema.governance_presets import apply_governance_preset, tritium_tight_closure_default  # type: ignore
 
+try:
+    from shams_io.provenance import refresh_artifact_provenance
+except ImportError:
+    from src.shams_io.provenance import refresh_artifact_provenance  # type: ignore
+
 try:
     from models.reference_machines import REFERENCE_MACHINES, reference_catalog
 except ImportError:
@@ -116,6 +121,7 @@ def run_verification_capture() -> tuple[bool, str, str, float]:
         )
         dt = time.time() - t0
         ok = (proc.returncode == 0) and os.path.exists(rep)
+        refresh_artifact_provenance()
         return ok, (proc.stdout or ""), (proc.stderr or ""), dt
     except Exception as e:
         dt = time.time() - t0
@@ -948,6 +948,37 @@ def baseline_delta_rows(
 
 
 PERT_SCAN_PARAMS = ["R0_m", "a_m", "kappa", "Bt_T", "Ip_MA", "fG", "Ti_keV", "Paux_MW"]
+LOCAL_FD_PARAMS = ["R0_m", "a_m", "kappa", "Bt_T", "Ip_MA", "fG", "H98", "eta_CD", "n_neu_frac", "Zeff"]
+
+
+def _perturbation_steps(base_pi: Any, params: Optional[List[str]] = None) -> List[Tuple[str, float, float, Any]]:
+    steps: List[Tuple[str, float, float, Any]] = []
+    for k in list(params or PERT_SCAN_PARAMS):
+        if not hasattr(base_pi, k):
+            continue
+        x0 = _safe_float(getattr(base_pi, k))
+        if not math.isfinite(x0) or x0 == 0.0:
+            continue
+        for fac in (0.9, 1.1):
+            steps.append((k, fac, x0, replace(base_pi, **{k: x0 * fac})))
+    return steps
+
+
+def perturbation_scan_points(base_pi: Any, *, params: Optional[List[str]] = None) -> List[Any]:
+    """Every point ``run_perturbation_scan`` evaluates (baseline first)."""
+    return [base_pi] + [pi for _k, _fac, _x0, pi in _perturbation_steps(base_pi, params)]
+
+
+def local_fd_points(base_pi: Any, *, params: Optional[List[str]] = None, rel_step: float = 1e-3) -> List[Any]:
+    """Every point ``local_fd_sensitivity_rows`` evaluates (baseline first)."""
+    try:
+        from solvers.sensitivity import central_difference_stencil
+    except ImportError:
+        from src.solvers.sensitivity import central_difference_stencil  # type: ignore
+    pts: List[Any] = [base_pi]
+    for _p, _h, plus, minus in central_difference_stencil(base_pi, list(params or LOCAL_FD_PARAMS), rel_step):
+        pts += [plus, minus]
+    return pts
 
 
 def run_perturbation_scan(
@@ -965,7 +996,6 @@ def run_perturbation_scan(
     except ImportError:
         return []
 
-    keys = list(params or PERT_SCAN_PARAMS)
     base_out = evaluator(base_pi)
     base_failed = [
         str(getattr(c, "name", ""))
@@ -973,28 +1003,21 @@ def run_perturbation_scan(
         if str(getattr(c, "severity", "hard")) == "hard" and not bool(getattr(c, "passed", False))
     ]
     rows: List[Dict[str, Any]] = []
-    for k in keys:
-        if not hasattr(base_pi, k):
-            continue
-        x0 = _safe_float(getattr(base_pi, k))
-        if not math.isfinite(x0) or x0 == 0.0:
-            continue
-        for fac in (0.9, 1.1):
-            pi = replace(base_pi, **{k: x0 * fac})
-            y = evaluator(pi)
-            failed = [
-                str(getattr(c, "name", ""))
-                for c in (evaluate_constraints(y) or [])
-                if str(getattr(c, "severity", "hard")) == "hard" and not bool(getattr(c, "passed", False))
-            ]
-            rows.append({
-                "param": k,
-                "factor": fac,
-                "value": fmt_num(x0 * fac),
-                "hard_failed": ", ".join(failed),
-                "new_failures": ", ".join(sorted(set(failed) - set(base_failed))),
-                "resolved": ", ".join(sorted(set(base_failed) - set(failed))),
-            })
+    for k, fac, x0, pi in _perturbation_steps(base_pi, params):
+        y = evaluator(pi)
+        failed = [
+            str(getattr(c, "name", ""))
+            for c in (evaluate_constraints(y) or [])
+            if str(getattr(c, "severity", "hard")) == "hard" and not bool(getattr(c, "passed", False))
+        ]
+        rows.append({
+            "param": k,
+            "factor": fac,
+            "value": fmt_num(x0 * fac),
+            "hard_failed": ", ".join(failed),
+            "new_failures": ", ".join(sorted(set(failed) - set(base_failed))),
+            "resolved": ", ".join(sorted(set(base_failed) - set(failed))),
+        })
     return rows
 
 
@@ -1014,7 +1037,7 @@ def local_fd_sensitivity_rows(
     except ImportError:
         return []
 
-    p_list = list(params or ["R0_m", "a_m", "kappa", "Bt_T", "Ip_MA", "fG", "H98", "eta_CD", "n_neu_frac", "Zeff"])
+    p_list = list(params or LOCAL_FD_PARAMS)
     o_list = list(outputs or ["Q_DT_eqv", "P_e_net_MW", "beta_N", "q_div_MW_m2", "B_peak_T"])
     sens = finite_difference_sensitivities(base_pi, evaluator, params=p_list, outputs=o_list, rel_step=rel_step)
     rows: List[Dict[str, Any]] = []
@@ -1,6 +1,7 @@
 """Point Designer solver / hash / frontier helpers (no Streamlit)."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 from dataclasses import asdict
@@ -23,7 +24,7 @@ except ImportError:
         solve_Ip_for_H98_with_Q_match_stream,
     )
 
-from ui_nicegui.evaluate import ui_evaluate
+from ui_nicegui.evaluate import ui_evaluate, ui_evaluate_async
 from ui_nicegui.session import DesignSession
 
 
@@ -231,13 +232,10 @@ def _solver_event_iter(session: DesignSession, base) -> Iterator[Dict[str, Any]]
     )
 
 
-def run_point_designer_evaluation(session: DesignSession) -> Dict[str, Any]:
-    """Evaluate Point Designer (direct or solver path). Returns result dict."""
+def _pd_solve(session: DesignSession, log_lines: List[str], trace: List[Dict[str, Any]]) -> Tuple[Any, Dict[str, Any], bool]:
+    """Optimizer / solver phase: ``(proposed inputs, solver outputs, ok)``; direct mode proposes the base point."""
     sync_solver_bounds_from_inputs(session)
     base = session.build_point_inputs()
-    log_lines: List[str] = []
-    trace: List[Dict[str, Any]] = []
-    _log_append(log_lines, "Point Designer evaluation")
 
     try:
         from src.solvers.evaluator_bridge import set_evaluate_point_override
@@ -354,26 +352,30 @@ def run_point_designer_evaluation(session: DesignSession) -> Dict[str, Any]:
                 ok = _solver_success(out, ok) if isinstance(out, dict) else ok
         else:
             _log_append(log_lines, "Direct frozen-point evaluate (no solver)")
-            out = ui_evaluate(sol_inp, origin="NiceGUI:Point Designer", Paux_for_Q_MW=session.paux_for_q)
-
-        if mode in ("solver", "envelope") and sol_inp is not None:
-            session.inputs["Ip_MA"] = float(getattr(sol_inp, "Ip_MA", session.inputs.get("Ip_MA")))
-            session.inputs["fG"] = float(getattr(sol_inp, "fG", session.inputs.get("fG")))
-            paux_sol = getattr(sol_inp, "Paux_MW", None)
-            if paux_sol is not None:
-                session.inputs["Paux_MW"] = float(paux_sol)
-            # Always re-certify proposed inputs through ui_evaluate (PHYS / constraints provenance).
-            solver_audit = {
-                k: v
-                for k, v in (out or {}).items()
-                if isinstance(k, str) and k.startswith("_")
-            }
-            out = ui_evaluate(
-                sol_inp, origin="NiceGUI:Point Designer", Paux_for_Q_MW=session.paux_for_q
-            )
-            out.update(solver_audit)
     finally:
         set_evaluate_point_override(None)
+    return sol_inp, out, ok
+
+
+def _pd_result(
+    session: DesignSession,
+    sol_inp: Any,
+    solver_out: Dict[str, Any],
+    certified: Dict[str, Any],
+    ok: bool,
+    log_lines: List[str],
+    trace: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    out = dict(certified)
+    if str(session.pd_eval_mode) in ("solver", "envelope") and sol_inp is not None:
+        session.inputs["Ip_MA"] = float(getattr(sol_inp, "Ip_MA", session.inputs.get("Ip_MA")))
+        session.inputs["fG"] = float(getattr(sol_inp, "fG", session.inputs.get("fG")))
+        paux_sol = getattr(sol_inp, "Paux_MW", None)
+        if paux_sol is not None:
+            session.inputs["Paux_MW"] = float(paux_sol)
+        # Keep the solver audit keys on top of the re-certified outputs.
+        solver_audit = {k: v for k, v in (solver_out or {}).items() if isinstance(k, str) and k.startswith("_")}
+        out.update(solver_audit)
 
     session.pd_solver_trace = trace
     session.pd_last_log_lines = log_lines
@@ -386,7 +388,7 @@ def run_point_designer_evaluation(session: DesignSession) -> Dict[str, Any]:
 
     return {
         "ok": ok,
-        "outputs": dict(out),
+        "outputs": out,
         "inputs": inputs_dict,
         "log_lines": log_lines,
         "trace": trace,
@@ -394,6 +396,38 @@ def run_point_designer_evaluation(session: DesignSession) -> Dict[str, Any]:
     }
 
 
+def run_point_designer_evaluation(session: DesignSession) -> Dict[str, Any]:
+    """Evaluate Point Designer (direct or solver path). Returns result dict."""
+    log_lines: List[str] = []
+    trace: List[Dict[str, Any]] = []
+    _log_append(log_lines, "Point Designer evaluation")
+    sol_inp, solver_out, ok = _pd_solve(session, log_lines, trace)
+    # Always (re-)certify the proposed inputs through ui_evaluate (PHYS / constraints provenance).
+    certified = ui_evaluate(sol_inp, origin="NiceGUI:Point Designer", Paux_for_Q_MW=session.paux_for_q)
+    return _pd_result(session, sol_inp, solver_out, certified, ok, log_lines, trace)
+
+
+async def run_point_designer_evaluation_async(session: DesignSession, *, eval_session: str = "default") -> Dict[str, Any]:
+    """``run_point_designer_evaluation`` without blocking the event loop.
+
+    The certifying evaluation goes through ``ui_evaluate_async`` (shared worker
+    pool, per-session limit). Optimizer / solver iterations depend on each
+    other, so that phase runs sequentially on a worker thread; direct mode
+    skips it.
+    """
+    log_lines: List[str] = []
+    trace: List[Dict[str, Any]] = []
+    _log_append(log_lines, "Point Designer evaluation")
+    if bool(session.pd_do_opt) or str(session.pd_eval_mode) in ("solver", "envelope"):
+        sol_inp, solver_out, ok = await asyncio.to_thread(_pd_solve, session, log_lines, trace)
+    else:
+        sol_inp, solver_out, ok = _pd_solve(session, log_lines, trace)
+    certified = await ui_evaluate_async(
+        sol_inp, origin="NiceGUI:Point Designer", Paux_for_Q_MW=session.paux_for_q, session=eval_session
+    )
+    return _pd_result(session, sol_inp, solver_out, certified, ok, log_lines, trace)
+
+
 def search_nearest_feasible(session: DesignSession) -> Dict[str, Any]:
     try:
         from src.solvers.evaluator_bridge import set_evaluate_point_override
@@ -97,6 +97,8 @@ def run_cartography_scan(
     include_outputs: bool = False,
     base_override: Optional[dict] = None,
     progress_cb: Optional[Callable[[int, int], None]] = None,
+    engine: str = "serial",
+    max_workers: Optional[int] = None,
 ) -> dict:
     import numpy as np
 
@@ -135,6 +137,8 @@ def run_cartography_scan(
         intents=list(intents or ["Reactor"]),
         include_outputs=bool(include_outputs),
         progress_cb=_cb,
+        engine=str(engine or "serial"),
+        max_workers=max_workers,
     )
     rep["run_seconds"] = float(time.time() - t0)
     return rep